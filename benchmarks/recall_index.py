@@ -0,0 +1,113 @@
+"""Top-N recall scan before and after the recall index (revision 4).
+
+Builds a throwaway SQLite database with the Memori schema, fills one
+entity with facts and times the `get_embeddings` query with revisions 1-3
+only, then again after revision 4 adds the index matching its ORDER BY.
+
+    python benchmarks/recall_index.py --facts 200000 --limit 1000
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+
+from memori.storage.migrations._sqlite import migrations
+
+RECALL_INDEX_REVISION = 4
+
+QUERY = """
+    SELECT id,
+           content_embedding
+      FROM memori_entity_fact
+     WHERE entity_id = ?
+     ORDER BY date_last_time DESC,
+              num_times DESC,
+              id DESC
+     LIMIT ?
+"""
+
+
+def apply(conn, revisions):
+    for revision in revisions:
+        for migration in migrations[revision]:
+            conn.execute(migration["operation"])
+    conn.commit()
+
+
+def populate(conn, facts, dim):
+    conn.execute(
+        "INSERT INTO memori_entity(uuid, external_id) VALUES (?, ?)",
+        (str(uuid.uuid4()), "benchmark"),
+    )
+    entity_id = conn.execute("SELECT id FROM memori_entity").fetchone()[0]
+    embedding = os.urandom(dim * 4)
+    conn.executemany(
+        """
+        INSERT INTO memori_entity_fact(
+            uuid, entity_id, content, content_embedding,
+            num_times, date_last_time, uniq
+        ) VALUES (?, ?, ?, ?, ?, datetime('now', ?), ?)
+        """,
+        (
+            (
+                str(uuid.uuid4()),
+                entity_id,
+                f"fact {n}",
+                embedding,
+                random.randint(1, 20),
+                f"-{random.randint(0, 86400 * 365)} seconds",
+                f"uniq-{n}",
+            )
+            for n in range(facts)
+        ),
+    )
+    conn.commit()
+    return entity_id
+
+
+def measure(conn, entity_id, limit, runs):
+    plan = [
+        row[-1]
+        for row in conn.execute(f"EXPLAIN QUERY PLAN {QUERY}", (entity_id, limit))
+    ]
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        conn.execute(QUERY, (entity_id, limit)).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    return plan, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--facts", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "recall.db"))
+        apply(conn, [r for r in sorted(migrations) if r < RECALL_INDEX_REVISION])
+        entity_id = populate(conn, args.facts, args.dim)
+        conn.execute("ANALYZE")
+
+        for label in ("revisions 1-3", f"revision {RECALL_INDEX_REVISION}"):
+            if label != "revisions 1-3":
+                apply(conn, [RECALL_INDEX_REVISION])
+                conn.execute("ANALYZE")
+            plan, median_ms = measure(conn, entity_id, args.limit, args.runs)
+            print(f"{label}: {median_ms:.2f} ms median")
+            for step in plan:
+                print(f"    {step}")
+
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
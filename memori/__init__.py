@@ -32,8 +32,14 @@ from memori.llm._providers import XAi as LlmProviderXAi
 from memori.memory.augmentation import Manager as AugmentationManager
 from memori.memory.recall import CloudRecallResponse, Recall, RecallFact
 from memori.storage import Manager as StorageManager
+from memori.storage.adapters.sharded import ShardedConn
 
-__all__ = ["Memori", "QuotaExceededError", "UnsupportedLLMProviderError"]
+__all__ = [
+    "Memori",
+    "QuotaExceededError",
+    "ShardedConn",
+    "UnsupportedLLMProviderError",
+]
 
 warn_if_legacy_memorisdk_installed()
 
@@ -90,14 +96,23 @@ class Memori:
         self,
         conn: Callable[[], Any] | Any | None = None,
         debug_truncate: bool = True,
+        warmup: bool | None = None,
+        read_conn: Callable[[], Any] | Any | None = None,
     ) -> None:
-        """Initialize Memori with cloud mode or a user-provided connection."""
+        """Initialize Memori with cloud mode or a user-provided connection.
+
+        With warmup=True (or MEMORI_EMBEDDINGS_WARMUP=1) the local embedding
+        model is loaded on a background thread; see is_ready(). read_conn is
+        an optional read replica of conn that serves recall and history.
+        """
         from memori._logging import set_truncate_enabled
 
         self.config = Config()
         self.config.api_key = os.environ.get("MEMORI_API_KEY", None)
         self.config.session_id = uuid4()
         self.config.debug_truncate = debug_truncate
+        if warmup is not None:
+            self.config.embeddings.warmup = warmup
         set_truncate_enabled(debug_truncate)
 
         if conn is None:
@@ -106,10 +121,28 @@ class Memori:
             self.config.cloud = False
             self.config.byodb = True
 
-        self.config.storage = StorageManager(self.config).start(conn)
-        self.config.augmentation = AugmentationManager(self.config).start(conn)
+        self.config.storage = StorageManager(self.config).start(
+            conn, read_conn=read_conn
+        )
+        self.config.augmentation = AugmentationManager(self.config).start(
+            self.config.storage.conn_factory
+        )
         self.config.rust_core = RustCoreAdapter.maybe_create(self.config)
 
+        from memori.embeddings._executor import get_embedding_executor
+
+        # The embedding executor is process-wide; the latest settings apply.
+        get_embedding_executor().configure(
+            max_workers=self.config.embeddings.executor_workers,
+            queue_size=self.config.embeddings.executor_queue_size,
+        )
+
+        self._warmup = None
+        if self.config.embeddings.warmup and not self.config.cloud:
+            from memori.embeddings._warmup import warmup_embeddings
+
+            self._warmup = warmup_embeddings(self.config.embeddings.model)
+
         self.augmentation = self.config.augmentation
         self.llm = LlmRegistry(self)
         self.agno = LlmProviderAgno(self)
@@ -120,6 +153,10 @@ class Memori:
         self.pydantic_ai = LlmProviderPydanticAi(self)
         self.xai = LlmProviderXAi(self)
 
+    def is_ready(self) -> bool:
+        """Return False while a background embedding warm-up is still running."""
+        return self._warmup is None or self._warmup.is_ready()
+
     def _get_default_connection(self) -> Callable[[], Any] | None:
         connection_string = os.environ.get("MEMORI_COCKROACHDB_CONNECTION_STRING", None)
         if connection_string:
@@ -204,6 +241,51 @@ class Memori:
 
         Recall(self.config).delete_entity_memories(entity_id)
 
+    def _transfer_entity_id(self, method: str, entity_id: str | None) -> str:
+        if not self.config.byodb:
+            raise RuntimeError(f"{method} is only available in BYODB mode")
+        if self.config.storage is None or self.config.storage.driver is None:
+            raise RuntimeError(f"{method} requires a synchronous connection")
+
+        entity_id = entity_id if entity_id is not None else self.config.entity_id
+        if entity_id is None:
+            raise RuntimeError(f"{method} requires an entity_id")
+        if not isinstance(entity_id, str):
+            raise TypeError("entity_id must be a string or None")
+        if len(entity_id) > 100:
+            raise RuntimeError("entity_id cannot be greater than 100 characters")
+        return entity_id
+
+    def export_memories(
+        self, path: str, entity_id: str | None = None
+    ) -> dict[str, int]:
+        """Export an entity's conversations, facts and triples to a directory.
+
+        Returns the number of rows exported per kind. Raises ValueError if
+        the entity does not exist.
+        """
+        from memori.storage._transfer import export_entity
+
+        return export_entity(
+            self.config, self._transfer_entity_id("export_memories", entity_id), path
+        )
+
+    def import_memories(
+        self, path: str, entity_id: str | None = None
+    ) -> dict[str, int]:
+        """Import a directory written by export_memories into an entity.
+
+        The entity defaults to the attributed one, then to the exported one.
+        Returns the number of rows imported per kind.
+        """
+        from memori.storage._transfer import import_entity, read_manifest
+
+        if entity_id is None and self.config.entity_id is None:
+            entity_id = read_manifest(path)["entity_id"]
+        return import_entity(
+            self.config, self._transfer_entity_id("import_memories", entity_id), path
+        )
+
     def close(self) -> None:
         """Close the underlying storage connection/session, if any.
 
@@ -211,13 +293,9 @@ class Memori:
         where you want to explicitly release database connections.
         """
         storage = getattr(self.config, "storage", None)
-        adapter = getattr(storage, "adapter", None) if storage is not None else None
-        if adapter is None:
+        if storage is None:
             return
-        try:
-            adapter.close()
-        except Exception:  # nosec B110
-            pass
+        storage.close()
 
     def __enter__(self) -> "Memori":
         return self
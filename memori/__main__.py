@@ -16,6 +16,7 @@ from memori._config import Config
 from memori._setup import Manager as SetupManager
 from memori.api._quota import Manager as ApiQuotaManager
 from memori.api._sign_up import Manager as ApiSignUpManager
+from memori.storage._transfer import ExportManager, ImportManager
 from memori.storage.cockroachdb._cluster_manager import (
     ClusterManager as CockroachDBClusterManager,
 )
@@ -31,6 +32,16 @@ def main():
             "params": ["cluster", "<start | claim | delete>"],
             "obj": CockroachDBClusterManager,
         },
+        "export": {
+            "description": "Export an entity's memories",
+            "params": ["<module:connection>", "<entity_id>", "<path>"],
+            "obj": ExportManager,
+        },
+        "import": {
+            "description": "Import an entity's memories",
+            "params": ["<module:connection>", "<entity_id>", "<path>"],
+            "obj": ImportManager,
+        },
         "quota": {
             "description": "Check your quota",
             "params": [],
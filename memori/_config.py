@@ -49,11 +49,32 @@ class Cache:
 class Storage:
     def __init__(self):
         self.cockroachdb = False
+        self.cockroachdb_follower_reads = False
+        self.cockroachdb_follower_read_staleness_seconds = 0
+        self.pool_size = 8
+        self.pool_max_lifetime_seconds = 1800
+        self.sqlite_wal = False
+        self.sqlite_read_pool_size = 4
+        self.embedding_segments = False
+        self.oracle_batch_size = 1000
+        self.read_your_writes = True
+        self.read_your_writes_seconds = 5
+
+
+class History:
+    def __init__(self):
+        self.max_messages = 0
+        self.max_tokens = 0
+        self.token_counter = None
+        self.cache = False
 
 
 class Embeddings:
     def __init__(self):
         self.model = "all-MiniLM-L6-v2"
+        self.warmup = False
+        self.executor_workers = 2
+        self.executor_queue_size = 256
 
 
 class Config:
@@ -67,10 +88,27 @@ class Config:
             _env_str("MEMORI_EMBEDDINGS_MODEL", self.embeddings.model)
             or self.embeddings.model
         )
+        self.embeddings.warmup = _env_bool(
+            "MEMORI_EMBEDDINGS_WARMUP", self.embeddings.warmup
+        )
+        self.embeddings.executor_workers = _env_int(
+            "MEMORI_EMBEDDINGS_WORKERS", self.embeddings.executor_workers
+        )
+        self.embeddings.executor_queue_size = _env_int(
+            "MEMORI_EMBEDDINGS_QUEUE_SIZE", self.embeddings.executor_queue_size
+        )
         self.cloud: bool | None = None
         self.byodb: bool = False
         self.llm = Llm()
         self.framework = Framework()
+        self.history = History()
+        self.history.max_messages = _env_int(
+            "MEMORI_HISTORY_MAX_MESSAGES", self.history.max_messages
+        )
+        self.history.max_tokens = _env_int(
+            "MEMORI_HISTORY_MAX_TOKENS", self.history.max_tokens
+        )
+        self.history.cache = _env_bool("MEMORI_HISTORY_CACHE", self.history.cache)
         self.platform = Platform()
         self.entity_id = None
         self.process_id = None
@@ -85,6 +123,40 @@ class Config:
         self.session_timeout_minutes = 30
         self.storage = None
         self.storage_config = Storage()
+        self.storage_config.pool_size = _env_int(
+            "MEMORI_STORAGE_POOL_SIZE", self.storage_config.pool_size
+        )
+        self.storage_config.pool_max_lifetime_seconds = _env_int(
+            "MEMORI_STORAGE_POOL_MAX_LIFETIME",
+            self.storage_config.pool_max_lifetime_seconds,
+        )
+        self.storage_config.sqlite_wal = _env_bool(
+            "MEMORI_SQLITE_WAL", self.storage_config.sqlite_wal
+        )
+        self.storage_config.sqlite_read_pool_size = _env_int(
+            "MEMORI_SQLITE_READ_POOL_SIZE", self.storage_config.sqlite_read_pool_size
+        )
+        self.storage_config.embedding_segments = _env_bool(
+            "MEMORI_EMBEDDING_SEGMENTS", self.storage_config.embedding_segments
+        )
+        self.storage_config.cockroachdb_follower_reads = _env_bool(
+            "MEMORI_COCKROACHDB_FOLLOWER_READS",
+            self.storage_config.cockroachdb_follower_reads,
+        )
+        self.storage_config.cockroachdb_follower_read_staleness_seconds = _env_int(
+            "MEMORI_COCKROACHDB_FOLLOWER_READ_STALENESS",
+            self.storage_config.cockroachdb_follower_read_staleness_seconds,
+        )
+        self.storage_config.oracle_batch_size = _env_int(
+            "MEMORI_ORACLE_BATCH_SIZE", self.storage_config.oracle_batch_size
+        )
+        self.storage_config.read_your_writes = _env_bool(
+            "MEMORI_STORAGE_READ_YOUR_WRITES", self.storage_config.read_your_writes
+        )
+        self.storage_config.read_your_writes_seconds = _env_int(
+            "MEMORI_STORAGE_READ_YOUR_WRITES_SECONDS",
+            self.storage_config.read_your_writes_seconds,
+        )
         self.thread_pool_executor = ThreadPoolExecutor(max_workers=15)
         self.use_rust_core = _env_bool("MEMORI_USE_RUST_CORE", False)
         self.rust_core = None
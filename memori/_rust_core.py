@@ -552,12 +552,18 @@ class RustCoreAdapter:
                 raise RustCoreAdapterError(
                     "fetch_embeddings.limit must be an integer"
                 ) from exc
-            with connection_context(config.storage.conn_factory) as (
-                _conn,
-                _adapter,
-                driver,
+            with (
+                config.storage.read_conn as (
+                    _conn,
+                    _adapter,
+                    driver,
+                )
             ):
-                entity_id = _resolve_entity_id(driver, raw_entity_id)
+                # This runs on the replica, which may be read-only: look the
+                # entity up rather than create it. No row means no facts.
+                entity_id = _resolve_entity_id(driver, raw_entity_id, create=False)
+                if entity_id is None:
+                    return json.dumps([])
                 rows = driver.entity_fact.get_embeddings(entity_id, limit)
                 out: list[dict[str, Any]] = []
                 for row in rows:
@@ -578,10 +584,12 @@ class RustCoreAdapter:
             if not isinstance(ids, list):
                 raise RustCoreAdapterError("fetch_facts_by_ids.ids must be a list")
             fact_ids = _normalize_fact_ids(ids)
-            with connection_context(config.storage.conn_factory) as (
-                _conn,
-                _adapter,
-                driver,
+            with (
+                config.storage.read_conn as (
+                    _conn,
+                    _adapter,
+                    driver,
+                )
             ):
                 rows = driver.entity_fact.get_facts_by_ids(fact_ids)
                 out = []
@@ -627,19 +635,29 @@ class RustCoreAdapter:
         return _callback
 
 
-def _resolve_entity_id(driver: Any, raw_entity_id: Any) -> int:
+def _resolve_entity_id(
+    driver: Any, raw_entity_id: Any, create: bool = True
+) -> int | None:
+    """Map an external entity id to its row id.
+
+    With create=False the entity is only looked up, and None is returned
+    when it does not exist.
+    """
     if isinstance(raw_entity_id, int):
         return raw_entity_id
-    if isinstance(raw_entity_id, str):
-        stripped = raw_entity_id.strip()
-        if not stripped:
-            raise RustCoreAdapterError("entity_id cannot be empty")
-        if stripped.isdigit():
-            return int(stripped)
-        return int(driver.entity.create(stripped))
     if raw_entity_id is None:
         raise RustCoreAdapterError("entity_id is required")
-    return int(driver.entity.create(str(raw_entity_id)))
+    external_id = str(raw_entity_id)
+    if isinstance(raw_entity_id, str):
+        external_id = raw_entity_id.strip()
+        if not external_id:
+            raise RustCoreAdapterError("entity_id cannot be empty")
+        if external_id.isdigit():
+            return int(external_id)
+    entity_id = (
+        driver.entity.create(external_id) if create else driver.entity.read(external_id)
+    )
+    return None if entity_id is None else int(entity_id)
 
 
 def _normalize_fact_ids(ids: list[Any]) -> list[Any]:
@@ -10,12 +10,18 @@ r"""
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Awaitable
 from functools import partial
 from typing import Literal, overload
 
+import numpy as np
+
+from memori.embeddings._executor import (
+    PRIORITY_FACT,
+    PRIORITY_QUERY,
+    get_embedding_executor,
+)
 from memori.embeddings._tei import TEI
 from memori.embeddings._tei_embed import embed_texts_via_tei
 from memori.embeddings._utils import prepare_text_inputs
@@ -61,6 +67,31 @@ def _embed_texts(
     )
 
 
+def _embed_texts_array(
+    texts: str | list[str],
+    model: str,
+    *,
+    tei: TEI | None = None,
+    tokenizer: object | None = None,
+    chunk_size: int = 128,
+) -> np.ndarray:
+    inputs = prepare_text_inputs(texts)
+    if not inputs:
+        logger.debug("embed_texts called with empty input")
+        return np.empty((0, _FALLBACK_DIMENSION), dtype=np.float32)
+    if tei is not None:
+        return np.asarray(
+            _embed_texts(
+                inputs, model, tei=tei, tokenizer=tokenizer, chunk_size=chunk_size
+            ),
+            dtype=np.float32,
+        )
+
+    return get_sentence_transformers_embedder(model).embed_array(
+        inputs, fallback_dimension=_FALLBACK_DIMENSION
+    )
+
+
 async def _embed_texts_async(
     texts: str | list[str],
     model: str,
@@ -69,7 +100,6 @@ async def _embed_texts_async(
     tokenizer: object | None = None,
     chunk_size: int = 128,
 ) -> list[list[float]]:
-    loop = asyncio.get_event_loop()
     fn = partial(
         _embed_texts,
         texts,
@@ -78,7 +108,27 @@ async def _embed_texts_async(
         tokenizer=tokenizer,
         chunk_size=chunk_size,
     )
-    return await loop.run_in_executor(None, fn)
+    return await get_embedding_executor().run(fn, priority=PRIORITY_QUERY)
+
+
+async def _embed_texts_array_async(
+    texts: str | list[str],
+    model: str,
+    *,
+    tei: TEI | None = None,
+    tokenizer: object | None = None,
+    chunk_size: int = 128,
+    priority: int = PRIORITY_FACT,
+) -> np.ndarray:
+    fn = partial(
+        _embed_texts_array,
+        texts,
+        model,
+        tei=tei,
+        tokenizer=tokenizer,
+        chunk_size=chunk_size,
+    )
+    return await get_embedding_executor().run(fn, priority=priority)
 
 
 @overload
@@ -117,7 +167,8 @@ def embed_texts(
     """
     Embed text(s) into vectors.
 
-    When async_=True, returns an awaitable that runs the work in a threadpool.
+    When async_=True, returns an awaitable that runs the work on the shared
+    embedding executor at query priority.
     """
     if async_:
         return _embed_texts_async(
@@ -126,3 +177,59 @@ def embed_texts(
     return _embed_texts(
         texts, model, tei=tei, tokenizer=tokenizer, chunk_size=chunk_size
     )
+
+
+@overload
+def embed_texts_array(
+    texts: str | list[str],
+    model: str,
+    *,
+    async_: Literal[False] = False,
+    tei: TEI | None = None,
+    tokenizer: object | None = None,
+    chunk_size: int = 128,
+    priority: int = PRIORITY_FACT,
+) -> np.ndarray: ...
+
+
+@overload
+def embed_texts_array(
+    texts: str | list[str],
+    model: str,
+    *,
+    async_: Literal[True],
+    tei: TEI | None = None,
+    tokenizer: object | None = None,
+    chunk_size: int = 128,
+    priority: int = PRIORITY_FACT,
+) -> Awaitable[np.ndarray]: ...
+
+
+def embed_texts_array(
+    texts: str | list[str],
+    model: str,
+    *,
+    async_: bool = False,
+    tei: TEI | None = None,
+    tokenizer: object | None = None,
+    chunk_size: int = 128,
+    priority: int = PRIORITY_FACT,
+) -> np.ndarray | Awaitable[np.ndarray]:
+    """
+    Internal variant of embed_texts returning a float32 (n, dim) array.
+
+    Rows can be handed to format_embedding_for_db without a round trip through
+    Python float lists. Async calls default to fact (augmentation) priority.
+    """
+    if async_:
+        return _embed_texts_array_async(
+            texts,
+            model,
+            tei=tei,
+            tokenizer=tokenizer,
+            chunk_size=chunk_size,
+            priority=priority,
+        )
+    return _embed_texts_array(
+        texts, model, tei=tei, tokenizer=tokenizer, chunk_size=chunk_size
+    )
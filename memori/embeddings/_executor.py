@@ -0,0 +1,199 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import queue as queue_module
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Lower values run first.
+PRIORITY_QUERY = 0
+PRIORITY_FACT = 10
+
+EMBEDDING_WORKERS = 2
+EMBEDDING_QUEUE_SIZE = 256
+
+
+class EmbeddingExecutor:
+    """
+    Bounded, prioritized thread pool dedicated to embedding work.
+
+    Query (recall) embeddings are dequeued ahead of fact (augmentation)
+    embeddings, and a full queue makes callers wait instead of growing
+    without bound. Waiting callers are admitted in priority order as workers
+    free slots, so a recall query never loses a slot to a fact batch.
+    """
+
+    def __init__(self) -> None:
+        self.max_workers = EMBEDDING_WORKERS
+        self.queue_size = EMBEDDING_QUEUE_SIZE
+        self.queue: queue_module.PriorityQueue | None = None
+        self.threads: list[threading.Thread] = []
+        self.lock = threading.Lock()
+        self._sequence = itertools.count()
+        # Callers waiting for a slot: (priority, sequence, item, notify).
+        # Every put goes through _admission so a freed slot is handed to the
+        # best waiter rather than to whichever caller retries first.
+        self._admission = threading.Lock()
+        self._waiters: list[tuple[int, int, tuple, Callable[[], None]]] = []
+
+    def configure(
+        self, *, max_workers: int | None = None, queue_size: int | None = None
+    ) -> EmbeddingExecutor:
+        with self.lock:
+            if max_workers is not None and max_workers > 0:
+                self.max_workers = max_workers
+            if queue_size is not None and queue_size > 0:
+                self.queue_size = queue_size
+                if self.queue is not None:
+                    with self.queue.mutex:
+                        self.queue.maxsize = queue_size
+                    self._admit_waiters()
+            if self.threads:
+                self._start_workers()
+        return self
+
+    def ensure_started(self) -> None:
+        with self.lock:
+            if self.queue is None:
+                self.queue = queue_module.PriorityQueue(maxsize=self.queue_size)
+            self._start_workers()
+
+    def _start_workers(self) -> None:
+        while len(self.threads) < self.max_workers:
+            thread = threading.Thread(
+                target=self._run_loop,
+                daemon=True,
+                name=f"memori-embeddings-{len(self.threads)}",
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def _run_loop(self) -> None:
+        while True:
+            queue = self.queue
+            if queue is None:
+                return
+            _priority, _sequence, future, fn = queue.get()
+            self._admit_waiters()
+            try:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn())
+                except BaseException as e:  # noqa: BLE001
+                    future.set_exception(e)
+            finally:
+                queue.task_done()
+
+    def _item(
+        self, fn: Callable[[], Any], priority: int
+    ) -> tuple[int, int, Future, Callable[[], Any]]:
+        return (priority, next(self._sequence), Future(), fn)
+
+    def _enqueue(self, item: tuple, notify: Callable[[], None] | None) -> bool:
+        """Queue item if a slot is free and no better caller is waiting.
+
+        Otherwise register notify (when given) to be called once item has
+        been queued by _admit_waiters, and return False.
+        """
+        with self._admission:
+            if (
+                not self._waiters or self._waiters[0][0] > item[0]
+            ) and not self.queue.full():
+                self.queue.put_nowait(item)
+                return True
+            if notify is not None:
+                heapq.heappush(self._waiters, (item[0], item[1], item, notify))
+            return False
+
+    def _withdraw(self, item: tuple) -> bool:
+        """Drop a waiting item; False if it was already queued."""
+        with self._admission:
+            for i, waiter in enumerate(self._waiters):
+                if waiter[2] is item:
+                    self._waiters.pop(i)
+                    heapq.heapify(self._waiters)
+                    return True
+        return False
+
+    def _admit_waiters(self) -> None:
+        with self._admission:
+            while self._waiters and not self.queue.full():
+                _priority, _sequence, item, notify = heapq.heappop(self._waiters)
+                self.queue.put_nowait(item)
+                notify()
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        *,
+        priority: int = PRIORITY_QUERY,
+        timeout: float | None = None,
+    ) -> Future:
+        """Queue fn, blocking while the queue is full."""
+        self.ensure_started()
+        item = self._item(fn, priority)
+        admitted = threading.Event()
+        if not self._enqueue(item, admitted.set):
+            if not admitted.wait(timeout) and self._withdraw(item):
+                raise queue_module.Full
+        return item[2]
+
+    def try_submit(
+        self, fn: Callable[[], Any], *, priority: int = PRIORITY_QUERY
+    ) -> Future | None:
+        """Queue fn, or return None immediately if the queue is full."""
+        self.ensure_started()
+        item = self._item(fn, priority)
+        if not self._enqueue(item, None):
+            return None
+        return item[2]
+
+    async def run(self, fn: Callable[[], Any], *, priority: int = PRIORITY_QUERY):
+        """Run fn on the executor without blocking the calling event loop."""
+        self.ensure_started()
+        item = self._item(fn, priority)
+        loop = asyncio.get_running_loop()
+        admitted = loop.create_future()
+
+        def _notify() -> None:
+            try:
+                loop.call_soon_threadsafe(
+                    lambda: admitted.done() or admitted.set_result(None)
+                )
+            except RuntimeError:
+                # The loop closed while waiting; the queued future is unused.
+                item[2].cancel()
+
+        if not self._enqueue(item, _notify):
+            try:
+                await admitted
+            except asyncio.CancelledError:
+                if not self._withdraw(item):
+                    item[2].cancel()
+                raise
+        return await asyncio.wrap_future(item[2])
+
+
+_executor = EmbeddingExecutor()
+
+
+def get_embedding_executor() -> EmbeddingExecutor:
+    return _executor
@@ -14,8 +14,36 @@ import json
 import struct
 from typing import Any
 
+import numpy as np
+
+# DB-API drivers for these dialects bind any buffer object as a BLOB/bytea, so
+# array rows can be passed without copying into a bytes object.
+_BUFFER_DIALECTS = {"sqlite", "postgresql", "cockroachdb"}
+
+
+def _format_array_for_db(embedding: np.ndarray, dialect: str) -> Any:
+    if dialect == "oceanbase":
+        return format_embedding_for_db(embedding.tolist(), dialect)
+
+    vector = np.ascontiguousarray(embedding, dtype="<f4").reshape(-1)
+    if dialect in _BUFFER_DIALECTS:
+        return memoryview(vector).cast("B")
+
+    binary_data = vector.tobytes()
+    if dialect == "mongodb":
+        try:
+            import bson
+
+            return bson.Binary(binary_data)
+        except ImportError:
+            return binary_data
+    return binary_data
+
+
+def format_embedding_for_db(embedding: list[float] | np.ndarray, dialect: str) -> Any:
+    if isinstance(embedding, np.ndarray):
+        return _format_array_for_db(embedding, dialect)
 
-def format_embedding_for_db(embedding: list[float], dialect: str) -> Any:
     binary_data = struct.pack(f"<{len(embedding)}f", *embedding)
 
     if dialect == "mongodb":
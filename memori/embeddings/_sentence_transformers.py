@@ -13,6 +13,7 @@ from __future__ import annotations
 import logging
 import os
 import threading
+from collections.abc import Mapping
 from typing import Any
 
 os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
@@ -23,10 +24,15 @@ from huggingface_hub.utils import disable_progress_bars
 from sentence_transformers import SentenceTransformer
 from transformers.utils import logging as transformers_logging
 
-from memori.embeddings._utils import embedding_dimension, zero_vectors
+from memori.embeddings._utils import embedding_dimension
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on padded tokens (batch size x longest sequence) per forward pass
+# when inputs are bucketed by token length.
+_BUCKET_TOKEN_BUDGET = 8192
+_BUCKET_MAX_BATCH_SIZE = 256
+
 
 def _configure_huggingface_logging() -> None:
     # Suppress noisy model-loading warnings and progress output.
@@ -61,29 +67,29 @@ class SentenceTransformersEmbedder:
 
     def _encode_batch(
         self, encoder: SentenceTransformer, inputs: list[str]
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         with self._encode_lock:
             embeddings = encoder.encode(
                 inputs, convert_to_numpy=True, normalize_embeddings=True
             )
-        return embeddings.tolist()
+        return np.asarray(embeddings, dtype=np.float32)
 
     def _encode_one_by_one(
         self, encoder: SentenceTransformer, inputs: list[str]
-    ) -> list[list[float]]:
-        vectors: list[list[float]] = []
+    ) -> np.ndarray:
+        vectors: list[np.ndarray] = []
         with self._encode_lock:
             for text in inputs:
                 single = encoder.encode(
                     [text], convert_to_numpy=True, normalize_embeddings=True
                 )
-                vectors.append(single[0].tolist())
+                vectors.append(np.asarray(single[0], dtype=np.float32))
 
-        dim_set = {len(v) for v in vectors}
+        dim_set = {v.shape for v in vectors}
         if len(dim_set) != 1:
             raise ValueError("all input arrays must have the same shape")
 
-        return vectors
+        return np.stack(vectors)
 
     def _chunk_size_tokens(self, encoder: SentenceTransformer) -> int | None:
         def _as_int(value: object) -> int | None:
@@ -123,66 +129,168 @@ class SentenceTransformersEmbedder:
     def _tokenizer(self, encoder: SentenceTransformer) -> Any | None:
         return getattr(encoder, "tokenizer", None)
 
-    def _chunk_text(
-        self, *, encoder: SentenceTransformer, text: str, chunk_size_tokens: int
-    ) -> list[str]:
-        tokenizer = self._tokenizer(encoder)
-        if tokenizer is None:
-            return [text]
+    def _token_ids(self, tokenizer: Any, texts: list[str]) -> list[list[int] | None]:
+        kwargs = {
+            "add_special_tokens": False,
+            "return_attention_mask": False,
+            "return_token_type_ids": False,
+        }
 
         try:
-            encoded = tokenizer(
-                text,
-                add_special_tokens=False,
-                return_attention_mask=False,
-                return_token_type_ids=False,
-            )
-            ids = encoded.get("input_ids") if isinstance(encoded, dict) else None
-            if not isinstance(ids, list):
-                return [text]
+            encoded = tokenizer(texts, **kwargs)
+            batch = encoded.get("input_ids") if isinstance(encoded, Mapping) else None
+            if (
+                isinstance(batch, list)
+                and len(batch) == len(texts)
+                and all(isinstance(ids, list) for ids in batch)
+            ):
+                return batch
         except Exception:
-            return [text]
-
-        if len(ids) <= chunk_size_tokens:
-            return [text]
-
-        chunks: list[str] = []
-        for i in range(0, len(ids), chunk_size_tokens):
-            chunk_ids = ids[i : i + chunk_size_tokens]
-            chunk_text = tokenizer.decode(
-                chunk_ids,
-                skip_special_tokens=True,
-                clean_up_tokenization_spaces=True,
-            )
-            if chunk_text:
-                chunks.append(chunk_text)
-
-        return chunks or [text]
+            pass
 
-    def _mean_pool_and_normalize(self, vectors: np.ndarray) -> np.ndarray:
-        mean_vec = vectors.mean(axis=0)
-        norm = float(np.linalg.norm(mean_vec))
-        if norm > 0.0:
-            mean_vec = mean_vec / norm
-        return mean_vec
+        # Tokenizers without a usable batch API are called one text at a time.
+        out: list[list[int] | None] = []
+        for text in texts:
+            try:
+                encoded = tokenizer(text, **kwargs)
+                ids = encoded.get("input_ids") if isinstance(encoded, Mapping) else None
+            except Exception:
+                ids = None
+            out.append(ids if isinstance(ids, list) else None)
+        return out
 
-    def _encode_chunks(
+    def _chunk_texts(
         self,
         *,
         encoder: SentenceTransformer,
-        chunks: list[str],
-    ) -> list[float]:
-        if len(chunks) == 1:
-            return self._encode_batch(encoder, chunks)[0]
+        texts: list[str],
+        chunk_size_tokens: int,
+    ) -> list[tuple[list[str], list[int | None]]]:
+        """
+        Split each text into chunks of at most chunk_size_tokens tokens.
+
+        Returns, per text, its chunks and the token length of each chunk (None
+        when the text could not be tokenized).
+        """
+        tokenizer = self._tokenizer(encoder)
+        if tokenizer is None:
+            return [([text], [None]) for text in texts]
+
+        out: list[tuple[list[str], list[int | None]]] = []
+        for text, ids in zip(texts, self._token_ids(tokenizer, texts), strict=True):
+            if ids is None:
+                out.append(([text], [None]))
+                continue
+            if len(ids) <= chunk_size_tokens:
+                out.append(([text], [len(ids)]))
+                continue
+
+            chunks: list[str] = []
+            lengths: list[int | None] = []
+            for i in range(0, len(ids), chunk_size_tokens):
+                chunk_ids = ids[i : i + chunk_size_tokens]
+                chunk_text = tokenizer.decode(
+                    chunk_ids,
+                    skip_special_tokens=True,
+                    clean_up_tokenization_spaces=True,
+                )
+                if chunk_text:
+                    chunks.append(chunk_text)
+                    lengths.append(len(chunk_ids))
 
-        with self._encode_lock:
-            chunk_vectors = encoder.encode(
-                chunks, convert_to_numpy=True, normalize_embeddings=True
+            if chunks:
+                out.append((chunks, lengths))
+            else:
+                out.append(([text], [min(len(ids), chunk_size_tokens)]))
+
+        return out
+
+    def _length_buckets(self, lengths: list[int]) -> list[list[int]]:
+        """
+        Group input positions into batches of similar token length.
+
+        Positions are sorted by length and greedily packed so that each batch
+        stays within the padded token budget; short inputs therefore run in
+        large batches and long inputs in small ones.
+        """
+        buckets: list[list[int]] = []
+        current: list[int] = []
+        for pos in sorted(range(len(lengths)), key=lengths.__getitem__):
+            # Sorted ascending, so the candidate is the longest in the batch.
+            padded = (len(current) + 1) * max(1, lengths[pos])
+            if current and (
+                padded > _BUCKET_TOKEN_BUDGET or len(current) >= _BUCKET_MAX_BATCH_SIZE
+            ):
+                buckets.append(current)
+                current = []
+            current.append(pos)
+        if current:
+            buckets.append(current)
+        return buckets
+
+    def _encode_bucketed(
+        self,
+        encoder: SentenceTransformer,
+        inputs: list[str],
+        lengths: list[int],
+    ) -> np.ndarray:
+        out: np.ndarray | None = None
+        buckets = self._length_buckets(lengths)
+
+        # The lock is taken per bucket so a query embedding can run between
+        # buckets of a large augmentation batch.
+        for bucket in buckets:
+            with self._encode_lock:
+                embeddings = np.asarray(
+                    encoder.encode(
+                        [inputs[pos] for pos in bucket],
+                        batch_size=len(bucket),
+                        convert_to_numpy=True,
+                        normalize_embeddings=True,
+                    ),
+                    dtype=np.float32,
+                )
+            if embeddings.ndim != 2 or embeddings.shape[0] != len(bucket):
+                raise ValueError("all input arrays must have the same shape")
+            if out is None:
+                out = np.empty((len(inputs), embeddings.shape[1]), np.float32)
+            elif embeddings.shape[1] != out.shape[1]:
+                raise ValueError("all input arrays must have the same shape")
+            out[bucket] = embeddings
+
+        if logger.isEnabledFor(logging.DEBUG):
+            real_tokens = sum(lengths)
+            padded_tokens = sum(
+                len(bucket) * max(lengths[pos] for pos in bucket) for bucket in buckets
             )
-        pooled = self._mean_pool_and_normalize(
-            np.asarray(chunk_vectors, dtype=np.float32)
-        )
-        return pooled.tolist()
+            logger.debug(
+                "Bucketed encode - inputs: %d, batches: %d, tokens: %d, "
+                "padded tokens: %d, padding efficiency: %.2f",
+                len(inputs),
+                len(buckets),
+                real_tokens,
+                padded_tokens,
+                real_tokens / padded_tokens if padded_tokens else 1.0,
+            )
+
+        return out if out is not None else np.empty((0, 0), np.float32)
+
+    def _pool_segments(self, vectors: np.ndarray, counts: list[int]) -> np.ndarray:
+        """
+        Mean-pool consecutive rows of vectors into one row per source text.
+
+        Rows built from more than one chunk are re-normalized to unit length;
+        single-chunk rows are returned as encoded.
+        """
+        if all(count == 1 for count in counts):
+            return vectors
+
+        sizes = np.asarray(counts)
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        pooled = np.add.reduceat(vectors, starts, axis=0) / sizes[:, None]
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        scale = np.where((sizes[:, None] > 1) & (norms > 0.0), norms, 1.0)
+        return (pooled / scale).astype(vectors.dtype, copy=False)
 
     def _encode_inputs(
         self,
@@ -190,37 +298,29 @@ class SentenceTransformersEmbedder:
         encoder: SentenceTransformer,
         inputs: list[str],
         chunk_size_tokens: int | None,
-    ) -> list[list[float]]:
-        if not inputs:
-            return []
+    ) -> np.ndarray:
         if chunk_size_tokens is None:
             return self._encode_batch(encoder, inputs)
 
-        short_inputs: list[str] = []
-        short_positions: list[int] = []
-        long_items: list[tuple[int, list[str]]] = []
-
-        for idx, text in enumerate(inputs):
-            chunks = self._chunk_text(
-                encoder=encoder, text=text, chunk_size_tokens=chunk_size_tokens
-            )
-            if len(chunks) == 1:
-                short_inputs.append(text)
-                short_positions.append(idx)
-            else:
-                long_items.append((idx, chunks))
-
-        out: list[list[float]] = [[] for _ in inputs]
-
-        if short_inputs:
-            short_vecs = self._encode_batch(encoder, short_inputs)
-            for pos, vec in zip(short_positions, short_vecs, strict=False):
-                out[pos] = vec
-
-        for pos, chunks in long_items:
-            out[pos] = self._encode_chunks(encoder=encoder, chunks=chunks)
-
-        return out
+        # Every chunk of every input is encoded together, then reduced back to
+        # one vector per input.
+        segments: list[str] = []
+        lengths: list[int | None] = []
+        counts: list[int] = []
+        for chunks, chunk_lengths in self._chunk_texts(
+            encoder=encoder, texts=inputs, chunk_size_tokens=chunk_size_tokens
+        ):
+            segments.extend(chunks)
+            lengths.extend(chunk_lengths)
+            counts.append(len(chunks))
+
+        known_lengths = [n for n in lengths if n is not None]
+        if len(known_lengths) == len(lengths):
+            vectors = self._encode_bucketed(encoder, segments, known_lengths)
+        else:
+            vectors = self._encode_batch(encoder, segments)
+
+        return self._pool_segments(vectors, counts)
 
     def _zero_result(
         self,
@@ -228,7 +328,7 @@ class SentenceTransformersEmbedder:
         count: int,
         fallback_dimension: int,
         encoder: SentenceTransformer | None,
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         dim = (
             embedding_dimension(encoder, default=fallback_dimension)
             if encoder is not None
@@ -239,11 +339,15 @@ class SentenceTransformersEmbedder:
             self._model_name,
             dim,
         )
-        return zero_vectors(count, dim)
+        return np.zeros((count, dim), dtype=np.float32)
 
     def embed(self, inputs: list[str], *, fallback_dimension: int) -> list[list[float]]:
+        return self.embed_array(inputs, fallback_dimension=fallback_dimension).tolist()
+
+    def embed_array(self, inputs: list[str], *, fallback_dimension: int) -> np.ndarray:
+        """Embed inputs into a float32 array of shape (len(inputs), dimension)."""
         if not inputs:
-            return []
+            return np.empty((0, fallback_dimension), dtype=np.float32)
 
         logger.debug(
             "Generating embedding using model: %s for %d text(s)",
@@ -253,7 +357,7 @@ class SentenceTransformersEmbedder:
 
         encoder = self._load_encoder(fallback_dimension=fallback_dimension)
         if encoder is None:
-            return zero_vectors(len(inputs), fallback_dimension)
+            return np.zeros((len(inputs), fallback_dimension), dtype=np.float32)
 
         try:
             result = self._encode_inputs(
@@ -261,12 +365,11 @@ class SentenceTransformersEmbedder:
                 inputs=inputs,
                 chunk_size_tokens=self._chunk_size_tokens(encoder),
             )
-            if result:
-                logger.debug(
-                    "Embedding generated - dimension: %d, count: %d",
-                    len(result[0]),
-                    len(result),
-                )
+            logger.debug(
+                "Embedding generated - dimension: %d, count: %d",
+                result.shape[1],
+                result.shape[0],
+            )
             return result
         except ValueError as e:
             if "same shape" not in str(e):
@@ -274,12 +377,11 @@ class SentenceTransformersEmbedder:
 
             try:
                 vectors = self._encode_one_by_one(encoder, inputs)
-                if vectors:
-                    logger.debug(
-                        "Embedding generated (one-by-one) - dimension: %d, count: %d",
-                        len(vectors[0]),
-                        len(vectors),
-                    )
+                logger.debug(
+                    "Embedding generated (one-by-one) - dimension: %d, count: %d",
+                    vectors.shape[1],
+                    vectors.shape[0],
+                )
                 return vectors
             except Exception:
                 return self._zero_result(
@@ -26,7 +26,3 @@ def embedding_dimension(model: Any, default: int) -> int:
         return int(dim_value) if dim_value is not None else default
     except (RuntimeError, ValueError, AttributeError, TypeError):
         return default
-
-
-def zero_vectors(count: int, dim: int) -> list[list[float]]:
-    return [[0.0] * dim for _ in range(count)]
@@ -0,0 +1,75 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingsWarmup:
+    """
+    Load and exercise an embedding model once on a background thread.
+
+    The first embedding otherwise pays for importing torch/transformers and
+    loading the model inline with a recall or augmentation.
+    """
+
+    def __init__(self, model: str) -> None:
+        self._model = model
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _run(self) -> None:
+        try:
+            from memori.embeddings._api import _embed_texts
+
+            _embed_texts("warmup", self._model)
+            logger.debug("Embedding model warm-up complete: %s", self._model)
+        except Exception:  # noqa: BLE001
+            logger.debug(
+                "Embedding model warm-up failed: %s", self._model, exc_info=True
+            )
+        finally:
+            self._done.set()
+
+    def start(self) -> EmbeddingsWarmup:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="memori-embeddings-warmup",
+                    daemon=True,
+                )
+                self._thread.start()
+        return self
+
+    def is_ready(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+
+_WARMUP_CACHE: dict[str, EmbeddingsWarmup] = {}
+_WARMUP_CACHE_LOCK = threading.Lock()
+
+
+def warmup_embeddings(model: str) -> EmbeddingsWarmup:
+    """Start (at most once per process and model) a background warm-up."""
+    with _WARMUP_CACHE_LOCK:
+        warmup = _WARMUP_CACHE.get(model)
+        if warmup is None:
+            warmup = EmbeddingsWarmup(model)
+            _WARMUP_CACHE[model] = warmup
+    return warmup.start()
@@ -84,6 +84,14 @@ class BaseClient:
         )
 
 
+async def run_storage(config: Config, fn, *args):
+    """Run storage work from an async path; off the event loop for async storage."""
+    storage = config.storage
+    if storage is None or getattr(storage, "is_async", False) is not True:
+        return fn(*args)
+    return await storage.run(fn, *args)
+
+
 class BaseInvoke:
     def __init__(self, config: Config, method):
         self.config = config
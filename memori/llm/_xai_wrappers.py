@@ -16,7 +16,9 @@ from typing import cast
 
 from google.protobuf import json_format
 
+from memori.llm._base import run_storage
 from memori.llm._constants import XAI_LLM_PROVIDER
+from memori.memory._history import read_history
 from memori.memory.augmentation._message import ConversationMessage
 
 
@@ -95,9 +97,7 @@ class XAiWrappers:
             if not self._ensure_cached_conversation_id():
                 return kwargs
 
-        messages = self.config.storage.driver.conversation.messages.read(
-            self.config.cache.conversation_id
-        )
+        messages = read_history(self.config, self.config.cache.conversation_id)
         if len(messages) == 0:
             return kwargs
 
@@ -207,7 +207,7 @@ class XAiWrappers:
             payload = self._build_payload(
                 query_formatted, response_json, client_version, start
             )
-            MemoryManager(self.config).execute(payload)
+            await run_storage(self.config, MemoryManager(self.config).execute, payload)
 
             if self.config.augmentation is not None:
                 from memori.memory.augmentation.input import AugmentationInput
@@ -270,7 +270,9 @@ class XAiWrappers:
                 payload = self._build_payload(
                     query_formatted, response_json, client_version, start
                 )
-                MemoryManager(self.config).execute(payload)
+                await run_storage(
+                    self.config, MemoryManager(self.config).execute, payload
+                )
 
                 if self.config.augmentation is not None:
                     from memori.memory.augmentation.input import AugmentationInput
@@ -8,7 +8,7 @@ from grpc.experimental.aio import UnaryStreamCall
 
 from memori._logging import truncate
 from memori._utils import merge_chunk
-from memori.llm._base import BaseInvoke
+from memori.llm._base import BaseInvoke, run_storage
 from memori.llm._utils import client_is_bedrock
 from memori.llm.invoke.iterable import Iterable as MemoriIterable
 from memori.llm.invoke.iterator import AsyncIterator as MemoriAsyncIterator
@@ -21,6 +21,10 @@ from memori.llm.pipelines.recall_injection import inject_recalled_facts
 logger = logging.getLogger(__name__)
 
 
+def _inject(invoke, kwargs):
+    return inject_conversation_messages(invoke, inject_recalled_facts(invoke, kwargs))
+
+
 class Invoke(BaseInvoke):
     def invoke(self, **kwargs):
         start = time.time()
@@ -69,9 +73,8 @@ class InvokeAsync(BaseInvoke):
     async def invoke(self, **kwargs):
         start = time.time()
 
-        kwargs = inject_conversation_messages(
-            self,
-            inject_recalled_facts(self, self.configure_for_streaming_usage(kwargs)),
+        kwargs = await run_storage(
+            self.config, _inject, self, self.configure_for_streaming_usage(kwargs)
         )
 
         logger.debug(
@@ -91,7 +94,9 @@ class InvokeAsync(BaseInvoke):
                 .configure_request(kwargs, start)
             )
         else:
-            handle_post_response(self, kwargs, start, raw_response)
+            await run_storage(
+                self.config, handle_post_response, self, kwargs, start, raw_response
+            )
             return raw_response
 
 
@@ -99,9 +104,8 @@ class InvokeAsyncIterator(BaseInvoke):
     async def invoke(self, **kwargs):
         start = time.time()
 
-        kwargs = inject_conversation_messages(
-            self,
-            inject_recalled_facts(self, self.configure_for_streaming_usage(kwargs)),
+        kwargs = await run_storage(
+            self.config, _inject, self, self.configure_for_streaming_usage(kwargs)
         )
 
         raw_response = await self._method(**kwargs)
@@ -116,7 +120,9 @@ class InvokeAsyncIterator(BaseInvoke):
                 .configure_request(kwargs, start)
             )
         else:
-            handle_post_response(self, kwargs, start, raw_response)
+            await run_storage(
+                self.config, handle_post_response, self, kwargs, start, raw_response
+            )
             return raw_response
 
 
@@ -124,9 +130,8 @@ class InvokeAsyncStream(BaseInvoke):
     async def invoke(self, **kwargs):
         start = time.time()
 
-        kwargs = inject_conversation_messages(
-            self,
-            inject_recalled_facts(self, self.configure_for_streaming_usage(kwargs)),
+        kwargs = await run_storage(
+            self.config, _inject, self, self.configure_for_streaming_usage(kwargs)
         )
 
         stream = await self._method(**kwargs)
@@ -136,19 +141,22 @@ class InvokeAsyncStream(BaseInvoke):
             raw_response = merge_chunk(raw_response, chunk.__dict__)
             yield chunk
 
-        handle_post_response(self, kwargs, start, raw_response)
+        await run_storage(
+            self.config, handle_post_response, self, kwargs, start, raw_response
+        )
 
 
 class InvokeStream(BaseInvoke):
     async def invoke(self, **kwargs):
         start = time.time()
 
-        kwargs = inject_conversation_messages(
-            self,
-            inject_recalled_facts(self, self.configure_for_streaming_usage(kwargs)),
+        kwargs = await run_storage(
+            self.config, _inject, self, self.configure_for_streaming_usage(kwargs)
         )
 
         raw_response = await self._method(**kwargs)
 
-        handle_post_response(self, kwargs, start, raw_response)
+        await run_storage(
+            self.config, handle_post_response, self, kwargs, start, raw_response
+        )
         return raw_response
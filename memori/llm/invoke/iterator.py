@@ -1,6 +1,6 @@
 import time
 
-from memori.llm._base import BaseIterator
+from memori.llm._base import BaseIterator, run_storage
 from memori.llm.helpers.serialization import format_kwargs, format_response
 from memori.llm.pipelines.post_invoke import format_payload
 from memori.memory._manager import Manager as MemoryManager
@@ -22,7 +22,9 @@ class AsyncIterator(BaseIterator):
 
             return chunk
         except StopAsyncIteration:
-            MemoryManager(self.config).execute(
+            await run_storage(
+                self.config,
+                MemoryManager(self.config).execute,
                 format_payload(
                     self.invoke,
                     self.config.framework.provider,
@@ -39,7 +41,7 @@ class AsyncIterator(BaseIterator):
                     format_response(
                         self.raw_response, uses_protobuf=self.invoke._uses_protobuf
                     ),
-                )
+                ),
             )
             raise
 
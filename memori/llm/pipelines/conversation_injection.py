@@ -14,6 +14,7 @@ from memori.llm._utils import (
     llm_is_openai,
     llm_is_xai,
 )
+from memori.memory._history import read_history
 
 logger = logging.getLogger(__name__)
 
@@ -163,9 +164,7 @@ def inject_conversation_messages(invoke, kwargs: dict) -> dict:
             ):
                 return kwargs
 
-    messages = invoke.config.storage.driver.conversation.messages.read(
-        invoke.config.cache.conversation_id
-    )
+    messages = read_history(invoke.config, invoke.config.cache.conversation_id)
     if not messages:
         return kwargs
 
@@ -0,0 +1,248 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from memori.storage._id_cache import get_id_cache
+
+# Messages fetched by the first read of a token-budgeted window. Each further
+# read doubles it until the budget is spent or the history is exhausted.
+HISTORY_PAGE_SIZE = 32
+
+HISTORY_CACHE_SIZE = 1000
+HISTORY_CACHE_MAX_MESSAGES = 1000
+
+
+class _Entry:
+    __slots__ = ("complete", "messages", "touched_at")
+
+    def __init__(self, messages: list[dict], complete: bool) -> None:
+        self.messages = messages
+        self.complete = complete
+        self.touched_at = time.monotonic()
+
+
+class HistoryCache:
+    """Process-wide LRU of the newest messages of recent conversations.
+
+    Keys are (connection identity, conversation id), as in the id cache. An
+    entry holds the newest messages oldest first and whether they are the
+    whole conversation. Writer appends each committed turn, so the next
+    injection does not re-read rows this process just wrote.
+    """
+
+    def __init__(
+        self,
+        max_size: int = HISTORY_CACHE_SIZE,
+        max_messages: int = HISTORY_CACHE_MAX_MESSAGES,
+    ) -> None:
+        self.max_size = max_size
+        self.max_messages = max_messages
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        # Reentrant for the same reason as IdCache: forget() runs from
+        # weakref finalizers.
+        self._lock = threading.RLock()
+
+    def get(
+        self, identity: int | None, conversation_id: Any, ttl_seconds: float
+    ) -> tuple[list[dict], bool] | None:
+        if identity is None:
+            return None
+
+        key = (identity, conversation_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.touched_at >= ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(entry.messages), entry.complete
+
+    def put(
+        self,
+        identity: int | None,
+        conversation_id: Any,
+        messages: list[dict],
+        complete: bool,
+    ) -> None:
+        if identity is None:
+            return
+
+        entry = _Entry(list(messages), complete)
+        self._trim(entry)
+        key = (identity, conversation_id)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def append(
+        self, identity: int | None, conversation_id: Any, messages: list[dict]
+    ) -> None:
+        """Add committed messages to a cached conversation; misses are ignored."""
+        if identity is None:
+            return
+
+        with self._lock:
+            entry = self._entries.get((identity, conversation_id))
+            if entry is None:
+                return
+            entry.messages.extend(messages)
+            entry.touched_at = time.monotonic()
+            self._trim(entry)
+
+    def forget(self, identity: int) -> None:
+        with self._lock:
+            for key in [key for key in list(self._entries) if key[0] == identity]:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _trim(self, entry: _Entry) -> None:
+        if len(entry.messages) > self.max_messages:
+            del entry.messages[: len(entry.messages) - self.max_messages]
+            entry.complete = False
+
+
+_history_cache = HistoryCache()
+get_id_cache().on_forget(_history_cache.forget)
+
+
+def get_history_cache() -> HistoryCache:
+    return _history_cache
+
+
+def estimate_tokens(message: dict) -> int:
+    """Rough token count for a message: ~4 characters per token plus overhead."""
+    return len(str(message.get("content") or "")) // 4 + 4
+
+
+def _fit_budget(
+    messages: list[dict], max_tokens: int, count_tokens: Callable[[dict], int]
+) -> list[dict]:
+    used = 0
+    start = len(messages)
+    while start > 0:
+        used += count_tokens(messages[start - 1])
+        if used > max_tokens:
+            break
+        start -= 1
+    return messages[start:]
+
+
+def _drop_leading_replies(messages: list[dict]) -> list[dict]:
+    # A cut window must not open on an assistant turn; several providers
+    # reject a history that does not start with a user message.
+    for i, message in enumerate(messages):
+        if message.get("role") == "user":
+            return messages[i:]
+    return []
+
+
+def _window(messages: list[dict], history: Any) -> tuple[list[dict], bool]:
+    """Apply the history limits to messages (oldest first).
+
+    Returns the window and whether a limit bound it, in which case older
+    messages than the ones given could not have been part of it.
+    """
+    max_messages = history.max_messages or None
+    max_tokens = history.max_tokens or None
+
+    window = messages
+    bounded = False
+    if max_messages is not None and len(window) >= max_messages:
+        window = window[-max_messages:]
+        bounded = True
+    if max_tokens is not None:
+        count_tokens = history.token_counter or estimate_tokens
+        fitted = _fit_budget(window, max_tokens, count_tokens)
+        bounded = bounded or len(fitted) < len(window)
+        window = fitted
+
+    if bounded:
+        return _drop_leading_replies(window), True
+    return window, False
+
+
+def _read(
+    messages_driver: Any, conversation_id: int, history: Any
+) -> tuple[list[dict], bool]:
+    """Read the newest messages the window needs; (messages, complete)."""
+    max_messages = history.max_messages or None
+    max_tokens = history.max_tokens or None
+
+    if max_messages is None and max_tokens is None:
+        return messages_driver.read(conversation_id), True
+
+    if max_tokens is None:
+        messages = messages_driver.read(conversation_id, limit=max_messages)
+        return messages, len(messages) < max_messages
+
+    count_tokens = history.token_counter or estimate_tokens
+    page = min(HISTORY_PAGE_SIZE, max_messages or HISTORY_PAGE_SIZE)
+    while True:
+        messages = messages_driver.read(conversation_id, limit=page)
+        if len(messages) < page:
+            return messages, True
+        if page == max_messages or len(
+            _fit_budget(messages, max_tokens, count_tokens)
+        ) < len(messages):
+            return messages, False
+        page = page * 2 if max_messages is None else min(page * 2, max_messages)
+
+
+def read_history(config: Any, conversation_id: int) -> list[dict]:
+    """Read the conversation history to inject, windowed by config.history.
+
+    history.max_messages keeps the most recent N messages and
+    history.max_tokens keeps the most recent messages that fit the budget,
+    counted with history.token_counter (estimate_tokens by default). Both
+    are pushed down to the driver as a newest-first LIMIT; 0 disables them.
+    With history.cache, recent conversations are served from HistoryCache
+    until they have been idle for session_timeout_minutes.
+    """
+    identity = None
+    if config.history.cache:
+        identity = getattr(config.storage.adapter, "identity", None)
+        cached = get_history_cache().get(
+            identity, conversation_id, config.session_timeout_minutes * 60
+        )
+        if cached is not None:
+            messages, complete = cached
+            window, bounded = _window(messages, config.history)
+            if complete or bounded:
+                return window
+
+    driver = config.storage.reader(conversation_id)
+    try:
+        messages, complete = _read(
+            driver.conversation.messages, conversation_id, config.history
+        )
+    finally:
+        config.storage.end_read(driver)
+    get_history_cache().put(identity, conversation_id, messages, complete)
+    return _window(messages, config.history)[0]
+
+
+def append_history(config: Any, conversation_id: int, messages: list[dict]) -> None:
+    if not config.history.cache:
+        return
+    get_history_cache().append(
+        getattr(config.storage.adapter, "identity", None), conversation_id, messages
+    )
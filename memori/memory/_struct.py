@@ -8,6 +8,8 @@ r"""
                        memorilabs.ai
 """
 
+from collections.abc import Sequence
+
 
 def build_fact_text_from_triple_entry(entry: dict) -> str | None:
     content = entry.get("content")
@@ -43,7 +45,8 @@ class Conversation:
 class Entity:
     def __init__(self):
         self.facts: list[str] = []
-        self.fact_embeddings: list[list[float]] = []
+        # Lists of floats, or float32 NumPy rows on the augmentation path.
+        self.fact_embeddings: list[Sequence[float]] = []
         self.semantic_triples: list[SemanticTriple] = []
 
     def configure_from_advanced_augmentation(self, json_: dict) -> "Entity":
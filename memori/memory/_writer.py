@@ -12,6 +12,7 @@ import logging
 import time
 
 from memori._config import Config
+from memori.memory._history import append_history
 
 try:
     from sqlalchemy.exc import OperationalError
@@ -97,13 +98,17 @@ class Writer:
             self.config.session_timeout_minutes,
         )
 
-        for message in payload.get("messages", []):
-            self.config.storage.driver.conversation.message.create(
-                self.config.cache.conversation_id,
-                message["role"],
-                message["type"],
-                message["text"],
-            )
+        messages = [
+            {
+                "role": message["role"],
+                "type": message["type"],
+                "content": message["text"],
+            }
+            for message in payload.get("messages", [])
+        ]
+        self.config.storage.driver.conversation.messages.create_many(
+            self.config.cache.conversation_id, messages
+        )
 
         if self.config.storage is not None and self.config.storage.adapter is not None:
             self.config.storage.adapter.flush()
@@ -112,3 +117,12 @@ class Writer:
                 "Transaction committed - conversation_id: %s",
                 self.config.cache.conversation_id,
             )
+            self.config.storage.mark_written(self.config.cache.conversation_id)
+            append_history(
+                self.config,
+                self.config.cache.conversation_id,
+                [
+                    {"content": message["content"], "role": message["role"]}
+                    for message in messages
+                ],
+            )
@@ -12,7 +12,7 @@ import logging
 from dataclasses import asdict, is_dataclass
 
 from memori._network import Api
-from memori.embeddings import embed_texts
+from memori.embeddings._api import embed_texts_array
 from memori.memory._struct import Memories, build_fact_text_from_triple_entry
 from memori.memory.augmentation._base import AugmentationContext, BaseAugmentation
 from memori.memory.augmentation._models import (
@@ -193,12 +193,13 @@ class AdvancedAugmentation(BaseAugmentation):
 
         if facts:
             embeddings_config = self.config.embeddings
-            fact_embeddings = await embed_texts(
+            fact_embeddings = await embed_texts_array(
                 facts,
                 model=embeddings_config.model,
                 async_=True,
             )
-            api_response["entity"]["fact_embeddings"] = fact_embeddings
+            # Rows stay float32 array views down to format_embedding_for_db.
+            api_response["entity"]["fact_embeddings"] = list(fact_embeddings)
 
         return Memories().configure_from_advanced_augmentation(api_response)
 
@@ -225,15 +226,15 @@ class AdvancedAugmentation(BaseAugmentation):
 
             if facts_from_triples:
                 embeddings_config = self.config.embeddings
-                embeddings_from_triples = await embed_texts(
+                embeddings_from_triples = await embed_texts_array(
                     facts_from_triples,
                     model=embeddings_config.model,
                     async_=True,
                 )
                 facts_to_write = (facts_to_write or []) + facts_from_triples
-                embeddings_to_write = (
-                    embeddings_to_write or []
-                ) + embeddings_from_triples
+                embeddings_to_write = (embeddings_to_write or []) + list(
+                    embeddings_from_triples
+                )
 
         if facts_to_write and embeddings_to_write:
             ctx.add_write(
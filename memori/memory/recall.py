@@ -11,12 +11,14 @@ r"""
 import logging
 import time
 from collections.abc import Mapping
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any, TypedDict, TypeGuard, cast
 
 from memori._config import Config
 from memori._logging import truncate
 from memori._network import Api
 from memori.embeddings import embed_texts
+from memori.embeddings._executor import PRIORITY_QUERY, get_embedding_executor
 from memori.search import search_facts as search_facts_api
 from memori.search._types import FactSearchResult
 
@@ -213,28 +215,54 @@ class Recall:
     def _embed_query(self, query: str) -> list[float]:
         logger.debug("Generating query embedding")
         embeddings_config = self.config.embeddings
-        return embed_texts(
-            query,
-            model=embeddings_config.model,
-        )[0]
+        # Runs on the embedding executor so the query is dequeued ahead of
+        # any fact batches queued by augmentation.
+        future = get_embedding_executor().submit(
+            lambda: embed_texts(query, model=embeddings_config.model),
+            priority=PRIORITY_QUERY,
+        )
+        return future.result()[0]
 
     def _search_with_retries(
         self, *, entity_id: int, query: str, query_embedding: list[float], limit: int
     ) -> list[FactSearchResult]:
+        storage_config = self.config.storage_config
+        follower_reads = (
+            storage_config.cockroachdb is True
+            and storage_config.cockroachdb_follower_reads is True
+        )
         facts: list[FactSearchResult] = []
         for attempt in range(MAX_RETRIES):
             try:
                 logger.debug(
                     f"Executing search_facts - entity_id: {entity_id}, limit: {limit}, embeddings_limit: {self.config.recall_embeddings_limit}"
                 )
-                facts = search_facts_api(
-                    self.config.storage.driver.entity_fact,
-                    entity_id,
-                    query_embedding,
-                    limit,
-                    self.config.recall_embeddings_limit,
-                    query_text=query,
+                read_driver = self.config.storage.read_driver
+                entity_fact = read_driver.entity_fact
+                reads: AbstractContextManager = (
+                    entity_fact.follower_reads(
+                        storage_config.cockroachdb_follower_read_staleness_seconds
+                    )
+                    if follower_reads
+                    else nullcontext()
                 )
+                try:
+                    with reads:
+                        facts = search_facts_api(
+                            entity_fact,
+                            entity_id,
+                            query_embedding,
+                            limit,
+                            self.config.recall_embeddings_limit,
+                            query_text=query,
+                            # Segments are synced on read, which neither a
+                            # historical transaction nor a replica can do.
+                            use_segments=storage_config.embedding_segments is True
+                            and not follower_reads
+                            and self.config.storage.read_conn_factory is None,
+                        )
+                finally:
+                    self.config.storage.end_read(read_driver)
                 logger.debug("Recall complete - found %d facts", len(facts))
                 break
             except _RETRYABLE_DB_ERRORS as e:
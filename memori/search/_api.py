@@ -15,7 +15,7 @@ from typing import Any
 from memori.search._core import (
     search_entity_facts_core,
 )
-from memori.search._faiss import find_similar_embeddings
+from memori.search._faiss import find_similar_embeddings, find_similar_packed
 from memori.search._lexical import dense_lexical_weights, lexical_scores_for_ids
 from memori.search._types import FactCandidate, FactSearchResult
 
@@ -29,12 +29,16 @@ def search_facts(
     *,
     query_text: str | None = None,
     candidates: list[FactCandidate] | None = None,
+    use_segments: bool = False,
 ) -> list[FactSearchResult]:
     """
     Unified search entrypoint.
 
     - DB-backed mode: provide entity_fact_driver, entity_id, query_embedding, embeddings_limit
     - Pre-scored mode: provide candidates (list[FactCandidate])
+
+    With use_segments, DB-backed mode reads the entity's packed embedding
+    segments when the driver supports them and falls back to rows otherwise.
     """
     if candidates is not None:
         return search_entity_facts_core(
@@ -67,4 +71,5 @@ def search_facts(
         find_similar_embeddings=find_similar_embeddings,
         lexical_scores_for_ids=lexical_scores_for_ids,
         dense_lexical_weights=dense_lexical_weights,
+        find_similar_packed=find_similar_packed if use_segments else None,
     )
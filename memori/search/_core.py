@@ -196,6 +196,7 @@ def search_entity_facts_core(
     ],
     lexical_scores_for_ids: Callable[..., dict[FactId, float]],
     dense_lexical_weights: Callable[..., tuple[float, float]],
+    find_similar_packed: Callable[..., list[tuple[FactId, float]]] | None = None,
 ) -> list[FactSearchResult]:
     idx_to_original_id: dict[int, FactId] = {}
     if fact_candidates is not None:
@@ -211,17 +212,33 @@ def search_entity_facts_core(
         if not candidate_ids:
             return []
     else:
-        results = _get_embeddings_rows(
-            entity_fact_driver, entity_id=entity_id, embeddings_limit=embeddings_limit
-        )
-        if not results:
-            return []
+        packed = None
+        if find_similar_packed is not None:
+            packed = entity_fact_driver.get_embedding_segments(
+                entity_id, embeddings_limit
+            )
 
-        embeddings = [(row["id"], row["content_embedding"]) for row in results]
-        cand_limit = _candidate_limit(
-            limit=limit, total_embeddings=len(embeddings), query_text=query_text
-        )
-        similar = find_similar_embeddings(embeddings, query_embedding, cand_limit)
+        if packed is not None:
+            fact_ids, matrix = packed
+            logger.debug("Retrieved %d embeddings from segments", len(fact_ids))
+            cand_limit = _candidate_limit(
+                limit=limit, total_embeddings=len(fact_ids), query_text=query_text
+            )
+            similar = find_similar_packed(fact_ids, matrix, query_embedding, cand_limit)
+        else:
+            results = _get_embeddings_rows(
+                entity_fact_driver,
+                entity_id=entity_id,
+                embeddings_limit=embeddings_limit,
+            )
+            if not results:
+                return []
+
+            embeddings = [(row["id"], row["content_embedding"]) for row in results]
+            cand_limit = _candidate_limit(
+                limit=limit, total_embeddings=len(embeddings), query_text=query_text
+            )
+            similar = find_similar_embeddings(embeddings, query_embedding, cand_limit)
         if not similar:
             logger.debug("No similar embeddings found")
             return []
@@ -131,3 +131,30 @@ def find_similar_embeddings(
         )
 
     return results
+
+
+def find_similar_packed(
+    fact_ids: np.ndarray,
+    embeddings: np.ndarray,
+    query_embedding: list[float],
+    limit: int = 5,
+) -> list[tuple[FactId, float]]:
+    """Find most similar embeddings in an already-decoded (n, dim) matrix."""
+    if len(fact_ids) == 0 or embeddings.ndim != 2:
+        return []
+
+    if embeddings.shape[1] != _query_dim(query_embedding):
+        logger.debug(
+            "Embedding dimension mismatch: db=%d, query=%d",
+            embeddings.shape[1],
+            _query_dim(query_embedding),
+        )
+        return []
+
+    logger.debug("Building FAISS index with %d packed embeddings", len(fact_ids))
+    return _faiss_search(
+        embeddings_array=embeddings,
+        query_embedding=query_embedding,
+        id_list=[int(fact_id) for fact_id in fact_ids],
+        limit=limit,
+    )
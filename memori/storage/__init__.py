@@ -22,7 +22,7 @@ def _import_optional_module(module_path: str) -> None:
 
 # Import adapters and drivers to trigger their self-registration decorators.
 # Order matters: more specific matchers (sqlalchemy, django) before generic ones (mongodb, dbapi)
-for adapter in ("sqlalchemy", "django", "mongodb", "dbapi"):
+for adapter in ("sharded", "sqlalchemy", "django", "mongodb", "dbapi"):
     _import_optional_module(f"memori.storage.adapters.{adapter}")
 
 for driver in (
@@ -31,6 +31,7 @@ for driver in (
     "oceanbase",
     "oracle",
     "postgresql",
+    "sharded",
     "sqlite",
     "tidb",
 ):
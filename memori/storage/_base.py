@@ -8,13 +8,25 @@ r"""
                        memorilabs.ai
 """
 
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, nullcontext
+from uuid import uuid4
+
 
 class BaseStorageAdapter:
+    # Registry key of the driver built for this adapter; None uses the
+    # dialect. Lets an adapter report its databases' dialect while being
+    # served by a different driver.
+    driver_dialect: str | None = None
+
     def __init__(self, conn):
         if not callable(conn):
             raise TypeError("conn must be a callable")
         self._release = None
         self._cm = None
+        # Identifies the database behind the factory for the process-wide id
+        # cache; set by the storage manager and connection_context.
+        self.identity = None
 
         resource = conn()
         if isinstance(resource, tuple) and len(resource) == 2 and callable(resource[1]):
@@ -89,6 +101,17 @@ class BaseStorageAdapter:
     def execute(self, *args, **kwargs):
         raise NotImplementedError
 
+    def execute_many(self, operation, seq_of_binds):
+        raise NotImplementedError
+
+    def execute_prefetch(self, operation, binds, rows: int):
+        """Execute a query expected to return up to rows rows.
+
+        Adapters that own the driver cursor size its fetches so the result
+        arrives in one round trip; the others run a plain execute().
+        """
+        return self.execute(operation, binds)
+
     def flush(self):
         raise NotImplementedError
 
@@ -99,6 +122,58 @@ class BaseStorageAdapter:
         raise NotImplementedError
 
 
+class BaseAsyncStorageAdapter:
+    """Storage adapter for an async connection, engine, pool or session.
+
+    The resource is already resolved (factories called and awaited). open()
+    acquires a connection on the running event loop and close() gives it
+    back; resources Memori did not create are never closed.
+    """
+
+    def __init__(self, conn, owned: bool = False):
+        self.conn = conn
+        self.owned = owned
+
+    async def open(self):
+        return self
+
+    async def close(self):
+        raise NotImplementedError
+
+    async def commit(self):
+        raise NotImplementedError
+
+    async def execute(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def execute_many(self, operation, seq_of_binds):
+        raise NotImplementedError
+
+    async def flush(self):
+        return self
+
+    async def rollback(self):
+        raise NotImplementedError
+
+    @classmethod
+    def is_factory(cls, conn) -> bool:
+        """Whether a matched object hands out resources rather than being one."""
+        return False
+
+    def get_dialect(self):
+        raise NotImplementedError
+
+
+class _BatchedWriter:
+    # Rows written per multi-row statement. 100 rows keeps the bind count
+    # under the 999-variable limit of older SQLite builds.
+    batch_size = 100
+
+    def _batches(self, rows: list) -> Iterator[list]:
+        for start in range(0, len(rows), self.batch_size):
+            yield rows[start : start + self.batch_size]
+
+
 class BaseConversation:
     def __init__(self, conn: BaseStorageAdapter):
         self.conn = conn
@@ -112,6 +187,13 @@ class BaseConversation:
     def read(self, id: int) -> dict | None:
         raise NotImplementedError
 
+    def export(self, entity_id: int, after_id=None, limit: int = 1000):
+        """Return the next page of an entity's conversations, ordered by id.
+
+        Rows are {id, session_uuid, process_external_id, summary}.
+        """
+        raise NotImplementedError
+
 
 class BaseConversationMessage:
     def __init__(self, conn: BaseStorageAdapter):
@@ -125,15 +207,165 @@ class BaseConversationMessages:
     def __init__(self, conn: BaseStorageAdapter):
         self.conn = conn
 
-    def read(self, conversation_id: int):
+    def create_many(self, conversation_id: int, messages: list[dict]):
+        raise NotImplementedError
+
+    def read(self, conversation_id: int, limit: int | None = None):
         raise NotImplementedError
 
 
-class BaseKnowledgeGraph:
+class BaseKnowledgeGraph(_BatchedWriter):
     def __init__(self, conn: BaseStorageAdapter):
         self.conn = conn
 
-    def create(self, entity_id: int, semantic_triples: list):
+    def _graph_rows(
+        self, semantic_triples: list, num_times: list[int] | None = None
+    ) -> tuple[dict, dict, dict, dict[tuple[str, str, str], int]]:
+        """Collapse triples into distinct dimension rows and edge counts.
+
+        Returns (subjects, predicates, objects, edges). Each dimension maps
+        uniq to its column values; edges map (subject_uniq, predicate_uniq,
+        object_uniq) to the number of times the triple was seen, or to the
+        sum of its num_times entries when given.
+        """
+        from memori._utils import generate_uniq
+
+        subjects: dict[str, tuple] = {}
+        predicates: dict[str, tuple] = {}
+        objects: dict[str, tuple] = {}
+        edges: dict[tuple[str, str, str], int] = {}
+        for i, semantic_triple in enumerate(semantic_triples):
+            subject_uniq = generate_uniq(
+                [semantic_triple.subject_name, semantic_triple.subject_type]
+            )
+            predicate_uniq = generate_uniq([semantic_triple.predicate])
+            object_uniq = generate_uniq(
+                [semantic_triple.object_name, semantic_triple.object_type]
+            )
+
+            subjects.setdefault(
+                subject_uniq,
+                (semantic_triple.subject_name, semantic_triple.subject_type),
+            )
+            predicates.setdefault(predicate_uniq, (semantic_triple.predicate,))
+            objects.setdefault(
+                object_uniq,
+                (semantic_triple.object_name, semantic_triple.object_type),
+            )
+
+            edge = (subject_uniq, predicate_uniq, object_uniq)
+            edges[edge] = edges.get(edge, 0) + (
+                1 if num_times is None else num_times[i]
+            )
+
+        return subjects, predicates, objects, edges
+
+    def _orphan_candidates(self, edges: list) -> list[tuple[str, str, list]]:
+        """Group the dimension ids referenced by an entity's edges by table.
+
+        Returns (table, edge column, ids) per dimension. Only these rows can
+        lose their last reference when the edges are deleted, so garbage
+        collection checks them instead of sweeping the dimension tables.
+        """
+        return [
+            (table, column, sorted({edge[column] for edge in edges}))
+            for table, column in (
+                ("memori_subject", "subject_id"),
+                ("memori_predicate", "predicate_id"),
+                ("memori_object", "object_id"),
+            )
+        ]
+
+    def create(
+        self,
+        entity_id: int,
+        semantic_triples: list,
+        num_times: list[int] | None = None,
+    ):
+        """Upsert the triples' dimension rows, then the entity's edges.
+
+        Drivers provide the dialect SQL through _insert_dimension,
+        _read_dimension_ids and _upsert_edges. Rows are written in key
+        order so concurrent writers lock shared rows in the same order.
+        """
+        if semantic_triples is None or len(semantic_triples) == 0:
+            return self
+
+        subjects, predicates, objects, edges = self._graph_rows(
+            semantic_triples, num_times
+        )
+        subject_ids = self._upsert_dimension(
+            "memori_subject", ("name", "type"), subjects
+        )
+        predicate_ids = self._upsert_dimension(
+            "memori_predicate", ("content",), predicates
+        )
+        object_ids = self._upsert_dimension("memori_object", ("name", "type"), objects)
+
+        rows = []
+        if entity_id is not None:
+            for (subject_uniq, predicate_uniq, object_uniq), count in edges.items():
+                subject_id = subject_ids.get(subject_uniq)
+                predicate_id = predicate_ids.get(predicate_uniq)
+                object_id = object_ids.get(object_uniq)
+                if subject_id is None or predicate_id is None or object_id is None:
+                    continue
+                rows.append(
+                    (
+                        str(uuid4()),
+                        entity_id,
+                        subject_id,
+                        predicate_id,
+                        object_id,
+                        count,
+                    )
+                )
+        rows.sort(key=lambda row: row[2:5])
+
+        for batch in self._batches(rows):
+            self._upsert_edges(batch)
+
+        self.conn.commit()
+
+        return self
+
+    def _upsert_dimension(
+        self, table: str, columns: tuple[str, ...], rows: dict[str, tuple]
+    ) -> dict[str, int]:
+        """Insert missing dimension rows and return their ids keyed by uniq."""
+        ids = {}
+        for batch in self._batches(sorted(rows)):
+            self._insert_dimension(
+                table, columns, [(str(uuid4()), *rows[uniq], uniq) for uniq in batch]
+            )
+            for row in self._read_dimension_ids(table, batch):
+                ids[row["uniq"]] = row["id"]
+        return ids
+
+    def _insert_dimension(
+        self, table: str, columns: tuple[str, ...], rows: list[tuple]
+    ) -> None:
+        """Insert (uuid, *columns, uniq) rows, skipping existing uniqs."""
+        raise NotImplementedError
+
+    def _read_dimension_ids(self, table: str, uniqs: list[str]) -> list:
+        """Return {id, uniq} rows of table for uniqs."""
+        raise NotImplementedError
+
+    def _upsert_edges(self, rows: list[tuple]) -> None:
+        """Upsert edge rows, adding num_times to edges that already exist.
+
+        Rows are (uuid, entity_id, subject_id, predicate_id, object_id,
+        num_times).
+        """
+        raise NotImplementedError
+
+    def export(self, entity_id: int, after_id=None, limit: int = 1000):
+        """Return the next page of an entity's triples, ordered by edge id.
+
+        Rows are {id, subject_name, subject_type, predicate, object_name,
+        object_type, num_times}.
+        """
         raise NotImplementedError
 
     def delete_by_entity(self, entity_id: int):
@@ -145,28 +377,123 @@ class BaseEntity:
         self.conn = conn
 
     def create(self, external_id: str):
+        from memori.storage._id_cache import get_id_cache
+
+        return get_id_cache().resolve(
+            self.conn, "entity", external_id, lambda: self._create(external_id)
+        )
+
+    def read(self, external_id: str):
+        """Return the entity's id, or None when it does not exist."""
+        from memori.storage._id_cache import get_id_cache
+
+        return get_id_cache().resolve(
+            self.conn, "entity", external_id, lambda: self._read(external_id)
+        )
+
+    def _create(self, external_id: str):
+        raise NotImplementedError
+
+    def _read(self, external_id: str):
         raise NotImplementedError
 
 
-class BaseEntityFact:
+class BaseEntityFact(_BatchedWriter):
+    # Bind placeholder for the packed embedding segments table; None for
+    # dialects without one.
+    segment_placeholder: str | None = None
+
     def __init__(self, conn: BaseStorageAdapter):
         self.conn = conn
 
+    def _fact_rows(
+        self,
+        entity_id: int,
+        facts: list,
+        fact_embeddings: list | None,
+        dialect: str,
+        num_times: list[int] | None = None,
+    ) -> list[tuple]:
+        """Build one upsert row per distinct fact.
+
+        Rows are (uuid, entity_id, content, content_embedding, num_times, uniq).
+        Repeated facts collapse into the first occurrence with num_times
+        counting every repeat (or summing their num_times entries, when
+        given), so a single multi-row upsert never touches the same key twice.
+        """
+        from memori._utils import generate_uniq
+        from memori.embeddings import format_embedding_for_db
+
+        rows: dict[str, list] = {}
+        for i, fact in enumerate(facts):
+            uniq = generate_uniq([fact])
+            count = 1 if num_times is None else num_times[i]
+            row = rows.get(uniq)
+            if row is not None:
+                row[4] += count
+                continue
+
+            embedding = (
+                fact_embeddings[i]
+                if fact_embeddings is not None and i < len(fact_embeddings)
+                else []
+            )
+            rows[uniq] = [
+                str(uuid4()),
+                entity_id,
+                fact,
+                format_embedding_for_db(embedding, dialect),
+                count,
+                uniq,
+            ]
+
+        return [tuple(row) for row in rows.values()]
+
     def create(
         self,
         entity_id: int,
         facts: list,
         fact_embeddings: list | None = None,
         conversation_id: int | None = None,
+        num_times: list[int] | None = None,
     ):
         raise NotImplementedError
 
     def get_embeddings(self, entity_id: int, limit: int = 1000):
         raise NotImplementedError
 
+    def get_embedding_segments(self, entity_id: int, limit: int = 1000):
+        if self.segment_placeholder is None:
+            return None
+
+        from memori.storage._segments import EmbeddingSegments
+
+        return EmbeddingSegments(self.conn, self.segment_placeholder).read(
+            entity_id, limit
+        )
+
     def get_facts_by_ids(self, fact_ids: list[int]):
         raise NotImplementedError
 
+    def export(self, entity_id: int, after_id=None, limit: int = 1000):
+        """Return the next page of an entity's facts, ordered by id.
+
+        Rows are {id, content, content_embedding, num_times}.
+        """
+        raise NotImplementedError
+
+    def read_mentions(self, fact_ids: list):
+        """Return {fact_id, conversation_id} rows for the given facts."""
+        raise NotImplementedError
+
+    def follower_reads(self, staleness_seconds: int = 0) -> AbstractContextManager:
+        """Serve the reads made inside the block from a stale snapshot.
+
+        Stale reads never conflict with concurrent writes. Only CockroachDB
+        supports them; elsewhere the block runs unchanged.
+        """
+        return nullcontext()
+
     def delete_by_entity(self, entity_id: int):
         raise NotImplementedError
 
@@ -176,6 +503,13 @@ class BaseProcess:
         self.conn = conn
 
     def create(self, external_id: str):
+        from memori.storage._id_cache import get_id_cache
+
+        return get_id_cache().resolve(
+            self.conn, "process", external_id, lambda: self._create(external_id)
+        )
+
+    def _create(self, external_id: str):
         raise NotImplementedError
 
 
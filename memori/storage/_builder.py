@@ -8,6 +8,9 @@ r"""
                        memorilabs.ai
 """
 
+import copy
+from types import SimpleNamespace
+
 from memori._cli import Cli
 from memori._config import Config
 from memori.storage._registry import Registry
@@ -98,6 +101,11 @@ class Builder:
         if self.config.storage is None or self.config.storage.adapter is None:
             return self
 
+        from memori.storage.adapters.sharded import Adapter as ShardedAdapter
+
+        if isinstance(self.config.storage.adapter, ShardedAdapter):
+            return self._execute_sharded(self.config.storage.adapter)
+
         dialect = self.config.storage.adapter.get_dialect()
         supported_dialects = self._get_supported_dialects()
 
@@ -111,6 +119,22 @@ class Builder:
 
         return self
 
+    def _execute_sharded(self, adapter):
+        """Migrate every shard on its own, as if it were the only database."""
+        if self.display_banner:
+            self.cli.banner()
+
+        for shard in range(len(adapter.conn)):
+            self.cli.notice(f"Shard #{shard}:")
+            shard_adapter, shard_driver = adapter.shard(shard)
+            shard_config = copy.copy(self.config)
+            shard_config.storage = SimpleNamespace(
+                adapter=shard_adapter, driver=shard_driver
+            )
+            Builder(shard_config).disable_banner().execute()
+
+        return self
+
     def _get_supported_dialects(self):
         return list(self.registry._drivers.keys())
 
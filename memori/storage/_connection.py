@@ -13,12 +13,14 @@ from contextlib import contextmanager
 from typing import Any
 
 from memori.storage._base import BaseStorageAdapter
+from memori.storage._id_cache import get_id_cache
 from memori.storage._registry import Registry
 
 
 @contextmanager
 def connection_context(
     conn_factory: Callable[[], Any] | None,
+    identity_factory: Callable[[], Any] | None = None,
 ) -> Generator[
     tuple[Any, BaseStorageAdapter, Any] | tuple[None, None, None], None, None
 ]:
@@ -28,6 +30,9 @@ def connection_context(
 
     conn = conn_factory()
     adapter = Registry().adapter(lambda: conn)
+    # A replica shares the id cache of its primary (identity_factory): both
+    # hold the same rows.
+    adapter.identity = get_id_cache().identity(identity_factory or conn_factory)
     driver = Registry().driver(adapter)
 
     try:
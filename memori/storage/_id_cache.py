@@ -0,0 +1,114 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+ID_CACHE_SIZE = 10000
+
+
+class IdCache:
+    """Process-wide LRU of resolved row ids.
+
+    Keys are (dialect, connection identity, kind, external id), so every
+    Memori instance built on the same connection factory shares entries.
+    """
+
+    def __init__(self, max_size: int = ID_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        # Reentrant: a collection triggered while the lock is held runs
+        # _forget on the same thread.
+        self._lock = threading.RLock()
+        self._identities: dict[int, weakref.finalize] = {}
+        self._forget_callbacks: list[Callable[[int], None]] = []
+
+    def resolve(
+        self,
+        conn: Any,
+        kind: str,
+        external_id: Hashable,
+        create: Callable[[], Any],
+    ) -> Any:
+        identity = getattr(conn, "identity", None)
+        if identity is None:
+            return create()
+
+        key = (conn.get_dialect(), identity, kind, external_id)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = create()
+        if value is None:
+            return value
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def identity(self, conn_factory: Any) -> int | None:
+        """Return a stable identity for the database behind a factory.
+
+        The identity is the id() of the user's factory (unwrapped from the
+        built-in pool). Entries are dropped when that object is collected so
+        a recycled id() can never see another database's ids.
+        """
+        from memori.storage._pool import ConnectionPool
+
+        if conn_factory is None:
+            return None
+
+        source = (
+            conn_factory.factory
+            if isinstance(conn_factory, ConnectionPool)
+            else conn_factory
+        )
+        identity = id(source)
+        with self._lock:
+            if identity in self._identities:
+                return identity
+            try:
+                self._identities[identity] = weakref.finalize(
+                    source, self._forget, identity
+                )
+            except TypeError:
+                return None
+        return identity
+
+    def on_forget(self, callback: Callable[[int], None]) -> None:
+        """Call callback(identity) when an identity's factory is collected."""
+        self._forget_callbacks.append(callback)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _forget(self, identity: int) -> None:
+        with self._lock:
+            self._identities.pop(identity, None)
+            for key in [key for key in list(self._entries) if key[1] == identity]:
+                self._entries.pop(key, None)
+        for callback in self._forget_callbacks:
+            callback(identity)
+
+
+_id_cache = IdCache()
+
+
+def get_id_cache() -> IdCache:
+    return _id_cache
@@ -8,44 +8,297 @@ r"""
                        memorilabs.ai
 """
 
+import asyncio
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from memori._config import Config
 from memori.storage._builder import Builder
 from memori.storage._connection import connection_context
+from memori.storage._id_cache import get_id_cache
+from memori.storage._pool import ConnectionPool, pooled_factory
 from memori.storage._registry import Registry
+from memori.storage._sqlite_profile import get_sqlite_profile
+from memori.storage.adapters.aio import AsyncConnectionFactory, is_async_connection
 
 
 class Manager:
     def __init__(self, config: Config) -> None:
-        self.adapter = None
+        self._adapter = None
+        self._driver = None
+        # Adapter and driver of the run() call on the current thread/task.
+        self._scoped: ContextVar = ContextVar(
+            f"memori_storage_{id(self)}", default=None
+        )
+        self._build_lock = threading.Lock()
+        self._build_pending = False
         self.config = config
         self.conn_factory = None
-        self.driver = None
+        self.is_async = False
+        self.read_adapter = None
+        self._read_driver = None
+        self.read_conn_factory = None
+        # Pools start() wrapped raw factories in; close() releases them.
+        self._pools: list = []
+        # Conversation id -> monotonic time of this process's last write.
+        self._written: dict = {}
+        self._written_lock = threading.Lock()
+
+    @property
+    def adapter(self):
+        scoped = self._scoped.get()
+        return scoped[0] if scoped is not None else self._adapter
+
+    @adapter.setter
+    def adapter(self, adapter) -> None:
+        self._adapter = adapter
+
+    @property
+    def driver(self):
+        scoped = self._scoped.get()
+        return scoped[1] if scoped is not None else self._driver
+
+    @driver.setter
+    def driver(self, driver) -> None:
+        self._driver = driver
+
+    @property
+    def read_driver(self):
+        """Driver for reads that may be served by the read replica."""
+        if self._scoped.get() is not None or self._read_driver is None:
+            return self.driver
+        return self._read_driver
+
+    @read_driver.setter
+    def read_driver(self, driver) -> None:
+        self._read_driver = driver
 
     @property
     def conn(self):
         return connection_context(self.conn_factory)
 
+    @property
+    def read_conn(self):
+        if self.read_conn_factory is None:
+            return self.conn
+        return connection_context(self.read_conn_factory, self.conn_factory)
+
+    def mark_written(self, conversation_id) -> None:
+        """Record a committed write so its conversation reads the primary."""
+        if self.read_conn_factory is None or conversation_id is None:
+            return
+
+        window = self.config.storage_config.read_your_writes_seconds
+        now = time.monotonic()
+        with self._written_lock:
+            for key in [k for k, at in self._written.items() if now - at >= window]:
+                del self._written[key]
+            self._written[conversation_id] = now
+
+    def reader(self, conversation_id=None):
+        """Driver to read conversation_id with.
+
+        Reads go to the replica, except those of a conversation this process
+        wrote within read_your_writes_seconds, which the replica may not have
+        applied yet.
+        """
+        storage_config = self.config.storage_config
+        if storage_config.read_your_writes and conversation_id is not None:
+            with self._written_lock:
+                written_at = self._written.get(conversation_id)
+            if (
+                written_at is not None
+                and time.monotonic() - written_at
+                < storage_config.read_your_writes_seconds
+            ):
+                return self.driver
+        return self.read_driver
+
+    def close(self) -> None:
+        """Close the adapters, then the connection pools start() created."""
+        from memori.storage.adapters.sharded import ShardedConn
+
+        sharded = getattr(self._adapter, "conn", None)
+        for adapter in (self._adapter, self.read_adapter):
+            if adapter is None:
+                continue
+            try:
+                adapter.close()
+            except Exception:  # nosec B110
+                pass
+
+        if isinstance(sharded, ShardedConn):
+            sharded.close()
+        pools, self._pools = self._pools, []
+        for pool in pools:
+            pool.close()
+
+    def _track_pool(self, factory) -> None:
+        if isinstance(factory, ConnectionPool):
+            self._pools.append(factory)
+
+    def end_read(self, driver) -> None:
+        """End the transaction a read through driver left open on the replica.
+
+        The replica adapter is long-lived. On a non-autocommit connection
+        its first read would otherwise open a transaction that never ends.
+        That pins one snapshot on MySQL and TiDB, and holds back xmin on
+        PostgreSQL.
+        """
+        if driver is None or driver is not self._read_driver:
+            return
+        if self.read_adapter is not None:
+            self.read_adapter.rollback()
+
     def build(self) -> "Manager":
         if self.conn_factory is None:
             return self
 
+        if self.is_async:
+            # Async connections belong to the application's event loop; the
+            # schema is built by the first run() on that loop.
+            self._build_pending = True
+            return self
+
         Builder(self.config).execute()
 
         return self
 
-    def start(self, conn) -> "Manager":
+    async def run(self, fn, *args):
+        """Run synchronous storage work from async code.
+
+        For async storage the work runs on a worker thread with a driver
+        bridged to the calling event loop, which stays free meanwhile.
+        """
+        if not self.is_async:
+            return fn(*args)
+
+        self.conn_factory.bind(asyncio.get_running_loop())
+        return await asyncio.to_thread(self._run_scoped, fn, *args)
+
+    @contextmanager
+    def _scope(self, adapter, driver):
+        token = self._scoped.set((adapter, driver))
+        try:
+            yield
+        finally:
+            self._scoped.reset(token)
+
+    def _run_scoped(self, fn, *args):
+        with connection_context(self.conn_factory) as (_conn, adapter, driver):
+            with self._scope(adapter, driver):
+                if self._build_pending:
+                    with self._build_lock:
+                        if self._build_pending:
+                            Builder(self.config).execute()
+                            self._build_pending = False
+                return fn(*args)
+
+    def start(self, conn, read_conn=None) -> "Manager":
+        """Open storage on conn.
+
+        read_conn is an optional connection or factory for a read replica of
+        the same database. Recall, history and Rust-core fetches read from
+        it; everything else uses conn.
+        """
         if conn is None:
             return self
 
+        resource = conn
+        if callable(conn) and not is_async_connection(conn):
+            resource = conn()
+        if is_async_connection(resource) or inspect.iscoroutine(resource):
+            if inspect.iscoroutine(resource):
+                resource.close()
+            if read_conn is not None:
+                raise ValueError("read_conn is not supported with async connections")
+            self.conn_factory = AsyncConnectionFactory(conn)
+            self.is_async = True
+            return self
+
         if callable(conn):
-            self.conn_factory = conn
+            # Raw factories (e.g. a psycopg.connect lambda) would otherwise
+            # open a new connection for every background write and callback.
+            self.conn_factory = pooled_factory(
+                conn,
+                self.config.storage_config.pool_size,
+                self.config.storage_config.pool_max_lifetime_seconds,
+            )
+            self._track_pool(self.conn_factory)
         else:
             self.conn_factory = lambda: conn
 
-        self.adapter = Registry().adapter(conn)
+        self.adapter = Registry().adapter(lambda: resource)
+        self.adapter.identity = get_id_cache().identity(self.conn_factory)
         self.driver = Registry().driver(self.adapter)
+        configure = getattr(self.driver, "configure", None)
+        if callable(configure):
+            configure(self.config.storage_config)
 
         dialect = self.adapter.get_dialect()
         self.config.storage_config.cockroachdb = dialect == "cockroachdb"
 
+        if dialect == "sqlite" and self.config.storage_config.sqlite_wal:
+            self._start_sqlite_profile(owned=callable(conn))
+
+        if read_conn is not None:
+            self._start_read_replica(read_conn)
+
         return self
+
+    def _start_read_replica(self, read_conn) -> None:
+        from memori.storage.adapters.sharded import ShardedConn
+
+        # Sharded ids are namespaced per shard; a single-database replica
+        # driver would read the wrong rows for them.
+        if isinstance(self.adapter.conn, ShardedConn):
+            raise ValueError("read_conn is not supported with ShardedConn")
+
+        if is_async_connection(read_conn):
+            raise ValueError("read_conn is not supported with async connections")
+
+        resource = read_conn() if callable(read_conn) else read_conn
+        if is_async_connection(resource) or inspect.iscoroutine(resource):
+            if inspect.iscoroutine(resource):
+                resource.close()
+            raise ValueError("read_conn is not supported with async connections")
+
+        if callable(read_conn):
+            self.read_conn_factory = pooled_factory(
+                read_conn,
+                self.config.storage_config.pool_size,
+                self.config.storage_config.pool_max_lifetime_seconds,
+            )
+            self._track_pool(self.read_conn_factory)
+        else:
+            self.read_conn_factory = lambda: read_conn
+
+        self.read_adapter = Registry().adapter(lambda: resource)
+        if self.read_adapter.get_dialect() != self.adapter.get_dialect():
+            raise ValueError("read_conn must be a replica of the database behind conn")
+
+        # Ids resolved on either side are the same rows.
+        self.read_adapter.identity = self.adapter.identity
+        self.read_driver = Registry().driver(self.read_adapter)
+
+    def _start_sqlite_profile(self, owned: bool) -> None:
+        profile = get_sqlite_profile(
+            self.adapter.conn,
+            read_pool_size=self.config.storage_config.sqlite_read_pool_size,
+            max_lifetime=self.config.storage_config.pool_max_lifetime_seconds,
+        )
+        if profile is None:
+            return
+
+        # The connection used to detect the dialect is replaced by the
+        # profile; it is only closed when Memori opened it.
+        if owned:
+            self.adapter.close()
+
+        self.conn_factory = profile
+        self.adapter = Registry().adapter(profile)
+        self.adapter.identity = get_id_cache().identity(self.conn_factory)
+        self.driver = Registry().driver(self.adapter)
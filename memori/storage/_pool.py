@@ -0,0 +1,197 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from memori.storage._base import BaseStorageAdapter
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+
+
+class _Entry:
+    __slots__ = ("conn", "created_at", "last_used")
+
+    def __init__(self, conn: Any) -> None:
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+def _close_quietly(conn: Any) -> None:
+    try:
+        conn.close()
+    except Exception:  # nosec B110
+        pass
+
+
+def _ping(conn: Any) -> bool:
+    try:
+        ping = getattr(conn, "ping", None)
+        if callable(ping):
+            ping()
+            return True
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+        conn.rollback()
+        return True
+    except Exception:
+        return False
+
+
+def _is_pooled_factory(factory: Callable) -> bool:
+    # Bound methods of pool objects (psycopg_pool, SQLAlchemy, DBUtils, ...)
+    # already hand out pooled connections.
+    owner = getattr(factory, "__self__", None)
+    if owner is None:
+        return False
+    return "pool" in type(owner).__module__.lower()
+
+
+def _is_raw_connection(resource: Any) -> bool:
+    from memori.storage.adapters.dbapi._adapter import is_dbapi_connection
+
+    if isinstance(resource, tuple):
+        return False
+    if BaseStorageAdapter._is_managed_resource(resource):
+        return False
+    return is_dbapi_connection(resource)
+
+
+class ConnectionPool:
+    """Bounded pool of raw DB-API connections built from a user factory.
+
+    Connections have per-thread affinity: an idle connection is only handed
+    back to the thread that opened it, which keeps drivers such as sqlite3
+    (check_same_thread) safe. When the pool is full, extra connections are
+    opened and closed around a single use, as they were without the pool.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        *,
+        max_size: int,
+        max_lifetime: float,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL_SECONDS,
+    ) -> None:
+        self.factory = factory
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self._idle: dict[int, tuple[threading.Thread, list[_Entry]]] = {}
+        self._lock = threading.Lock()
+        self._passthrough: bool | None = True if _is_pooled_factory(factory) else None
+        self._size = 0
+        self._closed = False
+
+    def __call__(self) -> Any:
+        if self._passthrough:
+            return self.factory()
+
+        entry = self._checkout()
+        if entry is not None:
+            return entry.conn, lambda: self._checkin(entry)
+
+        resource = self.factory()
+        if self._passthrough is None:
+            self._passthrough = not _is_raw_connection(resource)
+            if self._passthrough:
+                logger.debug("Connection pool disabled - factory is not a raw DB-API")
+                return resource
+
+        with self._lock:
+            pooled = not self._closed and self._size < self.max_size
+            if pooled:
+                self._size += 1
+        if not pooled:
+            return resource
+
+        entry = _Entry(resource)
+        return entry.conn, lambda: self._checkin(entry)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            entries = [e for _, idle in self._idle.values() for e in idle]
+            self._idle.clear()
+            self._size -= len(entries)
+        for entry in entries:
+            _close_quietly(entry.conn)
+
+    def _checkout(self) -> _Entry | None:
+        while True:
+            stale = self._prune_dead_threads()
+            with self._lock:
+                idle = self._idle.get(threading.get_ident())
+                entry = idle[1].pop() if idle and idle[1] else None
+            for conn in stale:
+                _close_quietly(conn)
+            if entry is None:
+                return None
+
+            now = time.monotonic()
+            if now - entry.created_at >= self.max_lifetime or (
+                now - entry.last_used >= self.health_check_interval
+                and not _ping(entry.conn)
+            ):
+                self._discard(entry)
+                continue
+
+            return entry
+
+    def _checkin(self, entry: _Entry) -> None:
+        if time.monotonic() - entry.created_at >= self.max_lifetime:
+            self._discard(entry)
+            return
+
+        entry.last_used = time.monotonic()
+        thread = threading.current_thread()
+        with self._lock:
+            if not self._closed:
+                self._idle.setdefault(threading.get_ident(), (thread, []))[1].append(
+                    entry
+                )
+                return
+        self._discard(entry)
+
+    def _discard(self, entry: _Entry) -> None:
+        with self._lock:
+            self._size -= 1
+        _close_quietly(entry.conn)
+
+    def _prune_dead_threads(self) -> list[Any]:
+        with self._lock:
+            dead = [
+                ident
+                for ident, (thread, _) in self._idle.items()
+                if not thread.is_alive()
+            ]
+            stale = [entry.conn for ident in dead for entry in self._idle.pop(ident)[1]]
+            self._size -= len(stale)
+        return stale
+
+
+def pooled_factory(
+    factory: Callable[[], Any], max_size: int, max_lifetime: float
+) -> Callable[[], Any]:
+    if max_size <= 0:
+        return factory
+    return ConnectionPool(factory, max_size=max_size, max_lifetime=max_lifetime)
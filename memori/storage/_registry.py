@@ -12,11 +12,12 @@ from collections.abc import Callable
 from typing import Any
 
 from memori._exceptions import UnsupportedDatabaseError
-from memori.storage._base import BaseStorageAdapter
+from memori.storage._base import BaseAsyncStorageAdapter, BaseStorageAdapter
 
 
 class Registry:
     _adapters: dict[Callable[[Any], bool], type[BaseStorageAdapter]] = {}
+    _async_adapters: dict[Callable[[Any], bool], type[BaseAsyncStorageAdapter]] = {}
     _drivers: dict[str, type] = {}
 
     @classmethod
@@ -27,6 +28,14 @@ class Registry:
 
         return decorator
 
+    @classmethod
+    def register_async_adapter(cls, matcher: Callable[[Any], bool]):
+        def decorator(adapter_class: type[BaseAsyncStorageAdapter]):
+            cls._async_adapters[matcher] = adapter_class
+            return adapter_class
+
+        return decorator
+
     @classmethod
     def register_driver(cls, dialect: str):
         def decorator(driver_class: type):
@@ -60,8 +69,20 @@ class Registry:
 
         raise UnsupportedDatabaseError()
 
+    def async_adapter_class(self, conn: Any) -> type[BaseAsyncStorageAdapter] | None:
+        for matcher, adapter_class in self._async_adapters.items():
+            if matcher(conn):
+                return adapter_class
+        return None
+
+    def async_adapter(self, conn: Any, owned: bool = False) -> BaseAsyncStorageAdapter:
+        adapter_class = self.async_adapter_class(conn)
+        if adapter_class is None:
+            raise UnsupportedDatabaseError()
+        return adapter_class(conn, owned=owned)
+
     def driver(self, conn: BaseStorageAdapter):
-        dialect = conn.get_dialect()
+        dialect = getattr(type(conn), "driver_dialect", None) or conn.get_dialect()
         if dialect not in self._drivers:
             raise RuntimeError(f"Unsupported database dialect: {dialect}")
         return self._drivers[dialect](conn)
@@ -0,0 +1,208 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import numpy as np
+
+# Segments per entity before they are merged back into one.
+SEGMENT_COMPACT_THRESHOLD = 8
+
+
+class EmbeddingSegments:
+    """Packed per-entity copies of fact embeddings.
+
+    A segment row holds a contiguous little-endian float32 block and the
+    matching int64 fact ids, so recall reads a handful of BLOBs instead of
+    one row per fact. Fact rows stay the source of truth: facts newer than
+    the last segment are appended as a new segment, anything else stale
+    rebuilds the entity's segments, and too many segments are compacted.
+    """
+
+    def __init__(self, conn, placeholder: str):
+        self.conn = conn
+        self.placeholder = placeholder
+
+    def read(self, entity_id: int, limit: int) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return (fact ids, embeddings matrix), or None to use fact rows.
+
+        Segments hold every fact of an entity, so they only stand in for the
+        recency-limited row query when the entity has at most limit facts.
+        """
+        p = self.placeholder
+        stats = (
+            self.conn.execute(
+                f"""
+                SELECT COUNT(*) AS num_facts,
+                       MAX(id) AS max_fact_id
+                  FROM memori_entity_fact
+                 WHERE entity_id = {p}
+                """,  # nosec B608
+                (entity_id,),
+            )
+            .mappings()
+            .fetchone()
+        )
+        num_facts = int(stats["num_facts"] or 0) if stats else 0
+        if num_facts == 0 or num_facts > limit:
+            return None
+
+        segments = self._segments(entity_id)
+        covered = sum(int(segment["num_facts"]) for segment in segments)
+        max_fact_id = max((int(s["max_fact_id"]) for s in segments), default=0)
+
+        if covered != num_facts or max_fact_id != int(stats["max_fact_id"]):
+            segments = self._refresh(
+                entity_id, segments, covered, max_fact_id, num_facts
+            )
+        elif len(segments) > SEGMENT_COMPACT_THRESHOLD:
+            segments = self._replace(entity_id, [_merge(segments)])
+
+        if not segments:
+            return None
+        return _unpack(segments)
+
+    def _refresh(
+        self, entity_id, segments, covered, max_fact_id, num_facts
+    ) -> list[dict]:
+        if segments:
+            delta = self._fact_rows(entity_id, max_fact_id)
+            segment = _pack(delta)
+            # Only an append when every fact the segments know still exists.
+            if (
+                segment is not None
+                and covered + len(delta) == num_facts
+                and segment["dim"] == int(segments[0]["dim"])
+            ):
+                segments = [*segments, segment]
+                if len(segments) > SEGMENT_COMPACT_THRESHOLD:
+                    return self._replace(entity_id, [_merge(segments)])
+                self._insert(entity_id, segment)
+                self.conn.commit()
+                return segments
+
+        segment = _pack(self._fact_rows(entity_id, 0))
+        return self._replace(entity_id, [segment] if segment is not None else [])
+
+    def _fact_rows(self, entity_id: int, after_id: int) -> list[dict]:
+        p = self.placeholder
+        return (
+            self.conn.execute(
+                f"""
+                SELECT id,
+                       content_embedding
+                  FROM memori_entity_fact
+                 WHERE entity_id = {p}
+                   AND id > {p}
+                 ORDER BY id
+                """,  # nosec B608
+                (entity_id, after_id),
+            )
+            .mappings()
+            .fetchall()
+        )
+
+    def _segments(self, entity_id: int) -> list[dict]:
+        return (
+            self.conn.execute(
+                f"""
+                SELECT num_facts,
+                       max_fact_id,
+                       dim,
+                       fact_ids,
+                       embeddings
+                  FROM memori_entity_fact_segment
+                 WHERE entity_id = {self.placeholder}
+                 ORDER BY id
+                """,  # nosec B608
+                (entity_id,),
+            )
+            .mappings()
+            .fetchall()
+        )
+
+    def _insert(self, entity_id: int, segment: dict) -> None:
+        p = self.placeholder
+        self.conn.execute(
+            f"""
+            INSERT INTO memori_entity_fact_segment(
+                entity_id,
+                num_facts,
+                max_fact_id,
+                dim,
+                fact_ids,
+                embeddings
+            ) VALUES ({p}, {p}, {p}, {p}, {p}, {p})
+            """,  # nosec B608
+            (
+                entity_id,
+                segment["num_facts"],
+                segment["max_fact_id"],
+                segment["dim"],
+                segment["fact_ids"],
+                segment["embeddings"],
+            ),
+        )
+
+    def _replace(self, entity_id: int, segments: list[dict]) -> list[dict]:
+        self.conn.execute(
+            f"""
+            DELETE
+              FROM memori_entity_fact_segment
+             WHERE entity_id = {self.placeholder}
+            """,  # nosec B608
+            (entity_id,),
+        )
+        for segment in segments:
+            self._insert(entity_id, segment)
+        self.conn.commit()
+        return segments
+
+
+def _pack(rows: list[dict]) -> dict | None:
+    """Pack fact rows into one segment; None if the embeddings differ in size."""
+    from memori.search._parsing import parse_embedding
+
+    if not rows:
+        return None
+
+    vectors = [parse_embedding(row["content_embedding"]) for row in rows]
+    dim = vectors[0].shape[0]
+    if dim == 0 or any(v.ndim != 1 or v.shape[0] != dim for v in vectors):
+        return None
+
+    fact_ids = np.asarray([int(row["id"]) for row in rows], dtype="<i8")
+    return {
+        "num_facts": len(rows),
+        "max_fact_id": int(fact_ids.max()),
+        "dim": dim,
+        "fact_ids": fact_ids.tobytes(),
+        "embeddings": np.asarray(vectors, dtype="<f4").tobytes(),
+    }
+
+
+def _merge(segments: list[dict]) -> dict:
+    return {
+        "num_facts": sum(int(s["num_facts"]) for s in segments),
+        "max_fact_id": max(int(s["max_fact_id"]) for s in segments),
+        "dim": int(segments[0]["dim"]),
+        "fact_ids": b"".join(bytes(s["fact_ids"]) for s in segments),
+        "embeddings": b"".join(bytes(s["embeddings"]) for s in segments),
+    }
+
+
+def _unpack(segments: list[dict]) -> tuple[np.ndarray, np.ndarray] | None:
+    dim = int(segments[0]["dim"])
+    if any(int(s["dim"]) != dim for s in segments):
+        return None
+
+    merged = _merge(segments)
+    fact_ids = np.frombuffer(merged["fact_ids"], dtype="<i8")
+    # bytearray keeps the matrix writable; FAISS normalizes it in place.
+    embeddings = np.frombuffer(bytearray(merged["embeddings"]), dtype="<f4")
+    return fact_ids, embeddings.reshape(-1, dim)
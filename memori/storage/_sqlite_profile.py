@@ -0,0 +1,208 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Any
+from urllib.parse import quote
+
+from memori.storage._pool import ConnectionPool
+
+SQLITE_BUSY_TIMEOUT_MS = 5000
+SQLITE_CACHE_SIZE_KIB = 65536
+SQLITE_MMAP_SIZE = 268435456
+
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+    f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KIB}",
+    f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+)
+
+_READ_STATEMENTS = {"SELECT", "WITH", "EXPLAIN"}
+
+
+def _is_read(operation: str) -> bool:
+    words = operation.lstrip().split(None, 1)
+    return bool(words) and words[0].upper() in _READ_STATEMENTS
+
+
+def database_path(conn: Any) -> str | None:
+    """Return the file behind a sqlite3 connection, or None for in-memory."""
+    if not isinstance(conn, sqlite3.Connection):
+        return None
+    try:
+        rows = conn.execute("PRAGMA database_list").fetchall()
+    except Exception:
+        return None
+    for _seq, name, path in rows:
+        if name == "main":
+            return os.path.realpath(path) if path else None
+    return None
+
+
+class SqliteProfile:
+    """WAL profile for one SQLite file: a single writer, pooled readers.
+
+    Calling the profile returns a connection that sends reads to a pooled
+    read-only connection and writes to the shared writer connection. A
+    connection holds the writer from its first write until commit or
+    rollback, so writes are serialized inside the process instead of
+    contending for the database lock.
+    """
+
+    def __init__(self, path: str, *, read_pool_size: int, max_lifetime: float):
+        self.path = path
+        self.busy_timeout = SQLITE_BUSY_TIMEOUT_MS / 1000
+        self.writer = sqlite3.connect(
+            path, timeout=self.busy_timeout, check_same_thread=False
+        )
+        self.writer.execute("PRAGMA journal_mode=WAL")
+        _apply_pragmas(self.writer)
+        self.writer_lock = threading.Lock()
+        self.readers = ConnectionPool(
+            self._connect_reader,
+            max_size=read_pool_size,
+            max_lifetime=max_lifetime,
+        )
+
+    def __call__(self) -> tuple["SqliteConnection", Any]:
+        resource = self.readers()
+        if isinstance(resource, tuple):
+            reader, release_reader = resource
+        else:
+            reader, release_reader = resource, resource.close
+
+        conn = SqliteConnection(self, reader)
+
+        def release():
+            try:
+                conn.close()
+            finally:
+                release_reader()
+
+        return conn, release
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        reader = sqlite3.connect(
+            f"file:{quote(self.path)}?mode=ro",
+            uri=True,
+            timeout=self.busy_timeout,
+            check_same_thread=False,
+        )
+        _apply_pragmas(reader)
+        return reader
+
+
+class SqliteConnection:
+    """DB-API connection routed by SqliteProfile."""
+
+    def __init__(self, profile: SqliteProfile, reader: sqlite3.Connection):
+        self._profile = profile
+        self._reader = reader
+        self._writing = False
+
+    def cursor(self) -> "_Cursor":
+        return _Cursor(self)
+
+    def commit(self) -> None:
+        if not self._writing:
+            return
+        try:
+            self._profile.writer.commit()
+        finally:
+            self._release_writer()
+
+    def rollback(self) -> None:
+        if not self._writing:
+            return
+        try:
+            self._profile.writer.rollback()
+        finally:
+            self._release_writer()
+
+    def close(self) -> None:
+        self.rollback()
+
+    def _cursor_for(self, operation: str, write: bool) -> sqlite3.Cursor:
+        if write and not self._writing:
+            if not self._profile.writer_lock.acquire(
+                timeout=self._profile.busy_timeout
+            ):
+                raise sqlite3.OperationalError("database is locked")
+            self._writing = True
+
+        # Reads see this connection's own uncommitted writes.
+        if self._writing:
+            return self._profile.writer.cursor()
+        return self._reader.cursor()
+
+    def _release_writer(self) -> None:
+        self._writing = False
+        self._profile.writer_lock.release()
+
+
+class _Cursor:
+    def __init__(self, conn: SqliteConnection):
+        self._conn = conn
+        self._cursor: sqlite3.Cursor | None = None
+
+    @property
+    def description(self):
+        return self._cursor.description if self._cursor is not None else None
+
+    def execute(self, operation, binds=()):
+        self._cursor = self._conn._cursor_for(operation, not _is_read(operation))
+        self._cursor.execute(operation, binds)
+        return self
+
+    def executemany(self, operation, seq_of_binds):
+        self._cursor = self._conn._cursor_for(operation, True)
+        self._cursor.executemany(operation, seq_of_binds)
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone() if self._cursor is not None else None
+
+    def fetchall(self):
+        return self._cursor.fetchall() if self._cursor is not None else []
+
+    def close(self) -> None:
+        if self._cursor is not None:
+            self._cursor.close()
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+
+
+_profiles: dict[str, SqliteProfile] = {}
+_profiles_lock = threading.Lock()
+
+
+def get_sqlite_profile(
+    conn: Any, *, read_pool_size: int, max_lifetime: float
+) -> SqliteProfile | None:
+    """Return the process-wide profile for the file behind conn.
+
+    In-memory databases cannot be shared between connections and get None.
+    """
+    path = database_path(conn)
+    if path is None:
+        return None
+
+    with _profiles_lock:
+        if path not in _profiles:
+            _profiles[path] = SqliteProfile(
+                path, read_pool_size=read_pool_size, max_lifetime=max_lifetime
+            )
+        return _profiles[path]
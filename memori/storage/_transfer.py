@@ -0,0 +1,347 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import importlib
+import json
+import os
+import sys
+from collections import defaultdict
+from typing import Any
+
+import numpy as np
+
+from memori._cli import Cli
+from memori._config import Config
+
+EXPORT_FORMAT = "memori-export"
+EXPORT_VERSION = 1
+
+# Rows per chunk file. Export and import hold one chunk in memory at a time.
+EXPORT_CHUNK_SIZE = 1000
+
+MANIFEST = "manifest.json"
+
+
+def _pack_text(arrays: dict, name: str, values: list) -> None:
+    # Arrow-style string column: UTF-8 bytes, n + 1 offsets and a validity
+    # mask, so loading never needs pickle.
+    encoded = [b"" if value is None else str(value).encode("utf-8") for value in values]
+    arrays[f"{name}.data"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    arrays[f"{name}.offsets"] = np.cumsum(
+        [0] + [len(value) for value in encoded], dtype=np.int64
+    )
+    arrays[f"{name}.valid"] = np.array(
+        [value is not None for value in values], dtype=bool
+    )
+
+
+def _unpack_text(chunk: Any, name: str) -> list[str | None]:
+    data = chunk[f"{name}.data"].tobytes()
+    offsets = chunk[f"{name}.offsets"]
+    return [
+        data[offsets[i] : offsets[i + 1]].decode("utf-8") if valid else None
+        for i, valid in enumerate(chunk[f"{name}.valid"])
+    ]
+
+
+def _pack_lists(arrays: dict, name: str, values: list, dtype: Any) -> None:
+    arrays[f"{name}.values"] = (
+        np.concatenate([np.asarray(value, dtype=dtype) for value in values])
+        if values
+        else np.empty(0, dtype=dtype)
+    )
+    arrays[f"{name}.offsets"] = np.cumsum(
+        [0] + [len(value) for value in values], dtype=np.int64
+    )
+
+
+def _unpack_lists(chunk: Any, name: str) -> list[np.ndarray]:
+    values = chunk[f"{name}.values"]
+    offsets = chunk[f"{name}.offsets"]
+    return [values[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def _pages(export: Any, entity_id: int, chunk_size: int):
+    after_id = None
+    while True:
+        rows = export(entity_id, after_id, chunk_size)
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        after_id = rows[-1]["id"]
+
+
+class _ChunkWriter:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.chunks: dict[str, list[str]] = defaultdict(list)
+        self.counts: dict[str, int] = defaultdict(int)
+
+    def write(self, kind: str, num_rows: int, arrays: dict) -> None:
+        name = f"{kind}-{len(self.chunks[kind]):05d}.npz"
+        np.savez(os.path.join(self.path, name), **arrays)
+        self.chunks[kind].append(name)
+        self.counts[kind] += num_rows
+
+
+def export_entity(
+    config: Config,
+    entity_id: str,
+    path: str,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> dict[str, int]:
+    """Write an entity's memories to a directory of columnar chunks.
+
+    The directory holds a manifest.json and .npz chunks of conversations
+    (with their messages), facts (with embeddings and the conversations
+    that mention them) and triples. Rows are read in keyset pages of
+    chunk_size, so memory stays bounded by one chunk. Export only reads;
+    a ValueError is raised if the entity does not exist. Returns row counts.
+    """
+    from memori.search._parsing import parse_embedding
+
+    driver = config.storage.driver
+    internal_id = driver.entity.read(entity_id)
+    if internal_id is None:
+        raise ValueError(f'entity "{entity_id}" does not exist')
+    os.makedirs(path, exist_ok=True)
+    writer = _ChunkWriter(path)
+
+    # Mentions reference conversations by their position in the export, so
+    # the files do not depend on the source database's ids.
+    conversation_index: dict[Any, int] = {}
+    for rows in _pages(driver.conversation.export, internal_id, chunk_size):
+        messages = [driver.conversation.messages.read(row["id"]) for row in rows]
+        for row in rows:
+            conversation_index[row["id"]] = len(conversation_index)
+
+        arrays: dict = {}
+        _pack_text(arrays, "session_uuid", [str(row["session_uuid"]) for row in rows])
+        _pack_text(
+            arrays, "process_external_id", [row["process_external_id"] for row in rows]
+        )
+        _pack_text(arrays, "summary", [row["summary"] for row in rows])
+        _pack_text(arrays, "role", [m["role"] for group in messages for m in group])
+        _pack_text(
+            arrays, "content", [m["content"] for group in messages for m in group]
+        )
+        arrays["messages.offsets"] = np.cumsum(
+            [0] + [len(group) for group in messages], dtype=np.int64
+        )
+        writer.write("conversations", len(rows), arrays)
+
+    for rows in _pages(driver.entity_fact.export, internal_id, chunk_size):
+        mentions = defaultdict(list)
+        for mention in driver.entity_fact.read_mentions([row["id"] for row in rows]):
+            index = conversation_index.get(mention["conversation_id"])
+            if index is not None:
+                mentions[mention["fact_id"]].append(index)
+
+        arrays = {"num_times": np.array([row["num_times"] for row in rows])}
+        _pack_text(arrays, "content", [row["content"] for row in rows])
+        _pack_lists(
+            arrays,
+            "embedding",
+            [parse_embedding(row["content_embedding"]) for row in rows],
+            np.float32,
+        )
+        _pack_lists(arrays, "mentions", [mentions[row["id"]] for row in rows], np.int64)
+        writer.write("facts", len(rows), arrays)
+
+    for rows in _pages(driver.knowledge_graph.export, internal_id, chunk_size):
+        arrays = {"num_times": np.array([row["num_times"] for row in rows])}
+        for column in (
+            "subject_name",
+            "subject_type",
+            "predicate",
+            "object_name",
+            "object_type",
+        ):
+            _pack_text(arrays, column, [row[column] for row in rows])
+        writer.write("triples", len(rows), arrays)
+
+    with open(os.path.join(path, MANIFEST), "w") as f:
+        json.dump(
+            {
+                "format": EXPORT_FORMAT,
+                "version": EXPORT_VERSION,
+                "entity_id": entity_id,
+                "chunks": dict(writer.chunks),
+                "counts": dict(writer.counts),
+            },
+            f,
+            indent=2,
+        )
+
+    return {kind: writer.counts[kind] for kind in ("conversations", "facts", "triples")}
+
+
+def read_manifest(path: str) -> dict:
+    with open(os.path.join(path, MANIFEST)) as f:
+        manifest = json.load(f)
+
+    if manifest.get("format") != EXPORT_FORMAT:
+        raise ValueError(f"{path} is not a Memori export")
+    if manifest.get("version") != EXPORT_VERSION:
+        raise ValueError(
+            f"unsupported Memori export version {manifest.get('version')}; "
+            f"expected {EXPORT_VERSION}"
+        )
+    return manifest
+
+
+def import_entity(config: Config, entity_id: str, path: str) -> dict[str, int]:
+    """Load an export written by export_entity into the entity_id entity.
+
+    Writes go through the drivers' bulk upserts (EntityFact.create,
+    KnowledgeGraph.create, ConversationMessages.create_many), one chunk per
+    call. Sessions keep their exported uuids; importing into a database
+    that already holds them appends to the existing conversations. Message
+    types and row timestamps are not carried over. Returns row counts.
+    """
+    from memori.memory._struct import SemanticTriple
+
+    manifest = read_manifest(path)
+    chunks = manifest.get("chunks", {})
+    driver = config.storage.driver
+    internal_id = driver.entity.create(entity_id)
+    counts = {"conversations": 0, "facts": 0, "triples": 0}
+
+    conversation_ids = []
+    for name in chunks.get("conversations", []):
+        with np.load(os.path.join(path, name), allow_pickle=False) as chunk:
+            session_uuids = _unpack_text(chunk, "session_uuid")
+            process_external_ids = _unpack_text(chunk, "process_external_id")
+            summaries = _unpack_text(chunk, "summary")
+            roles = _unpack_text(chunk, "role")
+            contents = _unpack_text(chunk, "content")
+            offsets = chunk["messages.offsets"]
+
+        for i, session_uuid in enumerate(session_uuids):
+            process_id = None
+            if process_external_ids[i] is not None:
+                process_id = driver.process.create(process_external_ids[i])
+            session_id = driver.session.create(session_uuid, internal_id, process_id)
+            conversation_id = driver.conversation.create(
+                session_id, config.session_timeout_minutes
+            )
+            driver.conversation.update(conversation_id, summaries[i])
+            driver.conversation.messages.create_many(
+                conversation_id,
+                [
+                    {"role": roles[j], "type": None, "content": contents[j]}
+                    for j in range(offsets[i], offsets[i + 1])
+                ],
+            )
+            conversation_ids.append(conversation_id)
+        config.storage.adapter.commit()
+        counts["conversations"] += len(session_uuids)
+
+    for name in chunks.get("facts", []):
+        with np.load(os.path.join(path, name), allow_pickle=False) as chunk:
+            facts = _unpack_text(chunk, "content")
+            embeddings = [e.tolist() for e in _unpack_lists(chunk, "embedding")]
+            mentions = _unpack_lists(chunk, "mentions")
+            num_times = chunk["num_times"].tolist()
+
+        driver.entity_fact.create(internal_id, facts, embeddings, num_times=num_times)
+
+        # Mentions are written by create() for one conversation at a time;
+        # a zero count leaves the facts just imported unchanged.
+        by_conversation = defaultdict(list)
+        for i, indexes in enumerate(mentions):
+            for index in indexes.tolist():
+                by_conversation[index].append(i)
+        for index, positions in by_conversation.items():
+            if index >= len(conversation_ids):
+                continue
+            driver.entity_fact.create(
+                internal_id,
+                [facts[i] for i in positions],
+                [embeddings[i] for i in positions],
+                conversation_id=conversation_ids[index],
+                num_times=[0] * len(positions),
+            )
+        counts["facts"] += len(facts)
+
+    for name in chunks.get("triples", []):
+        with np.load(os.path.join(path, name), allow_pickle=False) as chunk:
+            columns = {
+                column: _unpack_text(chunk, column)
+                for column in (
+                    "subject_name",
+                    "subject_type",
+                    "predicate",
+                    "object_name",
+                    "object_type",
+                )
+            }
+            num_times = chunk["num_times"].tolist()
+
+        triples = []
+        for i in range(len(num_times)):
+            triple = SemanticTriple()
+            for column, values in columns.items():
+                setattr(triple, column, values[i])
+            triples.append(triple)
+        driver.knowledge_graph.create(internal_id, triples, num_times=num_times)
+        counts["triples"] += len(triples)
+
+    return counts
+
+
+def _load_connection(spec: str) -> Any:
+    module_name, _, attribute = spec.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(
+            f'connection must be given as "module:attribute", got "{spec}"'
+        )
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class ExportManager:
+    def __init__(self, config: Config):
+        self.config = config
+
+    def execute(self):
+        from memori import Memori
+
+        cli = Cli(self.config)
+        with Memori(conn=_load_connection(sys.argv[2])) as memori:
+            counts = memori.export_memories(sys.argv[4], entity_id=sys.argv[3])
+
+        for kind, count in counts.items():
+            cli.notice(f"exported {count} {kind}")
+        cli.newline()
+
+    def usage(self):
+        print("usage: python -m memori export <module:connection> <entity_id> <path>")
+
+
+class ImportManager:
+    def __init__(self, config: Config):
+        self.config = config
+
+    def execute(self):
+        from memori import Memori
+
+        cli = Cli(self.config)
+        with Memori(conn=_load_connection(sys.argv[2])) as memori:
+            memori.config.storage.build()
+            counts = memori.import_memories(sys.argv[4], entity_id=sys.argv[3])
+
+        for kind, count in counts.items():
+            cli.notice(f"imported {count} {kind}")
+        cli.newline()
+
+    def usage(self):
+        print("usage: python -m memori import <module:connection> <entity_id> <path>")
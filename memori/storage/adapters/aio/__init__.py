@@ -0,0 +1,15 @@
+# Importing the modules registers their adapters; specific matchers go first.
+from memori.storage.adapters.aio import _sqlalchemy, _mongodb, _asyncpg, _dbapi  # noqa: F401, I001
+from memori.storage.adapters.aio._bridge import (
+    AsyncBridge,
+    AsyncConnectionFactory,
+    is_async_connection,
+)
+from memori.storage.adapters.aio._result import BufferedResult
+
+__all__ = [
+    "AsyncBridge",
+    "AsyncConnectionFactory",
+    "BufferedResult",
+    "is_async_connection",
+]
@@ -0,0 +1,103 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import re
+
+from memori.storage._base import BaseAsyncStorageAdapter
+from memori.storage._registry import Registry
+from memori.storage.adapters.aio._result import BufferedResult
+
+_PLACEHOLDER = re.compile(r"%(s|%)")
+_RETURNS_ROWS = re.compile(
+    r"^\s*(SELECT|WITH|SHOW|VALUES|TABLE)\b|\bRETURNING\b", re.IGNORECASE
+)
+
+
+def _numbered(operation: str) -> str:
+    """Rewrite the drivers' %s placeholders into asyncpg's $1, $2, ..."""
+    position = 0
+
+    def replace(match):
+        nonlocal position
+        if match.group(1) == "%":
+            return "%"
+        position += 1
+        return f"${position}"
+
+    return _PLACEHOLDER.sub(replace, operation)
+
+
+@Registry.register_async_adapter(
+    lambda conn: type(conn).__module__.startswith("asyncpg")
+)
+class Adapter(BaseAsyncStorageAdapter):
+    """asyncpg connection or pool.
+
+    asyncpg autocommits; a transaction is started on first use so commit()
+    and rollback() keep the semantics the drivers expect.
+    """
+
+    def __init__(self, conn, owned: bool = False):
+        super().__init__(conn, owned=owned)
+        self._connection = None
+        self._transaction = None
+
+    async def open(self):
+        if hasattr(self.conn, "acquire") and hasattr(self.conn, "release"):
+            self._connection = await self.conn.acquire()
+        else:
+            self._connection = self.conn
+        return self
+
+    async def close(self):
+        try:
+            await self.rollback()
+        finally:
+            if self._connection is not self.conn:
+                await self.conn.release(self._connection)
+            elif self.owned:
+                await self._connection.close()
+            self._connection = None
+
+    async def commit(self):
+        if self._transaction is not None:
+            transaction, self._transaction = self._transaction, None
+            await transaction.commit()
+        return self
+
+    async def execute(self, operation, binds=()):
+        await self._begin()
+        # fetch() always prepares. Statements that return no rows go through
+        # execute(), which uses the simple protocol when there are no binds,
+        # so multi-command migrations and SET statements run as sent.
+        if not _RETURNS_ROWS.search(operation):
+            await self._connection.execute(_numbered(operation), *binds)
+            return BufferedResult()
+        rows = await self._connection.fetch(_numbered(operation), *binds)
+        return BufferedResult(tuple(rows[0].keys()) if rows else (), rows)
+
+    async def execute_many(self, operation, seq_of_binds):
+        await self._begin()
+        await self._connection.executemany(_numbered(operation), list(seq_of_binds))
+        return BufferedResult()
+
+    async def rollback(self):
+        if self._transaction is not None:
+            transaction, self._transaction = self._transaction, None
+            await transaction.rollback()
+        return self
+
+    def get_dialect(self):
+        return "postgresql"
+
+    async def _begin(self):
+        if self._transaction is None:
+            self._transaction = self._connection.transaction()
+            await self._transaction.start()
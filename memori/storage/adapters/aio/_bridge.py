@@ -0,0 +1,139 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import asyncio
+import inspect
+from contextvars import ContextVar
+from typing import Any
+
+from memori.storage._base import BaseAsyncStorageAdapter, BaseStorageAdapter
+from memori.storage._registry import Registry
+
+
+def is_async_connection(conn: Any) -> bool:
+    """Whether conn is an async connection/engine/session or async factory."""
+    if Registry().async_adapter_class(conn) is not None:
+        return True
+    return inspect.iscoroutinefunction(conn)
+
+
+class AsyncBridge:
+    """Synchronous handle on an async adapter running on an event loop.
+
+    The drivers are synchronous, so they run on a worker thread and every
+    statement is handed to the loop with run_coroutine_threadsafe(). Calling
+    in from the loop's own thread would deadlock and is refused.
+    """
+
+    def __init__(self, factory: "AsyncConnectionFactory", loop):
+        self.factory = factory
+        self.loop = loop
+        self.adapter: BaseAsyncStorageAdapter | None = None
+
+    def open(self) -> BaseAsyncStorageAdapter:
+        if self.adapter is None:
+            self.adapter = self.run(self.factory.open())
+        return self.adapter
+
+    def close(self) -> None:
+        if self.adapter is not None:
+            adapter, self.adapter = self.adapter, None
+            self.run(adapter.close())
+
+    def run(self, coro):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self.loop:
+            coro.close()
+            raise RuntimeError(
+                "Async storage cannot be used synchronously from its event loop"
+            )
+        if self.loop.is_closed() or not self.loop.is_running():
+            coro.close()
+            raise RuntimeError("The event loop for async storage is not running")
+
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+class AsyncConnectionFactory:
+    """Connection factory over an async connection source.
+
+    Each call returns an AsyncBridge bound to the loop of the current
+    Manager.run() call, or the loop that last ran storage work when called
+    from a background thread (augmentation, Rust core callbacks).
+    """
+
+    def __init__(self, conn: Any):
+        self.conn = conn
+        self.loop = None
+        self._current_loop: ContextVar = ContextVar(
+            f"memori_async_loop_{id(self)}", default=None
+        )
+
+    def __call__(self) -> tuple[AsyncBridge, Any]:
+        loop = self._current_loop.get() or self.loop
+        if loop is None:
+            raise RuntimeError("Async storage has not been used from an event loop")
+
+        bridge = AsyncBridge(self, loop)
+        return bridge, bridge.close
+
+    def bind(self, loop) -> None:
+        self.loop = loop
+        self._current_loop.set(loop)
+
+    async def open(self) -> BaseAsyncStorageAdapter:
+        registry = Registry()
+        adapter_class = registry.async_adapter_class(self.conn)
+        if adapter_class is not None and not adapter_class.is_factory(self.conn):
+            adapter = adapter_class(self.conn)
+        else:
+            resource = self.conn()
+            if inspect.isawaitable(resource):
+                resource = await resource
+            adapter = registry.async_adapter(resource, owned=True)
+
+        try:
+            return await adapter.open()
+        except Exception:
+            if adapter.owned:
+                await adapter.close()
+            raise
+
+
+@Registry.register_adapter(lambda conn: isinstance(conn, AsyncBridge))
+class Adapter(BaseStorageAdapter):
+    def __init__(self, conn):
+        super().__init__(conn)
+        self._adapter = self.conn.open()
+
+    def commit(self):
+        self.conn.run(self._adapter.commit())
+        return self
+
+    def execute(self, *args, **kwargs):
+        return self.conn.run(self._adapter.execute(*args, **kwargs))
+
+    def execute_many(self, operation, seq_of_binds):
+        return self.conn.run(self._adapter.execute_many(operation, seq_of_binds))
+
+    def flush(self):
+        self.conn.run(self._adapter.flush())
+        return self
+
+    def get_dialect(self):
+        return self._adapter.get_dialect()
+
+    def rollback(self):
+        self.conn.run(self._adapter.rollback())
+        return self
@@ -0,0 +1,102 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import inspect
+
+from memori.storage._base import BaseAsyncStorageAdapter
+from memori.storage._registry import Registry
+from memori.storage.adapters.aio._result import BufferedResult
+
+
+async def _maybe_await(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def is_async_dbapi_connection(conn):
+    """Async DB-API style connections: aiosqlite, psycopg, aiomysql, asyncmy."""
+    return (
+        callable(getattr(conn, "cursor", None))
+        and inspect.iscoroutinefunction(getattr(conn, "commit", None))
+        and inspect.iscoroutinefunction(getattr(conn, "rollback", None))
+        and not type(conn).__module__.startswith("sqlalchemy")
+    )
+
+
+@Registry.register_async_adapter(is_async_dbapi_connection)
+class Adapter(BaseAsyncStorageAdapter):
+    def __init__(self, conn, owned: bool = False):
+        super().__init__(conn, owned=owned)
+        self._detected_dialect = None
+
+    async def open(self):
+        if self.get_dialect() == "mysql" and await self._is_tidb_server():
+            self._detected_dialect = "tidb"
+        return self
+
+    async def close(self):
+        if self.owned:
+            await _maybe_await(self.conn.close())
+
+    async def commit(self):
+        await self.conn.commit()
+        return self
+
+    async def execute(self, operation, binds=()):
+        cursor = await _maybe_await(self.conn.cursor())
+        try:
+            await cursor.execute(operation, binds)
+            if cursor.description is None:
+                return BufferedResult()
+            return BufferedResult(
+                tuple(col[0] for col in cursor.description),
+                await cursor.fetchall(),
+            )
+        finally:
+            await _maybe_await(cursor.close())
+
+    async def execute_many(self, operation, seq_of_binds):
+        cursor = await _maybe_await(self.conn.cursor())
+        try:
+            await cursor.executemany(operation, list(seq_of_binds))
+            return BufferedResult()
+        finally:
+            await _maybe_await(cursor.close())
+
+    async def rollback(self):
+        await self.conn.rollback()
+        return self
+
+    def get_dialect(self):
+        if self._detected_dialect is not None:
+            return self._detected_dialect
+
+        module_name = type(self.conn).__module__
+        dialect_mapping = {
+            "sqlite": ["aiosqlite"],
+            "postgresql": ["psycopg"],
+            "mysql": ["aiomysql", "asyncmy"],
+        }
+        for dialect, identifiers in dialect_mapping.items():
+            if any(identifier in module_name for identifier in identifiers):
+                self._detected_dialect = dialect
+                return dialect
+        raise ValueError(
+            f"Unable to determine dialect from connection module: {module_name}"
+        )
+
+    async def _is_tidb_server(self) -> bool:
+        try:
+            version = (await self.execute("SELECT VERSION()")).scalar()
+        except Exception:
+            return False
+
+        return isinstance(version, str) and "tidb" in version.lower()
@@ -0,0 +1,72 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import inspect
+
+from memori.storage._base import BaseAsyncStorageAdapter
+from memori.storage._registry import Registry
+
+
+def is_async_mongodb(conn):
+    return type(conn).__module__.startswith(
+        ("motor", "pymongo.asynchronous")
+    ) and hasattr(conn, "list_collection_names")
+
+
+@Registry.register_async_adapter(is_async_mongodb)
+class Adapter(BaseAsyncStorageAdapter):
+    """Motor or PyMongo async client/database."""
+
+    async def open(self):
+        # Motor databases resolve unknown attributes to collections, so a
+        # client is recognised by its class name rather than by hasattr().
+        if type(self.conn).__name__.endswith("Client"):
+            self._db = self.conn.get_default_database()
+        else:
+            self._db = self.conn
+
+        if self._db is None:
+            raise RuntimeError("MongoDB database connection is None")
+        return self
+
+    async def close(self):
+        """Async clients are long-lived and shared; they are never closed here."""
+
+    async def commit(self):
+        return self
+
+    async def execute(self, collection_name_or_ops, operation=None, *args, **kwargs):
+        if operation is None:
+            ops = collection_name_or_ops
+            for op in ops if isinstance(ops, list) else [ops]:
+                await self._call(
+                    op["collection"],
+                    op["method"],
+                    *op.get("args", []),
+                    **op.get("kwargs", {}),
+                )
+            return None
+
+        return await self._call(collection_name_or_ops, operation, *args, **kwargs)
+
+    async def rollback(self):
+        return self
+
+    def get_dialect(self):
+        return "mongodb"
+
+    async def _call(self, collection_name, operation, *args, **kwargs):
+        result = getattr(self._db[collection_name], operation)(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        # Cursors (find, aggregate) are drained here; the drivers iterate them.
+        if callable(getattr(result, "to_list", None)):
+            result = await result.to_list(None)
+        return result
@@ -0,0 +1,49 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+from typing import Any
+
+
+class BufferedResult:
+    """Rows fetched on the event loop, read back by the synchronous drivers."""
+
+    def __init__(self, columns: tuple[str, ...] = (), rows: list | None = None):
+        self._columns = tuple(columns)
+        self._rows = list(rows or [])
+
+    def mappings(self) -> "_MappingResult":
+        return _MappingResult(self._columns, self._rows)
+
+    def fetchone(self) -> tuple | None:
+        return tuple(self._rows.pop(0)) if self._rows else None
+
+    def fetchall(self) -> list[tuple]:
+        rows, self._rows = self._rows, []
+        return [tuple(row) for row in rows]
+
+    def scalar(self) -> Any:
+        row = self.fetchone()
+        return row[0] if row else None
+
+
+class _MappingResult:
+    def __init__(self, columns: tuple[str, ...], rows: list):
+        self._columns = columns
+        self._rows = rows
+
+    def fetchone(self) -> dict | None:
+        if not self._rows:
+            return None
+        return dict(zip(self._columns, self._rows.pop(0), strict=True))
+
+    def fetchall(self) -> list[dict]:
+        rows, self._rows[:] = list(self._rows), []
+        columns = self._columns
+        return [dict(zip(columns, row, strict=True)) for row in rows]
@@ -0,0 +1,101 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+from memori.storage._base import BaseAsyncStorageAdapter
+from memori.storage._registry import Registry
+
+_SESSION_FACTORIES = ("async_sessionmaker", "async_scoped_session")
+
+
+@Registry.register_async_adapter(
+    lambda conn: type(conn).__module__.startswith("sqlalchemy.ext.asyncio")
+)
+class Adapter(BaseAsyncStorageAdapter):
+    """SQLAlchemy AsyncEngine, AsyncConnection or AsyncSession."""
+
+    def __init__(self, conn, owned: bool = False):
+        super().__init__(conn, owned=owned)
+        self._connection = None
+        self._detected_dialect = None
+
+    @classmethod
+    def is_factory(cls, conn) -> bool:
+        return type(conn).__name__ in _SESSION_FACTORIES
+
+    async def open(self):
+        if type(self.conn).__name__ == "AsyncEngine":
+            self._connection = await self.conn.connect()
+        elif type(self.conn).__name__ == "AsyncConnection":
+            self._connection = self.conn
+
+        dialect = self._dialect()
+        if dialect.__class__.__module__.startswith("pyobvector."):
+            self._detected_dialect = "oceanbase"
+        else:
+            self._detected_dialect = dialect.name
+            if dialect.name in {"mysql", "mariadb"} and await self._is_tidb_server():
+                self._detected_dialect = "tidb"
+        return self
+
+    async def close(self):
+        if self._connection is None:
+            if self.owned:
+                await self.conn.close()
+            return
+
+        connection, self._connection = self._connection, None
+        if connection is not self.conn or self.owned:
+            await connection.close()
+
+    async def commit(self):
+        await self._target().commit()
+        return self
+
+    async def execute(self, operation, binds=()):
+        connection = await self._get_connection()
+        return await connection.exec_driver_sql(operation, binds)
+
+    async def execute_many(self, operation, seq_of_binds):
+        # A list of bind tuples makes exec_driver_sql use executemany.
+        connection = await self._get_connection()
+        return await connection.exec_driver_sql(operation, list(seq_of_binds))
+
+    async def flush(self):
+        if self._connection is None:
+            await self.conn.flush()
+        return self
+
+    async def rollback(self):
+        await self._target().rollback()
+        return self
+
+    def get_dialect(self):
+        return self._detected_dialect
+
+    def _dialect(self):
+        if self._connection is not None:
+            return self._connection.dialect
+        return self.conn.get_bind().dialect
+
+    async def _get_connection(self):
+        if self._connection is not None:
+            return self._connection
+        return await self.conn.connection()
+
+    def _target(self):
+        return self._connection if self._connection is not None else self.conn
+
+    async def _is_tidb_server(self) -> bool:
+        try:
+            version = (await self.execute("SELECT VERSION()")).scalar()
+        except Exception:
+            return False
+
+        return isinstance(version, str) and "tidb" in version.lower()
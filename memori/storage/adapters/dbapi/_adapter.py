@@ -11,6 +11,10 @@ r"""
 from memori.storage._base import BaseStorageAdapter
 from memori.storage._registry import Registry
 
+# oracledb/cx_Oracle keep parsed statements in a per-connection cache; the
+# drivers issue more distinct statements than the default of 20 holds.
+ORACLE_STATEMENT_CACHE_SIZE = 64
+
 
 class CursorWrapper:
     def __init__(self, cursor):
@@ -26,17 +30,31 @@ class CursorWrapper:
 class MappingResult:
     def __init__(self, cursor):
         self._cursor = cursor
+        description = cursor.description
+        self._columns = (
+            tuple(col[0] for col in description) if description is not None else ()
+        )
 
     def fetchone(self):
-        row = self._cursor.fetchone()
+        # Drivers only use fetchone() for single-row lookups, so the cursor
+        # is closed after the first row; later calls return None.
+        if self._cursor is None:
+            return None
+        try:
+            row = self._cursor.fetchone()
+        finally:
+            self._cursor.close()
+            self._cursor = None
         if row is None:
             return None
-        columns = [col[0] for col in self._cursor.description]
-        return dict(zip(columns, row, strict=True))
+        return dict(zip(self._columns, row, strict=True))
 
     def fetchall(self):
-        rows = self._cursor.fetchall()
-        columns = [col[0] for col in self._cursor.description]
+        try:
+            rows = self._cursor.fetchall()
+        finally:
+            self._cursor.close()
+        columns = self._columns
         return [dict(zip(columns, row, strict=True)) for row in rows]
 
 
@@ -69,20 +87,49 @@ class Adapter(BaseStorageAdapter):
     def __init__(self, conn):
         super().__init__(conn)
         self._detected_dialect = None
+        self._configure_statement_cache()
 
     def commit(self):
         self.conn.commit()
         return self
 
     def execute(self, operation, binds=()):
+        return self._execute(self.conn.cursor(), operation, binds)
+
+    def execute_prefetch(self, operation, binds, rows: int):
         cursor = self.conn.cursor()
+        # python-oracledb and cx_Oracle fetch arraysize rows per round trip
+        # and return prefetchrows with the execute itself; rows + 1 lets the
+        # driver see the end of the result without another trip.
+        if hasattr(cursor, "prefetchrows"):
+            cursor.arraysize = rows
+            cursor.prefetchrows = rows + 1
+        return self._execute(cursor, operation, binds)
+
+    def _execute(self, cursor, operation, binds):
         try:
             cursor.execute(operation, binds)
-            return CursorWrapper(cursor)
         except Exception:
             cursor.close()
             raise
 
+        # Statements without a result set have nothing left to read.
+        if cursor.description is None:
+            cursor.close()
+        return CursorWrapper(cursor)
+
+    def execute_many(self, operation, seq_of_binds):
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany(operation, seq_of_binds)
+        except Exception:
+            cursor.close()
+            raise
+
+        if cursor.description is None:
+            cursor.close()
+        return CursorWrapper(cursor)
+
     def flush(self):
         return self
 
@@ -125,3 +172,16 @@ class Adapter(BaseStorageAdapter):
     def rollback(self):
         self.conn.rollback()
         return self
+
+    def _configure_statement_cache(self) -> None:
+        # psycopg 3 is left to its own prepare_threshold: forcing prepare on
+        # the variable-shape multi-row VALUES and IN statements would evict
+        # the fixed-text ones from its prepared_max cache.
+        if not type(self.conn).__module__.startswith(("oracledb", "cx_Oracle")):
+            return
+
+        try:
+            if self.conn.stmtcachesize < ORACLE_STATEMENT_CACHE_SIZE:
+                self.conn.stmtcachesize = ORACLE_STATEMENT_CACHE_SIZE
+        except Exception:  # nosec B110
+            pass
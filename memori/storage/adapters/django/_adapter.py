@@ -69,6 +69,15 @@ class Adapter(BaseStorageAdapter):
             cursor.close()
             raise
 
+    def execute_many(self, operation, seq_of_binds):
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany(operation, seq_of_binds)
+            return CursorWrapper(cursor)
+        except Exception:
+            cursor.close()
+            raise
+
     def flush(self):
         return self
 
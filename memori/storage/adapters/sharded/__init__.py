@@ -0,0 +1,3 @@
+from memori.storage.adapters.sharded._adapter import Adapter, ShardedConn
+
+__all__ = ["Adapter", "ShardedConn"]
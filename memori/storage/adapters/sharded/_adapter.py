@@ -0,0 +1,146 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+import hashlib
+from collections.abc import Callable
+from typing import Any
+
+from memori.storage._base import BaseStorageAdapter
+from memori.storage._id_cache import get_id_cache
+from memori.storage._pool import ConnectionPool, pooled_factory
+from memori.storage._registry import Registry
+
+# Dialects whose row ids are integers, which the sharded driver namespaces.
+SHARDABLE_DIALECTS = {
+    "cockroachdb",
+    "mysql",
+    "oceanbase",
+    "oracle",
+    "postgresql",
+    "sqlite",
+    "tidb",
+}
+
+
+class ShardedConn:
+    """Connection factories of databases that together hold all entities.
+
+    Pass one to Memori(conn=...). Every entity lives on the shard chosen by
+    a stable hash of its external id, so the list and its order must not
+    change once data has been written; move entities between layouts with
+    export_memories/import_memories.
+    """
+
+    def __init__(self, conns: list[Callable[[], Any] | Any]) -> None:
+        if not conns:
+            raise ValueError("ShardedConn requires at least one connection")
+        self.factories = [
+            conn if callable(conn) else (lambda conn=conn: conn) for conn in conns
+        ]
+        # Connections passed in directly belong to the caller and are never
+        # pooled, as with Memori(conn=<connection>).
+        self._poolable = [callable(conn) for conn in conns]
+        self.dialect: str | None = None
+        self._pooled = False
+
+    def __len__(self) -> int:
+        return len(self.factories)
+
+    def pool(self, max_size: int, max_lifetime: float) -> None:
+        """Wrap each shard's factory in the built-in pool, once."""
+        if self._pooled:
+            return
+        self.factories = [
+            pooled_factory(factory, max_size, max_lifetime) if poolable else factory
+            for factory, poolable in zip(self.factories, self._poolable, strict=True)
+        ]
+        self._pooled = True
+
+    def close(self) -> None:
+        """Close the idle connections of the pools pool() created."""
+        for factory in self.factories:
+            if isinstance(factory, ConnectionPool):
+                factory.close()
+
+    def shard_for(self, external_id: str) -> int:
+        # hash() is salted per process; ids must land on the same shard in
+        # every process and across restarts.
+        digest = hashlib.blake2b(str(external_id).encode("utf-8"), digest_size=8)
+        return int.from_bytes(digest.digest(), "big") % len(self.factories)
+
+
+@Registry.register_adapter(lambda conn: isinstance(conn, ShardedConn))
+class Adapter(BaseStorageAdapter):
+    """Storage adapter over a ShardedConn.
+
+    Shard connections are opened on first use, so a call that touches one
+    entity opens one connection. commit, rollback and close apply to every
+    shard opened so far; there is no atomicity across shards.
+    """
+
+    driver_dialect = "sharded"
+
+    def __init__(self, conn):
+        super().__init__(conn)
+        self._shards: dict[int, tuple[BaseStorageAdapter, Any]] = {}
+
+    def shard(self, index: int) -> tuple[BaseStorageAdapter, Any]:
+        """Return the (adapter, driver) of shard index, opening it if needed."""
+        if index not in self._shards:
+            factory = self.conn.factories[index]
+            adapter = Registry().adapter(factory)
+            adapter.identity = get_id_cache().identity(factory)
+
+            dialect = adapter.get_dialect()
+            if dialect not in SHARDABLE_DIALECTS:
+                adapter.close()
+                raise ValueError(f"sharding is not supported for {dialect}")
+            if self.conn.dialect is None:
+                self.conn.dialect = dialect
+            elif dialect != self.conn.dialect:
+                adapter.close()
+                raise ValueError(
+                    f"shard #{index} is {dialect}; every shard must be "
+                    f"{self.conn.dialect}"
+                )
+
+            self._shards[index] = (adapter, Registry().driver(adapter))
+        return self._shards[index]
+
+    def close(self):
+        shards, self._shards = self._shards, {}
+        for adapter, _driver in shards.values():
+            adapter.close()
+        self.conn = None
+
+    def commit(self):
+        for adapter, _driver in self._shards.values():
+            adapter.commit()
+        return self
+
+    def execute(self, *args, **kwargs):
+        raise NotImplementedError("sharded storage has no single connection")
+
+    def execute_many(self, operation, seq_of_binds):
+        raise NotImplementedError("sharded storage has no single connection")
+
+    def flush(self):
+        for adapter, _driver in self._shards.values():
+            adapter.flush()
+        return self
+
+    def get_dialect(self):
+        if self.conn.dialect is None:
+            self.shard(0)
+        return self.conn.dialect
+
+    def rollback(self):
+        for adapter, _driver in self._shards.values():
+            adapter.rollback()
@@ -27,6 +27,10 @@ class Adapter(BaseStorageAdapter):
     def execute(self, operation, binds=()):
         return self.conn.connection().exec_driver_sql(operation, binds)
 
+    def execute_many(self, operation, seq_of_binds):
+        # A list of bind tuples makes exec_driver_sql use executemany.
+        return self.conn.connection().exec_driver_sql(operation, list(seq_of_binds))
+
     def flush(self):
         self.conn.flush()
         return self
@@ -8,9 +8,12 @@ r"""
                        memorilabs.ai
 """
 
+from collections import Counter
 from datetime import datetime, timezone
 from uuid import uuid4
 
+from pymongo import UpdateOne
+
 from memori.storage._base import (
     BaseConversation,
     BaseConversationMessage,
@@ -29,6 +32,24 @@ from memori.storage._registry import Registry
 from memori.storage.migrations._mongodb import migrations
 
 
+def _bulk_write(conn: BaseStorageAdapter, collection: str, operations: list) -> None:
+    # Unordered so one failed upsert does not stop the rest of the batch.
+    if operations:
+        conn.execute(collection, "bulk_write", operations, ordered=False)
+
+
+def _ids_by_uniq(
+    conn: BaseStorageAdapter, collection: str, uniqs: list, query: dict | None = None
+) -> dict:
+    results = conn.execute(
+        collection,
+        "find",
+        {**(query or {}), "uniq": {"$in": uniqs}},
+        {"_id": 1, "uniq": 1},
+    )
+    return {result["uniq"]: result["_id"] for result in results}
+
+
 class Conversation(BaseConversation):
     def __init__(self, conn: BaseStorageAdapter):
         super().__init__(conn)
@@ -41,18 +62,21 @@ class Conversation(BaseConversation):
         )
 
         if existing:
-            last_message = self.conn.execute(
-                "memori_conversation_message",
-                "find_one",
-                {"conversation_id": existing["_id"]},
-                sort=[("date_created", -1)],
-            )
+            last_activity = existing.get("last_activity")
+            if last_activity is None:
+                # Conversations written before last_activity was maintained.
+                last_message = self.conn.execute(
+                    "memori_conversation_message",
+                    "find_one",
+                    {"conversation_id": existing["_id"]},
+                    sort=[("date_created", -1)],
+                )
 
-            last_activity = (
-                last_message["date_created"]
-                if last_message
-                else existing["date_created"]
-            )
+                last_activity = (
+                    last_message["date_created"]
+                    if last_message
+                    else existing["date_created"]
+                )
 
             now = datetime.now(timezone.utc)
             minutes_elapsed = (now - last_activity).total_seconds() / 60
@@ -61,12 +85,14 @@ class Conversation(BaseConversation):
                 return existing.get("_id")
 
         conversation_uuid = str(uuid4())
+        date_created = datetime.now(timezone.utc)
         conversation_doc = {
             "uuid": conversation_uuid,
             "session_id": session_id,
             "summary": None,
-            "date_created": datetime.now(timezone.utc),
+            "date_created": date_created,
             "date_updated": None,
+            "last_activity": date_created,
         }
 
         result = self.conn.execute(
@@ -113,6 +139,59 @@ class Conversation(BaseConversation):
             return None
         return existing.get("_id")
 
+    def export(self, entity_id: int, after_id=None, limit: int = 1000):
+        sessions = {
+            session["_id"]: session
+            for session in self.conn.execute(
+                "memori_session",
+                "find",
+                {"entity_id": entity_id},
+                {"_id": 1, "uuid": 1, "process_id": 1},
+            )
+        }
+        query: dict = {"session_id": {"$in": list(sessions)}}
+        if after_id is not None:
+            query["_id"] = {"$gt": after_id}
+        conversations = list(
+            self.conn.execute(
+                "memori_conversation",
+                "find",
+                query,
+                {"_id": 1, "session_id": 1, "summary": 1},
+                sort=[("_id", 1)],
+                limit=limit,
+            )
+        )
+
+        process_ids = {
+            sessions[conversation["session_id"]].get("process_id")
+            for conversation in conversations
+        } - {None}
+        processes = {}
+        if process_ids:
+            processes = {
+                process["_id"]: process["external_id"]
+                for process in self.conn.execute(
+                    "memori_process",
+                    "find",
+                    {"_id": {"$in": list(process_ids)}},
+                    {"_id": 1, "external_id": 1},
+                )
+            }
+
+        rows = []
+        for conversation in conversations:
+            session = sessions[conversation["session_id"]]
+            rows.append(
+                {
+                    "id": conversation["_id"],
+                    "session_uuid": session["uuid"],
+                    "process_external_id": processes.get(session.get("process_id")),
+                    "summary": conversation.get("summary"),
+                }
+            )
+        return rows
+
 
 class ConversationMessage(BaseConversationMessage):
     def create(self, conversation_id: int, role: str, type: str, content: str):
@@ -127,16 +206,63 @@ class ConversationMessage(BaseConversationMessage):
         }
 
         self.conn.execute("memori_conversation_message", "insert_one", message_doc)
+        self.conn.execute(
+            "memori_conversation",
+            "update_one",
+            {"_id": conversation_id},
+            {"$set": {"last_activity": message_doc["date_created"]}},
+        )
 
 
 class ConversationMessages(BaseConversationMessages):
-    def read(self, conversation_id: int):
-        results = self.conn.execute(
+    def create_many(self, conversation_id: int, messages: list[dict]):
+        if not messages:
+            return self
+
+        date_created = datetime.now(timezone.utc)
+        self.conn.execute(
             "memori_conversation_message",
-            "find",
-            {"conversation_id": conversation_id},
-            {"role": 1, "content": 1, "_id": 0},
+            "insert_many",
+            [
+                {
+                    "uuid": str(uuid4()),
+                    "conversation_id": conversation_id,
+                    "role": message["role"],
+                    "type": message["type"],
+                    "content": message["content"],
+                    "date_created": date_created,
+                    "date_updated": None,
+                }
+                for message in messages
+            ],
+        )
+        self.conn.execute(
+            "memori_conversation",
+            "update_one",
+            {"_id": conversation_id},
+            {"$set": {"last_activity": date_created}},
         )
+        return self
+
+    def read(self, conversation_id: int, limit: int | None = None):
+        if limit is None:
+            results = self.conn.execute(
+                "memori_conversation_message",
+                "find",
+                {"conversation_id": conversation_id},
+                {"role": 1, "content": 1, "_id": 0},
+            )
+        else:
+            results = list(
+                self.conn.execute(
+                    "memori_conversation_message",
+                    "find",
+                    {"conversation_id": conversation_id},
+                    {"role": 1, "content": 1, "_id": 0},
+                    sort=[("_id", -1)],
+                    limit=limit,
+                )
+            )[::-1]
 
         messages = []
         for result in results:
@@ -146,14 +272,11 @@ class ConversationMessages(BaseConversationMessages):
 
 
 class Entity(BaseEntity):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
         # Check if entity already exists
-        existing = self.conn.execute(
-            "memori_entity", "find_one", {"external_id": external_id}
-        )
-
-        if existing:
-            return existing.get("_id")
+        existing = self._read(external_id)
+        if existing is not None:
+            return existing
 
         # Create new entity
         entity_doc = {
@@ -167,6 +290,14 @@ class Entity(BaseEntity):
 
         return result.inserted_id
 
+    def _read(self, external_id: str):
+        existing = self.conn.execute(
+            "memori_entity", "find_one", {"external_id": external_id}
+        )
+        if not existing:
+            return None
+        return existing.get("_id")
+
 
 class EntityFact(BaseEntityFact):
     def create(
@@ -175,128 +306,84 @@ class EntityFact(BaseEntityFact):
         facts: list,
         fact_embeddings: list | None = None,
         conversation_id: int | None = None,
+        num_times: list[int] | None = None,
     ):
         if facts is None or len(facts) == 0:
             return self
 
-        from memori._utils import generate_uniq
-        from memori.embeddings import format_embedding_for_db
-
-        for i, fact in enumerate(facts):
-            embedding = (
-                fact_embeddings[i]
-                if fact_embeddings and i < len(fact_embeddings)
-                else []
-            )
-            embedding_formatted = format_embedding_for_db(embedding, "mongodb")
-            uniq = generate_uniq([fact])
-
-            # Check if fact already exists
-            existing = self.conn.execute(
-                "memori_entity_fact",
-                "find_one",
-                {"entity_id": entity_id, "uniq": uniq},
-            )
-
-            fact_id = None
-            if existing:
-                # Update existing fact
-                self.conn.execute(
-                    "memori_entity_fact",
-                    "update_one",
-                    {"_id": existing["_id"]},
-                    {
-                        "$inc": {"num_times": 1},
-                        "$set": {"date_last_time": datetime.now(timezone.utc)},
-                    },
-                )
-                fact_id = existing["_id"]
-            else:
-                # Insert new fact
-                fact_doc = {
-                    "uuid": str(uuid4()),
-                    "entity_id": entity_id,
-                    "content": fact,
-                    "content_embedding": embedding_formatted,
-                    "num_times": 1,
-                    "date_last_time": datetime.now(timezone.utc),
-                    "uniq": uniq,
-                    "date_created": datetime.now(timezone.utc),
-                    "date_updated": None,
-                }
-
-                inserted = self.conn.execute(
-                    "memori_entity_fact", "insert_one", fact_doc
-                )
-                if inserted is not None and hasattr(inserted, "inserted_id"):
-                    fact_id = inserted.inserted_id
-                else:
-                    created = self.conn.execute(
-                        "memori_entity_fact",
-                        "find_one",
-                        {"entity_id": entity_id, "uniq": uniq},
-                        {"_id": 1},
-                    )
-                    if created is not None:
-                        fact_id = created.get("_id")
-
-            if conversation_id is not None and fact_id is not None:
-                now = datetime.now(timezone.utc)
-                self.conn.execute(
-                    "memori_entity_fact_mention",
-                    "update_one",
-                    {
-                        "entity_id": entity_id,
-                        "fact_id": fact_id,
-                        "conversation_id": conversation_id,
-                    },
+        now = datetime.now(timezone.utc)
+        rows = self._fact_rows(entity_id, facts, fact_embeddings, "mongodb", num_times)
+        _bulk_write(
+            self.conn,
+            "memori_entity_fact",
+            [
+                UpdateOne(
+                    {"entity_id": entity_id, "uniq": uniq},
                     {
+                        "$inc": {"num_times": num_times},
+                        "$set": {"date_last_time": now},
                         "$setOnInsert": {
-                            "uuid": str(uuid4()),
+                            "uuid": uuid,
+                            "content": content,
+                            "content_embedding": content_embedding,
                             "date_created": now,
+                            "date_updated": None,
                         },
-                        "$set": {"date_updated": now},
                     },
                     upsert=True,
                 )
+                for uuid, _, content, content_embedding, num_times, uniq in rows
+            ],
+        )
+
+        if conversation_id is not None:
+            fact_ids = _ids_by_uniq(
+                self.conn,
+                "memori_entity_fact",
+                [row[5] for row in rows],
+                {"entity_id": entity_id},
+            )
+            _bulk_write(
+                self.conn,
+                "memori_entity_fact_mention",
+                [
+                    UpdateOne(
+                        {
+                            "entity_id": entity_id,
+                            "fact_id": fact_id,
+                            "conversation_id": conversation_id,
+                        },
+                        {
+                            "$setOnInsert": {
+                                "uuid": str(uuid4()),
+                                "date_created": now,
+                            },
+                            "$set": {"date_updated": now},
+                        },
+                        upsert=True,
+                    )
+                    for fact_id in fact_ids.values()
+                ],
+            )
 
         return self
 
     def get_embeddings(self, entity_id: int, limit: int = 1000):
         results = self.conn.execute(
             "memori_entity_fact",
-            "find",
-            {"entity_id": entity_id},
-            {"_id": 1, "content_embedding": 1},
+            "aggregate",
+            [
+                {"$match": {"entity_id": entity_id}},
+                {"$sort": {"date_last_time": -1, "num_times": -1, "_id": -1}},
+                {"$limit": limit},
+                {"$project": {"_id": 1, "content_embedding": 1}},
+            ],
         )
 
-        embeddings = []
-        if hasattr(results, "limit"):
-            results = results.sort(
-                [("date_last_time", -1), ("num_times", -1), ("_id", -1)]
-            ).limit(limit)
-            iterable = results
-        else:
-            materialized = list(results)
-
-            def key(doc):
-                dt = doc.get("date_last_time")
-                num = doc.get("num_times")
-                _id = doc.get("_id")
-                return (
-                    dt if dt is not None else 0,
-                    num if num is not None else 0,
-                    _id if _id is not None else 0,
-                )
-
-            iterable = sorted(materialized, key=key, reverse=True)[:limit]
-
-        for result in iterable:
-            embeddings.append(
-                {"id": result["_id"], "content_embedding": result["content_embedding"]}
-            )
-
-        return embeddings
+        return [
+            {"id": result["_id"], "content_embedding": result["content_embedding"]}
+            for result in results
+        ]
 
     def get_facts_by_ids(self, fact_ids: list[int]):
         if not fact_ids:
@@ -371,6 +458,41 @@ class EntityFact(BaseEntityFact):
 
         return facts
 
+    def export(self, entity_id: int, after_id=None, limit: int = 1000):
+        query: dict = {"entity_id": entity_id}
+        if after_id is not None:
+            query["_id"] = {"$gt": after_id}
+        results = self.conn.execute(
+            "memori_entity_fact",
+            "find",
+            query,
+            {"_id": 1, "content": 1, "content_embedding": 1, "num_times": 1},
+            sort=[("_id", 1)],
+            limit=limit,
+        )
+        return [
+            {
+                "id": result["_id"],
+                "content": result["content"],
+                "content_embedding": result["content_embedding"],
+                "num_times": result["num_times"],
+            }
+            for result in results
+        ]
+
+    def read_mentions(self, fact_ids: list):
+        if not fact_ids:
+            return []
+
+        return list(
+            self.conn.execute(
+                "memori_entity_fact_mention",
+                "find",
+                {"fact_id": {"$in": fact_ids}},
+                {"_id": 0, "fact_id": 1, "conversation_id": 1},
+            )
+        )
+
     def delete_by_entity(self, entity_id: int):
         self.conn.execute(
             "memori_entity_fact_mention", "delete_many", {"entity_id": entity_id}
@@ -380,157 +502,173 @@ class EntityFact(BaseEntityFact):
 
 
 class KnowledgeGraph(BaseKnowledgeGraph):
-    def create(self, entity_id: int, semantic_triples: list):
+    def create(
+        self,
+        entity_id: int,
+        semantic_triples: list,
+        num_times: list[int] | None = None,
+    ):
         if semantic_triples is None or len(semantic_triples) == 0:
             return self
 
-        from datetime import datetime, timezone
-
-        from memori._utils import generate_uniq
-
-        for semantic_triple in semantic_triples:
-            # Insert or get subject
-            subject_uniq = generate_uniq(
-                [semantic_triple.subject_name, semantic_triple.subject_type]
-            )
-            existing_subject = self.conn.execute(
-                "memori_subject", "find_one", {"uniq": subject_uniq}
-            )
-
-            if existing_subject:
-                subject_id = existing_subject["_id"]
-            else:
-                subject_doc = {
-                    "uuid": str(uuid4()),
-                    "name": semantic_triple.subject_name,
-                    "type": semantic_triple.subject_type,
-                    "uniq": subject_uniq,
-                    "date_created": datetime.now(timezone.utc),
-                    "date_updated": None,
-                }
-                result = self.conn.execute("memori_subject", "insert_one", subject_doc)
-                subject_id = result.inserted_id
-
-            # Insert or get predicate
-            predicate_uniq = generate_uniq([semantic_triple.predicate])
-            existing_predicate = self.conn.execute(
-                "memori_predicate", "find_one", {"uniq": predicate_uniq}
+        now = datetime.now(timezone.utc)
+        subjects, predicates, objects, edges = self._graph_rows(
+            semantic_triples, num_times
+        )
+        ids = {}
+        for collection, columns, rows in (
+            ("memori_subject", ("name", "type"), subjects),
+            ("memori_predicate", ("content",), predicates),
+            ("memori_object", ("name", "type"), objects),
+        ):
+            _bulk_write(
+                self.conn,
+                collection,
+                [
+                    UpdateOne(
+                        {"uniq": uniq},
+                        {
+                            "$setOnInsert": {
+                                **dict(zip(columns, values, strict=True)),
+                                "uuid": str(uuid4()),
+                                "date_created": now,
+                                "date_updated": None,
+                            }
+                        },
+                        upsert=True,
+                    )
+                    for uniq, values in rows.items()
+                ],
             )
+            ids[collection] = _ids_by_uniq(self.conn, collection, list(rows))
 
-            if existing_predicate:
-                predicate_id = existing_predicate["_id"]
-            else:
-                predicate_doc = {
-                    "uuid": str(uuid4()),
-                    "content": semantic_triple.predicate,
-                    "uniq": predicate_uniq,
-                    "date_created": datetime.now(timezone.utc),
-                    "date_updated": None,
-                }
-                result = self.conn.execute(
-                    "memori_predicate", "insert_one", predicate_doc
-                )
-                predicate_id = result.inserted_id
+        if entity_id is None:
+            return self
 
-            # Insert or get object
-            object_uniq = generate_uniq(
-                [semantic_triple.object_name, semantic_triple.object_type]
-            )
-            existing_object = self.conn.execute(
-                "memori_object", "find_one", {"uniq": object_uniq}
+        counts: Counter[tuple] = Counter()
+        for (subject_uniq, predicate_uniq, object_uniq), num_times in edges.items():
+            key = (
+                ids["memori_subject"].get(subject_uniq),
+                ids["memori_predicate"].get(predicate_uniq),
+                ids["memori_object"].get(object_uniq),
             )
-
-            if existing_object:
-                object_id = existing_object["_id"]
-            else:
-                object_doc = {
-                    "uuid": str(uuid4()),
-                    "name": semantic_triple.object_name,
-                    "type": semantic_triple.object_type,
-                    "uniq": object_uniq,
-                    "date_created": datetime.now(timezone.utc),
-                    "date_updated": None,
-                }
-                result = self.conn.execute("memori_object", "insert_one", object_doc)
-                object_id = result.inserted_id
-
-            # Insert or update knowledge graph entry
-            if (
-                entity_id is not None
-                and subject_id is not None
-                and predicate_id is not None
-                and object_id is not None
-            ):
-                existing_kg = self.conn.execute(
-                    "memori_knowledge_graph",
-                    "find_one",
+            if None not in key:
+                counts[key] += num_times
+
+        _bulk_write(
+            self.conn,
+            "memori_knowledge_graph",
+            [
+                UpdateOne(
                     {
                         "entity_id": entity_id,
                         "subject_id": subject_id,
                         "predicate_id": predicate_id,
                         "object_id": object_id,
                     },
-                )
-
-                if existing_kg:
-                    self.conn.execute(
-                        "memori_knowledge_graph",
-                        "update_one",
-                        {"_id": existing_kg["_id"]},
-                        {
-                            "$inc": {"num_times": 1},
-                            "$set": {"date_last_time": datetime.now(timezone.utc)},
+                    {
+                        "$inc": {"num_times": num_times},
+                        "$set": {"date_last_time": now},
+                        "$setOnInsert": {
+                            "uuid": str(uuid4()),
+                            "date_created": now,
+                            "date_updated": None,
                         },
-                    )
-                else:
-                    kg_doc = {
-                        "uuid": str(uuid4()),
-                        "entity_id": entity_id,
-                        "subject_id": subject_id,
-                        "predicate_id": predicate_id,
-                        "object_id": object_id,
-                        "num_times": 1,
-                        "date_last_time": datetime.now(timezone.utc),
-                        "date_created": datetime.now(timezone.utc),
-                        "date_updated": None,
-                    }
-                    self.conn.execute("memori_knowledge_graph", "insert_one", kg_doc)
+                    },
+                    upsert=True,
+                )
+                for (subject_id, predicate_id, object_id), num_times in counts.items()
+            ],
+        )
 
         return self
 
-    def delete_by_entity(self, entity_id: int):
-        self.conn.execute(
-            "memori_knowledge_graph", "delete_many", {"entity_id": entity_id}
-        )
-        subject_ids = self.conn.execute(
-            "memori_knowledge_graph", "distinct", "subject_id"
-        )
-        predicate_ids = self.conn.execute(
-            "memori_knowledge_graph", "distinct", "predicate_id"
-        )
-        object_ids = self.conn.execute(
-            "memori_knowledge_graph", "distinct", "object_id"
-        )
-        self.conn.execute(
-            "memori_subject",
-            "delete_many",
-            {"_id": {"$nin": list(subject_ids)}},
+    def export(self, entity_id: int, after_id=None, limit: int = 1000):
+        query: dict = {"entity_id": entity_id}
+        if after_id is not None:
+            query["_id"] = {"$gt": after_id}
+        edges = list(
+            self.conn.execute(
+                "memori_knowledge_graph",
+                "find",
+                query,
+                {
+                    "_id": 1,
+                    "subject_id": 1,
+                    "predicate_id": 1,
+                    "object_id": 1,
+                    "num_times": 1,
+                },
+                sort=[("_id", 1)],
+                limit=limit,
+            )
         )
-        self.conn.execute(
-            "memori_predicate",
-            "delete_many",
-            {"_id": {"$nin": list(predicate_ids)}},
+
+        dimensions = {}
+        for collection, field in (
+            ("memori_subject", "subject_id"),
+            ("memori_predicate", "predicate_id"),
+            ("memori_object", "object_id"),
+        ):
+            dimensions[field] = {
+                document["_id"]: document
+                for document in self.conn.execute(
+                    collection,
+                    "find",
+                    {"_id": {"$in": list({edge[field] for edge in edges})}},
+                )
+            }
+
+        rows = []
+        for edge in edges:
+            subject = dimensions["subject_id"].get(edge["subject_id"])
+            predicate = dimensions["predicate_id"].get(edge["predicate_id"])
+            object_ = dimensions["object_id"].get(edge["object_id"])
+            if subject is None or predicate is None or object_ is None:
+                continue
+            rows.append(
+                {
+                    "id": edge["_id"],
+                    "subject_name": subject["name"],
+                    "subject_type": subject["type"],
+                    "predicate": predicate["content"],
+                    "object_name": object_["name"],
+                    "object_type": object_["type"],
+                    "num_times": edge["num_times"],
+                }
+            )
+        return rows
+
+    def delete_by_entity(self, entity_id: int):
+        # Only dimension documents this entity's edges referenced can become
+        # orphans, so collect them first instead of sweeping whole collections.
+        edges = list(
+            self.conn.execute(
+                "memori_knowledge_graph",
+                "find",
+                {"entity_id": entity_id},
+                {"_id": 0, "subject_id": 1, "predicate_id": 1, "object_id": 1},
+            )
         )
         self.conn.execute(
-            "memori_object",
-            "delete_many",
-            {"_id": {"$nin": list(object_ids)}},
+            "memori_knowledge_graph", "delete_many", {"entity_id": entity_id}
         )
+        for collection, field, ids in self._orphan_candidates(edges):
+            if not ids:
+                continue
+            referenced = self.conn.execute(
+                "memori_knowledge_graph", "distinct", field, {field: {"$in": ids}}
+            )
+            orphans = set(ids) - set(referenced)
+            if orphans:
+                self.conn.execute(
+                    collection, "delete_many", {"_id": {"$in": list(orphans)}}
+                )
         return self
 
 
 class Process(BaseProcess):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
         # Check if process already exists
         existing = self.conn.execute(
             "memori_process", "find_one", {"external_id": external_id}
@@ -557,42 +695,37 @@ class ProcessAttribute(BaseProcessAttribute):
         if attributes is None or len(attributes) == 0:
             return self
 
-        from datetime import datetime, timezone
-
         from memori._utils import generate_uniq
 
+        now = datetime.now(timezone.utc)
+        contents: dict[str, str] = {}
+        counts: Counter[str] = Counter()
         for attribute in attributes:
             uniq = generate_uniq([attribute])
-            existing = self.conn.execute(
-                "memori_process_attribute",
-                "find_one",
-                {"process_id": process_id, "uniq": uniq},
-            )
-
-            if existing:
-                self.conn.execute(
-                    "memori_process_attribute",
-                    "update_one",
-                    {"_id": existing["_id"]},
+            contents.setdefault(uniq, attribute)
+            counts[uniq] += 1
+
+        _bulk_write(
+            self.conn,
+            "memori_process_attribute",
+            [
+                UpdateOne(
+                    {"process_id": process_id, "uniq": uniq},
                     {
-                        "$inc": {"num_times": 1},
-                        "$set": {"date_last_time": datetime.now(timezone.utc)},
+                        "$inc": {"num_times": counts[uniq]},
+                        "$set": {"date_last_time": now},
+                        "$setOnInsert": {
+                            "uuid": str(uuid4()),
+                            "content": content,
+                            "date_created": now,
+                            "date_updated": None,
+                        },
                     },
+                    upsert=True,
                 )
-            else:
-                attribute_doc = {
-                    "uuid": str(uuid4()),
-                    "process_id": process_id,
-                    "content": attribute,
-                    "num_times": 1,
-                    "date_last_time": datetime.now(timezone.utc),
-                    "uniq": uniq,
-                    "date_created": datetime.now(timezone.utc),
-                    "date_updated": None,
-                }
-                self.conn.execute(
-                    "memori_process_attribute", "insert_one", attribute_doc
-                )
+                for uniq, content in contents.items()
+            ],
+        )
 
         return self
 
@@ -39,12 +39,14 @@ class Conversation(BaseConversation):
         existing = (
             self.conn.execute(
                 """
-                SELECT c.id,
-                       COALESCE(MAX(m.date_created), c.date_created) as last_activity
-                  FROM memori_conversation c
-                  LEFT JOIN memori_conversation_message m ON m.conversation_id = c.id
-                 WHERE c.session_id = %s
-                 GROUP BY c.id, c.date_created
+                SELECT id,
+                       TIMESTAMPDIFF(
+                           MINUTE,
+                           COALESCE(last_activity, date_created),
+                           CURRENT_TIMESTAMP
+                       ) AS minutes_since_activity
+                  FROM memori_conversation
+                 WHERE session_id = %s
                 """,
                 (session_id,),
             )
@@ -52,16 +54,8 @@ class Conversation(BaseConversation):
             .fetchone()
         )
 
-        if existing:
-            result = self.conn.execute(
-                """
-                SELECT TIMESTAMPDIFF(MINUTE, %s, CURRENT_TIMESTAMP) as minutes_since_activity
-                """,
-                (existing["last_activity"],),
-            ).fetchone()
-
-            if result[0] <= timeout_minutes:
-                return existing["id"]
+        if existing and existing["minutes_since_activity"] <= timeout_minutes:
+            return existing["id"]
 
         uuid = uuid4()
         self.conn.execute(
@@ -147,6 +141,30 @@ class Conversation(BaseConversation):
             return None
         return result.get("id", None)
 
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
+            self.conn.execute(
+                """
+                SELECT c.id,
+                       s.uuid AS session_uuid,
+                       p.external_id AS process_external_id,
+                       c.summary
+                  FROM memori_conversation c
+                  JOIN memori_session s
+                    ON s.id = c.session_id
+                  LEFT JOIN memori_process p
+                    ON p.id = s.process_id
+                 WHERE s.entity_id = %s
+                   AND c.id > %s
+                 ORDER BY c.id
+                 LIMIT %s
+                """,
+                (entity_id, after_id or 0, limit),
+            )
+            .mappings()
+            .fetchall()
+        )
+
 
 class ConversationMessage(BaseConversationMessage):
     def create(self, conversation_id: int, role: str, type: str, content: str):
@@ -175,190 +193,191 @@ class ConversationMessage(BaseConversationMessage):
             ),
         )
 
-
-class ConversationMessages(BaseConversationMessages):
-    def read(self, conversation_id: int):
-        results = (
-            self.conn.execute(
-                """
-                SELECT role,
-                       content
-                  FROM memori_conversation_message
-                 WHERE conversation_id = %s
-                """,
-                (conversation_id,),
-            )
-            .mappings()
-            .fetchall()
+        # date_updated is declared ON UPDATE CURRENT_TIMESTAMP; keep it
+        # tracking summary changes rather than every message.
+        self.conn.execute(
+            """
+            UPDATE memori_conversation
+               SET last_activity = CURRENT_TIMESTAMP,
+                   date_updated = date_updated
+             WHERE id = %s
+            """,
+            (conversation_id,),
         )
 
-        messages = []
-        for result in results:
-            messages.append({"content": result["content"], "role": result["role"]})
-
-        return messages
-
 
-class KnowledgeGraph(BaseKnowledgeGraph):
-    def create(self, entity_id: int, semantic_triples: list):
-        if semantic_triples is None or len(semantic_triples) == 0:
+class ConversationMessages(BaseConversationMessages):
+    def create_many(self, conversation_id: int, messages: list[dict]):
+        if not messages:
             return self
 
-        for semantic_triple in semantic_triples:
-            uniq = generate_uniq(
-                [semantic_triple.subject_name, semantic_triple.subject_type]
+        self.conn.execute_many(
+            """
+            INSERT INTO memori_conversation_message(
+                uuid,
+                conversation_id,
+                role,
+                type,
+                content
+            ) VALUES (
+                %s,
+                %s,
+                %s,
+                %s,
+                %s
             )
-
-            self.conn.execute(
-                """
-                INSERT IGNORE INTO memori_subject(
-                    uuid,
-                    name,
-                    type,
-                    uniq
-                ) VALUES (
-                    %s,
-                    %s,
-                    %s,
-                    %s
-                )
-                """,
+            """,
+            [
                 (
-                    uuid4(),
-                    semantic_triple.subject_name,
-                    semantic_triple.subject_type,
-                    uniq,
-                ),
-            )
-            self.conn.commit()
+                    str(uuid4()),
+                    conversation_id,
+                    message["role"],
+                    message["type"],
+                    message["content"],
+                )
+                for message in messages
+            ],
+        )
 
-            subject_id = (
+        self.conn.execute(
+            """
+            UPDATE memori_conversation
+               SET last_activity = CURRENT_TIMESTAMP,
+                   date_updated = date_updated
+             WHERE id = %s
+            """,
+            (conversation_id,),
+        )
+        return self
+
+    def read(self, conversation_id: int, limit: int | None = None):
+        if limit is None:
+            results = (
                 self.conn.execute(
                     """
-                    SELECT id
-                      FROM memori_subject
-                     WHERE uniq = %s
+                    SELECT role,
+                           content
+                      FROM memori_conversation_message
+                     WHERE conversation_id = %s
                     """,
-                    (uniq,),
+                    (conversation_id,),
                 )
                 .mappings()
-                .fetchone()
-                .get("id", None)
+                .fetchall()
             )
-
-            uniq = generate_uniq([semantic_triple.predicate])
-
-            self.conn.execute(
-                """
-                INSERT IGNORE INTO memori_predicate(
-                    uuid,
-                    content,
-                    uniq
-                ) VALUES (
-                    %s,
-                    %s,
-                    %s
-                )
-                """,
-                (
-                    uuid4(),
-                    semantic_triple.predicate,
-                    uniq,
-                ),
-            )
-            self.conn.commit()
-
-            predicate_id = (
+        else:
+            results = (
                 self.conn.execute(
                     """
-                    SELECT id
-                      FROM memori_predicate
-                     WHERE uniq = %s
+                    SELECT role,
+                           content
+                      FROM memori_conversation_message
+                     WHERE conversation_id = %s
+                     ORDER BY id DESC
+                     LIMIT %s
                     """,
-                    (uniq,),
+                    (conversation_id, limit),
                 )
                 .mappings()
-                .fetchone()
-                .get("id", None)
-            )
+                .fetchall()
+            )[::-1]
 
-            uniq = generate_uniq(
-                [semantic_triple.object_name, semantic_triple.object_type]
-            )
+        messages = []
+        for result in results:
+            messages.append({"content": result["content"], "role": result["role"]})
 
+        return messages
+
+
+class KnowledgeGraph(BaseKnowledgeGraph):
+    def _insert_dimension(
+        self, table: str, columns: tuple[str, ...], rows: list[tuple]
+    ) -> None:
+        row_placeholders = "(" + ", ".join(["%s"] * (len(columns) + 2)) + ")"
+        values = ",".join([row_placeholders] * len(rows))
+        insert_query = f"""
+            INSERT IGNORE INTO {table}(
+                uuid,
+                {", ".join(columns)},
+                uniq
+            ) VALUES {values}
+            """  # nosec B608: Safe - table and columns are constants, values parameterized
+        self.conn.execute(insert_query, tuple(value for row in rows for value in row))
+
+    def _read_dimension_ids(self, table: str, uniqs: list[str]) -> list:
+        placeholders = ",".join(["%s"] * len(uniqs))
+        id_query = f"""
+            SELECT id,
+                   uniq
+              FROM {table}
+             WHERE uniq IN ({placeholders})
+            """  # nosec B608: Safe - table is a constant, values parameterized
+        return self.conn.execute(id_query, tuple(uniqs)).mappings().fetchall()
+
+    def _upsert_edges(self, rows: list[tuple]) -> None:
+        values = ",".join(["(%s, %s, %s, %s, %s, %s, current_timestamp())"] * len(rows))
+        edge_query = f"""
+            INSERT INTO memori_knowledge_graph(
+                uuid,
+                entity_id,
+                subject_id,
+                predicate_id,
+                object_id,
+                num_times,
+                date_last_time
+            ) VALUES {values}
+            ON DUPLICATE KEY UPDATE
+                num_times = num_times + VALUES(num_times),
+                date_last_time = current_timestamp()
+            """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+        self.conn.execute(edge_query, tuple(value for row in rows for value in row))
+
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
             self.conn.execute(
                 """
-                INSERT IGNORE INTO memori_object(
-                    uuid,
-                    name,
-                    type,
-                    uniq
-                ) VALUES (
-                    %s,
-                    %s,
-                    %s,
-                    %s
-                )
+                SELECT kg.id,
+                       s.name AS subject_name,
+                       s.type AS subject_type,
+                       p.content AS predicate,
+                       o.name AS object_name,
+                       o.type AS object_type,
+                       kg.num_times
+                  FROM memori_knowledge_graph kg
+                  JOIN memori_subject s
+                    ON s.id = kg.subject_id
+                  JOIN memori_predicate p
+                    ON p.id = kg.predicate_id
+                  JOIN memori_object o
+                    ON o.id = kg.object_id
+                 WHERE kg.entity_id = %s
+                   AND kg.id > %s
+                 ORDER BY kg.id
+                 LIMIT %s
                 """,
-                (
-                    uuid4(),
-                    semantic_triple.object_name,
-                    semantic_triple.object_type,
-                    uniq,
-                ),
-            )
-            self.conn.commit()
-
-            object_id = (
-                self.conn.execute(
-                    """
-                    SELECT id
-                      FROM memori_object
-                     WHERE uniq = %s
-                    """,
-                    (uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
+                (entity_id, after_id or 0, limit),
             )
-
-            if (
-                entity_id is not None
-                and subject_id is not None
-                and predicate_id is not None
-                and object_id is not None
-            ):
-                self.conn.execute(
-                    """
-                    INSERT INTO memori_knowledge_graph(
-                        uuid,
-                        entity_id,
-                        subject_id,
-                        predicate_id,
-                        object_id,
-                        num_times,
-                        date_last_time
-                    ) VALUES (
-                        %s,
-                        %s,
-                        %s,
-                        %s,
-                        %s,
-                        1,
-                        current_timestamp()
-                    )
-                    ON DUPLICATE KEY UPDATE
-                        num_times = num_times + 1,
-                        date_last_time = current_timestamp()
-                    """,
-                    (uuid4(), entity_id, subject_id, predicate_id, object_id),
-                )
-                self.conn.commit()
-
-        return self
+            .mappings()
+            .fetchall()
+        )
 
     def delete_by_entity(self, entity_id: int):
+        # Only dimension rows this entity's edges referenced can become
+        # orphans, so collect them first instead of sweeping whole tables.
+        edges = (
+            self.conn.execute(
+                """
+                SELECT DISTINCT subject_id,
+                       predicate_id,
+                       object_id
+                  FROM memori_knowledge_graph
+                 WHERE entity_id = %s
+                """,
+                (entity_id,),
+            )
+            .mappings()
+            .fetchall()
+        )
         self.conn.execute(
             """
             DELETE
@@ -367,45 +386,32 @@ class KnowledgeGraph(BaseKnowledgeGraph):
             """,
             (entity_id,),
         )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_subject
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.subject_id = memori_subject.id
-             )
-            """
-        )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_predicate
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.predicate_id = memori_predicate.id
-             )
-            """
-        )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_object
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.object_id = memori_object.id
-             )
-            """
-        )
+        for table, column, ids in self._orphan_candidates(edges):
+            for batch in self._batches(ids):
+                placeholders = ",".join(["%s"] * len(batch))
+                self.conn.execute(
+                    f"""
+                    DELETE
+                      FROM {table}
+                     WHERE id IN ({placeholders})
+                       AND NOT EXISTS (
+                           SELECT 1
+                             FROM memori_knowledge_graph
+                            WHERE memori_knowledge_graph.{column} = {table}.id
+                       )
+                    """,  # nosec B608: Safe - table and column are constants, values parameterized
+                    tuple(batch),
+                )
         self.conn.commit()
         return self
 
 
 class Entity(BaseEntity):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
+        entity_id = self._read(external_id)
+        if entity_id is not None:
+            return entity_id
+
         self.conn.execute(
             """
             INSERT IGNORE INTO memori_entity(
@@ -420,7 +426,10 @@ class Entity(BaseEntity):
         )
         self.conn.commit()
 
-        return (
+        return self._read(external_id)
+
+    def _read(self, external_id: str) -> int | None:
+        result = (
             self.conn.execute(
                 """
                 SELECT id
@@ -431,34 +440,37 @@ class Entity(BaseEntity):
             )
             .mappings()
             .fetchone()
-            .get("id", None)
         )
+        if result is None:
+            return None
+        return result.get("id", None)
 
 
 class EntityFact(BaseEntityFact):
+    segment_placeholder = "%s"
+
+    def _embedding_dialect(self) -> str:
+        return "mysql"
+
     def create(
         self,
         entity_id: int,
         facts: list,
         fact_embeddings: list | None = None,
         conversation_id: int | None = None,
+        num_times: list[int] | None = None,
     ):
         if facts is None or len(facts) == 0:
             return self
 
-        from memori.embeddings import format_embedding_for_db
-
-        for i, fact in enumerate(facts):
-            embedding = (
-                fact_embeddings[i]
-                if fact_embeddings and i < len(fact_embeddings)
-                else []
+        rows = self._fact_rows(
+            entity_id, facts, fact_embeddings, self._embedding_dialect(), num_times
+        )
+        for batch in self._batches(rows):
+            values = ",".join(
+                ["(%s, %s, %s, %s, %s, current_timestamp(), %s)"] * len(batch)
             )
-            embedding_formatted = format_embedding_for_db(embedding, "mysql")
-            uniq = generate_uniq(fact)
-
-            self.conn.execute(
-                """
+            upsert_query = f"""
                 INSERT INTO memori_entity_fact(
                     uuid,
                     entity_id,
@@ -467,62 +479,51 @@ class EntityFact(BaseEntityFact):
                     num_times,
                     date_last_time,
                     uniq
-                ) VALUES (
-                    %s,
-                    %s,
-                    %s,
-                    %s,
-                    %s,
-                    current_timestamp(),
-                    %s
-                )
+                ) VALUES {values}
                 ON DUPLICATE KEY UPDATE
-                    num_times = num_times + 1,
+                    num_times = num_times + VALUES(num_times),
                     date_last_time = current_timestamp()
-                """,
-                (
-                    uuid4(),
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            self.conn.execute(
+                upsert_query, tuple(value for row in batch for value in row)
+            )
+
+            if conversation_id is None:
+                continue
+
+            uniqs = [row[5] for row in batch]
+            placeholders = ",".join(["%s"] * len(uniqs))
+            id_query = f"""
+                SELECT id
+                  FROM memori_entity_fact
+                 WHERE entity_id = %s
+                   AND uniq IN ({placeholders})
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            fact_rows = (
+                self.conn.execute(id_query, (entity_id, *uniqs)).mappings().fetchall()
+            )
+            fact_ids = [row["id"] for row in fact_rows if row.get("id") is not None]
+            if not fact_ids:
+                continue
+
+            values = ",".join(["(%s, %s, %s, %s)"] * len(fact_ids))
+            mention_query = f"""
+                INSERT IGNORE INTO memori_entity_fact_mention(
+                    uuid,
                     entity_id,
-                    fact,
-                    embedding_formatted,
-                    1,
-                    uniq,
+                    fact_id,
+                    conversation_id
+                ) VALUES {values}
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            self.conn.execute(
+                mention_query,
+                tuple(
+                    value
+                    for fact_id in fact_ids
+                    for value in (str(uuid4()), entity_id, fact_id, conversation_id)
                 ),
             )
 
-            if conversation_id is not None:
-                fact_row = (
-                    self.conn.execute(
-                        """
-                        SELECT id
-                          FROM memori_entity_fact
-                         WHERE entity_id = %s
-                           AND uniq = %s
-                        """,
-                        (entity_id, uniq),
-                    )
-                    .mappings()
-                    .fetchone()
-                )
-                fact_id = fact_row.get("id") if fact_row else None
-                if fact_id is not None:
-                    self.conn.execute(
-                        """
-                        INSERT IGNORE INTO memori_entity_fact_mention(
-                            uuid,
-                            entity_id,
-                            fact_id,
-                            conversation_id
-                        ) VALUES (
-                            %s,
-                            %s,
-                            %s,
-                            %s
-                        )
-                        """,
-                        (uuid4(), entity_id, fact_id, conversation_id),
-                    )
-
         self.conn.commit()
 
         return self
@@ -599,6 +600,41 @@ class EntityFact(BaseEntityFact):
 
         return [facts_by_id[fact_id] for fact_id in fact_ids if fact_id in facts_by_id]
 
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
+            self.conn.execute(
+                """
+                SELECT id,
+                       content,
+                       content_embedding,
+                       num_times
+                  FROM memori_entity_fact
+                 WHERE entity_id = %s
+                   AND id > %s
+                 ORDER BY id
+                 LIMIT %s
+                """,
+                (entity_id, after_id or 0, limit),
+            )
+            .mappings()
+            .fetchall()
+        )
+
+    def read_mentions(self, fact_ids: list[int]):
+        mentions = []
+        for batch in self._batches(fact_ids):
+            placeholders = ",".join(["%s"] * len(batch))
+            query = f"""
+                SELECT fact_id,
+                       conversation_id
+                  FROM memori_entity_fact_mention
+                 WHERE fact_id IN ({placeholders})
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            mentions.extend(
+                self.conn.execute(query, tuple(batch)).mappings().fetchall()
+            )
+        return mentions
+
     def delete_by_entity(self, entity_id: int):
         self.conn.execute(
             """
@@ -608,12 +644,24 @@ class EntityFact(BaseEntityFact):
             """,
             (entity_id,),
         )
+        self.conn.execute(
+            """
+            DELETE
+              FROM memori_entity_fact_segment
+             WHERE entity_id = %s
+            """,
+            (entity_id,),
+        )
         self.conn.commit()
         return self
 
 
 class Process(BaseProcess):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
+        process_id = self._read(external_id)
+        if process_id is not None:
+            return process_id
+
         self.conn.execute(
             """
             INSERT IGNORE INTO memori_process(
@@ -631,7 +679,10 @@ class Process(BaseProcess):
         )
         self.conn.commit()
 
-        return (
+        return self._read(external_id)
+
+    def _read(self, external_id: str) -> int | None:
+        result = (
             self.conn.execute(
                 """
                 SELECT id
@@ -642,8 +693,10 @@ class Process(BaseProcess):
             )
             .mappings()
             .fetchone()
-            .get("id", None)
         )
+        if result is None:
+            return None
+        return result.get("id", None)
 
 
 class ProcessAttribute(BaseProcessAttribute):
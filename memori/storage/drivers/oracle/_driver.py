@@ -23,10 +23,21 @@ from memori.storage._base import (
     BaseSchemaVersion,
     BaseSession,
     BaseStorageAdapter,
+    _BatchedWriter,
 )
 from memori.storage._registry import Registry
 from memori.storage.migrations._oracle import migrations
 
+# Oracle rejects IN lists longer than 1000 expressions, and ids are looked up
+# one batch at a time.
+MAX_BATCH_SIZE = 1000
+
+
+class _ArrayBoundWriter(_BatchedWriter):
+    # Rows bound per execute_many() round trip. Array binds have no bind
+    # count limit, so batches are larger than the multi-row VALUES default.
+    batch_size = MAX_BATCH_SIZE
+
 
 class Conversation(BaseConversation):
     def __init__(self, conn: BaseStorageAdapter):
@@ -38,12 +49,13 @@ class Conversation(BaseConversation):
         existing = (
             self.conn.execute(
                 """
-                SELECT c.id,
-                       COALESCE(MAX(m.date_created), c.date_created) as last_activity
-                  FROM memori_conversation c
-                  LEFT JOIN memori_conversation_message m ON m.conversation_id = c.id
-                 WHERE c.session_id = :1
-                 GROUP BY c.id, c.date_created
+                SELECT id,
+                       ROUND((
+                           CAST(SYSTIMESTAMP AS DATE)
+                           - CAST(COALESCE(last_activity, date_created) AS DATE)
+                       ) * 24 * 60) AS minutes_since_activity
+                  FROM memori_conversation
+                 WHERE session_id = :1
                 """,
                 (session_id,),
             )
@@ -51,17 +63,12 @@ class Conversation(BaseConversation):
             .fetchone()
         )
 
-        if existing:
-            result = self.conn.execute(
-                """
-                SELECT ROUND((CAST(SYSTIMESTAMP AS DATE) - CAST(:1 AS DATE)) * 24 * 60) as minutes_since_activity
-                  FROM DUAL
-                """,
-                (existing["last_activity"],),
-            ).fetchone()
-
-            if result and result[0] is not None and result[0] <= timeout_minutes:
-                return existing["id"]
+        if (
+            existing
+            and existing["minutes_since_activity"] is not None
+            and existing["minutes_since_activity"] <= timeout_minutes
+        ):
+            return existing["id"]
 
         uuid = str(uuid4())
         self.conn.execute(
@@ -149,6 +156,36 @@ class Conversation(BaseConversation):
             return None
         return result.get("id", None)
 
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
+            self.conn.execute(
+                """
+                SELECT id,
+                       session_uuid,
+                       process_external_id,
+                       summary
+                  FROM (
+                    SELECT c.id,
+                           s.uuid AS session_uuid,
+                           p.external_id AS process_external_id,
+                           c.summary
+                      FROM memori_conversation c
+                      JOIN memori_session s
+                        ON s.id = c.session_id
+                      LEFT JOIN memori_process p
+                        ON p.id = s.process_id
+                     WHERE s.entity_id = :1
+                       AND c.id > :2
+                     ORDER BY c.id
+                  )
+                 WHERE ROWNUM <= :3
+                """,
+                (entity_id, after_id or 0, limit),
+            )
+            .mappings()
+            .fetchall()
+        )
+
 
 class ConversationMessage(BaseConversationMessage):
     def create(self, conversation_id: int, role: str, type: str, content: str):
@@ -177,23 +214,97 @@ class ConversationMessage(BaseConversationMessage):
             ),
         )
 
+        self.conn.execute(
+            """
+            UPDATE memori_conversation
+               SET last_activity = SYSTIMESTAMP
+             WHERE id = :1
+            """,
+            (conversation_id,),
+        )
+
 
-class ConversationMessages(BaseConversationMessages):
-    def read(self, conversation_id: int):
-        results = (
-            self.conn.execute(
+class ConversationMessages(_ArrayBoundWriter, BaseConversationMessages):
+    def create_many(self, conversation_id: int, messages: list[dict]):
+        if not messages:
+            return self
+
+        rows = [
+            (
+                str(uuid4()),
+                conversation_id,
+                message["role"],
+                message["type"],
+                message["content"],
+            )
+            for message in messages
+        ]
+        for batch in self._batches(rows):
+            self.conn.execute_many(
                 """
-                SELECT role,
-                       content
-                  FROM memori_conversation_message
-                 WHERE conversation_id = :1
-                 ORDER BY id
+                INSERT INTO memori_conversation_message(
+                    uuid,
+                    conversation_id,
+                    role,
+                    type,
+                    content
+                ) VALUES (
+                    :1,
+                    :2,
+                    :3,
+                    :4,
+                    :5
+                )
                 """,
-                (conversation_id,),
+                batch,
             )
-            .mappings()
-            .fetchall()
+
+        self.conn.execute(
+            """
+            UPDATE memori_conversation
+               SET last_activity = SYSTIMESTAMP
+             WHERE id = :1
+            """,
+            (conversation_id,),
         )
+        return self
+
+    def read(self, conversation_id: int, limit: int | None = None):
+        if limit is None:
+            results = (
+                self.conn.execute(
+                    """
+                    SELECT role,
+                           content
+                      FROM memori_conversation_message
+                     WHERE conversation_id = :1
+                     ORDER BY id
+                    """,
+                    (conversation_id,),
+                )
+                .mappings()
+                .fetchall()
+            )
+        else:
+            results = (
+                self.conn.execute(
+                    """
+                    SELECT role,
+                           content
+                      FROM (
+                        SELECT role,
+                               content
+                          FROM memori_conversation_message
+                         WHERE conversation_id = :1
+                         ORDER BY id DESC
+                      )
+                     WHERE ROWNUM <= :2
+                    """,
+                    (conversation_id, limit),
+                )
+                .mappings()
+                .fetchall()
+            )[::-1]
 
         messages = []
         for result in results:
@@ -203,7 +314,11 @@ class ConversationMessages(BaseConversationMessages):
 
 
 class Entity(BaseEntity):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
+        entity_id = self._read(external_id)
+        if entity_id is not None:
+            return entity_id
+
         self.conn.execute(
             """
             MERGE INTO memori_entity dst
@@ -217,7 +332,10 @@ class Entity(BaseEntity):
         )
         self.conn.commit()
 
-        return (
+        return self._read(external_id)
+
+    def _read(self, external_id: str) -> int | None:
+        result = (
             self.conn.execute(
                 """
                 SELECT id
@@ -228,103 +346,97 @@ class Entity(BaseEntity):
             )
             .mappings()
             .fetchone()
-            .get("id", None)
         )
+        if result is None:
+            return None
+        return result.get("id", None)
 
 
-class EntityFact(BaseEntityFact):
+class EntityFact(_ArrayBoundWriter, BaseEntityFact):
     def create(
         self,
         entity_id: int,
         facts: list,
         fact_embeddings: list | None = None,
         conversation_id: int | None = None,
+        num_times: list[int] | None = None,
     ):
         if facts is None or len(facts) == 0:
             return self
 
-        from memori._utils import generate_uniq
-        from memori.embeddings import format_embedding_for_db
-
-        dialect = self.conn.get_dialect()
-
-        for i, fact in enumerate(facts):
-            embedding = (
-                fact_embeddings[i]
-                if fact_embeddings and i < len(fact_embeddings)
-                else []
-            )
-            embedding_formatted = format_embedding_for_db(embedding, dialect)
-            uniq = generate_uniq([fact])
-
-            self.conn.execute(
+        rows = self._fact_rows(
+            entity_id, facts, fact_embeddings, self.conn.get_dialect(), num_times
+        )
+        for batch in self._batches(rows):
+            # One single-row MERGE, executed once per bound row.
+            self.conn.execute_many(
                 """
                 MERGE INTO memori_entity_fact dst
-                USING (SELECT :1 AS uuid, :2 AS entity_id, :3 AS content,
-                              :4 AS content_embedding, :5 AS uniq FROM DUAL) src
+                USING (
+                    SELECT :1 AS uuid, :2 AS entity_id, :3 AS content,
+                           :4 AS content_embedding, :5 AS num_times, :6 AS uniq
+                      FROM DUAL
+                ) src
                 ON (dst.entity_id = src.entity_id AND dst.uniq = src.uniq)
                 WHEN MATCHED THEN
-                    UPDATE SET num_times = dst.num_times + 1,
+                    UPDATE SET num_times = dst.num_times + src.num_times,
                                date_last_time = SYSTIMESTAMP
                 WHEN NOT MATCHED THEN
                     INSERT (uuid, entity_id, content, content_embedding,
                             num_times, date_last_time, uniq)
                     VALUES (src.uuid, src.entity_id, src.content, src.content_embedding,
-                            1, SYSTIMESTAMP, src.uniq)
+                            src.num_times, SYSTIMESTAMP, src.uniq)
                 """,
-                (
-                    str(uuid4()),
-                    entity_id,
-                    fact,
-                    embedding_formatted,
-                    uniq,
-                ),
+                batch,
+            )
+
+            if conversation_id is None:
+                continue
+
+            uniqs = [row[5] for row in batch]
+            placeholders = ",".join([f":{i + 2}" for i in range(len(uniqs))])
+            id_query = f"""
+                SELECT id
+                  FROM memori_entity_fact
+                 WHERE entity_id = :1
+                   AND uniq IN ({placeholders})
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            fact_rows = (
+                self.conn.execute(id_query, (entity_id, *uniqs)).mappings().fetchall()
             )
+            fact_ids = [row["id"] for row in fact_rows if row.get("id") is not None]
+            if not fact_ids:
+                continue
 
-            if conversation_id is not None:
-                fact_row = (
-                    self.conn.execute(
-                        """
-                        SELECT id
-                          FROM memori_entity_fact
-                         WHERE entity_id = :1
-                           AND uniq = :2
-                        """,
-                        (entity_id, uniq),
-                    )
-                    .mappings()
-                    .fetchone()
+            self.conn.execute_many(
+                """
+                MERGE INTO memori_entity_fact_mention dst
+                USING (
+                    SELECT :1 AS uuid, :2 AS entity_id, :3 AS fact_id,
+                           :4 AS conversation_id
+                      FROM DUAL
+                ) src
+                ON (
+                    dst.entity_id = src.entity_id
+                    AND dst.fact_id = src.fact_id
+                    AND dst.conversation_id = src.conversation_id
                 )
-                fact_id = fact_row.get("id") if fact_row else None
-                if fact_id is not None:
-                    self.conn.execute(
-                        """
-                        MERGE INTO memori_entity_fact_mention dst
-                        USING (
-                            SELECT :1 AS uuid,
-                                   :2 AS entity_id,
-                                   :3 AS fact_id,
-                                   :4 AS conversation_id
-                              FROM DUAL
-                        ) src
-                        ON (
-                            dst.entity_id = src.entity_id
-                            AND dst.fact_id = src.fact_id
-                            AND dst.conversation_id = src.conversation_id
-                        )
-                        WHEN NOT MATCHED THEN
-                            INSERT (uuid, entity_id, fact_id, conversation_id)
-                            VALUES (src.uuid, src.entity_id, src.fact_id, src.conversation_id)
-                        """,
-                        (str(uuid4()), entity_id, fact_id, conversation_id),
-                    )
+                WHEN NOT MATCHED THEN
+                    INSERT (uuid, entity_id, fact_id, conversation_id)
+                    VALUES (src.uuid, src.entity_id, src.fact_id, src.conversation_id)
+                """,
+                [
+                    (str(uuid4()), entity_id, fact_id, conversation_id)
+                    for fact_id in fact_ids
+                ],
+            )
 
         self.conn.commit()
         return self
 
     def get_embeddings(self, entity_id: int, limit: int = 1000):
         return (
-            self.conn.execute(
+            self.conn.execute_prefetch(
                 """
                 SELECT id,
                        content_embedding
@@ -340,6 +452,7 @@ class EntityFact(BaseEntityFact):
                  WHERE ROWNUM <= :2
                 """,
                 (entity_id, limit),
+                limit,
             )
             .mappings()
             .fetchall()
@@ -399,6 +512,47 @@ class EntityFact(BaseEntityFact):
 
         return [facts_by_id[fact_id] for fact_id in fact_ids if fact_id in facts_by_id]
 
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
+            self.conn.execute(
+                """
+                SELECT id,
+                       content,
+                       content_embedding,
+                       num_times
+                  FROM (
+                    SELECT id,
+                           content,
+                           content_embedding,
+                           num_times
+                      FROM memori_entity_fact
+                     WHERE entity_id = :1
+                       AND id > :2
+                     ORDER BY id
+                  )
+                 WHERE ROWNUM <= :3
+                """,
+                (entity_id, after_id or 0, limit),
+            )
+            .mappings()
+            .fetchall()
+        )
+
+    def read_mentions(self, fact_ids: list[int]):
+        mentions = []
+        for batch in self._batches(fact_ids):
+            placeholders = ",".join([f":{i + 1}" for i in range(len(batch))])
+            query = f"""
+                SELECT fact_id,
+                       conversation_id
+                  FROM memori_entity_fact_mention
+                 WHERE fact_id IN ({placeholders})
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            mentions.extend(
+                self.conn.execute(query, tuple(batch)).mappings().fetchall()
+            )
+        return mentions
+
     def delete_by_entity(self, entity_id: int):
         self.conn.execute(
             """
@@ -412,148 +566,113 @@ class EntityFact(BaseEntityFact):
         return self
 
 
-class KnowledgeGraph(BaseKnowledgeGraph):
-    def create(self, entity_id: int, semantic_triples: list):
-        if semantic_triples is None or len(semantic_triples) == 0:
-            return self
-
-        from memori._utils import generate_uniq
-
-        for semantic_triple in semantic_triples:
-            uniq = generate_uniq(
-                [semantic_triple.subject_name, semantic_triple.subject_type]
-            )
-
-            self.conn.execute(
-                """
-                MERGE INTO memori_subject dst
-                USING (SELECT :1 AS uuid, :2 AS name, :3 AS type, :4 AS uniq FROM DUAL) src
-                ON (dst.uniq = src.uniq)
-                WHEN NOT MATCHED THEN
-                    INSERT (uuid, name, type, uniq)
-                    VALUES (src.uuid, src.name, src.type, src.uniq)
-                """,
-                (
-                    str(uuid4()),
-                    semantic_triple.subject_name,
-                    semantic_triple.subject_type,
-                    uniq,
-                ),
-            )
-            self.conn.commit()
-
-            subject_id = (
-                self.conn.execute(
-                    """
-                    SELECT id
-                      FROM memori_subject
-                     WHERE uniq = :1
-                    """,
-                    (uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
-            )
-
-            uniq = generate_uniq([semantic_triple.predicate])
+class KnowledgeGraph(_ArrayBoundWriter, BaseKnowledgeGraph):
+    def _insert_dimension(
+        self, table: str, columns: tuple[str, ...], rows: list[tuple]
+    ) -> None:
+        names = ("uuid", *columns, "uniq")
+        merge_query = f"""
+            MERGE INTO {table} dst
+            USING (
+                SELECT {", ".join(f":{i + 1} AS {name}" for i, name in enumerate(names))}
+                  FROM DUAL
+            ) src
+            ON (dst.uniq = src.uniq)
+            WHEN NOT MATCHED THEN
+                INSERT ({", ".join(names)})
+                VALUES ({", ".join(f"src.{name}" for name in names)})
+            """  # nosec B608: Safe - table and columns are constants, values parameterized
+        self.conn.execute_many(merge_query, rows)
+
+    def _read_dimension_ids(self, table: str, uniqs: list[str]) -> list:
+        placeholders = ",".join([f":{i + 1}" for i in range(len(uniqs))])
+        id_query = f"""
+            SELECT id,
+                   uniq
+              FROM {table}
+             WHERE uniq IN ({placeholders})
+            """  # nosec B608: Safe - table is a constant, values parameterized
+        return self.conn.execute(id_query, tuple(uniqs)).mappings().fetchall()
+
+    def _upsert_edges(self, rows: list[tuple]) -> None:
+        self.conn.execute_many(
+            """
+            MERGE INTO memori_knowledge_graph dst
+            USING (
+                SELECT :1 AS uuid, :2 AS entity_id, :3 AS subject_id,
+                       :4 AS predicate_id, :5 AS object_id, :6 AS num_times
+                  FROM DUAL
+            ) src
+            ON (dst.entity_id = src.entity_id AND dst.subject_id = src.subject_id
+                AND dst.predicate_id = src.predicate_id
+                AND dst.object_id = src.object_id)
+            WHEN MATCHED THEN
+                UPDATE SET num_times = dst.num_times + src.num_times,
+                           date_last_time = SYSTIMESTAMP
+            WHEN NOT MATCHED THEN
+                INSERT (uuid, entity_id, subject_id, predicate_id, object_id,
+                        num_times, date_last_time)
+                VALUES (src.uuid, src.entity_id, src.subject_id, src.predicate_id,
+                        src.object_id, src.num_times, SYSTIMESTAMP)
+            """,
+            rows,
+        )
 
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
             self.conn.execute(
                 """
-                MERGE INTO memori_predicate dst
-                USING (SELECT :1 AS uuid, :2 AS content, :3 AS uniq FROM DUAL) src
-                ON (dst.uniq = src.uniq)
-                WHEN NOT MATCHED THEN
-                    INSERT (uuid, content, uniq)
-                    VALUES (src.uuid, src.content, src.uniq)
+                SELECT id,
+                       subject_name,
+                       subject_type,
+                       predicate,
+                       object_name,
+                       object_type,
+                       num_times
+                  FROM (
+                    SELECT kg.id,
+                           s.name AS subject_name,
+                           s.type AS subject_type,
+                           p.content AS predicate,
+                           o.name AS object_name,
+                           o.type AS object_type,
+                           kg.num_times
+                      FROM memori_knowledge_graph kg
+                      JOIN memori_subject s
+                        ON s.id = kg.subject_id
+                      JOIN memori_predicate p
+                        ON p.id = kg.predicate_id
+                      JOIN memori_object o
+                        ON o.id = kg.object_id
+                     WHERE kg.entity_id = :1
+                       AND kg.id > :2
+                     ORDER BY kg.id
+                  )
+                 WHERE ROWNUM <= :3
                 """,
-                (
-                    str(uuid4()),
-                    semantic_triple.predicate,
-                    uniq,
-                ),
-            )
-            self.conn.commit()
-
-            predicate_id = (
-                self.conn.execute(
-                    """
-                    SELECT id
-                      FROM memori_predicate
-                     WHERE uniq = :1
-                    """,
-                    (uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
-            )
-
-            uniq = generate_uniq(
-                [semantic_triple.object_name, semantic_triple.object_type]
+                (entity_id, after_id or 0, limit),
             )
+            .mappings()
+            .fetchall()
+        )
 
+    def delete_by_entity(self, entity_id: int):
+        # Only dimension rows this entity's edges referenced can become
+        # orphans, so collect them first instead of sweeping whole tables.
+        edges = (
             self.conn.execute(
                 """
-                MERGE INTO memori_object dst
-                USING (SELECT :1 AS uuid, :2 AS name, :3 AS type, :4 AS uniq FROM DUAL) src
-                ON (dst.uniq = src.uniq)
-                WHEN NOT MATCHED THEN
-                    INSERT (uuid, name, type, uniq)
-                    VALUES (src.uuid, src.name, src.type, src.uniq)
+                SELECT DISTINCT subject_id,
+                       predicate_id,
+                       object_id
+                  FROM memori_knowledge_graph
+                 WHERE entity_id = :1
                 """,
-                (
-                    str(uuid4()),
-                    semantic_triple.object_name,
-                    semantic_triple.object_type,
-                    uniq,
-                ),
-            )
-            self.conn.commit()
-
-            object_id = (
-                self.conn.execute(
-                    """
-                    SELECT id
-                      FROM memori_object
-                     WHERE uniq = :1
-                    """,
-                    (uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
+                (entity_id,),
             )
-
-            if (
-                entity_id is not None
-                and subject_id is not None
-                and predicate_id is not None
-                and object_id is not None
-            ):
-                self.conn.execute(
-                    """
-                    MERGE INTO memori_knowledge_graph dst
-                    USING (SELECT :1 AS uuid, :2 AS entity_id, :3 AS subject_id,
-                                  :4 AS predicate_id, :5 AS object_id FROM DUAL) src
-                    ON (dst.entity_id = src.entity_id AND dst.subject_id = src.subject_id
-                        AND dst.predicate_id = src.predicate_id AND dst.object_id = src.object_id)
-                    WHEN MATCHED THEN
-                        UPDATE SET num_times = dst.num_times + 1,
-                                   date_last_time = SYSTIMESTAMP
-                    WHEN NOT MATCHED THEN
-                        INSERT (uuid, entity_id, subject_id, predicate_id, object_id,
-                                num_times, date_last_time)
-                        VALUES (src.uuid, src.entity_id, src.subject_id, src.predicate_id,
-                                src.object_id, 1, SYSTIMESTAMP)
-                    """,
-                    (str(uuid4()), entity_id, subject_id, predicate_id, object_id),
-                )
-                self.conn.commit()
-
-        return self
-
-    def delete_by_entity(self, entity_id: int):
+            .mappings()
+            .fetchall()
+        )
         self.conn.execute(
             """
             DELETE
@@ -562,45 +681,32 @@ class KnowledgeGraph(BaseKnowledgeGraph):
             """,
             (entity_id,),
         )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_subject
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.subject_id = memori_subject.id
-             )
-            """
-        )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_predicate
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.predicate_id = memori_predicate.id
-             )
-            """
-        )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_object
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.object_id = memori_object.id
-             )
-            """
-        )
+        for table, column, ids in self._orphan_candidates(edges):
+            for batch in self._batches(ids):
+                placeholders = ",".join([f":{i + 1}" for i in range(len(batch))])
+                self.conn.execute(
+                    f"""
+                    DELETE
+                      FROM {table}
+                     WHERE id IN ({placeholders})
+                       AND NOT EXISTS (
+                           SELECT 1
+                             FROM memori_knowledge_graph
+                            WHERE memori_knowledge_graph.{column} = {table}.id
+                       )
+                    """,  # nosec B608: Safe - table and column are constants, values parameterized
+                    tuple(batch),
+                )
         self.conn.commit()
         return self
 
 
 class Process(BaseProcess):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
+        process_id = self._read(external_id)
+        if process_id is not None:
+            return process_id
+
         self.conn.execute(
             """
             MERGE INTO memori_process dst
@@ -614,7 +720,10 @@ class Process(BaseProcess):
         )
         self.conn.commit()
 
-        return (
+        return self._read(external_id)
+
+    def _read(self, external_id: str) -> int | None:
+        result = (
             self.conn.execute(
                 """
                 SELECT id
@@ -625,38 +734,44 @@ class Process(BaseProcess):
             )
             .mappings()
             .fetchone()
-            .get("id", None)
         )
+        if result is None:
+            return None
+        return result.get("id", None)
 
 
-class ProcessAttribute(BaseProcessAttribute):
+class ProcessAttribute(_ArrayBoundWriter, BaseProcessAttribute):
     def create(self, process_id: int, attributes: list):
         if attributes is None or len(attributes) == 0:
             return self
 
         from memori._utils import generate_uniq
 
+        rows: dict[str, list] = {}
         for attribute in attributes:
             uniq = generate_uniq([attribute])
+            row = rows.setdefault(uniq, [str(uuid4()), process_id, attribute, 0, uniq])
+            row[3] += 1
 
-            self.conn.execute(
+        for batch in self._batches([tuple(row) for row in rows.values()]):
+            self.conn.execute_many(
                 """
                 MERGE INTO memori_process_attribute dst
-                USING (SELECT :1 AS uuid, :2 AS process_id, :3 AS content, :4 AS uniq FROM DUAL) src
+                USING (
+                    SELECT :1 AS uuid, :2 AS process_id, :3 AS content,
+                           :4 AS num_times, :5 AS uniq
+                      FROM DUAL
+                ) src
                 ON (dst.process_id = src.process_id AND dst.uniq = src.uniq)
                 WHEN MATCHED THEN
-                    UPDATE SET num_times = dst.num_times + 1,
+                    UPDATE SET num_times = dst.num_times + src.num_times,
                                date_last_time = SYSTIMESTAMP
                 WHEN NOT MATCHED THEN
                     INSERT (uuid, process_id, content, num_times, date_last_time, uniq)
-                    VALUES (src.uuid, src.process_id, src.content, 1, SYSTIMESTAMP, src.uniq)
+                    VALUES (src.uuid, src.process_id, src.content, src.num_times,
+                            SYSTIMESTAMP, src.uniq)
                 """,
-                (
-                    str(uuid4()),
-                    process_id,
-                    attribute,
-                    uniq,
-                ),
+                batch,
             )
 
         self.conn.commit()
@@ -763,6 +878,13 @@ class Driver:
     migrations = migrations
     requires_rollback_on_error = True
 
+    @classmethod
+    def configure(cls, storage_config) -> None:
+        """Apply storage settings; they are shared by every Oracle connection."""
+        _ArrayBoundWriter.batch_size = max(
+            1, min(storage_config.oracle_batch_size, MAX_BATCH_SIZE)
+        )
+
     def __init__(self, conn: BaseStorageAdapter):
         self.conversation = Conversation(conn)
         self.entity = Entity(conn)
@@ -8,6 +8,8 @@ r"""
                        memorilabs.ai
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from uuid import uuid4
 
 from memori.storage._base import (
@@ -38,12 +40,12 @@ class Conversation(BaseConversation):
         existing = (
             self.conn.execute(
                 """
-                SELECT c.id,
-                       COALESCE(MAX(m.date_created), c.date_created) as last_activity
-                  FROM memori_conversation c
-                  LEFT JOIN memori_conversation_message m ON m.conversation_id = c.id
-                 WHERE c.session_id = %s
-                 GROUP BY c.id, c.date_created
+                SELECT id,
+                       EXTRACT(EPOCH FROM (
+                           CURRENT_TIMESTAMP - COALESCE(last_activity, date_created)
+                       )) / 60 AS minutes_since_activity
+                  FROM memori_conversation
+                 WHERE session_id = %s
                 """,
                 (session_id,),
             )
@@ -51,46 +53,42 @@ class Conversation(BaseConversation):
             .fetchone()
         )
 
-        if existing:
-            result = self.conn.execute(
-                """
-                SELECT EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - %s::timestamp)) / 60 as minutes_since_activity
-                """,
-                (existing["last_activity"],),
-            ).fetchone()
+        if existing and existing["minutes_since_activity"] <= timeout_minutes:
+            return existing["id"]
 
-            if result[0] <= timeout_minutes:
-                return existing["id"]
-
-        uuid = str(uuid4())
-        self.conn.execute(
-            """
-            INSERT INTO memori_conversation(
-                uuid,
-                session_id
-            ) VALUES (
-                %s,
-                %s
-            )
-            ON CONFLICT DO NOTHING
-            """,
-            (uuid, session_id),
-        )
-        self.conn.commit()
-
-        return (
+        # Insert-or-select in one round trip: the CTE yields the new id, and
+        # the fallback branch yields the existing row on conflict.
+        result = (
             self.conn.execute(
                 """
+                WITH inserted AS (
+                    INSERT INTO memori_conversation(
+                        uuid,
+                        session_id
+                    ) VALUES (
+                        %s,
+                        %s
+                    )
+                    ON CONFLICT DO NOTHING
+                    RETURNING id
+                )
+                SELECT id FROM inserted
+                 UNION ALL
                 SELECT id
                   FROM memori_conversation
                  WHERE session_id = %s
+                 LIMIT 1
                 """,
-                (session_id,),
+                (str(uuid4()), session_id, session_id),
             )
             .mappings()
             .fetchone()
-            .get("id", None)
         )
+        self.conn.commit()
+
+        if result is None:
+            return None
+        return result.get("id", None)
 
     def update(self, id: int, summary: str):
         if summary is None:
@@ -147,6 +145,30 @@ class Conversation(BaseConversation):
             return None
         return result.get("id", None)
 
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
+            self.conn.execute(
+                """
+                SELECT c.id,
+                       s.uuid AS session_uuid,
+                       p.external_id AS process_external_id,
+                       c.summary
+                  FROM memori_conversation c
+                  JOIN memori_session s
+                    ON s.id = c.session_id
+                  LEFT JOIN memori_process p
+                    ON p.id = s.process_id
+                 WHERE s.entity_id = %s
+                   AND c.id > %s
+                 ORDER BY c.id
+                 LIMIT %s
+                """,
+                (entity_id, after_id or 0, limit),
+            )
+            .mappings()
+            .fetchall()
+        )
+
 
 class ConversationMessage(BaseConversationMessage):
     def create(self, conversation_id: int, role: str, type: str, content: str):
@@ -175,23 +197,91 @@ class ConversationMessage(BaseConversationMessage):
             ),
         )
 
+        self.conn.execute(
+            """
+            UPDATE memori_conversation
+               SET last_activity = CURRENT_TIMESTAMP
+             WHERE id = %s
+            """,
+            (conversation_id,),
+        )
+
 
 class ConversationMessages(BaseConversationMessages):
-    def read(self, conversation_id: int):
-        results = (
-            self.conn.execute(
-                """
-                SELECT role,
-                       content
-                  FROM memori_conversation_message
-                 WHERE conversation_id = %s
-                """,
-                (conversation_id,),
+    def create_many(self, conversation_id: int, messages: list[dict]):
+        if not messages:
+            return self
+
+        self.conn.execute_many(
+            """
+            INSERT INTO memori_conversation_message(
+                uuid,
+                conversation_id,
+                role,
+                type,
+                content
+            ) VALUES (
+                %s,
+                %s,
+                %s,
+                %s,
+                %s
             )
-            .mappings()
-            .fetchall()
+            """,
+            [
+                (
+                    str(uuid4()),
+                    conversation_id,
+                    message["role"],
+                    message["type"],
+                    message["content"],
+                )
+                for message in messages
+            ],
         )
 
+        self.conn.execute(
+            """
+            UPDATE memori_conversation
+               SET last_activity = CURRENT_TIMESTAMP
+             WHERE id = %s
+            """,
+            (conversation_id,),
+        )
+        return self
+
+    def read(self, conversation_id: int, limit: int | None = None):
+        if limit is None:
+            results = (
+                self.conn.execute(
+                    """
+                    SELECT role,
+                           content
+                      FROM memori_conversation_message
+                     WHERE conversation_id = %s
+                    """,
+                    (conversation_id,),
+                )
+                .mappings()
+                .fetchall()
+            )
+        else:
+            results = (
+                self.conn.execute(
+                    """
+                    SELECT role,
+                           content
+                      FROM memori_conversation_message
+                     WHERE conversation_id = %s
+                     ORDER BY id DESC
+                     LIMIT %s
+                    """,
+                    (conversation_id, limit),
+                )
+                .mappings()
+                .fetchall()
+            )[::-1]
+
         messages = []
         for result in results:
             messages.append({"content": result["content"], "role": result["role"]})
@@ -200,7 +290,11 @@ class ConversationMessages(BaseConversationMessages):
 
 
 class Entity(BaseEntity):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
+        entity_id = self._read(external_id)
+        if entity_id is not None:
+            return entity_id
+
         self.conn.execute(
             """
             INSERT INTO memori_entity(
@@ -216,7 +310,10 @@ class Entity(BaseEntity):
         )
         self.conn.commit()
 
-        return (
+        return self._read(external_id)
+
+    def _read(self, external_id: str) -> int | None:
+        result = (
             self.conn.execute(
                 """
                 SELECT id
@@ -227,37 +324,34 @@ class Entity(BaseEntity):
             )
             .mappings()
             .fetchone()
-            .get("id", None)
         )
+        if result is None:
+            return None
+        return result.get("id", None)
 
 
 class EntityFact(BaseEntityFact):
+    segment_placeholder = "%s"
+
     def create(
         self,
         entity_id: int,
         facts: list,
         fact_embeddings: list | None = None,
         conversation_id: int | None = None,
+        num_times: list[int] | None = None,
     ):
         if facts is None or len(facts) == 0:
             return self
 
-        from memori._utils import generate_uniq
-        from memori.embeddings import format_embedding_for_db
-
-        dialect = self.conn.get_dialect()
-
-        for i, fact in enumerate(facts):
-            embedding = (
-                fact_embeddings[i]
-                if fact_embeddings and i < len(fact_embeddings)
-                else []
+        rows = self._fact_rows(
+            entity_id, facts, fact_embeddings, self.conn.get_dialect(), num_times
+        )
+        for batch in self._batches(rows):
+            values = ",".join(
+                ["(%s, %s, %s, %s, %s, CURRENT_TIMESTAMP, %s)"] * len(batch)
             )
-            embedding_formatted = format_embedding_for_db(embedding, dialect)
-            uniq = generate_uniq([fact])
-
-            self.conn.execute(
-                """
+            upsert_query = f"""
                 INSERT INTO memori_entity_fact(
                     uuid,
                     entity_id,
@@ -266,62 +360,46 @@ class EntityFact(BaseEntityFact):
                     num_times,
                     date_last_time,
                     uniq
-                ) VALUES (
-                    %s,
-                    %s,
-                    %s,
-                    %s,
-                    1,
-                    CURRENT_TIMESTAMP,
-                    %s
-                )
+                ) VALUES {values}
                 ON CONFLICT (entity_id, uniq) DO UPDATE SET
-                    num_times = memori_entity_fact.num_times + 1,
+                    num_times = memori_entity_fact.num_times + EXCLUDED.num_times,
                     date_last_time = CURRENT_TIMESTAMP
-                """,
-                (
-                    str(uuid4()),
+                RETURNING id
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            result = self.conn.execute(
+                upsert_query, tuple(value for row in batch for value in row)
+            )
+
+            if conversation_id is None:
+                continue
+
+            fact_ids = [
+                row["id"]
+                for row in result.mappings().fetchall()
+                if row.get("id") is not None
+            ]
+            if not fact_ids:
+                continue
+
+            values = ",".join(["(%s, %s, %s, %s)"] * len(fact_ids))
+            mention_query = f"""
+                INSERT INTO memori_entity_fact_mention(
+                    uuid,
                     entity_id,
-                    fact,
-                    embedding_formatted,
-                    uniq,
+                    fact_id,
+                    conversation_id
+                ) VALUES {values}
+                ON CONFLICT (entity_id, fact_id, conversation_id) DO NOTHING
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            self.conn.execute(
+                mention_query,
+                tuple(
+                    value
+                    for fact_id in fact_ids
+                    for value in (str(uuid4()), entity_id, fact_id, conversation_id)
                 ),
             )
 
-            if conversation_id is not None:
-                fact_row = (
-                    self.conn.execute(
-                        """
-                        SELECT id
-                          FROM memori_entity_fact
-                         WHERE entity_id = %s
-                           AND uniq = %s
-                        """,
-                        (entity_id, uniq),
-                    )
-                    .mappings()
-                    .fetchone()
-                )
-                fact_id = fact_row.get("id") if fact_row else None
-                if fact_id is not None:
-                    self.conn.execute(
-                        """
-                        INSERT INTO memori_entity_fact_mention(
-                            uuid,
-                            entity_id,
-                            fact_id,
-                            conversation_id
-                        ) VALUES (
-                            %s,
-                            %s,
-                            %s,
-                            %s
-                        )
-                        ON CONFLICT (entity_id, fact_id, conversation_id) DO NOTHING
-                        """,
-                        (str(uuid4()), entity_id, fact_id, conversation_id),
-                    )
-
         return self
 
     def get_embeddings(self, entity_id: int, limit: int = 1000):
@@ -343,6 +421,31 @@ class EntityFact(BaseEntityFact):
             .fetchall()
         )
 
+    @contextmanager
+    def follower_reads(self, staleness_seconds: int = 0) -> Iterator[None]:
+        if self.conn.get_dialect() != "cockroachdb":
+            yield
+            return
+
+        timestamp = (
+            f"'-{int(staleness_seconds)}s'"
+            if staleness_seconds > 0
+            else "follower_read_timestamp()"
+        )
+        # AS OF SYSTEM TIME has to be the first statement of its transaction,
+        # so end the one in progress. The historical transaction is read-only
+        # and served by the nearest replica.
+        self.conn.commit()
+        self.conn.execute(
+            f"SET TRANSACTION AS OF SYSTEM TIME {timestamp}"  # nosec B608: Safe - timestamp is an integer or a constant
+        )
+        try:
+            yield
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
     def get_facts_by_ids(self, fact_ids: list[int]):
         fact_rows = (
             self.conn.execute(
@@ -402,6 +505,44 @@ class EntityFact(BaseEntityFact):
 
         return [facts_by_id[fact_id] for fact_id in fact_ids if fact_id in facts_by_id]
 
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
+            self.conn.execute(
+                """
+                SELECT id,
+                       content,
+                       content_embedding,
+                       num_times
+                  FROM memori_entity_fact
+                 WHERE entity_id = %s
+                   AND id > %s
+                 ORDER BY id
+                 LIMIT %s
+                """,
+                (entity_id, after_id or 0, limit),
+            )
+            .mappings()
+            .fetchall()
+        )
+
+    def read_mentions(self, fact_ids: list[int]):
+        if not fact_ids:
+            return []
+
+        return (
+            self.conn.execute(
+                """
+                SELECT fact_id,
+                       conversation_id
+                  FROM memori_entity_fact_mention
+                 WHERE fact_id = ANY(%s)
+                """,
+                (fact_ids,),
+            )
+            .mappings()
+            .fetchall()
+        )
+
     def delete_by_entity(self, entity_id: int):
         self.conn.execute(
             """
@@ -411,174 +552,107 @@ class EntityFact(BaseEntityFact):
             """,
             (entity_id,),
         )
+        self.conn.execute(
+            """
+            DELETE
+              FROM memori_entity_fact_segment
+             WHERE entity_id = %s
+            """,
+            (entity_id,),
+        )
         self.conn.commit()
         return self
 
 
 class KnowledgeGraph(BaseKnowledgeGraph):
-    def create(self, entity_id: int, semantic_triples: list):
-        if semantic_triples is None or len(semantic_triples) == 0:
-            return self
-
-        from memori._utils import generate_uniq
-
-        for semantic_triple in semantic_triples:
-            uniq = generate_uniq(
-                [semantic_triple.subject_name, semantic_triple.subject_type]
-            )
-
-            self.conn.execute(
-                """
-                INSERT INTO memori_subject(
-                    uuid,
-                    name,
-                    type,
-                    uniq
-                ) VALUES (
-                    %s,
-                    %s,
-                    %s,
-                    %s
-                )
-                ON CONFLICT DO NOTHING
-                """,
-                (
-                    str(uuid4()),
-                    semantic_triple.subject_name,
-                    semantic_triple.subject_type,
-                    uniq,
-                ),
-            )
-            self.conn.commit()
-
-            subject_id = (
-                self.conn.execute(
-                    """
-                    SELECT id
-                      FROM memori_subject
-                     WHERE uniq = %s
-                    """,
-                    (uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
-            )
-
-            uniq = generate_uniq([semantic_triple.predicate])
-
+    def _insert_dimension(
+        self, table: str, columns: tuple[str, ...], rows: list[tuple]
+    ) -> None:
+        row_placeholders = "(" + ", ".join(["%s"] * (len(columns) + 2)) + ")"
+        values = ",".join([row_placeholders] * len(rows))
+        insert_query = f"""
+            INSERT INTO {table}(
+                uuid,
+                {", ".join(columns)},
+                uniq
+            ) VALUES {values}
+            ON CONFLICT DO NOTHING
+            """  # nosec B608: Safe - table and columns are constants, values parameterized
+        self.conn.execute(insert_query, tuple(value for row in rows for value in row))
+
+    def _read_dimension_ids(self, table: str, uniqs: list[str]) -> list:
+        id_query = f"""
+            SELECT id,
+                   uniq
+              FROM {table}
+             WHERE uniq = ANY(%s)
+            """  # nosec B608: Safe - table is a constant, values parameterized
+        return self.conn.execute(id_query, (uniqs,)).mappings().fetchall()
+
+    def _upsert_edges(self, rows: list[tuple]) -> None:
+        values = ",".join(["(%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)"] * len(rows))
+        edge_query = f"""
+            INSERT INTO memori_knowledge_graph(
+                uuid,
+                entity_id,
+                subject_id,
+                predicate_id,
+                object_id,
+                num_times,
+                date_last_time
+            ) VALUES {values}
+            ON CONFLICT (entity_id, subject_id, predicate_id, object_id) DO UPDATE SET
+                num_times = memori_knowledge_graph.num_times + EXCLUDED.num_times,
+                date_last_time = CURRENT_TIMESTAMP
+            """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+        self.conn.execute(edge_query, tuple(value for row in rows for value in row))
+
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
             self.conn.execute(
                 """
-                INSERT INTO memori_predicate(
-                    uuid,
-                    content,
-                    uniq
-                ) VALUES (
-                    %s,
-                    %s,
-                    %s
-                )
-                ON CONFLICT DO NOTHING
+                SELECT kg.id,
+                       s.name AS subject_name,
+                       s.type AS subject_type,
+                       p.content AS predicate,
+                       o.name AS object_name,
+                       o.type AS object_type,
+                       kg.num_times
+                  FROM memori_knowledge_graph kg
+                  JOIN memori_subject s
+                    ON s.id = kg.subject_id
+                  JOIN memori_predicate p
+                    ON p.id = kg.predicate_id
+                  JOIN memori_object o
+                    ON o.id = kg.object_id
+                 WHERE kg.entity_id = %s
+                   AND kg.id > %s
+                 ORDER BY kg.id
+                 LIMIT %s
                 """,
-                (
-                    str(uuid4()),
-                    semantic_triple.predicate,
-                    uniq,
-                ),
-            )
-            self.conn.commit()
-
-            predicate_id = (
-                self.conn.execute(
-                    """
-                    SELECT id
-                      FROM memori_predicate
-                     WHERE uniq = %s
-                    """,
-                    (uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
-            )
-
-            uniq = generate_uniq(
-                [semantic_triple.object_name, semantic_triple.object_type]
+                (entity_id, after_id or 0, limit),
             )
+            .mappings()
+            .fetchall()
+        )
 
+    def delete_by_entity(self, entity_id: int):
+        # Only dimension rows this entity's edges referenced can become
+        # orphans, so collect them first instead of sweeping whole tables.
+        edges = (
             self.conn.execute(
                 """
-                INSERT INTO memori_object(
-                    uuid,
-                    name,
-                    type,
-                    uniq
-                ) VALUES (
-                    %s,
-                    %s,
-                    %s,
-                    %s
-                )
-                ON CONFLICT DO NOTHING
+                SELECT DISTINCT subject_id,
+                       predicate_id,
+                       object_id
+                  FROM memori_knowledge_graph
+                 WHERE entity_id = %s
                 """,
-                (
-                    str(uuid4()),
-                    semantic_triple.object_name,
-                    semantic_triple.object_type,
-                    uniq,
-                ),
-            )
-            self.conn.commit()
-
-            object_id = (
-                self.conn.execute(
-                    """
-                    SELECT id
-                      FROM memori_object
-                     WHERE uniq = %s
-                    """,
-                    (uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
+                (entity_id,),
             )
-
-            if (
-                entity_id is not None
-                and subject_id is not None
-                and predicate_id is not None
-                and object_id is not None
-            ):
-                self.conn.execute(
-                    """
-                    INSERT INTO memori_knowledge_graph(
-                        uuid,
-                        entity_id,
-                        subject_id,
-                        predicate_id,
-                        object_id,
-                        num_times,
-                        date_last_time
-                    ) VALUES (
-                        %s,
-                        %s,
-                        %s,
-                        %s,
-                        %s,
-                        1,
-                        CURRENT_TIMESTAMP
-                    )
-                    ON CONFLICT (entity_id, subject_id, predicate_id, object_id) DO UPDATE SET
-                        num_times = memori_knowledge_graph.num_times + 1,
-                        date_last_time = CURRENT_TIMESTAMP
-                    """,
-                    (str(uuid4()), entity_id, subject_id, predicate_id, object_id),
-                )
-
-        return self
-
-    def delete_by_entity(self, entity_id: int):
+            .mappings()
+            .fetchall()
+        )
         self.conn.execute(
             """
             DELETE
@@ -587,45 +661,32 @@ class KnowledgeGraph(BaseKnowledgeGraph):
             """,
             (entity_id,),
         )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_subject
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.subject_id = memori_subject.id
-             )
-            """
-        )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_predicate
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.predicate_id = memori_predicate.id
-             )
-            """
-        )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_object
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.object_id = memori_object.id
-             )
-            """
-        )
+        for table, column, ids in self._orphan_candidates(edges):
+            if not ids:
+                continue
+            self.conn.execute(
+                f"""
+                DELETE
+                  FROM {table}
+                 WHERE id = ANY(%s)
+                   AND NOT EXISTS (
+                       SELECT 1
+                         FROM memori_knowledge_graph
+                        WHERE memori_knowledge_graph.{column} = {table}.id
+                   )
+                """,  # nosec B608: Safe - table and column are constants, values parameterized
+                (ids,),
+            )
         self.conn.commit()
         return self
 
 
 class Process(BaseProcess):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
+        process_id = self._read(external_id)
+        if process_id is not None:
+            return process_id
+
         self.conn.execute(
             """
             INSERT INTO memori_process(
@@ -641,7 +702,10 @@ class Process(BaseProcess):
         )
         self.conn.commit()
 
-        return (
+        return self._read(external_id)
+
+    def _read(self, external_id: str) -> int | None:
+        result = (
             self.conn.execute(
                 """
                 SELECT id
@@ -652,8 +716,10 @@ class Process(BaseProcess):
             )
             .mappings()
             .fetchone()
-            .get("id", None)
         )
+        if result is None:
+            return None
+        return result.get("id", None)
 
 
 class ProcessAttribute(BaseProcessAttribute):
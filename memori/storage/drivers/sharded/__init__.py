@@ -0,0 +1,3 @@
+from memori.storage.drivers.sharded._driver import Driver
+
+__all__ = ["Driver"]
@@ -0,0 +1,317 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                  perfectam memoriam
+                       memorilabs.ai
+"""
+
+from collections import defaultdict
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
+
+from memori.storage._base import BaseStorageAdapter
+from memori.storage._registry import Registry
+
+
+class ProcessRef:
+    """Process id handed out by the sharded driver.
+
+    A process is not tied to an entity, so it is created lazily on the shard
+    of each session that uses it; the reference carries the external id.
+    """
+
+    __slots__ = ("external_id",)
+
+    def __init__(self, external_id: str) -> None:
+        self.external_id = external_id
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ProcessRef) and other.external_id == self.external_id
+
+    def __hash__(self) -> int:
+        return hash(self.external_id)
+
+    def __repr__(self) -> str:
+        return f"ProcessRef({self.external_id!r})"
+
+
+class _Sharded:
+    """Base of the sharded components.
+
+    Row ids are namespaced as local_id * num_shards + shard, so every id a
+    caller holds routes back to the shard that issued it.
+    """
+
+    def __init__(self, conn: BaseStorageAdapter):
+        self.conn = conn
+        self.num_shards = len(conn.conn)
+
+    def _driver(self, shard: int) -> Any:
+        return self.conn.shard(shard)[1]
+
+    def _join(self, shard: int, local_id: Any) -> int | None:
+        if local_id is None:
+            return None
+        return int(local_id) * self.num_shards + shard
+
+    def _split(self, id: Any) -> tuple[int, int]:
+        local_id, shard = divmod(int(id), self.num_shards)
+        return shard, local_id
+
+    def _route(self, id: Any) -> tuple[int, Any, int]:
+        shard, local_id = self._split(id)
+        return shard, self._driver(shard), local_id
+
+    def _rows(self, shard: int, rows: list, *columns: str) -> list[dict]:
+        out = []
+        for row in rows:
+            row = dict(row)
+            for column in columns:
+                row[column] = self._join(shard, row.get(column))
+            out.append(row)
+        return out
+
+    def _group(self, ids: list) -> dict[int, list]:
+        by_shard: dict[int, list] = defaultdict(list)
+        for id in ids:
+            shard, local_id = self._split(id)
+            by_shard[shard].append(local_id)
+        return by_shard
+
+
+class Conversation(_Sharded):
+    def __init__(self, conn: BaseStorageAdapter):
+        super().__init__(conn)
+        self.message = ConversationMessage(conn)
+        self.messages = ConversationMessages(conn)
+
+    def create(self, session_id, timeout_minutes: int):
+        shard, driver, local_id = self._route(session_id)
+        return self._join(shard, driver.conversation.create(local_id, timeout_minutes))
+
+    def update(self, id: int, summary: str):
+        _shard, driver, local_id = self._route(id)
+        driver.conversation.update(local_id, summary)
+        return self
+
+    def read(self, id: int) -> dict | None:
+        shard, driver, local_id = self._route(id)
+        row = driver.conversation.read(local_id)
+        if row is None:
+            return None
+        return self._rows(shard, [row], "id", "session_id")[0]
+
+    def read_id_by_session_id(self, session_id) -> int | None:
+        shard, driver, local_id = self._route(session_id)
+        return self._join(shard, driver.conversation.read_id_by_session_id(local_id))
+
+    def export(self, entity_id: int, after_id=None, limit: int = 1000):
+        shard, driver, local_id = self._route(entity_id)
+        after = None if after_id is None else self._split(after_id)[1]
+        return self._rows(
+            shard, driver.conversation.export(local_id, after, limit), "id"
+        )
+
+
+class ConversationMessage(_Sharded):
+    def create(self, conversation_id: int, role: str, type: str, content: str):
+        _shard, driver, local_id = self._route(conversation_id)
+        driver.conversation.message.create(local_id, role, type, content)
+        return self
+
+
+class ConversationMessages(_Sharded):
+    def create_many(self, conversation_id: int, messages: list[dict]):
+        _shard, driver, local_id = self._route(conversation_id)
+        driver.conversation.messages.create_many(local_id, messages)
+        return self
+
+    def read(self, conversation_id: int, limit: int | None = None):
+        _shard, driver, local_id = self._route(conversation_id)
+        return driver.conversation.messages.read(local_id, limit=limit)
+
+
+class Entity(_Sharded):
+    def create(self, external_id: str):
+        shard = self.conn.conn.shard_for(external_id)
+        return self._join(shard, self._driver(shard).entity.create(external_id))
+
+    def read(self, external_id: str):
+        shard = self.conn.conn.shard_for(external_id)
+        return self._join(shard, self._driver(shard).entity.read(external_id))
+
+
+class EntityFact(_Sharded):
+    def create(
+        self,
+        entity_id: int,
+        facts: list,
+        fact_embeddings: list | None = None,
+        conversation_id: int | None = None,
+        num_times: list[int] | None = None,
+    ):
+        shard, driver, local_id = self._route(entity_id)
+        local_conversation_id = None
+        if conversation_id is not None:
+            conversation_shard, local_conversation_id = self._split(conversation_id)
+            if conversation_shard != shard:
+                raise ValueError(
+                    f"conversation {conversation_id} is not on the shard of "
+                    f"entity {entity_id}"
+                )
+
+        driver.entity_fact.create(
+            local_id,
+            facts,
+            fact_embeddings,
+            conversation_id=local_conversation_id,
+            num_times=num_times,
+        )
+        return self
+
+    def get_embeddings(self, entity_id: int, limit: int = 1000):
+        shard, driver, local_id = self._route(entity_id)
+        return self._rows(
+            shard, driver.entity_fact.get_embeddings(local_id, limit), "id"
+        )
+
+    def get_embedding_segments(self, entity_id: int, limit: int = 1000):
+        shard, driver, local_id = self._route(entity_id)
+        packed = driver.entity_fact.get_embedding_segments(local_id, limit)
+        if packed is None:
+            return None
+        fact_ids, matrix = packed
+        return fact_ids * self.num_shards + shard, matrix
+
+    def get_facts_by_ids(self, fact_ids: list[int]):
+        facts = {}
+        for shard, local_ids in self._group(fact_ids).items():
+            rows = self._driver(shard).entity_fact.get_facts_by_ids(local_ids)
+            for row in self._rows(shard, rows, "id"):
+                facts[row["id"]] = row
+        return [facts[int(id)] for id in fact_ids if int(id) in facts]
+
+    def export(self, entity_id: int, after_id=None, limit: int = 1000):
+        shard, driver, local_id = self._route(entity_id)
+        after = None if after_id is None else self._split(after_id)[1]
+        return self._rows(
+            shard, driver.entity_fact.export(local_id, after, limit), "id"
+        )
+
+    def read_mentions(self, fact_ids: list):
+        mentions = []
+        for shard, local_ids in self._group(fact_ids).items():
+            rows = self._driver(shard).entity_fact.read_mentions(local_ids)
+            mentions.extend(self._rows(shard, rows, "fact_id", "conversation_id"))
+        return mentions
+
+    def follower_reads(self, staleness_seconds: int = 0) -> AbstractContextManager:
+        # The shard a read will hit is not known when the block is entered.
+        return nullcontext()
+
+    def delete_by_entity(self, entity_id: int):
+        _shard, driver, local_id = self._route(entity_id)
+        driver.entity_fact.delete_by_entity(local_id)
+        return self
+
+
+class KnowledgeGraph(_Sharded):
+    def create(
+        self,
+        entity_id: int,
+        semantic_triples: list,
+        num_times: list[int] | None = None,
+    ):
+        _shard, driver, local_id = self._route(entity_id)
+        driver.knowledge_graph.create(local_id, semantic_triples, num_times=num_times)
+        return self
+
+    def export(self, entity_id: int, after_id=None, limit: int = 1000):
+        shard, driver, local_id = self._route(entity_id)
+        after = None if after_id is None else self._split(after_id)[1]
+        return self._rows(
+            shard, driver.knowledge_graph.export(local_id, after, limit), "id"
+        )
+
+    def delete_by_entity(self, entity_id: int):
+        _shard, driver, local_id = self._route(entity_id)
+        driver.knowledge_graph.delete_by_entity(local_id)
+        return self
+
+
+class Process(_Sharded):
+    def create(self, external_id: str):
+        if external_id is None:
+            return None
+        return ProcessRef(external_id)
+
+
+class ProcessAttribute(_Sharded):
+    def create(self, process_id: ProcessRef, attributes: list):
+        # Attributes describe the process, not an entity; they live on the
+        # shard its external id hashes to.
+        driver = self._driver(self.conn.conn.shard_for(process_id.external_id))
+        driver.process_attribute.create(
+            driver.process.create(process_id.external_id), attributes
+        )
+        return self
+
+
+class Session(_Sharded):
+    def create(self, uuid: str, entity_id: int | None, process_id: ProcessRef | None):
+        if entity_id is not None:
+            shard, driver, local_id = self._route(entity_id)
+        else:
+            # Process-only (or anonymous) sessions have no entity to follow;
+            # they live on the shard of the process, as its attributes do.
+            shard = self.conn.conn.shard_for(
+                str(uuid) if process_id is None else process_id.external_id
+            )
+            driver, local_id = self._driver(shard), None
+        local_process_id = None
+        if process_id is not None:
+            local_process_id = driver.process.create(process_id.external_id)
+        return self._join(
+            shard, driver.session.create(uuid, local_id, local_process_id)
+        )
+
+    def read(self, uuid: str) -> int | None:
+        # A uuid carries no entity, so every shard is asked.
+        for shard in range(self.num_shards):
+            session_id = self._driver(shard).session.read(uuid)
+            if session_id is not None:
+                return self._join(shard, session_id)
+        return None
+
+
+@Registry.register_driver("sharded")
+class Driver:
+    """Routes each call to the shard that owns the entity behind it.
+
+    Entities are placed by ShardedConn.shard_for(external id); sessions,
+    conversations and facts follow their entity, and their ids encode the
+    shard. Each shard keeps its own schema, built by Builder.
+    """
+
+    def __init__(self, conn: BaseStorageAdapter):
+        self.conn = conn
+        self.conversation = Conversation(conn)
+        self.entity = Entity(conn)
+        self.entity_fact = EntityFact(conn)
+        self.knowledge_graph = KnowledgeGraph(conn)
+        self.process = Process(conn)
+        self.process_attribute = ProcessAttribute(conn)
+        self.session = Session(conn)
+
+    def configure(self, storage_config) -> None:
+        """Pool each shard's factory and configure every shard's driver."""
+        self.conn.conn.pool(
+            storage_config.pool_size, storage_config.pool_max_lifetime_seconds
+        )
+        for shard in range(len(self.conn.conn)):
+            configure = getattr(self.conn.shard(shard)[1], "configure", None)
+            if callable(configure):
+                configure(storage_config)
@@ -38,12 +38,11 @@ class Conversation(BaseConversation):
         existing = (
             self.conn.execute(
                 """
-                SELECT c.id,
-                       COALESCE(MAX(m.date_created), c.date_created) as last_activity
-                  FROM memori_conversation c
-                  LEFT JOIN memori_conversation_message m ON m.conversation_id = c.id
-                 WHERE c.session_id = ?
-                 GROUP BY c.id, c.date_created
+                SELECT id,
+                       (julianday('now') - julianday(COALESCE(last_activity, date_created)))
+                           * 24 * 60 AS minutes_since_activity
+                  FROM memori_conversation
+                 WHERE session_id = ?
                 """,
                 (session_id,),
             )
@@ -51,16 +50,8 @@ class Conversation(BaseConversation):
             .fetchone()
         )
 
-        if existing:
-            result = self.conn.execute(
-                """
-                SELECT (julianday('now') - julianday(?)) * 24 * 60 as minutes_since_activity
-                """,
-                (existing["last_activity"],),
-            ).fetchone()
-
-            if result[0] <= timeout_minutes:
-                return existing["id"]
+        if existing and existing["minutes_since_activity"] <= timeout_minutes:
+            return existing["id"]
 
         uuid = str(uuid4())
         self.conn.execute(
@@ -146,6 +137,30 @@ class Conversation(BaseConversation):
             return None
         return result.get("id", None)
 
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
+            self.conn.execute(
+                """
+                SELECT c.id,
+                       s.uuid AS session_uuid,
+                       p.external_id AS process_external_id,
+                       c.summary
+                  FROM memori_conversation c
+                  JOIN memori_session s
+                    ON s.id = c.session_id
+                  LEFT JOIN memori_process p
+                    ON p.id = s.process_id
+                 WHERE s.entity_id = ?
+                   AND c.id > ?
+                 ORDER BY c.id
+                 LIMIT ?
+                """,
+                (entity_id, after_id or 0, limit),
+            )
+            .mappings()
+            .fetchall()
+        )
+
 
 class ConversationMessage(BaseConversationMessage):
     def create(self, conversation_id: int, role: str, type: str, content: str):
@@ -174,23 +189,91 @@ class ConversationMessage(BaseConversationMessage):
             ),
         )
 
+        self.conn.execute(
+            """
+            UPDATE memori_conversation
+               SET last_activity = datetime('now')
+             WHERE id = ?
+            """,
+            (conversation_id,),
+        )
+
 
 class ConversationMessages(BaseConversationMessages):
-    def read(self, conversation_id: int):
-        results = (
-            self.conn.execute(
-                """
-                SELECT role,
-                       content
-                  FROM memori_conversation_message
-                 WHERE conversation_id = ?
-                 ORDER BY id
-                """,
-                (conversation_id,),
+    def create_many(self, conversation_id: int, messages: list[dict]):
+        if not messages:
+            return self
+
+        self.conn.execute_many(
+            """
+            INSERT INTO memori_conversation_message(
+                uuid,
+                conversation_id,
+                role,
+                type,
+                content
+            ) VALUES (
+                ?,
+                ?,
+                ?,
+                ?,
+                ?
             )
-            .mappings()
-            .fetchall()
+            """,
+            [
+                (
+                    str(uuid4()),
+                    conversation_id,
+                    message["role"],
+                    message["type"],
+                    message["content"],
+                )
+                for message in messages
+            ],
+        )
+
+        self.conn.execute(
+            """
+            UPDATE memori_conversation
+               SET last_activity = datetime('now')
+             WHERE id = ?
+            """,
+            (conversation_id,),
         )
+        return self
+
+    def read(self, conversation_id: int, limit: int | None = None):
+        if limit is None:
+            results = (
+                self.conn.execute(
+                    """
+                    SELECT role,
+                           content
+                      FROM memori_conversation_message
+                     WHERE conversation_id = ?
+                     ORDER BY id
+                    """,
+                    (conversation_id,),
+                )
+                .mappings()
+                .fetchall()
+            )
+        else:
+            results = (
+                self.conn.execute(
+                    """
+                    SELECT role,
+                           content
+                      FROM memori_conversation_message
+                     WHERE conversation_id = ?
+                     ORDER BY id DESC
+                     LIMIT ?
+                    """,
+                    (conversation_id, limit),
+                )
+                .mappings()
+                .fetchall()
+            )[::-1]
 
         messages = []
         for result in results:
@@ -200,7 +283,11 @@ class ConversationMessages(BaseConversationMessages):
 
 
 class Entity(BaseEntity):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
+        entity_id = self._read(external_id)
+        if entity_id is not None:
+            return entity_id
+
         self.conn.execute(
             """
             INSERT OR IGNORE INTO memori_entity(
@@ -215,7 +302,10 @@ class Entity(BaseEntity):
         )
         self.conn.commit()
 
-        return (
+        return self._read(external_id)
+
+    def _read(self, external_id: str) -> int | None:
+        result = (
             self.conn.execute(
                 """
                 SELECT id
@@ -226,35 +316,30 @@ class Entity(BaseEntity):
             )
             .mappings()
             .fetchone()
-            .get("id", None)
         )
+        if result is None:
+            return None
+        return result.get("id", None)
 
 
 class EntityFact(BaseEntityFact):
+    segment_placeholder = "?"
+
     def create(
         self,
         entity_id: int,
         facts: list,
         fact_embeddings: list | None = None,
         conversation_id: int | None = None,
+        num_times: list[int] | None = None,
     ):
         if facts is None or len(facts) == 0:
             return self
 
-        from memori._utils import generate_uniq
-        from memori.embeddings import format_embedding_for_db
-
-        for i, fact in enumerate(facts):
-            embedding = (
-                fact_embeddings[i]
-                if fact_embeddings and i < len(fact_embeddings)
-                else []
-            )
-            embedding_formatted = format_embedding_for_db(embedding, "sqlite")
-            uniq = generate_uniq([fact])
-
-            self.conn.execute(
-                """
+        rows = self._fact_rows(entity_id, facts, fact_embeddings, "sqlite", num_times)
+        for batch in self._batches(rows):
+            values = ",".join(["(?, ?, ?, ?, ?, datetime('now'), ?)"] * len(batch))
+            upsert_query = f"""
                 INSERT INTO memori_entity_fact(
                     uuid,
                     entity_id,
@@ -263,62 +348,51 @@ class EntityFact(BaseEntityFact):
                     num_times,
                     date_last_time,
                     uniq
-                ) VALUES (
-                    ?,
-                    ?,
-                    ?,
-                    ?,
-                    ?,
-                    datetime('now'),
-                    ?
-                )
+                ) VALUES {values}
                 ON CONFLICT(entity_id, uniq) DO UPDATE SET
-                    num_times = num_times + 1,
+                    num_times = num_times + excluded.num_times,
                     date_last_time = datetime('now')
-                """,
-                (
-                    str(uuid4()),
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            self.conn.execute(
+                upsert_query, tuple(value for row in batch for value in row)
+            )
+
+            if conversation_id is None:
+                continue
+
+            uniqs = [row[5] for row in batch]
+            placeholders = ",".join(["?"] * len(uniqs))
+            id_query = f"""
+                SELECT id
+                  FROM memori_entity_fact
+                 WHERE entity_id = ?
+                   AND uniq IN ({placeholders})
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            fact_rows = (
+                self.conn.execute(id_query, (entity_id, *uniqs)).mappings().fetchall()
+            )
+            fact_ids = [row["id"] for row in fact_rows if row.get("id") is not None]
+            if not fact_ids:
+                continue
+
+            values = ",".join(["(?, ?, ?, ?)"] * len(fact_ids))
+            mention_query = f"""
+                INSERT OR IGNORE INTO memori_entity_fact_mention(
+                    uuid,
                     entity_id,
-                    fact,
-                    embedding_formatted,
-                    1,
-                    uniq,
+                    fact_id,
+                    conversation_id
+                ) VALUES {values}
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            self.conn.execute(
+                mention_query,
+                tuple(
+                    value
+                    for fact_id in fact_ids
+                    for value in (str(uuid4()), entity_id, fact_id, conversation_id)
                 ),
             )
 
-            if conversation_id is not None:
-                fact_row = (
-                    self.conn.execute(
-                        """
-                        SELECT id
-                          FROM memori_entity_fact
-                         WHERE entity_id = ?
-                           AND uniq = ?
-                        """,
-                        (entity_id, uniq),
-                    )
-                    .mappings()
-                    .fetchone()
-                )
-                fact_id = fact_row.get("id") if fact_row else None
-                if fact_id is not None:
-                    self.conn.execute(
-                        """
-                        INSERT OR IGNORE INTO memori_entity_fact_mention(
-                            uuid,
-                            entity_id,
-                            fact_id,
-                            conversation_id
-                        ) VALUES (
-                            ?,
-                            ?,
-                            ?,
-                            ?
-                        )
-                        """,
-                        (str(uuid4()), entity_id, fact_id, conversation_id),
-                    )
-
         self.conn.commit()
 
         return self
@@ -398,6 +472,41 @@ class EntityFact(BaseEntityFact):
 
         return [facts_by_id[fact_id] for fact_id in fact_ids if fact_id in facts_by_id]
 
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
+            self.conn.execute(
+                """
+                SELECT id,
+                       content,
+                       content_embedding,
+                       num_times
+                  FROM memori_entity_fact
+                 WHERE entity_id = ?
+                   AND id > ?
+                 ORDER BY id
+                 LIMIT ?
+                """,
+                (entity_id, after_id or 0, limit),
+            )
+            .mappings()
+            .fetchall()
+        )
+
+    def read_mentions(self, fact_ids: list[int]):
+        mentions = []
+        for batch in self._batches(fact_ids):
+            placeholders = ",".join(["?"] * len(batch))
+            query = f"""
+                SELECT fact_id,
+                       conversation_id
+                  FROM memori_entity_fact_mention
+                 WHERE fact_id IN ({placeholders})
+                """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+            mentions.extend(
+                self.conn.execute(query, tuple(batch)).mappings().fetchall()
+            )
+        return mentions
+
     def delete_by_entity(self, entity_id: int):
         self.conn.execute(
             """
@@ -407,142 +516,107 @@ class EntityFact(BaseEntityFact):
             """,
             (entity_id,),
         )
+        self.conn.execute(
+            """
+            DELETE
+              FROM memori_entity_fact_segment
+             WHERE entity_id = ?
+            """,
+            (entity_id,),
+        )
         self.conn.commit()
         return self
 
 
 class KnowledgeGraph(BaseKnowledgeGraph):
-    def create(self, entity_id: int, semantic_triples: list):
-        if semantic_triples is None or len(semantic_triples) == 0:
-            return self
-
-        from memori._utils import generate_uniq
-
-        for semantic_triple in semantic_triples:
-            # Insert or get subject
-            subject_uniq = generate_uniq(
-                [semantic_triple.subject_name, semantic_triple.subject_type]
-            )
-
-            self.conn.execute(
-                """
-                INSERT OR IGNORE INTO memori_subject(
-                    uuid,
-                    name,
-                    type,
-                    uniq
-                ) VALUES (?, ?, ?, ?)
-                """,
-                (
-                    str(uuid4()),
-                    semantic_triple.subject_name,
-                    semantic_triple.subject_type,
-                    subject_uniq,
-                ),
-            )
-            self.conn.commit()
-
-            subject_id = (
-                self.conn.execute(
-                    "SELECT id FROM memori_subject WHERE uniq = ?",
-                    (subject_uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
-            )
-
-            # Insert or get predicate
-            predicate_uniq = generate_uniq([semantic_triple.predicate])
-
+    def _insert_dimension(
+        self, table: str, columns: tuple[str, ...], rows: list[tuple]
+    ) -> None:
+        row_placeholders = "(" + ", ".join(["?"] * (len(columns) + 2)) + ")"
+        values = ",".join([row_placeholders] * len(rows))
+        insert_query = f"""
+            INSERT OR IGNORE INTO {table}(
+                uuid,
+                {", ".join(columns)},
+                uniq
+            ) VALUES {values}
+            """  # nosec B608: Safe - table and columns are constants, values parameterized
+        self.conn.execute(insert_query, tuple(value for row in rows for value in row))
+
+    def _read_dimension_ids(self, table: str, uniqs: list[str]) -> list:
+        placeholders = ",".join(["?"] * len(uniqs))
+        id_query = f"""
+            SELECT id,
+                   uniq
+              FROM {table}
+             WHERE uniq IN ({placeholders})
+            """  # nosec B608: Safe - table is a constant, values parameterized
+        return self.conn.execute(id_query, tuple(uniqs)).mappings().fetchall()
+
+    def _upsert_edges(self, rows: list[tuple]) -> None:
+        values = ",".join(["(?, ?, ?, ?, ?, ?, datetime('now'))"] * len(rows))
+        edge_query = f"""
+            INSERT INTO memori_knowledge_graph(
+                uuid,
+                entity_id,
+                subject_id,
+                predicate_id,
+                object_id,
+                num_times,
+                date_last_time
+            ) VALUES {values}
+            ON CONFLICT(entity_id, subject_id, predicate_id, object_id) DO UPDATE SET
+                num_times = num_times + excluded.num_times,
+                date_last_time = datetime('now')
+            """  # nosec B608: Safe - only interpolating placeholder count, actual values parameterized
+        self.conn.execute(edge_query, tuple(value for row in rows for value in row))
+
+    def export(self, entity_id: int, after_id: int | None = None, limit: int = 1000):
+        return (
             self.conn.execute(
                 """
-                INSERT OR IGNORE INTO memori_predicate(
-                    uuid,
-                    content,
-                    uniq
-                ) VALUES (?, ?, ?)
+                SELECT kg.id,
+                       s.name AS subject_name,
+                       s.type AS subject_type,
+                       p.content AS predicate,
+                       o.name AS object_name,
+                       o.type AS object_type,
+                       kg.num_times
+                  FROM memori_knowledge_graph kg
+                  JOIN memori_subject s
+                    ON s.id = kg.subject_id
+                  JOIN memori_predicate p
+                    ON p.id = kg.predicate_id
+                  JOIN memori_object o
+                    ON o.id = kg.object_id
+                 WHERE kg.entity_id = ?
+                   AND kg.id > ?
+                 ORDER BY kg.id
+                 LIMIT ?
                 """,
-                (
-                    str(uuid4()),
-                    semantic_triple.predicate,
-                    predicate_uniq,
-                ),
-            )
-            self.conn.commit()
-
-            predicate_id = (
-                self.conn.execute(
-                    "SELECT id FROM memori_predicate WHERE uniq = ?",
-                    (predicate_uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
-            )
-
-            # Insert or get object
-            object_uniq = generate_uniq(
-                [semantic_triple.object_name, semantic_triple.object_type]
+                (entity_id, after_id or 0, limit),
             )
+            .mappings()
+            .fetchall()
+        )
 
+    def delete_by_entity(self, entity_id: int):
+        # Only dimension rows this entity's edges referenced can become
+        # orphans, so collect them first instead of sweeping whole tables.
+        edges = (
             self.conn.execute(
                 """
-                INSERT OR IGNORE INTO memori_object(
-                    uuid,
-                    name,
-                    type,
-                    uniq
-                ) VALUES (?, ?, ?, ?)
+                SELECT DISTINCT subject_id,
+                       predicate_id,
+                       object_id
+                  FROM memori_knowledge_graph
+                 WHERE entity_id = ?
                 """,
-                (
-                    str(uuid4()),
-                    semantic_triple.object_name,
-                    semantic_triple.object_type,
-                    object_uniq,
-                ),
+                (entity_id,),
             )
-            self.conn.commit()
-
-            object_id = (
-                self.conn.execute(
-                    "SELECT id FROM memori_object WHERE uniq = ?",
-                    (object_uniq,),
-                )
-                .mappings()
-                .fetchone()
-                .get("id", None)
-            )
-
-            # Insert or update knowledge graph entry
-            if (
-                entity_id is not None
-                and subject_id is not None
-                and predicate_id is not None
-                and object_id is not None
-            ):
-                self.conn.execute(
-                    """
-                    INSERT INTO memori_knowledge_graph(
-                        uuid,
-                        entity_id,
-                        subject_id,
-                        predicate_id,
-                        object_id,
-                        num_times,
-                        date_last_time
-                    ) VALUES (?, ?, ?, ?, ?, 1, datetime('now'))
-                    ON CONFLICT(entity_id, subject_id, predicate_id, object_id) DO UPDATE SET
-                        num_times = num_times + 1,
-                        date_last_time = datetime('now')
-                    """,
-                    (str(uuid4()), entity_id, subject_id, predicate_id, object_id),
-                )
-                self.conn.commit()
-
-        return self
-
-    def delete_by_entity(self, entity_id: int):
+            .mappings()
+            .fetchall()
+        )
         self.conn.execute(
             """
             DELETE
@@ -551,45 +625,32 @@ class KnowledgeGraph(BaseKnowledgeGraph):
             """,
             (entity_id,),
         )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_subject
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.subject_id = memori_subject.id
-             )
-            """
-        )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_predicate
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.predicate_id = memori_predicate.id
-             )
-            """
-        )
-        self.conn.execute(
-            """
-            DELETE
-              FROM memori_object
-             WHERE NOT EXISTS (
-                   SELECT 1
-                     FROM memori_knowledge_graph
-                    WHERE memori_knowledge_graph.object_id = memori_object.id
-             )
-            """
-        )
+        for table, column, ids in self._orphan_candidates(edges):
+            for batch in self._batches(ids):
+                placeholders = ",".join(["?"] * len(batch))
+                self.conn.execute(
+                    f"""
+                    DELETE
+                      FROM {table}
+                     WHERE id IN ({placeholders})
+                       AND NOT EXISTS (
+                           SELECT 1
+                             FROM memori_knowledge_graph
+                            WHERE memori_knowledge_graph.{column} = {table}.id
+                       )
+                    """,  # nosec B608: Safe - table and column are constants, values parameterized
+                    tuple(batch),
+                )
         self.conn.commit()
         return self
 
 
 class Process(BaseProcess):
-    def create(self, external_id: str):
+    def _create(self, external_id: str):
+        process_id = self._read(external_id)
+        if process_id is not None:
+            return process_id
+
         self.conn.execute(
             """
             INSERT OR IGNORE INTO memori_process(
@@ -604,7 +665,10 @@ class Process(BaseProcess):
         )
         self.conn.commit()
 
-        return (
+        return self._read(external_id)
+
+    def _read(self, external_id: str) -> int | None:
+        result = (
             self.conn.execute(
                 """
                 SELECT id
@@ -615,8 +679,10 @@ class Process(BaseProcess):
             )
             .mappings()
             .fetchone()
-            .get("id", None)
         )
+        if result is None:
+            return None
+        return result.get("id", None)
 
 
 class ProcessAttribute(BaseProcessAttribute):
@@ -299,4 +299,24 @@ migrations = {
             ],
         },
     ],
+    3: [
+        {
+            "description": "create index on memori_entity_fact for recall",
+            "operations": [
+                {
+                    "collection": "memori_entity_fact",
+                    "method": "create_index",
+                    "args": [
+                        [
+                            ("entity_id", 1),
+                            ("date_last_time", -1),
+                            ("num_times", -1),
+                            ("_id", -1),
+                        ]
+                    ],
+                    "kwargs": {"name": "idx_memori_entity_fact_recall"},
+                },
+            ],
+        },
+    ],
 }
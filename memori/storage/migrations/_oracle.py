@@ -399,4 +399,60 @@ migrations = {
             """,
         },
     ],
+    3: [
+        {
+            "description": "add last_activity to memori_conversation",
+            "operation": """
+                BEGIN
+                    EXECUTE IMMEDIATE '
+                        ALTER TABLE memori_conversation
+                          ADD (last_activity TIMESTAMP DEFAULT NULL)
+                    ';
+                EXCEPTION
+                    WHEN OTHERS THEN
+                        IF SQLCODE = -1430 THEN NULL;
+                        ELSE RAISE;
+                        END IF;
+                END;
+            """,
+        },
+        {
+            "description": "backfill memori_conversation last_activity",
+            "operation": """
+                MERGE INTO memori_conversation c
+                USING (
+                    SELECT conversation_id,
+                           MAX(date_created) AS last_activity
+                      FROM memori_conversation_message
+                     GROUP BY conversation_id
+                ) m
+                ON (m.conversation_id = c.id)
+                WHEN MATCHED THEN
+                    UPDATE SET c.last_activity = m.last_activity
+            """,
+        },
+    ],
+    4: [
+        {
+            "description": "create index on memori_entity_fact for recall",
+            "operation": """
+                BEGIN
+                    EXECUTE IMMEDIATE '
+                        CREATE INDEX idx_memori_entity_fact_recall
+                        ON memori_entity_fact (
+                            entity_id,
+                            date_last_time DESC,
+                            num_times DESC,
+                            id DESC
+                        )
+                    ';
+                EXCEPTION
+                    WHEN OTHERS THEN
+                        IF SQLCODE = -955 OR SQLCODE = -1408 THEN NULL;
+                        ELSE RAISE;
+                        END IF;
+                END;
+            """,
+        },
+    ],
 }
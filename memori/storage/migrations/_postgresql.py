@@ -300,4 +300,70 @@ migrations = {
             """,
         },
     ],
+    3: [
+        {
+            "description": "add last_activity to memori_conversation",
+            "operation": """
+                ALTER TABLE memori_conversation
+                  ADD COLUMN IF NOT EXISTS last_activity TIMESTAMP DEFAULT NULL
+            """,
+        },
+        {
+            "description": "backfill memori_conversation last_activity",
+            "operation": """
+                UPDATE memori_conversation c
+                   SET last_activity = m.last_activity
+                  FROM (
+                       SELECT conversation_id,
+                              MAX(date_created) AS last_activity
+                         FROM memori_conversation_message
+                        GROUP BY conversation_id
+                  ) m
+                 WHERE m.conversation_id = c.id
+            """,
+        },
+    ],
+    4: [
+        {
+            "description": "create index on memori_entity_fact for recall",
+            "operation": """
+                CREATE INDEX IF NOT EXISTS idx_memori_entity_fact_recall
+                ON memori_entity_fact (
+                    entity_id,
+                    date_last_time DESC,
+                    num_times DESC,
+                    id DESC
+                )
+            """,
+        },
+    ],
+    5: [
+        {
+            "description": "create table memori_entity_fact_segment",
+            "operation": """
+                CREATE TABLE IF NOT EXISTS memori_entity_fact_segment(
+                    id BIGSERIAL NOT NULL PRIMARY KEY,
+                    entity_id BIGINT NOT NULL,
+                    num_facts INTEGER NOT NULL,
+                    max_fact_id BIGINT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    fact_ids BYTEA NOT NULL,
+                    embeddings BYTEA NOT NULL,
+                    date_created TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    --
+                    CONSTRAINT fk_memori_ent_fact_segment_entity
+                       FOREIGN KEY (entity_id)
+                        REFERENCES memori_entity (id)
+                         ON DELETE CASCADE
+                )
+            """,
+        },
+        {
+            "description": "create index on memori_entity_fact_segment for entity lookups",
+            "operation": """
+                CREATE INDEX IF NOT EXISTS idx_memori_entity_fact_segment_entity_id
+                ON memori_entity_fact_segment (entity_id, id)
+            """,
+        },
+    ],
 }
@@ -310,4 +310,68 @@ migrations = {
             """,
         },
     ],
+    3: [
+        {
+            "description": "add last_activity to memori_conversation",
+            "operation": """
+                ALTER TABLE memori_conversation
+                  ADD COLUMN last_activity TEXT DEFAULT NULL
+            """,
+        },
+        {
+            "description": "backfill memori_conversation last_activity",
+            "operation": """
+                UPDATE memori_conversation
+                   SET last_activity = (
+                       SELECT MAX(m.date_created)
+                         FROM memori_conversation_message m
+                        WHERE m.conversation_id = memori_conversation.id
+                   )
+            """,
+        },
+    ],
+    4: [
+        {
+            "description": "create index on memori_entity_fact for recall",
+            "operation": """
+                CREATE INDEX IF NOT EXISTS idx_memori_entity_fact_recall
+                ON memori_entity_fact (
+                    entity_id,
+                    date_last_time DESC,
+                    num_times DESC,
+                    id DESC,
+                    content_embedding
+                )
+            """,
+        },
+    ],
+    5: [
+        {
+            "description": "create table memori_entity_fact_segment",
+            "operation": """
+                CREATE TABLE IF NOT EXISTS memori_entity_fact_segment(
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    entity_id INTEGER NOT NULL,
+                    num_facts INTEGER NOT NULL,
+                    max_fact_id INTEGER NOT NULL,
+                    dim INTEGER NOT NULL,
+                    fact_ids BLOB NOT NULL,
+                    embeddings BLOB NOT NULL,
+                    date_created TEXT NOT NULL DEFAULT (datetime('now')),
+                    --
+                    CONSTRAINT fk_memori_ent_fact_segment_entity
+                       FOREIGN KEY (entity_id)
+                        REFERENCES memori_entity (id)
+                         ON DELETE CASCADE
+                )
+            """,
+        },
+        {
+            "description": "create index on memori_entity_fact_segment for entity lookups",
+            "operation": """
+                CREATE INDEX IF NOT EXISTS idx_memori_entity_fact_segment_entity_id
+                ON memori_entity_fact_segment (entity_id, id)
+            """,
+        },
+    ],
 }
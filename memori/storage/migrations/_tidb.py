@@ -305,4 +305,66 @@ migrations = {
             """,
         },
     ],
+    3: [
+        {
+            "description": "add last_activity to memori_conversation",
+            "operation": """
+                alter table memori_conversation
+                  add column last_activity datetime default null
+            """,
+        },
+        {
+            "description": "backfill memori_conversation last_activity",
+            "operation": """
+                update memori_conversation c
+                  join (
+                       select conversation_id,
+                              max(date_created) as last_activity
+                         from memori_conversation_message
+                        group by conversation_id
+                  ) m on m.conversation_id = c.id
+                   set c.last_activity = m.last_activity,
+                       c.date_updated = c.date_updated
+            """,
+        },
+    ],
+    4: [
+        {
+            "description": "create index on memori_entity_fact for recall",
+            "operation": """
+                alter table memori_entity_fact
+                  add key idx_memori_entity_fact_recall (
+                      entity_id,
+                      date_last_time desc,
+                      num_times desc,
+                      id desc
+                  )
+            """,
+        },
+    ],
+    5: [
+        {
+            "description": "create table memori_entity_fact_segment",
+            "operation": """
+                create table if not exists memori_entity_fact_segment(
+                    id bigint not null auto_increment,
+                    entity_id bigint not null,
+                    num_facts int not null,
+                    max_fact_id bigint not null,
+                    dim int not null,
+                    fact_ids longblob not null,
+                    embeddings longblob not null,
+                    date_created datetime not null default current_timestamp,
+                    --
+                    primary key (id),
+                    key idx_memori_entity_fact_segment_entity_id (entity_id, id),
+                    --
+                    constraint fk_memori_ent_fact_segment_entity
+                   foreign key (entity_id)
+                    references memori_entity (id)
+                     on delete cascade
+                )
+            """,
+        },
+    ],
 }
@@ -0,0 +1,115 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                 perfectam memoriam
+                      memorilabs.ai
+"""
+
+import asyncio
+import queue
+import threading
+
+import pytest
+
+from memori.embeddings._executor import (
+    PRIORITY_FACT,
+    PRIORITY_QUERY,
+    EmbeddingExecutor,
+)
+
+
+def _blocked_executor(queue_size=16):
+    executor = EmbeddingExecutor().configure(max_workers=1, queue_size=queue_size)
+    release = threading.Event()
+    started = threading.Event()
+
+    def _block():
+        started.set()
+        release.wait(timeout=5)
+
+    blocker = executor.submit(_block, priority=PRIORITY_FACT)
+    assert started.wait(timeout=5)
+    return executor, release, blocker
+
+
+def test_query_jobs_run_before_queued_fact_jobs():
+    executor, release, blocker = _blocked_executor()
+    order = []
+
+    facts = [
+        executor.submit(lambda i=i: order.append(f"fact-{i}"), priority=PRIORITY_FACT)
+        for i in range(2)
+    ]
+    query = executor.submit(lambda: order.append("query"), priority=PRIORITY_QUERY)
+
+    release.set()
+    for future in [blocker, *facts, query]:
+        future.result(timeout=5)
+
+    assert order == ["query", "fact-0", "fact-1"]
+
+
+def test_try_submit_applies_backpressure_when_queue_full():
+    executor, release, blocker = _blocked_executor(queue_size=1)
+
+    queued = executor.try_submit(lambda: "queued", priority=PRIORITY_FACT)
+    rejected = executor.try_submit(lambda: "rejected", priority=PRIORITY_FACT)
+
+    assert queued is not None
+    assert rejected is None
+
+    release.set()
+    assert queued.result(timeout=5) == "queued"
+    blocker.result(timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result_and_propagates_errors():
+    executor = EmbeddingExecutor().configure(max_workers=1, queue_size=4)
+
+    assert await executor.run(lambda: 42) == 42
+
+    def _fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await executor.run(_fail, priority=PRIORITY_FACT)
+
+
+@pytest.mark.asyncio
+async def test_waiting_callers_admitted_in_priority_order():
+    executor, release, blocker = _blocked_executor(queue_size=1)
+    order = []
+
+    queued = executor.try_submit(lambda: order.append("queued"), priority=PRIORITY_FACT)
+    fact = asyncio.ensure_future(
+        executor.run(lambda: order.append("fact"), priority=PRIORITY_FACT)
+    )
+    await asyncio.sleep(0)
+    query = asyncio.ensure_future(
+        executor.run(lambda: order.append("query"), priority=PRIORITY_QUERY)
+    )
+    await asyncio.sleep(0)
+    assert executor.try_submit(lambda: None, priority=PRIORITY_FACT) is None
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(fact, query), timeout=5)
+    queued.result(timeout=5)
+    blocker.result(timeout=5)
+
+    assert order == ["queued", "query", "fact"]
+
+
+def test_submit_times_out_when_queue_stays_full():
+    executor, release, blocker = _blocked_executor(queue_size=1)
+    executor.submit(lambda: None, priority=PRIORITY_FACT)
+
+    with pytest.raises(queue.Full):
+        executor.submit(lambda: None, priority=PRIORITY_QUERY, timeout=0.05)
+
+    release.set()
+    blocker.result(timeout=5)
+    assert not executor._waiters
@@ -0,0 +1,36 @@
+r"""
+ __  __                           _
+|  \/  | ___ _ __ ___   ___  _ __(_)
+| |\/| |/ _ \ '_ ` _ \ / _ \| '__| |
+| |  | |  __/ | | | | | (_) | |  | |
+|_|  |_|\___|_| |_| |_|\___/|_|  |_|
+                 perfectam memoriam
+                      memorilabs.ai
+"""
+
+import memori.embeddings._warmup as warmup_mod
+
+
+def test_warmup_runs_embedding_once_in_background(mocker):
+    warmup_mod._WARMUP_CACHE.clear()
+    embed = mocker.patch("memori.embeddings._api._embed_texts")
+
+    first = warmup_mod.warmup_embeddings("test-model")
+    second = warmup_mod.warmup_embeddings("test-model")
+
+    assert first is second
+    assert first.wait(timeout=5) is True
+    assert first.is_ready() is True
+    embed.assert_called_once_with("warmup", "test-model")
+
+
+def test_warmup_marks_ready_when_model_load_fails(mocker):
+    warmup_mod._WARMUP_CACHE.clear()
+    mocker.patch(
+        "memori.embeddings._api._embed_texts", side_effect=RuntimeError("boom")
+    )
+
+    warmup = warmup_mod.warmup_embeddings("broken-model")
+
+    assert warmup.wait(timeout=5) is True
+    assert warmup.is_ready() is True
@@ -399,3 +399,48 @@ class TestMongoDBStorage:
 
         assistant_messages = [m for m in messages if m["role"] == "assistant"]
         assert len(assistant_messages) >= 1
+
+    @requires_mongodb
+    @pytest.mark.integration
+    def test_bulk_fact_and_triple_writes(self, mongodb_memori):
+        """Test that bulk upserts count repeats and resolve ids in MongoDB."""
+        from uuid import uuid4
+
+        from memori.memory._struct import SemanticTriple
+
+        driver = mongodb_memori.config.storage.driver
+        entity_id = driver.entity.create(f"mongodb-bulk-{uuid4()}")
+
+        driver.entity_fact.create(
+            entity_id,
+            ["likes tea", "likes tea", "lives in Oslo"],
+            [[0.1], [0.1], [0.2]],
+        )
+        driver.entity_fact.create(entity_id, ["likes tea"], [[0.1]], 1)
+
+        facts = list(
+            driver.entity_fact.conn.execute(
+                "memori_entity_fact", "find", {"entity_id": entity_id}
+            )
+        )
+        assert sorted((f["content"], f["num_times"]) for f in facts) == [
+            ("likes tea", 3),
+            ("lives in Oslo", 1),
+        ]
+        embeddings = driver.entity_fact.get_embeddings(entity_id, 1)
+        assert [row["id"] for row in embeddings] == [
+            next(f["_id"] for f in facts if f["content"] == "likes tea")
+        ]
+
+        triple = SemanticTriple()
+        triple.subject_name, triple.subject_type = "alice", "person"
+        triple.predicate = "likes"
+        triple.object_name, triple.object_type = "tea", "thing"
+        driver.knowledge_graph.create(entity_id, [triple, triple])
+
+        edges = list(
+            driver.knowledge_graph.conn.execute(
+                "memori_knowledge_graph", "find", {"entity_id": entity_id}
+            )
+        )
+        assert [edge["num_times"] for edge in edges] == [2]
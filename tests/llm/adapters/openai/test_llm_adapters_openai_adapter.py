@@ -392,6 +392,7 @@ def test_inject_conversation_messages_converts_string_input_to_list():
     config.cache.conversation_id = 1
     config.storage = MagicMock()
     config.storage.driver = MagicMock()
+    config.storage.reader.return_value = config.storage.driver
     config.storage.driver.conversation.messages.read.return_value = [
         {"role": "user", "content": "Previous"},
     ]
@@ -877,6 +877,7 @@ def test_inject_conversation_messages_no_messages():
     config.cache.conversation_id = 123
     config.storage = Mock()
     config.storage.driver = Mock()
+    config.storage.reader.return_value = config.storage.driver
     config.storage.driver.conversation.messages.read.return_value = []
     invoke = BaseInvoke(config, "test_method")
 
@@ -893,6 +894,7 @@ def test_inject_conversation_messages_openai_success():
     config.llm.provider = OPENAI_LLM_PROVIDER
     config.storage = Mock()
     config.storage.driver = Mock()
+    config.storage.reader.return_value = config.storage.driver
     config.storage.driver.conversation.messages.read.return_value = [
         {"role": "user", "content": "Previous question"},
         {"role": "assistant", "content": "Previous answer"},
@@ -924,6 +926,7 @@ def test_inject_conversation_messages_cache_miss_loads_from_session(mocker):
 
     mock_storage = mocker.MagicMock()
     mock_storage.driver = mock_driver
+    mock_storage.reader.return_value = mock_driver
     config.storage = mock_storage
 
     invoke = BaseInvoke(config, "test_method")
@@ -17,6 +17,7 @@ import pytest
 import memori.embeddings._sentence_transformers as st_core
 from memori._config import Config
 from memori.embeddings import TEI, embed_texts, format_embedding_for_db
+from memori.embeddings._executor import PRIORITY_QUERY
 
 
 def test_format_embedding_for_db_mysql():
@@ -118,6 +119,53 @@ def test_format_embedding_for_db_high_dimensional():
     assert list(unpacked_postgres) == pytest.approx(embedding)
 
 
+def test_format_embedding_for_db_array_sqlite_is_zero_copy():
+    rows = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], dtype=np.float32)
+    result = format_embedding_for_db(rows[1], "sqlite")
+    assert isinstance(result, memoryview)
+    assert np.shares_memory(np.frombuffer(result, dtype=np.float32), rows)
+    assert struct.unpack("<3f", result) == (4.0, 5.0, 6.0)
+
+
+def test_format_embedding_for_db_array_mysql_returns_bytes():
+    result = format_embedding_for_db(np.array([1.0, 2.0], dtype=np.float64), "mysql")
+    assert isinstance(result, bytes)
+    assert struct.unpack("<2f", result) == (1.0, 2.0)
+
+
+def test_format_embedding_for_db_array_oceanbase_uses_list(mocker):
+    mock_vector = mocker.MagicMock()
+    mock_vector._to_db.return_value = "vector-bytes"
+    mock_util = mocker.MagicMock(Vector=mock_vector)
+    mocker.patch.dict(
+        "sys.modules",
+        {"pyobvector": mocker.MagicMock(util=mock_util), "pyobvector.util": mock_util},
+    )
+
+    result = format_embedding_for_db(np.array([1.0, 2.0], np.float32), "oceanbase")
+
+    assert result == "vector-bytes"
+    mock_vector._to_db.assert_called_once_with([1.0, 2.0])
+
+
+def test_embed_texts_array_returns_float32_matrix(mocker):
+    from memori.embeddings._api import embed_texts_array
+
+    st_core._EMBEDDER_CACHE.clear()
+    mock_model = mocker.Mock()
+    mock_model.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4]])
+    mocker.patch(
+        "memori.embeddings._sentence_transformers.SentenceTransformersEmbedder._get_model",
+        return_value=mock_model,
+    )
+
+    out = embed_texts_array(["a", "b"], model="test-model")
+
+    assert isinstance(out, np.ndarray)
+    assert out.dtype == np.float32
+    assert out.shape == (2, 2)
+
+
 def test_get_model_caches_model():
     st_core._EMBEDDER_CACHE.clear()
     with patch(
@@ -272,11 +320,103 @@ def test_embed_texts_chunks_long_text_and_pools(mocker):
     assert out[0] == pytest.approx([0.832050, 0.554700], rel=1e-4)
     mock_model.encode.assert_called_with(
         ["c1", "c2", "c3", "c4", "c5"],
+        batch_size=5,
         convert_to_numpy=True,
         normalize_embeddings=True,
     )
 
 
+def test_embed_texts_batches_chunks_across_long_inputs(mocker):
+    st_core._EMBEDDER_CACHE.clear()
+    mock_model = mocker.Mock()
+    mock_model.get_max_seq_length.return_value = 6
+    mock_model.tokenizer = mocker.Mock()
+    mock_model.tokenizer.return_value = {
+        "input_ids": [list(range(8)), [0, 1], list(range(6))]
+    }
+    mock_model.tokenizer.decode.side_effect = ["a1", "a2", "c1", "c2"]
+    mock_model.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[1.0, 0.0] if t in ("a1", "c1") else [0.0, 1.0] for t in texts],
+        dtype=np.float32,
+    )
+    mocker.patch(
+        "memori.embeddings._sentence_transformers.SentenceTransformersEmbedder._get_model",
+        return_value=mock_model,
+    )
+
+    out = embed_texts(["long a", "short", "long c"], model="test-model")
+
+    assert len(out) == 3
+    assert out[0] == pytest.approx([0.707106, 0.707106], rel=1e-5)
+    assert out[1] == pytest.approx([0.0, 1.0])
+    assert out[2] == pytest.approx([0.707106, 0.707106], rel=1e-5)
+    # One batched tokenizer call and one encode call for all chunks.
+    mock_model.tokenizer.assert_called_once()
+    assert mock_model.tokenizer.call_args.args[0] == ["long a", "short", "long c"]
+    mock_model.encode.assert_called_once()
+    assert sorted(mock_model.encode.call_args.args[0]) == [
+        "a1",
+        "a2",
+        "c1",
+        "c2",
+        "short",
+    ]
+
+
+def test_embed_texts_buckets_short_inputs_by_token_length(mocker):
+    st_core._EMBEDDER_CACHE.clear()
+    mocker.patch.object(st_core, "_BUCKET_TOKEN_BUDGET", 8)
+    mock_model = mocker.Mock()
+    mock_model.get_max_seq_length.return_value = 512
+    mock_model.tokenizer = mocker.Mock()
+    mock_model.tokenizer.side_effect = lambda texts, **kwargs: {
+        "input_ids": [list(range(len(t))) for t in texts]
+    }
+
+    def fake_encode(texts, **kwargs):
+        return np.array([[float(len(t)), 0.0] for t in texts], dtype=np.float32)
+
+    mock_model.encode.side_effect = fake_encode
+    mocker.patch(
+        "memori.embeddings._sentence_transformers.SentenceTransformersEmbedder._get_model",
+        return_value=mock_model,
+    )
+
+    out = embed_texts(["aaaaaaa", "a", "aa", "aaaaaa", "a"], model="test-model")
+
+    # Results come back in the caller's order.
+    assert [v[0] for v in out] == [7.0, 1.0, 2.0, 6.0, 1.0]
+    batches = [c.args[0] for c in mock_model.encode.call_args_list]
+    assert batches == [["a", "a", "aa"], ["aaaaaa"], ["aaaaaaa"]]
+    assert [c.kwargs["batch_size"] for c in mock_model.encode.call_args_list] == [
+        3,
+        1,
+        1,
+    ]
+
+
+def test_embed_texts_bucketed_logs_padding_efficiency(mocker, caplog):
+    st_core._EMBEDDER_CACHE.clear()
+    mock_model = mocker.Mock()
+    mock_model.get_max_seq_length.return_value = 512
+    mock_model.tokenizer = mocker.Mock()
+    mock_model.tokenizer.side_effect = lambda texts, **kwargs: {
+        "input_ids": [list(range(len(t))) for t in texts]
+    }
+    mock_model.encode.side_effect = lambda texts, **kwargs: np.ones(
+        (len(texts), 2), dtype=np.float32
+    )
+    mocker.patch(
+        "memori.embeddings._sentence_transformers.SentenceTransformersEmbedder._get_model",
+        return_value=mock_model,
+    )
+
+    with caplog.at_level("DEBUG", logger="memori.embeddings._sentence_transformers"):
+        embed_texts(["ab", "abcd"], model="test-model")
+
+    assert "padding efficiency: 0.75" in caplog.text
+
+
 def test_embed_texts_custom_model():
     st_core._EMBEDDER_CACHE.clear()
     with patch("memori.embeddings._api.get_sentence_transformers_embedder") as mock_get:
@@ -397,12 +537,7 @@ async def test_embed_texts_async_single_string():
     cfg = Config()
     mock_result = [[0.1, 0.2, 0.3]]
 
-    async def mock_run_in_executor(executor, func, *args):
-        return mock_result
-
-    with patch("asyncio.get_event_loop") as mock_loop:
-        mock_loop.return_value.run_in_executor = mock_run_in_executor
-
+    with patch("memori.embeddings._api._embed_texts", return_value=mock_result):
         result = await embed_texts(
             "Hello world",
             model=cfg.embeddings.model,
@@ -418,12 +553,7 @@ async def test_embed_texts_async_list():
     cfg = Config()
     mock_result = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
 
-    async def mock_run_in_executor(executor, func, *args):
-        return mock_result
-
-    with patch("asyncio.get_event_loop") as mock_loop:
-        mock_loop.return_value.run_in_executor = mock_run_in_executor
-
+    with patch("memori.embeddings._api._embed_texts", return_value=mock_result):
         result = await embed_texts(
             ["Hello", "World"],
             model=cfg.embeddings.model,
@@ -439,16 +569,33 @@ async def test_embed_texts_async_list():
 async def test_embed_texts_async_custom_model():
     mock_result = [[0.1, 0.2, 0.3]]
 
-    async def mock_run_in_executor(executor, func, *args):
-        return mock_result
-
-    with patch("asyncio.get_event_loop") as mock_loop:
-        mock_loop.return_value.run_in_executor = mock_run_in_executor
-
+    with patch(
+        "memori.embeddings._api._embed_texts", return_value=mock_result
+    ) as mock_embed:
         result = await embed_texts("test", model="custom-model", async_=True)
 
         assert len(result) == 1
         assert result[0] == pytest.approx([0.1, 0.2, 0.3])
+        assert mock_embed.call_args.args[1] == "custom-model"
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_async_uses_embedding_executor():
+    mock_result = [[0.1, 0.2, 0.3]]
+
+    async def fake_run(fn, *, priority):
+        assert priority == PRIORITY_QUERY
+        return fn()
+
+    with (
+        patch("memori.embeddings._api._embed_texts", return_value=mock_result),
+        patch("memori.embeddings._api.get_embedding_executor") as mock_get,
+    ):
+        mock_get.return_value.run = fake_run
+
+        result = await embed_texts("test", model="custom-model", async_=True)
+
+    assert result == mock_result
 
 
 def test_embed_texts_uses_tei_remote(mocker):
@@ -39,6 +39,7 @@ def test_inject_conversation_history_cache_miss_loads_from_session(
     ]
     mock_storage = mocker.MagicMock()
     mock_storage.driver = mock_driver
+    mock_storage.reader.return_value = mock_driver
     config.storage = mock_storage
 
     mock_user.return_value = "user_msg"
@@ -61,6 +62,7 @@ def test_inject_conversation_history_empty_messages(xai_wrappers, config, mocker
     mock_driver.conversation.messages.read.return_value = []
     mock_storage = mocker.MagicMock()
     mock_storage.driver = mock_driver
+    mock_storage.reader.return_value = mock_driver
     config.storage = mock_storage
 
     kwargs = {"messages": ["msg1"]}
@@ -82,6 +84,7 @@ def test_inject_conversation_history_with_user_messages(xai_wrappers, config, mo
         ]
         mock_storage = mocker.MagicMock()
         mock_storage.driver = mock_driver
+        mock_storage.reader.return_value = mock_driver
         config.storage = mock_storage
 
         mock_user.return_value = "user_msg"
@@ -107,6 +110,7 @@ def test_inject_conversation_history_with_assistant_messages(
         ]
         mock_storage = mocker.MagicMock()
         mock_storage.driver = mock_driver
+        mock_storage.reader.return_value = mock_driver
         config.storage = mock_storage
 
         mock_assistant.return_value = "assistant_msg"
@@ -134,6 +138,7 @@ def test_inject_conversation_history_with_multiple_messages(
         ]
         mock_storage = mocker.MagicMock()
         mock_storage.driver = mock_driver
+        mock_storage.reader.return_value = mock_driver
         config.storage = mock_storage
 
         mock_user.side_effect = ["user_msg1", "user_msg2"]
@@ -161,6 +166,7 @@ def test_inject_conversation_history_ignores_unknown_roles(
         ]
         mock_storage = mocker.MagicMock()
         mock_storage.driver = mock_driver
+        mock_storage.reader.return_value = mock_driver
         config.storage = mock_storage
 
         mock_user.return_value = "user_msg"
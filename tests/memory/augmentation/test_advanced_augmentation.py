@@ -259,7 +259,7 @@ async def test_process_api_response_dict_to_memories(augmentation):
     }
 
     with patch(
-        "memori.memory.augmentation.augmentations.memori._augmentation.embed_texts",
+        "memori.memory.augmentation.augmentations.memori._augmentation.embed_texts_array",
         new_callable=AsyncMock,
     ) as mock_embed:
         mock_embed.return_value = [[0.1, 0.2], [0.3, 0.4]]
@@ -292,7 +292,7 @@ async def test_process_api_response_triples_to_facts(augmentation):
     }
 
     with patch(
-        "memori.memory.augmentation.augmentations.memori._augmentation.embed_texts",
+        "memori.memory.augmentation.augmentations.memori._augmentation.embed_texts_array",
         new_callable=AsyncMock,
     ) as mock_embed:
         mock_embed.return_value = [[0.1, 0.2], [0.3, 0.4]]
@@ -322,7 +322,7 @@ async def test_process_api_response_triples_prefers_content_field(augmentation):
     }
 
     with patch(
-        "memori.memory.augmentation.augmentations.memori._augmentation.embed_texts",
+        "memori.memory.augmentation.augmentations.memori._augmentation.embed_texts_array",
         new_callable=AsyncMock,
     ) as mock_embed:
         mock_embed.return_value = [[0.1, 0.2]]
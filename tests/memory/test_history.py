@@ -0,0 +1,191 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from memori._config import Config
+from memori.memory._history import (
+    HistoryCache,
+    append_history,
+    estimate_tokens,
+    get_history_cache,
+    read_history,
+)
+
+
+class _Messages:
+    def __init__(self, messages):
+        self.messages = messages
+        self.limits = []
+
+    def read(self, conversation_id, limit=None):
+        self.limits.append(limit)
+        if limit is None:
+            return list(self.messages)
+        return self.messages[-limit:]
+
+
+def _config(messages, **history):
+    config = Config()
+    config.storage = Mock()
+    config.storage.driver.conversation.messages = _Messages(messages)
+    config.storage.reader.return_value = config.storage.driver
+    config.storage.adapter.identity = 1
+    for name, value in history.items():
+        setattr(config.history, name, value)
+    return config
+
+
+def _turns(count):
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"m{i}"}
+        for i in range(count)
+    ]
+
+
+def test_unbounded_by_default():
+    config = _config(_turns(5))
+
+    assert read_history(config, 1) == _turns(5)
+    assert config.storage.driver.conversation.messages.limits == [None]
+
+
+def test_max_messages_pushed_down():
+    config = _config(_turns(10), max_messages=4)
+
+    assert read_history(config, 1) == _turns(10)[-4:]
+    assert config.storage.driver.conversation.messages.limits == [4]
+
+
+def test_window_never_opens_on_assistant_turn():
+    config = _config(_turns(10), max_messages=3)
+
+    assert read_history(config, 1) == _turns(10)[-2:]
+
+
+def test_max_tokens_keeps_newest_messages_within_budget():
+    config = _config(_turns(10), max_tokens=20, token_counter=lambda m: 5)
+
+    assert read_history(config, 1) == _turns(10)[-4:]
+
+
+def test_max_tokens_grows_window_until_budget_spent():
+    config = _config(_turns(100), max_tokens=50 * 5, token_counter=lambda m: 5)
+
+    assert read_history(config, 1) == _turns(100)[-50:]
+    assert config.storage.driver.conversation.messages.limits == [32, 64]
+
+
+def test_max_tokens_stops_when_history_exhausted():
+    config = _config(_turns(5), max_tokens=1000)
+
+    assert read_history(config, 1) == _turns(5)
+    assert config.storage.driver.conversation.messages.limits == [32]
+
+
+def test_max_tokens_capped_by_max_messages():
+    config = _config(
+        _turns(100), max_messages=6, max_tokens=1000, token_counter=lambda m: 1
+    )
+
+    assert read_history(config, 1) == _turns(100)[-6:]
+    assert config.storage.driver.conversation.messages.limits == [6]
+
+
+def test_read_ends_replica_read():
+    config = _config(_turns(2))
+
+    read_history(config, 1)
+
+    config.storage.end_read.assert_called_once_with(config.storage.driver)
+
+
+def test_estimate_tokens():
+    assert estimate_tokens({"role": "user", "content": "x" * 40}) == 14
+    assert estimate_tokens({"role": "user", "content": None}) == 4
+
+
+@pytest.fixture
+def cache():
+    get_history_cache().clear()
+    yield get_history_cache()
+    get_history_cache().clear()
+
+
+def test_cache_serves_appended_turns_without_reading(cache):
+    config = _config(_turns(4), cache=True)
+
+    assert read_history(config, 1) == _turns(4)
+    append_history(config, 1, _turns(6)[4:])
+
+    assert read_history(config, 1) == _turns(6)
+    assert config.storage.driver.conversation.messages.limits == [None]
+
+
+def test_cache_disabled_by_default(cache):
+    config = _config(_turns(4))
+
+    read_history(config, 1)
+    read_history(config, 1)
+
+    assert config.storage.driver.conversation.messages.limits == [None, None]
+
+
+def test_cached_tail_used_only_when_window_fits(cache):
+    config = _config(_turns(10), max_messages=4, cache=True)
+    read_history(config, 1)
+    append_history(config, 1, [{"role": "user", "content": "m10"}])
+
+    assert read_history(config, 1) == _turns(11)[-4:][1:]
+    assert config.storage.driver.conversation.messages.limits == [4]
+
+    config.history.max_messages = 8
+    read_history(config, 1)
+    assert config.storage.driver.conversation.messages.limits == [4, 8]
+
+
+def test_cache_expires_after_session_timeout(cache, monkeypatch):
+    config = _config(_turns(2), cache=True)
+    read_history(config, 1)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31 * 60)
+    read_history(config, 1)
+
+    assert config.storage.driver.conversation.messages.limits == [None, None]
+
+
+def test_cache_requires_connection_identity(cache):
+    config = _config(_turns(2), cache=True)
+    config.storage.adapter.identity = None
+
+    read_history(config, 1)
+    read_history(config, 1)
+
+    assert config.storage.driver.conversation.messages.limits == [None, None]
+
+
+def test_history_cache_bounds():
+    cache = HistoryCache(max_size=1, max_messages=2)
+    cache.put(1, "a", _turns(2), True)
+    cache.append(1, "a", _turns(3)[2:])
+
+    assert cache.get(1, "a", 60) == (_turns(3)[1:], False)
+
+    cache.put(1, "b", [], True)
+    assert cache.get(1, "a", 60) is None
+    cache.append(1, "a", _turns(1))
+    assert cache.get(1, "a", 60) is None
+
+    cache.forget(1)
+    assert cache.get(1, "b", 60) is None
+
+
+def test_history_cache_forget_reentrant_while_lock_held():
+    cache = HistoryCache()
+    cache.put(1, "a", _turns(2), True)
+
+    with cache._lock:
+        cache.forget(1)
+
+    assert cache.get(1, "a", 60) is None
@@ -1,6 +1,12 @@
 from memori.memory._writer import Writer
 
 
+def _written_messages(config):
+    create_many = config.storage.driver.conversation.messages.create_many
+    assert create_many.call_count == 1
+    return create_many.call_args[0][1]
+
+
 def test_execute(config, mocker):
     Writer(config).execute(
         {
@@ -17,15 +23,19 @@ def test_execute(config, mocker):
 
     assert config.storage.driver.session.create.called
     assert config.storage.driver.conversation.create.called
-    assert config.storage.driver.conversation.message.create.call_count == 3
+    assert not config.storage.driver.conversation.message.create.called
+
+    create_many = config.storage.driver.conversation.messages.create_many
+    assert create_many.call_args[0][0] == config.cache.conversation_id
 
-    calls = config.storage.driver.conversation.message.create.call_args_list
-    assert calls[0][0][1] == "user"
-    assert calls[0][0][3] == "abc"
-    assert calls[1][0][1] == "assistant"
-    assert calls[1][0][3] == "def"
-    assert calls[2][0][1] == "assistant"
-    assert calls[2][0][3] == "ghi"
+    messages = _written_messages(config)
+    assert len(messages) == 3
+    assert messages[0]["role"] == "user"
+    assert messages[0]["content"] == "abc"
+    assert messages[1]["role"] == "assistant"
+    assert messages[1]["content"] == "def"
+    assert messages[2]["role"] == "assistant"
+    assert messages[2]["content"] == "ghi"
 
 
 def test_execute_with_entity_and_process(config, mocker):
@@ -58,7 +68,7 @@ def test_execute_with_entity_and_process(config, mocker):
     assert session_call_args[1] == config.cache.entity_id
     assert session_call_args[2] == config.cache.process_id
 
-    assert config.storage.driver.conversation.message.create.call_count == 3
+    assert len(_written_messages(config)) == 3
 
 
 def test_execute_includes_system_messages(config, mocker):
@@ -76,15 +86,14 @@ def test_execute_includes_system_messages(config, mocker):
         }
     )
 
-    assert config.storage.driver.conversation.message.create.call_count == 3
-
-    calls = config.storage.driver.conversation.message.create.call_args_list
-    assert calls[0][0][1] == "system"
-    assert calls[0][0][3] == "You are a helpful assistant"
-    assert calls[1][0][1] == "user"
-    assert calls[1][0][3] == "Hello"
-    assert calls[2][0][1] == "assistant"
-    assert calls[2][0][3] == "Hi there!"
+    messages = _written_messages(config)
+    assert len(messages) == 3
+    assert messages[0]["role"] == "system"
+    assert messages[0]["content"] == "You are a helpful assistant"
+    assert messages[1]["role"] == "user"
+    assert messages[1]["content"] == "Hello"
+    assert messages[2]["role"] == "assistant"
+    assert messages[2]["content"] == "Hi there!"
 
 
 def test_execute_writes_response_type(config, mocker):
@@ -97,9 +106,9 @@ def test_execute_writes_response_type(config, mocker):
         }
     )
 
-    calls = config.storage.driver.conversation.message.create.call_args_list
-    assert calls[0][0][2] is None
-    assert calls[1][0][2] == "text"
+    messages = _written_messages(config)
+    assert messages[0]["type"] is None
+    assert messages[1]["type"] == "text"
 
 
 def test_execute_multiple_turns_ingests_all_messages(config, mocker):
@@ -119,13 +128,11 @@ def test_execute_multiple_turns_ingests_all_messages(config, mocker):
     )
 
     assert config.cache.conversation_id == conversation_id
-    assert config.storage.driver.conversation.message.create.call_count == 2
-    calls1 = config.storage.driver.conversation.message.create.call_args_list
-    assert calls1[0][0][3] == "Hello"
-    assert calls1[1][0][3] == "Hi there!"
+    messages1 = _written_messages(config)
+    assert [m["content"] for m in messages1] == ["Hello", "Hi there!"]
 
     # Second turn: same conversation_id, new messages
-    config.storage.driver.conversation.message.create.reset_mock()
+    config.storage.driver.conversation.messages.create_many.reset_mock()
     Writer(config).execute(
         {
             "messages": [
@@ -136,7 +143,40 @@ def test_execute_multiple_turns_ingests_all_messages(config, mocker):
     )
 
     assert config.cache.conversation_id == conversation_id
-    assert config.storage.driver.conversation.message.create.call_count == 2
-    calls2 = config.storage.driver.conversation.message.create.call_args_list
-    assert calls2[0][0][3] == "What's the weather?"
-    assert calls2[1][0][3] == "I don't have access."
+    create_many = config.storage.driver.conversation.messages.create_many
+    assert create_many.call_args[0][0] == conversation_id
+    messages2 = _written_messages(config)
+    assert [m["content"] for m in messages2] == [
+        "What's the weather?",
+        "I don't have access.",
+    ]
+
+
+def test_execute_appends_to_history_cache(config):
+    from memori.memory._history import get_history_cache
+
+    cache = get_history_cache()
+    cache.clear()
+    config.history.cache = True
+    config.cache.conversation_id = 9
+    config.storage.adapter.identity = 1
+    cache.put(1, 9, [{"content": "abc", "role": "user"}], True)
+
+    Writer(config).execute(
+        {
+            "messages": [
+                {"role": "user", "type": None, "text": "def"},
+                {"role": "assistant", "type": "text", "text": "ghi"},
+            ]
+        }
+    )
+
+    assert cache.get(1, 9, 60) == (
+        [
+            {"content": "abc", "role": "user"},
+            {"content": "def", "role": "user"},
+            {"content": "ghi", "role": "assistant"},
+        ],
+        True,
+    )
+    cache.clear()
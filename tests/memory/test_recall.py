@@ -8,8 +8,9 @@ r"""
                       memorilabs.ai
 """
 
+import threading
 from typing import cast
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from sqlalchemy.exc import OperationalError
@@ -153,10 +154,44 @@ def test_search_facts_uses_provided_entity_id():
             assert args[1] == 42
 
 
+def test_query_embedding_runs_on_embedding_executor():
+    config = Config()
+    recall = Recall(config)
+    threads = []
+
+    def _embed(query, model):
+        threads.append(threading.current_thread().name)
+        return [[0.1, 0.2]]
+
+    with patch("memori.memory.recall.embed_texts", side_effect=_embed):
+        assert recall._embed_query("query") == [0.1, 0.2]
+
+    assert threads[0].startswith("memori-embeddings-")
+
+
+def test_search_facts_ends_replica_read_on_error():
+    config = Config()
+    config.storage = Mock()
+    config.storage.read_driver = Mock()
+    config.storage.read_conn_factory = None
+    recall = Recall(config)
+
+    with patch("memori.memory.recall.embed_texts", return_value=[[0.1]]):
+        with patch(
+            "memori.memory.recall.search_facts_api", side_effect=RuntimeError("boom")
+        ):
+            with pytest.raises(RuntimeError):
+                recall.search_facts("query", entity_id=1)
+
+    config.storage.end_read.assert_called_once_with(config.storage.read_driver)
+
+
 def test_search_facts_success():
     config = Config()
     config.storage = Mock()
     config.storage.driver = Mock()
+    config.storage.read_driver = config.storage.driver
+    config.storage.read_conn_factory = None
     config.storage.driver.entity.create.return_value = 1
     config.entity_id = "test-entity"
     recall = Recall(config)
@@ -202,6 +237,7 @@ def test_search_facts_success():
                 5,
                 config.recall_embeddings_limit,
                 query_text="What do I like?",
+                use_segments=False,
             )
 
 
@@ -224,6 +260,44 @@ def test_search_facts_with_custom_limit():
             assert mock_search.call_args[0][4] == config.recall_embeddings_limit
 
 
+def test_search_facts_uses_follower_reads_on_cockroachdb():
+    config = Config()
+    config.storage = MagicMock()
+    config.storage_config.cockroachdb = True
+    config.storage_config.cockroachdb_follower_reads = True
+    config.storage_config.cockroachdb_follower_read_staleness_seconds = 10
+    config.storage_config.embedding_segments = True
+    recall = Recall(config)
+    entity_fact = config.storage.read_driver.entity_fact
+
+    with patch("memori.memory.recall.embed_texts") as mock_embed:
+        mock_embed.return_value = [[0.1, 0.2, 0.3]]
+
+        with patch("memori.memory.recall.search_facts_api") as mock_search:
+            mock_search.return_value = []
+            recall.search_facts("test query", entity_id=1)
+
+    entity_fact.follower_reads.assert_called_once_with(10)
+    entity_fact.follower_reads.return_value.__enter__.assert_called_once()
+    assert mock_search.call_args.kwargs["use_segments"] is False
+
+
+def test_search_facts_follower_reads_ignored_off_cockroachdb():
+    config = Config()
+    config.storage = MagicMock()
+    config.storage_config.cockroachdb_follower_reads = True
+    recall = Recall(config)
+
+    with patch("memori.memory.recall.embed_texts") as mock_embed:
+        mock_embed.return_value = [[0.1, 0.2, 0.3]]
+
+        with patch("memori.memory.recall.search_facts_api") as mock_search:
+            mock_search.return_value = []
+            recall.search_facts("test query", entity_id=1)
+
+    config.storage.driver.entity_fact.follower_reads.assert_not_called()
+
+
 def test_search_facts_retry_on_operational_error():
     config = Config()
     config.storage = Mock()
@@ -65,6 +65,11 @@ class _FakeStorageDriver:
 class _FakeStorage:
     def __init__(self, driver: _FakeStorageDriver):
         self.driver = driver
+        self.read_driver = driver
+        self.read_conn_factory = None
+
+    def end_read(self, driver) -> None:
+        pass
 
 
 def _recall_at_k(*, cases: list[_Case], results_by_query: dict[str, list[int]], k: int):
@@ -0,0 +1,235 @@
+import asyncio
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from memori._config import Config
+from memori.storage._manager import Manager
+from memori.storage._registry import Registry
+from memori.storage.adapters.aio import AsyncConnectionFactory, is_async_connection
+from memori.storage.adapters.aio._asyncpg import Adapter as AsyncpgAdapter
+from memori.storage.adapters.aio._asyncpg import _numbered
+from memori.storage.adapters.aio._dbapi import Adapter as AsyncDBAPIAdapter
+from memori.storage.adapters.dbapi._adapter import Adapter as DBAPIAdapter
+
+
+class FakeAsyncCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    async def execute(self, operation, binds=()):
+        self._cursor.execute(operation, binds)
+
+    async def executemany(self, operation, seq_of_binds):
+        self._cursor.executemany(operation, seq_of_binds)
+
+    async def fetchall(self):
+        return self._cursor.fetchall()
+
+    async def close(self):
+        self._cursor.close()
+
+
+class FakeAsyncConnection:
+    """aiosqlite-shaped connection over sqlite3."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.closed = False
+
+    async def cursor(self):
+        return FakeAsyncCursor(self.conn.cursor())
+
+    async def commit(self):
+        self.conn.commit()
+
+    async def rollback(self):
+        self.conn.rollback()
+
+    async def close(self):
+        self.closed = True
+
+
+FakeAsyncConnection.__module__ = "aiosqlite.core"
+
+
+@pytest.fixture
+def sqlite_conn():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def storage(sqlite_conn):
+    async def connect():
+        return FakeAsyncConnection(sqlite_conn)
+
+    config = Config()
+    config.storage = Manager(config).start(connect)
+    return config.storage.build()
+
+
+def test_async_connections_are_detected(sqlite_conn):
+    async def connect():
+        return FakeAsyncConnection(sqlite_conn)
+
+    assert is_async_connection(FakeAsyncConnection(sqlite_conn)) is True
+    assert is_async_connection(connect) is True
+    assert is_async_connection(sqlite_conn) is False
+    assert is_async_connection(lambda: sqlite_conn) is False
+
+
+def test_registry_routes_async_connection_to_async_adapter(sqlite_conn):
+    registry = Registry()
+
+    adapter = registry.async_adapter(FakeAsyncConnection(sqlite_conn))
+
+    assert isinstance(adapter, AsyncDBAPIAdapter)
+    assert adapter.get_dialect() == "sqlite"
+    assert registry.async_adapter_class(sqlite_conn) is None
+    assert isinstance(registry.adapter(lambda: sqlite_conn), DBAPIAdapter)
+
+
+def test_manager_start_with_async_factory(storage):
+    assert storage.is_async is True
+    assert isinstance(storage.conn_factory, AsyncConnectionFactory)
+    assert storage.adapter is None
+    assert storage.driver is None
+
+
+def test_manager_start_with_sync_factory_returning_async_connection(sqlite_conn):
+    config = Config()
+    storage = Manager(config).start(lambda: FakeAsyncConnection(sqlite_conn))
+
+    assert storage.is_async is True
+
+
+def test_asyncpg_placeholders_are_numbered():
+    assert (
+        _numbered("SELECT %s, '%%' FROM t WHERE a = %s")
+        == "SELECT $1, '%' FROM t WHERE a = $2"
+    )
+
+
+class FakeRecord(dict):
+    # asyncpg.Record iterates over values and exposes keys().
+    def __iter__(self):
+        return iter(self.values())
+
+
+class FakeAsyncpgConnection:
+    def __init__(self, rows=()):
+        self.fetch = AsyncMock(return_value=list(rows))
+        self.execute = AsyncMock(return_value="OK")
+        self.transaction = MagicMock(
+            return_value=MagicMock(start=AsyncMock(), commit=AsyncMock())
+        )
+
+
+FakeAsyncpgConnection.__module__ = "asyncpg.connection"
+
+
+async def test_asyncpg_statements_without_rows_are_not_prepared():
+    conn = FakeAsyncpgConnection()
+    adapter = await AsyncpgAdapter(conn).open()
+    migration = "CREATE TABLE t (id INT); CREATE INDEX t_id ON t (id)"
+
+    await adapter.execute(migration)
+    await adapter.execute("SET statement_timeout = 0")
+    await adapter.execute("UPDATE t SET id = %s WHERE id = %s", (2, 1))
+
+    assert conn.fetch.await_count == 0
+    assert [call.args for call in conn.execute.await_args_list] == [
+        (migration,),
+        ("SET statement_timeout = 0",),
+        ("UPDATE t SET id = $1 WHERE id = $2", 2, 1),
+    ]
+
+
+async def test_asyncpg_statements_returning_rows_are_fetched():
+    conn = FakeAsyncpgConnection(rows=[FakeRecord(id=7)])
+    adapter = await AsyncpgAdapter(conn).open()
+
+    selected = await adapter.execute("SELECT id FROM t WHERE id = %s", (7,))
+    inserted = await adapter.execute(
+        "INSERT INTO t (id) VALUES (%s) RETURNING id", (7,)
+    )
+
+    assert selected.mappings().fetchone() == {"id": 7}
+    assert inserted.mappings().fetchone() == {"id": 7}
+    assert conn.execute.await_count == 0
+    assert conn.fetch.await_args_list[1].args == (
+        "INSERT INTO t (id) VALUES ($1) RETURNING id",
+        7,
+    )
+
+
+async def test_run_builds_schema_and_bridges_driver(storage, sqlite_conn):
+    def create_entity():
+        assert storage.driver is not None
+        return storage.driver.entity.create("user-1")
+
+    entity_id = await storage.run(create_entity)
+
+    assert entity_id is not None
+    assert storage.driver is None
+    assert sqlite_conn.execute(
+        "SELECT id FROM memori_entity WHERE external_id = 'user-1'"
+    ).fetchone() == (entity_id,)
+
+
+async def test_run_keeps_event_loop_free(storage):
+    ticks = []
+
+    async def tick():
+        for _ in range(3):
+            ticks.append(1)
+            await asyncio.sleep(0)
+
+    def read_version():
+        return storage.driver.schema.version.read()
+
+    version, _ = await asyncio.gather(storage.run(read_version), tick())
+
+    assert version is not None
+    assert len(ticks) == 3
+
+
+async def test_run_rolls_back_on_error(storage, sqlite_conn):
+    await storage.run(lambda: None)
+
+    def fail():
+        storage.adapter.execute(
+            "INSERT INTO memori_entity(uuid, external_id) VALUES ('u', 'user-2')"
+        )
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await storage.run(fail)
+
+    assert (
+        sqlite_conn.execute(
+            "SELECT COUNT(*) FROM memori_entity WHERE external_id = 'user-2'"
+        ).fetchone()[0]
+        == 0
+    )
+
+
+async def test_bridge_refuses_use_from_its_own_loop(storage):
+    await storage.run(lambda: None)
+
+    with pytest.raises(RuntimeError):
+        Registry().adapter(storage.conn_factory)
+
+
+async def test_run_calls_sync_storage_inline(sqlite_conn):
+    config = Config()
+    storage = Manager(config).start(lambda: sqlite_conn)
+
+    assert await storage.run(lambda: storage.driver) is storage.driver
@@ -1,5 +1,9 @@
+from types import SimpleNamespace
+
 import pytest
 
+from memori._config import Config
+from memori.storage._builder import Builder
 from memori.storage._registry import Registry
 from memori.storage.adapters.dbapi._adapter import (
     Adapter as DBAPIAdapter,
@@ -204,6 +208,49 @@ def test_execute_closes_cursor_on_exception(mock_psycopg2_conn):
     mock_cursor.close.assert_called_once()
 
 
+def test_execute_many_psycopg2(mock_psycopg2_conn):
+    adapter = DBAPIAdapter(lambda: mock_psycopg2_conn)
+    adapter.execute_many("INSERT INTO t VALUES (%s)", [(1,), (2,)])
+
+    mock_cursor = mock_psycopg2_conn.cursor.return_value
+    mock_cursor.executemany.assert_called_once_with(
+        "INSERT INTO t VALUES (%s)", [(1,), (2,)]
+    )
+
+
+def test_execute_many_closes_cursor_on_exception(mock_psycopg2_conn):
+    adapter = DBAPIAdapter(lambda: mock_psycopg2_conn)
+    mock_cursor = mock_psycopg2_conn.cursor.return_value
+    mock_cursor.executemany.side_effect = Exception("Query error")
+
+    with pytest.raises(Exception, match="Query error"):
+        adapter.execute_many("INSERT INTO t VALUES (%s)", [(1,)])
+
+    mock_cursor.close.assert_called_once()
+
+
+def test_execute_prefetch_sizes_cursor_fetches(mock_psycopg2_conn):
+    adapter = DBAPIAdapter(lambda: mock_psycopg2_conn)
+    mock_cursor = mock_psycopg2_conn.cursor.return_value
+    adapter.execute_prefetch("SELECT id FROM t WHERE ROWNUM <= :1", (500,), 500)
+
+    assert mock_cursor.arraysize == 500
+    assert mock_cursor.prefetchrows == 501
+    mock_cursor.execute.assert_called_once_with(
+        "SELECT id FROM t WHERE ROWNUM <= :1", (500,)
+    )
+
+
+def test_execute_prefetch_without_prefetchrows(mocker, mock_sqlite3_conn):
+    mock_cursor = mocker.Mock(spec=["execute", "close", "description"])
+    mock_sqlite3_conn.cursor.return_value = mock_cursor
+    adapter = DBAPIAdapter(lambda: mock_sqlite3_conn)
+    adapter.execute_prefetch("SELECT id FROM t LIMIT ?", (500,), 500)
+
+    assert not hasattr(mock_cursor, "arraysize")
+    mock_cursor.execute.assert_called_once_with("SELECT id FROM t LIMIT ?", (500,))
+
+
 def test_get_dialect_unknown_raises_error(mocker):
     mock_conn = mocker.MagicMock()
     mock_conn.__module__ = "unknown_driver"
@@ -264,3 +311,142 @@ def test_registry_routes_sqlite3_to_dbapi_adapter(mock_sqlite3_conn):
     registry = Registry()
     adapter = registry.adapter(lambda: mock_sqlite3_conn)
     assert isinstance(adapter, DBAPIAdapter)
+
+
+def test_execute_closes_cursor_without_result_set(mock_sqlite3_conn):
+    mock_cursor = mock_sqlite3_conn.cursor.return_value
+    mock_cursor.description = None
+
+    DBAPIAdapter(lambda: mock_sqlite3_conn).execute("INSERT INTO t VALUES (1)")
+
+    mock_cursor.close.assert_called_once()
+
+
+def test_mapping_result_fetchall_maps_rows_and_closes_cursor(mock_sqlite3_conn):
+    mock_cursor = mock_sqlite3_conn.cursor.return_value
+    mock_cursor.description = (("id", None), ("content", None))
+    mock_cursor.fetchall.return_value = [(1, "a"), (2, "b")]
+
+    result = DBAPIAdapter(lambda: mock_sqlite3_conn).execute("SELECT id, content")
+    mock_cursor.close.assert_not_called()
+
+    assert result.mappings().fetchall() == [
+        {"id": 1, "content": "a"},
+        {"id": 2, "content": "b"},
+    ]
+    mock_cursor.close.assert_called_once()
+
+
+def test_mapping_result_fetchone_closes_cursor_after_first_row(mock_sqlite3_conn):
+    mock_cursor = mock_sqlite3_conn.cursor.return_value
+    mock_cursor.description = (("id", None),)
+    mock_cursor.fetchone.side_effect = [(1,), (2,)]
+
+    mappings = DBAPIAdapter(lambda: mock_sqlite3_conn).execute("SELECT id").mappings()
+
+    assert mappings.fetchone() == {"id": 1}
+    mock_cursor.close.assert_called_once()
+    assert mappings.fetchone() is None
+    assert mock_cursor.fetchone.call_count == 1
+
+
+def test_mapping_result_fetchone_closes_cursor_without_rows(mock_sqlite3_conn):
+    mock_cursor = mock_sqlite3_conn.cursor.return_value
+    mock_cursor.description = (("id", None),)
+    mock_cursor.fetchone.return_value = None
+
+    mappings = DBAPIAdapter(lambda: mock_sqlite3_conn).execute("SELECT id").mappings()
+
+    assert mappings.fetchone() is None
+    mock_cursor.close.assert_called_once()
+
+
+def test_execute_against_sqlite3_connection():
+    import sqlite3
+
+    adapter = DBAPIAdapter(lambda: sqlite3.connect(":memory:"))
+    adapter.execute("CREATE TABLE t (id INTEGER, content TEXT)")
+    adapter.execute("INSERT INTO t VALUES (?, ?)", (1, "a"))
+
+    assert adapter.execute("SELECT id, content FROM t").mappings().fetchall() == [
+        {"id": 1, "content": "a"}
+    ]
+    assert (
+        adapter.execute("SELECT id FROM t WHERE id = ?", (2,)).mappings().fetchone()
+        is None
+    )
+
+
+def test_execute_leaves_psycopg3_prepares_to_the_driver(mocker):
+    mock_conn = mocker.Mock(spec=["cursor", "commit", "rollback", "prepare_threshold"])
+    type(mock_conn).__module__ = "psycopg"
+    mock_conn.prepare_threshold = 5
+
+    DBAPIAdapter(lambda: mock_conn).execute("SELECT %s", (1,))
+
+    mock_conn.cursor.return_value.execute.assert_called_once_with("SELECT %s", (1,))
+
+
+class _Psycopg3Cursor:
+    """Rejects prepared multi-command strings, as the PostgreSQL server does."""
+
+    description = None
+
+    def __init__(self, executed):
+        self.executed = executed
+
+    def execute(self, operation, binds=(), prepare=None):
+        if prepare and ";" in operation.strip().rstrip(";"):
+            raise RuntimeError(
+                "cannot insert multiple commands into a prepared statement"
+            )
+        if "FROM memori_schema_version" in operation and "SELECT" in operation:
+            raise RuntimeError('relation "memori_schema_version" does not exist')
+        self.executed.append((operation, prepare))
+
+    def close(self):
+        pass
+
+
+class _Psycopg3Connection:
+    prepare_threshold = 5
+
+    def __init__(self):
+        self.executed = []
+
+    def cursor(self):
+        return _Psycopg3Cursor(self.executed)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+_Psycopg3Connection.__module__ = "psycopg"
+
+
+def test_builder_creates_postgresql_schema_over_psycopg3():
+    conn = _Psycopg3Connection()
+    adapter = DBAPIAdapter(lambda: conn)
+    config = Config()
+    config.storage = SimpleNamespace(adapter=adapter, driver=Registry().driver(adapter))
+
+    Builder(config).disable_banner().execute()
+
+    statements = [operation for operation, _prepare in conn.executed]
+    assert any(
+        "CREATE TABLE IF NOT EXISTS memori_entity_fact(" in s for s in statements
+    )
+    assert all(prepare is None for _operation, prepare in conn.executed)
+
+
+def test_oracle_statement_cache_is_enlarged(mocker):
+    mock_conn = mocker.Mock(spec=["cursor", "commit", "rollback", "stmtcachesize"])
+    type(mock_conn).__module__ = "oracledb.connection"
+    mock_conn.stmtcachesize = 20
+
+    DBAPIAdapter(lambda: mock_conn)
+
+    assert mock_conn.stmtcachesize == 64
@@ -12,6 +12,17 @@ def test_execute(session):
     assert adapter.execute("select 1 from dual").mappings().fetchone() == {"1": 1}
 
 
+def test_execute_many(mocker):
+    session = mocker.Mock()
+    adapter = SqlAlchemyAdapter(lambda: session)
+
+    adapter.execute_many("insert into t values (?)", ((1,), (2,)))
+
+    session.connection.return_value.exec_driver_sql.assert_called_once_with(
+        "insert into t values (?)", [(1,), (2,)]
+    )
+
+
 def test_flush(session):
     adapter = SqlAlchemyAdapter(lambda: session)
     adapter.flush()
@@ -212,6 +212,24 @@ def test_conversation_create_returns_existing_within_timeout(mock_conn):
     assert mock_conn.execute.call_count == 2  # Check conversation, check last message
 
 
+def test_conversation_create_uses_stored_last_activity(mock_conn):
+    """Test that a stored last_activity avoids the last-message lookup."""
+    from datetime import datetime, timedelta, timezone
+
+    mock_conn.execute.return_value = {
+        "_id": 999,
+        "session_id": 789,
+        "date_created": datetime.now(timezone.utc) - timedelta(minutes=50),
+        "last_activity": datetime.now(timezone.utc) - timedelta(minutes=5),
+    }
+
+    conversation = Conversation(mock_conn)
+    result = conversation.create(session_id=789, timeout_minutes=30)
+
+    assert result == 999
+    assert mock_conn.execute.call_count == 1
+
+
 def test_conversation_create_new_when_expired(mock_conn):
     """Test creating new conversation when existing one is expired."""
     from datetime import datetime, timedelta, timezone
@@ -248,7 +266,7 @@ def test_conversation_message_create(mock_conn):
         conversation_id=101, role="user", type="text", content="Hello, world!"
     )
 
-    assert mock_conn.execute.call_count == 1
+    assert mock_conn.execute.call_count == 2
 
     # Verify insert_one query
     insert_call = mock_conn.execute.call_args_list[0]
@@ -256,6 +274,11 @@ def test_conversation_message_create(mock_conn):
     assert insert_call[0][1] == "insert_one"
     doc = insert_call[0][2]
 
+    # Verify conversation last_activity is touched
+    update_call = mock_conn.execute.call_args_list[1]
+    assert update_call[0][:3] == ("memori_conversation", "update_one", {"_id": 101})
+    assert update_call[0][3] == {"$set": {"last_activity": doc["date_created"]}}
+
     assert doc["conversation_id"] == 101
     assert doc["role"] == "user"
     assert doc["type"] == "text"
@@ -264,6 +287,30 @@ def test_conversation_message_create(mock_conn):
     assert "date_created" in doc
 
 
+def test_conversation_messages_create_many(mock_conn):
+    """Test writing a batch of messages with one insert_many."""
+    ConversationMessages(mock_conn).create_many(
+        101,
+        [
+            {"role": "user", "type": None, "content": "Hello"},
+            {"role": "assistant", "type": "text", "content": "Hi"},
+        ],
+    )
+
+    assert mock_conn.execute.call_count == 2
+
+    insert_call = mock_conn.execute.call_args_list[0]
+    assert insert_call[0][0] == "memori_conversation_message"
+    assert insert_call[0][1] == "insert_many"
+    docs = insert_call[0][2]
+    assert [doc["content"] for doc in docs] == ["Hello", "Hi"]
+    assert all(doc["conversation_id"] == 101 for doc in docs)
+    assert docs[0]["uuid"] != docs[1]["uuid"]
+
+    update_call = mock_conn.execute.call_args_list[1]
+    assert update_call[0][:3] == ("memori_conversation", "update_one", {"_id": 101})
+
+
 def test_conversation_messages_read(mock_conn):
     """Test reading conversation messages."""
     # Mock the find query to return cursor with messages
@@ -288,6 +335,26 @@ def test_conversation_messages_read(mock_conn):
     assert find_call[0][3] == {"role": 1, "content": 1, "_id": 0}
 
 
+def test_conversation_messages_read_with_limit(mock_conn):
+    mock_conn.execute.return_value = iter(
+        [
+            {"role": "assistant", "content": "Hi there!"},
+            {"role": "user", "content": "Hello"},
+        ]
+    )
+
+    messages = ConversationMessages(mock_conn)
+    result = messages.read(conversation_id=101, limit=2)
+
+    assert result == [
+        {"content": "Hello", "role": "user"},
+        {"content": "Hi there!", "role": "assistant"},
+    ]
+    find_call = mock_conn.execute.call_args_list[0]
+    assert find_call[0][2] == {"conversation_id": 101}
+    assert find_call[1] == {"sort": [("_id", -1)], "limit": 2}
+
+
 def test_conversation_messages_read_empty(mock_conn):
     """Test reading messages when none exist."""
     mock_conn.execute.return_value = []
@@ -440,6 +507,12 @@ def test_mongodb_session_with_datetime(mock_conn):
     assert doc["date_updated"] is None
 
 
+def _bulk_requests(call):
+    assert call[0][1] == "bulk_write"
+    assert call[1] == {"ordered": False}
+    return [(op._filter, op._doc, op._upsert) for op in call[0][2]]
+
+
 def test_entity_fact_create_new_fact(mock_conn, mocker):
     """Test creating a new entity fact."""
     from unittest.mock import Mock
@@ -453,11 +526,6 @@ def test_entity_fact_create_new_fact(mock_conn, mocker):
         return_value=mock_binary,
     )
 
-    mock_conn.execute.side_effect = [
-        None,  # find_one: no existing fact
-        Mock(inserted_id=555),  # insert_one
-    ]
-
     entity_fact = EntityFact(mock_conn)
     facts = ["User likes Python"]
     embeddings = [[0.1, 0.2, 0.3]]
@@ -465,70 +533,37 @@ def test_entity_fact_create_new_fact(mock_conn, mocker):
     result = entity_fact.create(entity_id=123, facts=facts, fact_embeddings=embeddings)
 
     assert result == entity_fact
-    assert mock_conn.execute.call_count == 2  # find_one, insert_one
-
-    # Verify find_one query
-    find_call = mock_conn.execute.call_args_list[0]
-    assert find_call[0][0] == "memori_entity_fact"
-    assert find_call[0][1] == "find_one"
-    assert find_call[0][2] == {"entity_id": 123, "uniq": "uniq123"}
+    assert mock_conn.execute.call_count == 1
 
-    # Verify insert_one query
-    insert_call = mock_conn.execute.call_args_list[1]
-    assert insert_call[0][0] == "memori_entity_fact"
-    assert insert_call[0][1] == "insert_one"
-    doc = insert_call[0][2]
-    assert doc["entity_id"] == 123
+    bulk_call = mock_conn.execute.call_args_list[0]
+    assert bulk_call[0][0] == "memori_entity_fact"
+    [(query, update, upsert)] = _bulk_requests(bulk_call)
+    assert query == {"entity_id": 123, "uniq": "uniq123"}
+    assert upsert is True
+    assert update["$inc"] == {"num_times": 1}
+    assert isinstance(update["$set"]["date_last_time"], datetime)
+    doc = update["$setOnInsert"]
     assert doc["content"] == "User likes Python"
-    # content_embedding is now a Mock object representing bson.Binary
-    assert doc["content_embedding"] is not None
-    assert doc["num_times"] == 1
-    assert doc["uniq"] == "uniq123"
+    assert doc["content_embedding"] is mock_binary
     assert "uuid" in doc
-    assert "date_created" in doc
     assert isinstance(doc["date_created"], datetime)
+    assert doc["date_updated"] is None
 
 
-def test_entity_fact_create_existing_fact(mock_conn, mocker):
-    """Test updating an existing entity fact."""
-    from unittest.mock import Mock
-
+def test_entity_fact_create_duplicate_facts_in_batch(mock_conn, mocker):
+    """Duplicates in one batch become a single upsert counting them all."""
     mocker.patch("memori._utils.generate_uniq", return_value="uniq123")
-    mock_binary = Mock()
-    mocker.patch(
-        "memori.embeddings.format_embedding_for_db",
-        return_value=mock_binary,
-    )
-
-    # Mock existing fact
-    existing = {"_id": 999, "num_times": 5}
-    mock_conn.execute.return_value = existing
+    mocker.patch("memori.embeddings.format_embedding_for_db", return_value=Mock())
 
     entity_fact = EntityFact(mock_conn)
-    facts = ["User likes Python"]
-    embeddings = [[0.1, 0.2, 0.3]]
-
-    result = entity_fact.create(entity_id=123, facts=facts, fact_embeddings=embeddings)
-
-    assert result == entity_fact
-    assert mock_conn.execute.call_count == 2  # find_one, update_one
-
-    # Verify find_one query
-    find_call = mock_conn.execute.call_args_list[0]
-    assert find_call[0][0] == "memori_entity_fact"
-    assert find_call[0][1] == "find_one"
+    entity_fact.create(
+        entity_id=123,
+        facts=["User likes Python", "User likes Python"],
+        fact_embeddings=[[0.1], [0.1]],
+    )
 
-    # Verify update_one query
-    update_call = mock_conn.execute.call_args_list[1]
-    assert update_call[0][0] == "memori_entity_fact"
-    assert update_call[0][1] == "update_one"
-    assert update_call[0][2] == {"_id": 999}
-    update_doc = update_call[0][3]
-    assert "$inc" in update_doc
-    assert update_doc["$inc"]["num_times"] == 1
-    assert "$set" in update_doc
-    assert "date_last_time" in update_doc["$set"]
-    assert isinstance(update_doc["$set"]["date_last_time"], datetime)
+    [(_, update, _)] = _bulk_requests(mock_conn.execute.call_args_list[0])
+    assert update["$inc"] == {"num_times": 2}
 
 
 def test_entity_fact_create_empty_facts(mock_conn):
@@ -555,21 +590,17 @@ def test_entity_fact_create_multiple_facts(mock_conn, mocker):
         side_effect=[mock_binary1, mock_binary2],
     )
 
-    mock_conn.execute.side_effect = [
-        None,
-        Mock(inserted_id=1),
-        None,
-        Mock(inserted_id=2),
-    ]
-
     entity_fact = EntityFact(mock_conn)
     facts = ["Fact 1", "Fact 2"]
     embeddings = [[0.1, 0.2], [0.3, 0.4]]
 
     entity_fact.create(entity_id=123, facts=facts, fact_embeddings=embeddings)
 
-    # Should be 4 calls: find_one, insert_one for each fact
-    assert mock_conn.execute.call_count == 4
+    # One unordered bulk_write for the whole batch
+    assert mock_conn.execute.call_count == 1
+    requests = _bulk_requests(mock_conn.execute.call_args_list[0])
+    assert [query["uniq"] for query, _, _ in requests] == ["uniq1", "uniq2"]
+    assert requests[1][1]["$setOnInsert"]["content_embedding"] is mock_binary2
 
 
 def test_entity_fact_create_without_embeddings(mock_conn, mocker):
@@ -578,29 +609,24 @@ def test_entity_fact_create_without_embeddings(mock_conn, mocker):
 
     mocker.patch("memori._utils.generate_uniq", return_value="uniq123")
     mock_binary = Mock()
-    mocker.patch(
+    format_embedding = mocker.patch(
         "memori.embeddings.format_embedding_for_db",
         return_value=mock_binary,
     )
 
-    mock_conn.execute.side_effect = [None, Mock(inserted_id=777)]
-
     entity_fact = EntityFact(mock_conn)
     facts = ["User likes Python"]
 
     entity_fact.create(entity_id=123, facts=facts, fact_embeddings=None)
 
-    # Verify embedding was formatted (as Mock object representing bson.Binary)
-    insert_call = mock_conn.execute.call_args_list[1]
-    doc = insert_call[0][2]
-    assert doc["content_embedding"] is not None
+    format_embedding.assert_called_once_with([], "mongodb")
+    [(_, update, _)] = _bulk_requests(mock_conn.execute.call_args_list[0])
+    assert update["$setOnInsert"]["content_embedding"] is mock_binary
 
 
 def test_entity_fact_get_embeddings(mock_conn):
     """Test retrieving embeddings for an entity."""
-    mock_cursor = mock_conn.execute.return_value
-    mock_cursor.sort.return_value = mock_cursor
-    mock_cursor.limit.return_value = [
+    mock_conn.execute.return_value = [
         {"_id": 1, "content_embedding": b"\x00\x01\x02\x03"},
         {"_id": 2, "content_embedding": b"\x04\x05\x06\x07"},
     ]
@@ -614,46 +640,27 @@ def test_entity_fact_get_embeddings(mock_conn):
     assert result[1]["id"] == 2
     assert result[1]["content_embedding"] == b"\x04\x05\x06\x07"
 
-    # Verify find query
-    find_call = mock_conn.execute.call_args_list[0]
-    assert find_call[0][0] == "memori_entity_fact"
-    assert find_call[0][1] == "find"
-    assert find_call[0][2] == {"entity_id": 123}
-    assert find_call[0][3] == {"_id": 1, "content_embedding": 1}
-    mock_cursor.sort.assert_called_once_with(
-        [("date_last_time", -1), ("num_times", -1), ("_id", -1)]
-    )
-    mock_cursor.limit.assert_called_once_with(100)
-
-
-def test_entity_fact_get_embeddings_with_limit(mock_conn):
-    """Test retrieving embeddings respects the limit."""
-    # Return more results than the limit
-    mock_cursor = mock_conn.execute.return_value
-    mock_cursor.sort.return_value = mock_cursor
-    mock_cursor.limit.return_value = [
-        {"_id": i, "content_embedding": bytes([i])} for i in range(1, 6)
+    # Sort, limit and projection run on the server
+    aggregate_call = mock_conn.execute.call_args_list[0]
+    assert aggregate_call[0][0] == "memori_entity_fact"
+    assert aggregate_call[0][1] == "aggregate"
+    assert aggregate_call[0][2] == [
+        {"$match": {"entity_id": 123}},
+        {"$sort": {"date_last_time": -1, "num_times": -1, "_id": -1}},
+        {"$limit": 100},
+        {"$project": {"_id": 1, "content_embedding": 1}},
     ]
 
-    entity_fact = EntityFact(mock_conn)
-    result = entity_fact.get_embeddings(entity_id=123, limit=5)
-
-    # Should only return first 5 results
-    assert len(result) == 5
-    assert result[0]["id"] == 1
-    assert result[4]["id"] == 5
-
 
 def test_entity_fact_get_embeddings_default_limit(mock_conn):
     """Test retrieving embeddings with default limit."""
     mock_conn.execute.return_value = []
 
     entity_fact = EntityFact(mock_conn)
-    entity_fact.get_embeddings(entity_id=123)
+    assert entity_fact.get_embeddings(entity_id=123) == []
 
-    # Verify default limit is used in slicing (1000)
-    find_call = mock_conn.execute.call_args_list[0]
-    assert find_call[0][0] == "memori_entity_fact"
+    pipeline = mock_conn.execute.call_args_list[0][0][2]
+    assert {"$limit": 1000} in pipeline
 
 
 def test_entity_fact_get_facts_by_ids(mock_conn):
@@ -716,9 +723,9 @@ def test_entity_fact_create_with_conversation_mention(mock_conn, mocker):
         return_value=Mock(),
     )
     mock_conn.execute.side_effect = [
-        None,  # find_one fact
-        Mock(inserted_id=42),  # insert_one fact
-        None,  # update_one mention upsert
+        None,  # bulk_write facts
+        [{"_id": 42, "uniq": "uniq123"}],  # find fact ids
+        None,  # bulk_write mentions
     ]
 
     entity_fact = EntityFact(mock_conn)
@@ -729,15 +736,19 @@ def test_entity_fact_create_with_conversation_mention(mock_conn, mocker):
         conversation_id=456,
     )
 
+    find_call = mock_conn.execute.call_args_list[1]
+    assert find_call[0][1] == "find"
+    assert find_call[0][2] == {"entity_id": 123, "uniq": {"$in": ["uniq123"]}}
+
     mention_call = mock_conn.execute.call_args_list[2]
     assert mention_call[0][0] == "memori_entity_fact_mention"
-    assert mention_call[0][1] == "update_one"
-    assert mention_call[0][2] == {
+    [(query, _, upsert)] = _bulk_requests(mention_call)
+    assert query == {
         "entity_id": 123,
         "fact_id": 42,
         "conversation_id": 456,
     }
-    assert mention_call[1]["upsert"] is True
+    assert upsert is True
 
 
 def test_entity_fact_get_facts_by_ids_empty(mock_conn):
@@ -769,12 +780,15 @@ def test_entity_fact_delete_by_entity_cleans_mentions(mock_conn):
 
 def test_knowledge_graph_delete_by_entity_cleans_orphan_dimensions(mock_conn):
     mock_conn.execute.side_effect = [
+        [
+            {"subject_id": 1, "predicate_id": 3, "object_id": 5},
+            {"subject_id": 2, "predicate_id": 3, "object_id": 6},
+        ],  # the entity's edges
         None,  # delete knowledge graph by entity
-        [1, 2],  # distinct subject ids
-        [3, 4],  # distinct predicate ids
-        [5, 6],  # distinct object ids
+        [2],  # subjects still referenced
         None,  # delete orphan subjects
-        None,  # delete orphan predicates
+        [3],  # predicates still referenced
+        [],  # objects still referenced
         None,  # delete orphan objects
     ]
 
@@ -782,53 +796,118 @@ def test_knowledge_graph_delete_by_entity_cleans_orphan_dimensions(mock_conn):
     result = knowledge_graph.delete_by_entity(123)
 
     assert result == knowledge_graph
-    assert mock_conn.execute.call_count == 7
+    calls = [call[0] for call in mock_conn.execute.call_args_list]
+    assert calls == [
+        (
+            "memori_knowledge_graph",
+            "find",
+            {"entity_id": 123},
+            {"_id": 0, "subject_id": 1, "predicate_id": 1, "object_id": 1},
+        ),
+        ("memori_knowledge_graph", "delete_many", {"entity_id": 123}),
+        (
+            "memori_knowledge_graph",
+            "distinct",
+            "subject_id",
+            {"subject_id": {"$in": [1, 2]}},
+        ),
+        ("memori_subject", "delete_many", {"_id": {"$in": [1]}}),
+        (
+            "memori_knowledge_graph",
+            "distinct",
+            "predicate_id",
+            {"predicate_id": {"$in": [3]}},
+        ),
+        (
+            "memori_knowledge_graph",
+            "distinct",
+            "object_id",
+            {"object_id": {"$in": [5, 6]}},
+        ),
+        ("memori_object", "delete_many", {"_id": {"$in": [5, 6]}}),
+    ]
 
-    kg_delete_call = mock_conn.execute.call_args_list[0]
-    assert kg_delete_call[0] == (
-        "memori_knowledge_graph",
-        "delete_many",
-        {"entity_id": 123},
-    )
 
-    subject_distinct_call = mock_conn.execute.call_args_list[1]
-    assert subject_distinct_call[0] == (
-        "memori_knowledge_graph",
-        "distinct",
-        "subject_id",
-    )
+def test_knowledge_graph_create_uses_bulk_upserts(mock_conn):
+    from memori._utils import generate_uniq
+    from memori.memory._struct import SemanticTriple
 
-    predicate_distinct_call = mock_conn.execute.call_args_list[2]
-    assert predicate_distinct_call[0] == (
-        "memori_knowledge_graph",
-        "distinct",
-        "predicate_id",
-    )
+    triple = SemanticTriple()
+    triple.subject_name, triple.subject_type = "alice", "person"
+    triple.predicate = "likes"
+    triple.object_name, triple.object_type = "tea", "thing"
 
-    object_distinct_call = mock_conn.execute.call_args_list[3]
-    assert object_distinct_call[0] == (
-        "memori_knowledge_graph",
-        "distinct",
-        "object_id",
-    )
+    mock_conn.execute.side_effect = [
+        None,
+        [{"_id": 1, "uniq": generate_uniq(["alice", "person"])}],
+        None,
+        [{"_id": 2, "uniq": generate_uniq(["likes"])}],
+        None,
+        [{"_id": 3, "uniq": generate_uniq(["tea", "thing"])}],
+        None,
+    ]
 
-    subject_cleanup_call = mock_conn.execute.call_args_list[4]
-    assert subject_cleanup_call[0] == (
-        "memori_subject",
-        "delete_many",
-        {"_id": {"$nin": [1, 2]}},
-    )
+    Driver(mock_conn).knowledge_graph.create(123, [triple, triple])
 
-    predicate_cleanup_call = mock_conn.execute.call_args_list[5]
-    assert predicate_cleanup_call[0] == (
+    calls = mock_conn.execute.call_args_list
+    assert [call[0][0] for call in calls] == [
+        "memori_subject",
+        "memori_subject",
         "memori_predicate",
-        "delete_many",
-        {"_id": {"$nin": [3, 4]}},
+        "memori_predicate",
+        "memori_object",
+        "memori_object",
+        "memori_knowledge_graph",
+    ]
+    [(query, update, upsert)] = _bulk_requests(calls[0])
+    assert query == {"uniq": generate_uniq(["alice", "person"])}
+    assert update["$setOnInsert"]["name"] == "alice"
+    assert upsert is True
+    assert calls[1][0][1:3] == (
+        "find",
+        {"uniq": {"$in": [generate_uniq(["alice", "person"])]}},
     )
 
-    object_cleanup_call = mock_conn.execute.call_args_list[6]
-    assert object_cleanup_call[0] == (
-        "memori_object",
-        "delete_many",
-        {"_id": {"$nin": [5, 6]}},
+    [(query, update, _)] = _bulk_requests(calls[6])
+    assert query == {
+        "entity_id": 123,
+        "subject_id": 1,
+        "predicate_id": 2,
+        "object_id": 3,
+    }
+    assert update["$inc"] == {"num_times": 2}
+
+
+def test_process_attribute_create_uses_bulk_upserts(mock_conn):
+    from memori._utils import generate_uniq
+
+    Driver(mock_conn).process_attribute.create(7, ["a", "b", "a"])
+
+    assert mock_conn.execute.call_count == 1
+    call = mock_conn.execute.call_args_list[0]
+    assert call[0][0] == "memori_process_attribute"
+    requests = _bulk_requests(call)
+    assert [(query, update["$inc"]) for query, update, _ in requests] == [
+        ({"process_id": 7, "uniq": generate_uniq(["a"])}, {"num_times": 2}),
+        ({"process_id": 7, "uniq": generate_uniq(["b"])}, {"num_times": 1}),
+    ]
+    assert requests[0][1]["$setOnInsert"]["content"] == "a"
+
+
+def test_entity_fact_export_pages_by_id(mock_conn):
+    mock_conn.execute.return_value = [
+        {"_id": 5, "content": "fact", "content_embedding": b"", "num_times": 2}
+    ]
+
+    rows = EntityFact(mock_conn).export(123, after_id=4, limit=2)
+
+    assert rows == [
+        {"id": 5, "content": "fact", "content_embedding": b"", "num_times": 2}
+    ]
+    call = mock_conn.execute.call_args
+    assert call[0][:3] == (
+        "memori_entity_fact",
+        "find",
+        {"entity_id": 123, "_id": {"$gt": 4}},
     )
+    assert call[1] == {"sort": [("_id", 1)], "limit": 2}
@@ -7,6 +7,7 @@ from memori.storage.drivers.mysql._driver import (
     ConversationMessages,
     Driver,
     Entity,
+    EntityFact,
     Process,
     Schema,
     SchemaVersion,
@@ -27,22 +28,26 @@ def test_driver_initialization(mock_conn):
 
 def test_entity_create(mock_conn, mock_single_result):
     """Test creating a entity record."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     entity = Entity(mock_conn)
     result = entity.create("external-entity-id")
 
     assert result == 123
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
     # Verify INSERT query
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     assert "INSERT IGNORE INTO memori_entity" in insert_call[0][0]
     assert insert_call[0][1][1] == "external-entity-id"
 
     # Verify SELECT query
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "SELECT id" in select_call[0][0]
     assert "FROM memori_entity" in select_call[0][0]
     assert select_call[0][1] == ("external-entity-id",)
@@ -50,13 +55,17 @@ def test_entity_create(mock_conn, mock_single_result):
 
 def test_entity_generates_uuid(mock_conn, mock_single_result):
     """Test that create generates a valid UUID."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     entity = Entity(mock_conn)
     entity.create("external-entity-id")
 
     # Check that a UUID was generated in the INSERT
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     uuid_arg = insert_call[0][1][0]
 
     # Verify it's a valid UUID object
@@ -65,22 +74,26 @@ def test_entity_generates_uuid(mock_conn, mock_single_result):
 
 def test_process_create(mock_conn, mock_single_result):
     """Test creating a process record."""
-    mock_conn.execute.return_value = mock_single_result({"id": 456})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 456}),
+    ]
 
     process = Process(mock_conn)
     result = process.create("external-process-id")
 
     assert result == 456
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
     # Verify INSERT query
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     assert "INSERT IGNORE INTO memori_process" in insert_call[0][0]
     assert insert_call[0][1][1] == "external-process-id"
 
     # Verify SELECT query
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "SELECT id" in select_call[0][0]
     assert "FROM memori_process" in select_call[0][0]
     assert select_call[0][1] == ("external-process-id",)
@@ -138,10 +151,8 @@ def test_conversation_create(mock_conn, mock_single_result):
 
     # Verify check for existing conversation
     check_call = mock_conn.execute.call_args_list[0]
-    assert (
-        "COALESCE(MAX(m.date_created), c.date_created) as last_activity"
-        in check_call[0][0]
-    )
+    assert "COALESCE(last_activity, date_created)" in check_call[0][0]
+    assert "memori_conversation_message" not in check_call[0][0]
     assert check_call[0][1] == (789,)
 
     # Verify INSERT query
@@ -162,62 +173,41 @@ def test_conversation_create(mock_conn, mock_single_result):
 
 def test_conversation_create_returns_existing_within_timeout(mock_conn):
     """Test returning existing conversation when within timeout period."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=15)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 15.0,
     }
-
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [15.0]  # 15 minutes elapsed
-
-    mock_conn.execute.side_effect = [
-        mock_existing,  # Existing conversation found
-        mock_timeout_check,  # Time check: 15 min < 30 min timeout
-    ]
+    mock_conn.execute.return_value = mock_existing
 
     conversation = Conversation(mock_conn)
     result = conversation.create(session_id=789, timeout_minutes=30)
 
-    assert result == 101  # Returns existing conversation id
-    assert mock_conn.execute.call_count == 2  # Check existing, check timeout
-    assert mock_conn.commit.call_count == 0  # No insert, no commit
+    assert result == 101
+    assert mock_conn.execute.call_count == 1  # Single lookup, no aggregate
+    assert mock_conn.commit.call_count == 0
 
 
 def test_conversation_create_new_when_expired(mock_conn, mock_single_result):
     """Test creating new conversation when existing one is expired."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=45)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 45.0,
     }
 
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [45.0]  # 45 minutes elapsed
-
     mock_conn.execute.side_effect = [
-        mock_existing,  # Existing conversation found
-        mock_timeout_check,  # Time check: 45 min > 30 min timeout
-        None,  # INSERT (no return value needed)
-        mock_single_result({"id": 202}),  # SELECT returns new conversation id
+        mock_existing,  # Existing conversation found, 45 min > 30 min timeout
+        None,  # Insert (no return value needed)
+        mock_single_result({"id": 202}),  # SELECT returns conversation id
     ]
 
     conversation = Conversation(mock_conn)
     result = conversation.create(session_id=789, timeout_minutes=30)
 
-    assert result == 202  # Returns new conversation id
-    assert (
-        mock_conn.execute.call_count == 4
-    )  # Check existing, check timeout, INSERT, SELECT
-    assert mock_conn.commit.call_count == 1  # Committed new conversation
+    assert result == 202
+    assert mock_conn.execute.call_count == 3
+    assert mock_conn.commit.call_count == 1
 
 
 def test_conversation_message_create(mock_conn):
@@ -227,7 +217,7 @@ def test_conversation_message_create(mock_conn):
         conversation_id=101, role="user", type="text", content="Hello, world!"
     )
 
-    assert mock_conn.execute.call_count == 1
+    assert mock_conn.execute.call_count == 2
 
     # Verify INSERT query
     insert_call = mock_conn.execute.call_args_list[0]
@@ -241,6 +231,25 @@ def test_conversation_message_create(mock_conn):
     assert type_ == "text"
     assert content == "Hello, world!"
 
+    # Verify conversation last_activity is touched
+    update_call = mock_conn.execute.call_args_list[1]
+    assert "UPDATE memori_conversation" in update_call[0][0]
+    assert "last_activity" in update_call[0][0]
+    assert "date_updated = date_updated" in update_call[0][0]
+    assert update_call[0][1] == (101,)
+
+
+def test_conversation_messages_create_many_keeps_date_updated(mock_conn):
+    """Test batched messages touch last_activity but not date_updated."""
+    ConversationMessages(mock_conn).create_many(
+        101, [{"role": "user", "type": None, "content": "hi"}]
+    )
+
+    update_call = mock_conn.execute.call_args_list[-1]
+    assert "SET last_activity = CURRENT_TIMESTAMP" in update_call[0][0]
+    assert "date_updated = date_updated" in update_call[0][0]
+    assert update_call[0][1] == (101,)
+
 
 def test_conversation_messages_read(mock_conn, mock_multiple_results):
     """Test reading conversation messages."""
@@ -265,6 +274,27 @@ def test_conversation_messages_read(mock_conn, mock_multiple_results):
     assert select_call[0][1] == (101,)
 
 
+def test_conversation_messages_read_with_limit(mock_conn, mock_multiple_results):
+    mock_conn.execute.return_value = mock_multiple_results(
+        [
+            {"role": "assistant", "content": "Hi there!"},
+            {"role": "user", "content": "Hello"},
+        ]
+    )
+
+    messages = ConversationMessages(mock_conn)
+    result = messages.read(conversation_id=101, limit=2)
+
+    assert result == [
+        {"content": "Hello", "role": "user"},
+        {"content": "Hi there!", "role": "assistant"},
+    ]
+    select_call = mock_conn.execute.call_args_list[0]
+    assert "order by id desc" in select_call[0][0].lower()
+    assert "limit %s" in select_call[0][0].lower()
+    assert select_call[0][1] == (101, 2)
+
+
 def test_conversation_messages_read_empty(mock_conn, mock_empty_result):
     """Test reading messages when none exist."""
     mock_conn.execute.return_value = mock_empty_result
@@ -321,3 +351,35 @@ def test_schema_initialization(mock_conn):
 
     assert isinstance(schema.version, SchemaVersion)
     assert schema.conn == mock_conn
+
+
+def test_entity_fact_create_with_conversation_mention(mock_conn, mock_multiple_results):
+    """Test facts and mentions are written with multi-row statements."""
+    mock_conn.execute.side_effect = [
+        None,
+        mock_multiple_results([{"id": 7}, {"id": 8}]),
+        None,
+    ]
+
+    entity_fact = EntityFact(mock_conn)
+    entity_fact.create(
+        entity_id=123,
+        facts=["fact-1", "fact-2"],
+        fact_embeddings=[[0.1], [0.2]],
+        conversation_id=456,
+    )
+
+    assert mock_conn.execute.call_count == 3
+    assert mock_conn.commit.call_count == 1
+
+    upsert_call = mock_conn.execute.call_args_list[0]
+    assert "ON DUPLICATE KEY UPDATE" in upsert_call[0][0]
+    assert "VALUES(num_times)" in upsert_call[0][0]
+    assert len(upsert_call[0][1]) == 12
+
+    select_call = mock_conn.execute.call_args_list[1]
+    assert "uniq IN (%s,%s)" in select_call[0][0]
+
+    mention_call = mock_conn.execute.call_args_list[2]
+    assert "INSERT IGNORE INTO memori_entity_fact_mention" in mention_call[0][0]
+    assert len(mention_call[0][1]) == 8
@@ -64,20 +64,24 @@ def test_entity_fact_create_uses_formatted_embedding(mock_conn):
 
 def test_entity_create(mock_conn, mock_single_result):
     """Test creating an entity record via OceanBase driver."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     driver = Driver(mock_conn)
     result = driver.entity.create("external-entity-id")
 
     assert result == 123
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     assert "INSERT IGNORE INTO memori_entity" in insert_call[0][0]
     assert insert_call[0][1][1] == "external-entity-id"
 
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "SELECT id" in select_call[0][0]
     assert "FROM memori_entity" in select_call[0][0]
     assert select_call[0][1] == ("external-entity-id",)
@@ -85,32 +89,40 @@ def test_entity_create(mock_conn, mock_single_result):
 
 def test_entity_generates_uuid(mock_conn, mock_single_result):
     """Test that entity create generates a valid UUID."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     driver = Driver(mock_conn)
     driver.entity.create("external-entity-id")
 
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     uuid_arg = insert_call[0][1][0]
     assert isinstance(uuid_arg, UUID)
 
 
 def test_process_create(mock_conn, mock_single_result):
     """Test creating a process record."""
-    mock_conn.execute.return_value = mock_single_result({"id": 456})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 456}),
+    ]
 
     driver = Driver(mock_conn)
     result = driver.process.create("external-process-id")
 
     assert result == 456
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     assert "INSERT IGNORE INTO memori_process" in insert_call[0][0]
     assert insert_call[0][1][1] == "external-process-id"
 
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "SELECT id" in select_call[0][0]
     assert "FROM memori_process" in select_call[0][0]
     assert select_call[0][1] == ("external-process-id",)
@@ -166,10 +178,8 @@ def test_conversation_create(mock_conn, mock_single_result):
     assert mock_conn.commit.call_count == 1
 
     check_call = mock_conn.execute.call_args_list[0]
-    assert (
-        "COALESCE(MAX(m.date_created), c.date_created) as last_activity"
-        in check_call[0][0]
-    )
+    assert "COALESCE(last_activity, date_created)" in check_call[0][0]
+    assert "memori_conversation_message" not in check_call[0][0]
     assert check_call[0][1] == (789,)
 
     insert_call = mock_conn.execute.call_args_list[1]
@@ -183,59 +193,40 @@ def test_conversation_create(mock_conn, mock_single_result):
 
 def test_conversation_create_returns_existing_within_timeout(mock_conn):
     """Test returning existing conversation when within timeout period."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=15)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 15.0,
     }
-
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [15.0]
-
-    mock_conn.execute.side_effect = [
-        mock_existing,
-        mock_timeout_check,
-    ]
+    mock_conn.execute.return_value = mock_existing
 
     driver = Driver(mock_conn)
     result = driver.conversation.create(session_id=789, timeout_minutes=30)
 
     assert result == 101
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 1  # Single lookup, no aggregate
     assert mock_conn.commit.call_count == 0
 
 
 def test_conversation_create_new_when_expired(mock_conn, mock_single_result):
     """Test creating new conversation when existing one is expired."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=45)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 45.0,
     }
 
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [45.0]
-
     mock_conn.execute.side_effect = [
-        mock_existing,
-        mock_timeout_check,
-        None,
-        mock_single_result({"id": 202}),
+        mock_existing,  # Existing conversation found, 45 min > 30 min timeout
+        None,  # Insert (no return value needed)
+        mock_single_result({"id": 202}),  # SELECT returns conversation id
     ]
 
     driver = Driver(mock_conn)
     result = driver.conversation.create(session_id=789, timeout_minutes=30)
 
     assert result == 202
-    assert mock_conn.execute.call_count == 4
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
 
@@ -246,7 +237,7 @@ def test_conversation_message_create(mock_conn):
         conversation_id=101, role="user", type="text", content="Hello, world!"
     )
 
-    assert mock_conn.execute.call_count == 1
+    assert mock_conn.execute.call_count == 2
 
     insert_call = mock_conn.execute.call_args_list[0]
     assert "INSERT INTO memori_conversation_message" in insert_call[0][0]
@@ -258,6 +249,12 @@ def test_conversation_message_create(mock_conn):
     assert type_ == "text"
     assert content == "Hello, world!"
 
+    # Verify conversation last_activity is touched
+    update_call = mock_conn.execute.call_args_list[1]
+    assert "UPDATE memori_conversation" in update_call[0][0]
+    assert "last_activity" in update_call[0][0]
+    assert update_call[0][1] == (101,)
+
 
 def test_conversation_messages_read(mock_conn, mock_multiple_results):
     """Test reading conversation messages."""
@@ -7,10 +7,14 @@ from memori.storage.drivers.oracle._driver import (
     ConversationMessages,
     Driver,
     Entity,
+    EntityFact,
+    KnowledgeGraph,
     Process,
+    ProcessAttribute,
     Schema,
     SchemaVersion,
     Session,
+    _ArrayBoundWriter,
 )
 
 
@@ -27,24 +31,28 @@ def test_driver_initialization(mock_conn):
 
 def test_entity_create(mock_conn, mock_single_result):
     """Test creating a entity record."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     entity = Entity(mock_conn)
     result = entity.create("external-entity-id")
 
     assert result == 123
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
     # Verify MERGE query (Oracle uses MERGE instead of INSERT...ON CONFLICT)
-    merge_call = mock_conn.execute.call_args_list[0]
+    merge_call = mock_conn.execute.call_args_list[1]
     assert "MERGE INTO memori_entity" in merge_call[0][0]
     assert "USING (SELECT :1" in merge_call[0][0]
     assert "FROM DUAL)" in merge_call[0][0]
     assert merge_call[0][1][1] == "external-entity-id"
 
     # Verify SELECT query
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "SELECT id" in select_call[0][0]
     assert "FROM memori_entity" in select_call[0][0]
     assert select_call[0][1] == ("external-entity-id",)
@@ -52,13 +60,17 @@ def test_entity_create(mock_conn, mock_single_result):
 
 def test_entity_generates_uuid(mock_conn, mock_single_result):
     """Test that create generates a valid UUID."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     entity = Entity(mock_conn)
     entity.create("external-entity-id")
 
     # Check that a UUID was generated in the MERGE
-    merge_call = mock_conn.execute.call_args_list[0]
+    merge_call = mock_conn.execute.call_args_list[1]
     uuid_arg = merge_call[0][1][0]
 
     # Verify it's a valid UUID string
@@ -67,24 +79,28 @@ def test_entity_generates_uuid(mock_conn, mock_single_result):
 
 def test_process_create(mock_conn, mock_single_result):
     """Test creating a process record."""
-    mock_conn.execute.return_value = mock_single_result({"id": 456})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 456}),
+    ]
 
     process = Process(mock_conn)
     result = process.create("external-process-id")
 
     assert result == 456
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
     # Verify MERGE query
-    merge_call = mock_conn.execute.call_args_list[0]
+    merge_call = mock_conn.execute.call_args_list[1]
     assert "MERGE INTO memori_process" in merge_call[0][0]
     assert "USING (SELECT :1" in merge_call[0][0]
     assert "FROM DUAL)" in merge_call[0][0]
     assert merge_call[0][1][1] == "external-process-id"
 
     # Verify SELECT query
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "SELECT id" in select_call[0][0]
     assert "FROM memori_process" in select_call[0][0]
     assert select_call[0][1] == ("external-process-id",)
@@ -145,8 +161,8 @@ def test_conversation_create(mock_conn, mock_single_result):
 
     # Verify check for existing conversation
     existing_call = mock_conn.execute.call_args_list[0]
-    assert "SELECT c.id" in existing_call[0][0]
-    assert "COALESCE(MAX(m.date_created), c.date_created)" in existing_call[0][0]
+    assert "COALESCE(last_activity, date_created)" in existing_call[0][0]
+    assert "memori_conversation_message" not in existing_call[0][0]
     assert existing_call[0][1] == (789,)
 
     # Verify MERGE query
@@ -169,62 +185,41 @@ def test_conversation_create(mock_conn, mock_single_result):
 
 def test_conversation_create_returns_existing_within_timeout(mock_conn):
     """Test returning existing conversation when within timeout period."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=15)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 15.0,
     }
-
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [15.0]  # 15 minutes elapsed
-
-    mock_conn.execute.side_effect = [
-        mock_existing,  # Existing conversation found
-        mock_timeout_check,  # Time check: 15 min < 30 min timeout
-    ]
+    mock_conn.execute.return_value = mock_existing
 
     conversation = Conversation(mock_conn)
     result = conversation.create(session_id=789, timeout_minutes=30)
 
-    assert result == 101  # Returns existing conversation id
-    assert mock_conn.execute.call_count == 2  # Check existing, check timeout
-    assert mock_conn.commit.call_count == 0  # No insert, no commit
+    assert result == 101
+    assert mock_conn.execute.call_count == 1  # Single lookup, no aggregate
+    assert mock_conn.commit.call_count == 0
 
 
 def test_conversation_create_new_when_expired(mock_conn, mock_single_result):
     """Test creating new conversation when existing one is expired."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=45)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 45.0,
     }
 
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [45.0]  # 45 minutes elapsed
-
     mock_conn.execute.side_effect = [
-        mock_existing,  # Existing conversation found
-        mock_timeout_check,  # Time check: 45 min > 30 min timeout
-        None,  # MERGE (no return value needed)
-        mock_single_result({"id": 202}),  # SELECT returns new conversation id
+        mock_existing,  # Existing conversation found, 45 min > 30 min timeout
+        None,  # Insert (no return value needed)
+        mock_single_result({"id": 202}),  # SELECT returns conversation id
     ]
 
     conversation = Conversation(mock_conn)
     result = conversation.create(session_id=789, timeout_minutes=30)
 
-    assert result == 202  # Returns new conversation id
-    assert (
-        mock_conn.execute.call_count == 4
-    )  # Check existing, check timeout, MERGE, SELECT
-    assert mock_conn.commit.call_count == 1  # Committed new conversation
+    assert result == 202
+    assert mock_conn.execute.call_count == 3
+    assert mock_conn.commit.call_count == 1
 
 
 def test_conversation_message_create(mock_conn):
@@ -234,7 +229,7 @@ def test_conversation_message_create(mock_conn):
         conversation_id=101, role="user", type="text", content="Hello, world!"
     )
 
-    assert mock_conn.execute.call_count == 1
+    assert mock_conn.execute.call_count == 2
 
     # Verify INSERT query (messages use INSERT, not MERGE)
     insert_call = mock_conn.execute.call_args_list[0]
@@ -248,6 +243,12 @@ def test_conversation_message_create(mock_conn):
     assert type_ == "text"
     assert content == "Hello, world!"
 
+    # Verify conversation last_activity is touched
+    update_call = mock_conn.execute.call_args_list[1]
+    assert "UPDATE memori_conversation" in update_call[0][0]
+    assert "last_activity" in update_call[0][0]
+    assert update_call[0][1] == (101,)
+
 
 def test_conversation_messages_read(mock_conn, mock_multiple_results):
     """Test reading conversation messages."""
@@ -272,6 +273,27 @@ def test_conversation_messages_read(mock_conn, mock_multiple_results):
     assert select_call[0][1] == (101,)
 
 
+def test_conversation_messages_read_with_limit(mock_conn, mock_multiple_results):
+    mock_conn.execute.return_value = mock_multiple_results(
+        [
+            {"role": "assistant", "content": "Hi there!"},
+            {"role": "user", "content": "Hello"},
+        ]
+    )
+
+    messages = ConversationMessages(mock_conn)
+    result = messages.read(conversation_id=101, limit=2)
+
+    assert result == [
+        {"content": "Hello", "role": "user"},
+        {"content": "Hi there!", "role": "assistant"},
+    ]
+    select_call = mock_conn.execute.call_args_list[0]
+    assert "order by id desc" in select_call[0][0].lower()
+    assert "rownum <= :2" in select_call[0][0].lower()
+    assert select_call[0][1] == (101, 2)
+
+
 def test_conversation_messages_read_empty(mock_conn, mock_empty_result):
     """Test reading messages when none exist."""
     mock_conn.execute.return_value = mock_empty_result
@@ -328,3 +350,90 @@ def test_schema_initialization(mock_conn):
 
     assert isinstance(schema.version, SchemaVersion)
     assert schema.conn == mock_conn
+
+
+def test_entity_fact_create_with_conversation_mention(mock_conn, mock_multiple_results):
+    """Test facts and mentions are merged with array binds."""
+    mock_conn.get_dialect.return_value = "oracle"
+    mock_conn.execute.return_value = mock_multiple_results([{"id": 7}, {"id": 8}])
+
+    entity_fact = EntityFact(mock_conn)
+    entity_fact.create(
+        entity_id=123,
+        facts=["fact-1", "fact-2"],
+        fact_embeddings=[[0.1], [0.2]],
+        conversation_id=456,
+    )
+
+    assert mock_conn.execute_many.call_count == 2
+    assert mock_conn.execute.call_count == 1
+    assert mock_conn.commit.call_count == 1
+
+    merge_call = mock_conn.execute_many.call_args_list[0]
+    assert "MERGE INTO memori_entity_fact" in merge_call[0][0]
+    assert "UNION ALL" not in merge_call[0][0]
+    assert ":6 AS uniq" in merge_call[0][0]
+    assert len(merge_call[0][1]) == 2
+    assert all(len(row) == 6 for row in merge_call[0][1])
+
+    select_call = mock_conn.execute.call_args_list[0]
+    assert "uniq IN (:2,:3)" in select_call[0][0]
+
+    mention_call = mock_conn.execute_many.call_args_list[1]
+    assert "MERGE INTO memori_entity_fact_mention" in mention_call[0][0]
+    assert [row[1:] for row in mention_call[0][1]] == [(123, 7, 456), (123, 8, 456)]
+
+
+def test_entity_fact_create_batches_array_binds(mock_conn, monkeypatch):
+    """Test fact rows are bound in batch_size chunks."""
+    mock_conn.get_dialect.return_value = "oracle"
+    monkeypatch.setattr(EntityFact, "batch_size", 2)
+
+    EntityFact(mock_conn).create(
+        entity_id=123, facts=["a", "b", "c"], fact_embeddings=[[0.1]] * 3
+    )
+
+    assert [len(call[0][1]) for call in mock_conn.execute_many.call_args_list] == [
+        2,
+        1,
+    ]
+    mock_conn.execute.assert_not_called()
+
+
+def test_entity_fact_get_embeddings_prefetches_limit(mock_conn, mock_multiple_results):
+    """Test embeddings are fetched with cursor sizing for the whole limit."""
+    mock_conn.execute_prefetch.return_value = mock_multiple_results(
+        [{"id": 1, "content_embedding": b"x"}]
+    )
+
+    rows = EntityFact(mock_conn).get_embeddings(123, 500)
+
+    assert rows == [{"id": 1, "content_embedding": b"x"}]
+    call = mock_conn.execute_prefetch.call_args
+    assert call[0][1:] == ((123, 500), 500)
+
+
+def test_process_attribute_create_aggregates_duplicates(mock_conn):
+    """Test repeated attributes are merged once with their count."""
+    ProcessAttribute(mock_conn).create(1, ["a", "b", "a"])
+
+    assert mock_conn.execute_many.call_count == 1
+    query, rows = mock_conn.execute_many.call_args[0]
+    assert "dst.num_times + src.num_times" in query
+    assert sorted((row[2], row[3]) for row in rows) == [("a", 2), ("b", 1)]
+    assert mock_conn.commit.call_count == 1
+
+
+def test_driver_configure_caps_batch_size(monkeypatch):
+    """Test the batch size is configurable but bounded by the IN list limit."""
+    monkeypatch.setattr(_ArrayBoundWriter, "batch_size", _ArrayBoundWriter.batch_size)
+    storage_config = MagicMock()
+
+    storage_config.oracle_batch_size = 250
+    Driver.configure(storage_config)
+    assert EntityFact.batch_size == 250
+    assert KnowledgeGraph.batch_size == 250
+
+    storage_config.oracle_batch_size = 5000
+    Driver.configure(storage_config)
+    assert ConversationMessages.batch_size == 1000
@@ -1,12 +1,15 @@
 from unittest.mock import MagicMock
 from uuid import UUID
 
+import pytest
+
 from memori.storage.drivers.postgresql._driver import (
     Conversation,
     ConversationMessage,
     ConversationMessages,
     Driver,
     Entity,
+    EntityFact,
     Process,
     Schema,
     SchemaVersion,
@@ -27,37 +30,58 @@ def test_driver_initialization(mock_conn):
 
 def test_entity_create(mock_conn, mock_single_result):
     """Test creating a entity record."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     entity = Entity(mock_conn)
     result = entity.create("external-entity-id")
 
     assert result == 123
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
     # Verify INSERT query
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     assert "INSERT INTO memori_entity" in insert_call[0][0]
     assert "ON CONFLICT DO NOTHING" in insert_call[0][0]
     assert insert_call[0][1][1] == "external-entity-id"
 
     # Verify SELECT query
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "SELECT id" in select_call[0][0]
     assert "FROM memori_entity" in select_call[0][0]
     assert select_call[0][1] == ("external-entity-id",)
 
 
+def test_entity_create_existing_skips_insert(mock_conn, mock_single_result):
+    """Test that an existing entity is resolved without writing."""
+    mock_conn.execute.return_value = mock_single_result({"id": 123})
+
+    entity = Entity(mock_conn)
+    result = entity.create("external-entity-id")
+
+    assert result == 123
+    assert mock_conn.execute.call_count == 1
+    assert mock_conn.commit.call_count == 0
+    assert "SELECT id" in mock_conn.execute.call_args[0][0]
+
+
 def test_entity_generates_uuid(mock_conn, mock_single_result):
     """Test that create generates a valid UUID."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     entity = Entity(mock_conn)
     entity.create("external-entity-id")
 
     # Check that a UUID was generated in the INSERT
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     uuid_arg = insert_call[0][1][0]
 
     # Verify it's a valid UUID string
@@ -66,23 +90,27 @@ def test_entity_generates_uuid(mock_conn, mock_single_result):
 
 def test_process_create(mock_conn, mock_single_result):
     """Test creating a process record."""
-    mock_conn.execute.return_value = mock_single_result({"id": 456})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 456}),
+    ]
 
     process = Process(mock_conn)
     result = process.create("external-process-id")
 
     assert result == 456
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
     # Verify INSERT query
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     assert "INSERT INTO memori_process" in insert_call[0][0]
     assert "ON CONFLICT DO NOTHING" in insert_call[0][0]
     assert insert_call[0][1][1] == "external-process-id"
 
     # Verify SELECT query
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "SELECT id" in select_call[0][0]
     assert "FROM memori_process" in select_call[0][0]
     assert select_call[0][1] == ("external-process-id",)
@@ -128,7 +156,6 @@ def test_conversation_create(mock_conn, mock_single_result):
     mock_empty_result.mappings.return_value.fetchone.return_value = None
     mock_conn.execute.side_effect = [
         mock_empty_result,
-        None,
         mock_single_result({"id": 101}),
     ]
 
@@ -136,92 +163,65 @@ def test_conversation_create(mock_conn, mock_single_result):
     result = conversation.create(session_id=789, timeout_minutes=30)
 
     assert result == 101
-    assert mock_conn.execute.call_count == 3  # Check existing, INSERT, SELECT
+    assert mock_conn.execute.call_count == 2  # Check existing, insert-or-select
     assert mock_conn.commit.call_count == 1
 
     # Verify check for existing conversation
     check_call = mock_conn.execute.call_args_list[0]
-    assert (
-        "COALESCE(MAX(m.date_created), c.date_created) as last_activity"
-        in check_call[0][0]
-    )
+    assert "COALESCE(last_activity, date_created)" in check_call[0][0]
+    assert "memori_conversation_message" not in check_call[0][0]
     assert check_call[0][1] == (789,)
 
-    # Verify INSERT query
-    insert_call = mock_conn.execute.call_args_list[1]
-    assert "INSERT INTO memori_conversation" in insert_call[0][0]
-    assert "ON CONFLICT DO NOTHING" in insert_call[0][0]
+    # Verify insert-or-select runs as a single statement
+    upsert_call = mock_conn.execute.call_args_list[1]
+    assert "INSERT INTO memori_conversation" in upsert_call[0][0]
+    assert "ON CONFLICT DO NOTHING" in upsert_call[0][0]
+    assert "RETURNING id" in upsert_call[0][0]
+    assert "UNION ALL" in upsert_call[0][0]
 
     # Verify the UUID is generated and session_id is passed
-    uuid_arg, session_id_arg = insert_call[0][1]
+    uuid_arg, session_id_arg, select_session_id_arg = upsert_call[0][1]
     UUID(uuid_arg)  # Validate UUID
     assert session_id_arg == 789
-
-    # Verify SELECT query
-    select_call = mock_conn.execute.call_args_list[2]
-    assert "SELECT id" in select_call[0][0]
-    assert "FROM memori_conversation" in select_call[0][0]
-    assert select_call[0][1] == (789,)
+    assert select_session_id_arg == 789
 
 
 def test_conversation_create_returns_existing_within_timeout(mock_conn):
     """Test returning existing conversation when within timeout period."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=15)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 15.0,
     }
-
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [15.0]  # 15 minutes elapsed
-
-    mock_conn.execute.side_effect = [
-        mock_existing,  # Existing conversation found
-        mock_timeout_check,  # Time check: 15 min < 30 min timeout
-    ]
+    mock_conn.execute.return_value = mock_existing
 
     conversation = Conversation(mock_conn)
     result = conversation.create(session_id=789, timeout_minutes=30)
 
-    assert result == 101  # Returns existing conversation id
-    assert mock_conn.execute.call_count == 2  # Check existing, check timeout
-    assert mock_conn.commit.call_count == 0  # No insert, no commit
+    assert result == 101
+    assert mock_conn.execute.call_count == 1  # Single lookup, no aggregate
+    assert mock_conn.commit.call_count == 0
 
 
 def test_conversation_create_new_when_expired(mock_conn, mock_single_result):
     """Test creating new conversation when existing one is expired."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=45)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 45.0,
     }
 
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [45.0]  # 45 minutes elapsed
-
     mock_conn.execute.side_effect = [
-        mock_existing,  # Existing conversation found
-        mock_timeout_check,  # Time check: 45 min > 30 min timeout
-        None,  # INSERT (no return value needed)
-        mock_single_result({"id": 202}),  # SELECT returns new conversation id
+        mock_existing,  # Existing conversation found, 45 min > 30 min timeout
+        mock_single_result({"id": 202}),  # Insert-or-select returns the id
     ]
 
     conversation = Conversation(mock_conn)
     result = conversation.create(session_id=789, timeout_minutes=30)
 
-    assert result == 202  # Returns new conversation id
-    assert (
-        mock_conn.execute.call_count == 4
-    )  # Check existing, check timeout, INSERT, SELECT
-    assert mock_conn.commit.call_count == 1  # Committed new conversation
+    assert result == 202
+    assert mock_conn.execute.call_count == 2
+    assert mock_conn.commit.call_count == 1
 
 
 def test_conversation_message_create(mock_conn):
@@ -231,7 +231,7 @@ def test_conversation_message_create(mock_conn):
         conversation_id=101, role="user", type="text", content="Hello, world!"
     )
 
-    assert mock_conn.execute.call_count == 1
+    assert mock_conn.execute.call_count == 2
 
     # Verify INSERT query
     insert_call = mock_conn.execute.call_args_list[0]
@@ -245,6 +245,12 @@ def test_conversation_message_create(mock_conn):
     assert type_ == "text"
     assert content == "Hello, world!"
 
+    # Verify conversation last_activity is touched
+    update_call = mock_conn.execute.call_args_list[1]
+    assert "UPDATE memori_conversation" in update_call[0][0]
+    assert "last_activity" in update_call[0][0]
+    assert update_call[0][1] == (101,)
+
 
 def test_conversation_messages_read(mock_conn, mock_multiple_results):
     """Test reading conversation messages."""
@@ -269,6 +275,27 @@ def test_conversation_messages_read(mock_conn, mock_multiple_results):
     assert select_call[0][1] == (101,)
 
 
+def test_conversation_messages_read_with_limit(mock_conn, mock_multiple_results):
+    mock_conn.execute.return_value = mock_multiple_results(
+        [
+            {"role": "assistant", "content": "Hi there!"},
+            {"role": "user", "content": "Hello"},
+        ]
+    )
+
+    messages = ConversationMessages(mock_conn)
+    result = messages.read(conversation_id=101, limit=2)
+
+    assert result == [
+        {"content": "Hello", "role": "user"},
+        {"content": "Hi there!", "role": "assistant"},
+    ]
+    select_call = mock_conn.execute.call_args_list[0]
+    assert "order by id desc" in select_call[0][0].lower()
+    assert "limit %s" in select_call[0][0].lower()
+    assert select_call[0][1] == (101, 2)
+
+
 def test_conversation_messages_read_empty(mock_conn, mock_empty_result):
     """Test reading messages when none exist."""
     mock_conn.execute.return_value = mock_empty_result
@@ -325,3 +352,205 @@ def test_schema_initialization(mock_conn):
 
     assert isinstance(schema.version, SchemaVersion)
     assert schema.conn == mock_conn
+
+
+def test_entity_fact_create_with_conversation_mention(mock_conn, mock_multiple_results):
+    """Test facts upsert in one statement and mentions reuse RETURNING ids."""
+    mock_conn.get_dialect.return_value = "postgresql"
+    mock_conn.execute.side_effect = [
+        mock_multiple_results([{"id": 7}, {"id": 8}]),
+        None,
+    ]
+
+    entity_fact = EntityFact(mock_conn)
+    result = entity_fact.create(
+        entity_id=123,
+        facts=["fact-1", "fact-2"],
+        fact_embeddings=[[0.1], [0.2]],
+        conversation_id=456,
+    )
+
+    assert result == entity_fact
+    assert mock_conn.execute.call_count == 2
+
+    upsert_call = mock_conn.execute.call_args_list[0]
+    assert "ON CONFLICT (entity_id, uniq) DO UPDATE" in upsert_call[0][0]
+    assert "EXCLUDED.num_times" in upsert_call[0][0]
+    assert "RETURNING id" in upsert_call[0][0]
+    assert len(upsert_call[0][1]) == 12
+
+    mention_call = mock_conn.execute.call_args_list[1]
+    assert "INSERT INTO memori_entity_fact_mention" in mention_call[0][0]
+    assert mention_call[0][1][1:4] == (123, 7, 456)
+    assert mention_call[0][1][5:8] == (123, 8, 456)
+
+
+def test_knowledge_graph_create_resolves_ids_with_any(mock_conn, mock_multiple_results):
+    """Test dimension ids are resolved with one ANY() lookup per table."""
+    from memori._utils import generate_uniq
+    from memori.memory._struct import SemanticTriple
+
+    triple = SemanticTriple()
+    triple.subject_name, triple.subject_type = "alice", "person"
+    triple.predicate = "likes"
+    triple.object_name, triple.object_type = "tea", "thing"
+
+    mock_conn.execute.side_effect = [
+        None,
+        mock_multiple_results([{"id": 1, "uniq": generate_uniq(["alice", "person"])}]),
+        None,
+        mock_multiple_results([{"id": 2, "uniq": generate_uniq(["likes"])}]),
+        None,
+        mock_multiple_results([{"id": 3, "uniq": generate_uniq(["tea", "thing"])}]),
+        None,
+    ]
+
+    Driver(mock_conn).knowledge_graph.create(123, [triple, triple])
+
+    assert mock_conn.execute.call_count == 7
+    assert mock_conn.commit.call_count == 1
+
+    subject_select = mock_conn.execute.call_args_list[1]
+    assert "WHERE uniq = ANY(%s)" in subject_select[0][0]
+
+    edge_insert = mock_conn.execute.call_args_list[6]
+    assert "EXCLUDED.num_times" in edge_insert[0][0]
+    assert edge_insert[0][1][1:] == (123, 1, 2, 3, 2)
+
+
+def test_knowledge_graph_create_writes_rows_in_key_order(
+    mock_conn, mock_multiple_results
+):
+    """Test dimension and edge rows are written sorted, so writers lock alike."""
+    from memori._utils import generate_uniq
+    from memori.memory._struct import SemanticTriple
+
+    triples = []
+    for name in ("zoe", "alice", "mike"):
+        triple = SemanticTriple()
+        triple.subject_name, triple.subject_type = name, "person"
+        triple.predicate = "likes"
+        triple.object_name, triple.object_type = "tea", "thing"
+        triples.append(triple)
+
+    subject_uniqs = sorted(
+        generate_uniq([name, "person"]) for name in ("zoe", "alice", "mike")
+    )
+    mock_conn.execute.side_effect = [
+        None,
+        mock_multiple_results(
+            [{"id": 30 - i, "uniq": uniq} for i, uniq in enumerate(subject_uniqs)]
+        ),
+        None,
+        mock_multiple_results([{"id": 2, "uniq": generate_uniq(["likes"])}]),
+        None,
+        mock_multiple_results([{"id": 3, "uniq": generate_uniq(["tea", "thing"])}]),
+        None,
+    ]
+
+    Driver(mock_conn).knowledge_graph.create(123, triples)
+
+    subject_insert = mock_conn.execute.call_args_list[0][0][1]
+    assert [subject_insert[i] for i in (3, 7, 11)] == subject_uniqs
+
+    edge_insert = mock_conn.execute.call_args_list[6][0][1]
+    assert [edge_insert[i] for i in (2, 8, 14)] == [28, 29, 30]
+
+
+def test_entity_fact_follower_reads_on_cockroachdb(mock_conn):
+    """Test recall reads run in a historical transaction on CockroachDB."""
+    mock_conn.get_dialect.return_value = "cockroachdb"
+
+    with EntityFact(mock_conn).follower_reads():
+        mock_conn.execute("SELECT 1")
+
+    statements = [call[0][0] for call in mock_conn.execute.call_args_list]
+    assert statements == [
+        "SET TRANSACTION AS OF SYSTEM TIME follower_read_timestamp()",
+        "SELECT 1",
+    ]
+    assert mock_conn.commit.call_count == 2
+
+
+def test_entity_fact_follower_reads_with_staleness(mock_conn):
+    """Test an explicit staleness reads at a fixed interval in the past."""
+    mock_conn.get_dialect.return_value = "cockroachdb"
+
+    with EntityFact(mock_conn).follower_reads(15):
+        pass
+
+    assert mock_conn.execute.call_args[0][0] == (
+        "SET TRANSACTION AS OF SYSTEM TIME '-15s'"
+    )
+
+
+def test_entity_fact_follower_reads_rolls_back_on_error(mock_conn):
+    """Test a failed historical transaction is rolled back, not committed."""
+    mock_conn.get_dialect.return_value = "cockroachdb"
+
+    with pytest.raises(RuntimeError):
+        with EntityFact(mock_conn).follower_reads():
+            raise RuntimeError("read failed")
+
+    assert mock_conn.rollback.call_count == 1
+    assert mock_conn.commit.call_count == 1
+
+
+def test_entity_fact_follower_reads_noop_on_postgresql(mock_conn):
+    """Test PostgreSQL runs the block unchanged."""
+    mock_conn.get_dialect.return_value = "postgresql"
+
+    with EntityFact(mock_conn).follower_reads():
+        pass
+
+    mock_conn.execute.assert_not_called()
+    mock_conn.commit.assert_not_called()
+
+
+def test_knowledge_graph_delete_by_entity_checks_only_its_dimensions(
+    mock_conn, mock_multiple_results
+):
+    """Test orphan cleanup is limited to dimensions the entity referenced."""
+    mock_conn.execute.side_effect = [
+        mock_multiple_results([{"subject_id": 1, "predicate_id": 2, "object_id": 3}]),
+        None,
+        None,
+        None,
+        None,
+    ]
+
+    Driver(mock_conn).knowledge_graph.delete_by_entity(123)
+
+    cleanup_calls = mock_conn.execute.call_args_list[2:]
+    assert [call[0][1] for call in cleanup_calls] == [([1],), ([2],), ([3],)]
+    assert all("id = ANY(%s)" in call[0][0] for call in cleanup_calls)
+    assert mock_conn.commit.call_count == 1
+
+
+def test_entity_fact_export_pages_by_id(mock_conn, mock_multiple_results):
+    """Test facts are exported in keyset pages ordered by id."""
+    mock_conn.execute.return_value = mock_multiple_results([{"id": 5}])
+
+    assert EntityFact(mock_conn).export(123, after_id=4, limit=2) == [{"id": 5}]
+
+    query, params = mock_conn.execute.call_args[0]
+    assert "id > %s" in query
+    assert "ORDER BY id" in query
+    assert params == (123, 4, 2)
+
+
+def test_entity_fact_read_mentions_uses_any(mock_conn, mock_multiple_results):
+    """Test mentions of a page of facts are read with one ANY() lookup."""
+    mock_conn.execute.return_value = mock_multiple_results(
+        [{"fact_id": 1, "conversation_id": 9}]
+    )
+
+    assert EntityFact(mock_conn).read_mentions([1, 2]) == [
+        {"fact_id": 1, "conversation_id": 9}
+    ]
+    assert EntityFact(mock_conn).read_mentions([]) == []
+
+    query, params = mock_conn.execute.call_args[0]
+    assert "fact_id = ANY(%s)" in query
+    assert params == ([1, 2],)
+    assert mock_conn.execute.call_count == 1
@@ -0,0 +1,249 @@
+import sqlite3
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from memori._config import Config
+from memori.storage._manager import Manager
+from memori.storage.adapters.sharded import Adapter, ShardedConn
+from memori.storage.drivers.sharded import Driver
+from memori.storage.drivers.sharded._driver import ProcessRef
+
+NUM_SHARDS = 3
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return [str(tmp_path / f"shard-{i}.db") for i in range(NUM_SHARDS)]
+
+
+@pytest.fixture
+def storage(paths):
+    config = Config()
+    config.storage = Manager(config).start(
+        ShardedConn([lambda path=path: sqlite3.connect(path) for path in paths])
+    )
+    config.storage.build()
+    return config.storage
+
+
+def _entities_on_shards(conn, count):
+    # External ids that together cover every shard.
+    seen = {}
+    i = 0
+    while len(seen) < count:
+        seen.setdefault(conn.shard_for(f"user-{i}"), f"user-{i}")
+        i += 1
+    return [seen[shard] for shard in sorted(seen)]
+
+
+def _external_ids(path):
+    with sqlite3.connect(path) as conn:
+        return [row[0] for row in conn.execute("SELECT external_id FROM memori_entity")]
+
+
+def test_shard_for_is_stable():
+    conn = ShardedConn([Mock(), Mock(), Mock()])
+
+    assert conn.shard_for("user-1") == conn.shard_for("user-1")
+    assert conn.shard_for("user-1") == ShardedConn([Mock()] * 3).shard_for("user-1")
+    assert {conn.shard_for(f"user-{i}") for i in range(100)} == {0, 1, 2}
+
+
+def test_sharded_conn_requires_connections():
+    with pytest.raises(ValueError):
+        ShardedConn([])
+
+
+def test_manager_builds_sharded_driver_with_shard_dialect(storage, paths):
+    assert isinstance(storage.adapter, Adapter)
+    assert isinstance(storage.driver, Driver)
+    assert storage.adapter.get_dialect() == "sqlite"
+    for path in paths:
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT num FROM memori_schema_version").fetchone()
+
+
+def test_entities_are_placed_by_external_id(storage, paths):
+    driver = storage.driver
+    external_ids = _entities_on_shards(storage.adapter.conn, NUM_SHARDS)
+
+    entity_ids = [driver.entity.create(external_id) for external_id in external_ids]
+    storage.adapter.commit()
+
+    assert [entity_id % NUM_SHARDS for entity_id in entity_ids] == [0, 1, 2]
+    assert driver.entity.create(external_ids[1]) == entity_ids[1]
+    for shard, path in enumerate(paths):
+        assert _external_ids(path) == [external_ids[shard]]
+
+
+def test_conversation_and_facts_follow_their_entity(storage):
+    driver = storage.driver
+    external_ids = _entities_on_shards(storage.adapter.conn, NUM_SHARDS)
+
+    fact_ids = []
+    for shard, external_id in enumerate(external_ids):
+        entity_id = driver.entity.create(external_id)
+        process_id = driver.process.create("app")
+        session_id = driver.session.create(f"uuid-{shard}", entity_id, process_id)
+        conversation_id = driver.conversation.create(session_id, 30)
+        driver.conversation.messages.create_many(
+            conversation_id, [{"role": "user", "type": None, "content": external_id}]
+        )
+        driver.conversation.update(conversation_id, f"summary {shard}")
+        driver.entity_fact.create(
+            entity_id, [f"fact {shard}"], [[float(shard)] * 4], conversation_id
+        )
+        driver.process_attribute.create(process_id, ["tone"])
+        storage.adapter.commit()
+
+        assert session_id % NUM_SHARDS == shard
+        assert conversation_id % NUM_SHARDS == shard
+        assert driver.session.read(f"uuid-{shard}") == session_id
+        assert driver.conversation.read_id_by_session_id(session_id) == (
+            conversation_id
+        )
+        assert driver.conversation.read(conversation_id)["session_id"] == session_id
+        assert driver.conversation.messages.read(conversation_id) == [
+            {"role": "user", "content": external_id}
+        ]
+
+        rows = driver.entity_fact.get_embeddings(entity_id, 10)
+        assert [row["id"] % NUM_SHARDS for row in rows] == [shard]
+        fact_ids.append(rows[0]["id"])
+
+        mentions = driver.entity_fact.read_mentions([rows[0]["id"]])
+        assert mentions == [
+            {"fact_id": rows[0]["id"], "conversation_id": conversation_id}
+        ]
+
+    facts = driver.entity_fact.get_facts_by_ids(list(reversed(fact_ids)))
+    assert [fact["content"] for fact in facts] == ["fact 2", "fact 1", "fact 0"]
+    assert facts[0]["summaries"][0]["content"] == "summary 2"
+    assert driver.session.read("missing") is None
+
+
+def test_embedding_segments_ids_are_namespaced(storage):
+    driver = storage.driver
+    external_id = _entities_on_shards(storage.adapter.conn, NUM_SHARDS)[2]
+    entity_id = driver.entity.create(external_id)
+    driver.entity_fact.create(entity_id, ["a", "b"], [[0.1] * 4, [0.2] * 4])
+
+    fact_ids, matrix = driver.entity_fact.get_embedding_segments(entity_id, 10)
+
+    expected = [row["id"] for row in driver.entity_fact.get_embeddings(entity_id, 10)]
+    assert sorted(fact_ids.tolist()) == sorted(expected)
+    assert matrix.shape == (2, 4)
+    np.testing.assert_array_equal(fact_ids % NUM_SHARDS, [2, 2])
+
+
+def test_fact_mention_must_share_entity_shard(storage):
+    driver = storage.driver
+    first, second = _entities_on_shards(storage.adapter.conn, 2)
+    entity_id = driver.entity.create(first)
+    session_id = driver.session.create("uuid", driver.entity.create(second), None)
+    conversation_id = driver.conversation.create(session_id, 30)
+
+    with pytest.raises(ValueError, match="not on the shard"):
+        driver.entity_fact.create(entity_id, ["fact"], [[0.1] * 4], conversation_id)
+
+
+def test_delete_by_entity_only_touches_its_shard(storage):
+    driver = storage.driver
+    first, second = _entities_on_shards(storage.adapter.conn, 2)
+    kept = driver.entity.create(first)
+    deleted = driver.entity.create(second)
+    driver.entity_fact.create(kept, ["kept"], [[0.1] * 4])
+    driver.entity_fact.create(deleted, ["deleted"], [[0.1] * 4])
+
+    driver.entity_fact.delete_by_entity(deleted)
+    driver.knowledge_graph.delete_by_entity(deleted)
+
+    assert driver.entity_fact.get_embeddings(deleted, 10) == []
+    assert len(driver.entity_fact.get_embeddings(kept, 10)) == 1
+
+
+def test_process_only_sessions_live_on_the_process_shard(storage, paths):
+    driver = storage.driver
+    shard = storage.adapter.conn.shard_for("proc")
+
+    session_id = driver.session.create("uuid", None, driver.process.create("proc"))
+    conversation_id = driver.conversation.create(session_id, 30)
+    driver.conversation.messages.create_many(
+        conversation_id, [{"role": "user", "type": None, "content": "hi"}]
+    )
+    storage.adapter.commit()
+
+    assert session_id % NUM_SHARDS == shard
+    assert driver.session.read("uuid") == session_id
+    with sqlite3.connect(paths[shard]) as conn:
+        assert conn.execute("SELECT entity_id FROM memori_session").fetchall() == [
+            (None,)
+        ]
+
+
+def test_read_conn_is_rejected(paths):
+    config = Config()
+    conn = ShardedConn([lambda path=path: sqlite3.connect(path) for path in paths])
+
+    with pytest.raises(ValueError, match="ShardedConn"):
+        Manager(config).start(conn, read_conn=lambda: sqlite3.connect(paths[0]))
+
+
+def test_manager_close_closes_shard_pools(paths):
+    opened = []
+
+    def connect(path):
+        conn = sqlite3.connect(path, check_same_thread=False)
+        opened.append(conn)
+        return conn
+
+    config = Config()
+    config.storage = storage = Manager(config).start(
+        ShardedConn([lambda path=path: connect(path) for path in paths])
+    )
+    storage.build()
+    for external_id in _entities_on_shards(storage.adapter.conn, NUM_SHARDS):
+        storage.driver.entity.create(external_id)
+    sharded = storage.adapter.conn
+
+    storage.close()
+
+    assert opened
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    assert all(factory._closed for factory in sharded.factories)
+
+
+def test_process_ids_are_references():
+    assert ProcessRef("app") == ProcessRef("app")
+    assert len({ProcessRef("app"), ProcessRef("app")}) == 1
+
+
+def test_shards_must_share_dialect(tmp_path):
+    conn = ShardedConn([lambda: sqlite3.connect(str(tmp_path / "a.db")), Mock()])
+    adapter = Adapter(lambda: conn)
+    adapter.shard(0)
+
+    other = Mock()
+    other.get_dialect.return_value = "mysql"
+    with patch("memori.storage.adapters.sharded._adapter.Registry") as registry:
+        registry.return_value.adapter.return_value = other
+        with pytest.raises(ValueError, match="every shard must be sqlite"):
+            adapter.shard(1)
+
+    other.close.assert_called_once()
+
+
+def test_mongodb_cannot_be_sharded():
+    conn = ShardedConn([Mock()])
+    adapter = Adapter(lambda: conn)
+
+    other = Mock()
+    other.get_dialect.return_value = "mongodb"
+    with patch("memori.storage.adapters.sharded._adapter.Registry") as registry:
+        registry.return_value.adapter.return_value = other
+        with pytest.raises(ValueError, match="not supported for mongodb"):
+            adapter.get_dialect()
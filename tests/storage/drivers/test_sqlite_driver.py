@@ -29,36 +29,57 @@ def test_driver_initialization(mock_conn):
 
 def test_entity_create(mock_conn, mock_single_result):
     """Test creating a entity record."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     entity = Entity(mock_conn)
     result = entity.create("external-entity-id")
 
     assert result == 123
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
     # Verify INSERT query
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     assert "insert or ignore into memori_entity" in insert_call[0][0].lower()
     assert insert_call[0][1][1] == "external-entity-id"
 
     # Verify SELECT query
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "select id" in select_call[0][0].lower()
     assert "from memori_entity" in select_call[0][0].lower()
     assert select_call[0][1] == ("external-entity-id",)
 
 
+def test_entity_create_existing_skips_insert(mock_conn, mock_single_result):
+    """Test that an existing entity is resolved without writing."""
+    mock_conn.execute.return_value = mock_single_result({"id": 123})
+
+    entity = Entity(mock_conn)
+    result = entity.create("external-entity-id")
+
+    assert result == 123
+    assert mock_conn.execute.call_count == 1
+    assert mock_conn.commit.call_count == 0
+    assert "select id" in mock_conn.execute.call_args[0][0].lower()
+
+
 def test_entity_generates_uuid(mock_conn, mock_single_result):
     """Test that create generates a valid UUID string."""
-    mock_conn.execute.return_value = mock_single_result({"id": 123})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 123}),
+    ]
 
     entity = Entity(mock_conn)
     entity.create("external-entity-id")
 
     # Check that a UUID was generated in the INSERT
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     uuid_arg = insert_call[0][1][0]
 
     # SQLite driver uses str(uuid4()), so verify it's a string
@@ -69,22 +90,26 @@ def test_entity_generates_uuid(mock_conn, mock_single_result):
 
 def test_process_create(mock_conn, mock_single_result):
     """Test creating a process record."""
-    mock_conn.execute.return_value = mock_single_result({"id": 456})
+    mock_conn.execute.side_effect = [
+        mock_single_result(None),
+        MagicMock(),
+        mock_single_result({"id": 456}),
+    ]
 
     process = Process(mock_conn)
     result = process.create("external-process-id")
 
     assert result == 456
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 3
     assert mock_conn.commit.call_count == 1
 
     # Verify INSERT query
-    insert_call = mock_conn.execute.call_args_list[0]
+    insert_call = mock_conn.execute.call_args_list[1]
     assert "insert or ignore into memori_process" in insert_call[0][0].lower()
     assert insert_call[0][1][1] == "external-process-id"
 
     # Verify SELECT query
-    select_call = mock_conn.execute.call_args_list[1]
+    select_call = mock_conn.execute.call_args_list[2]
     assert "select id" in select_call[0][0].lower()
     assert "from memori_process" in select_call[0][0].lower()
     assert select_call[0][1] == ("external-process-id",)
@@ -142,10 +167,8 @@ def test_conversation_create(mock_conn, mock_single_result):
 
     # Verify check for existing conversation
     check_call = mock_conn.execute.call_args_list[0]
-    assert (
-        "coalesce(max(m.date_created), c.date_created) as last_activity"
-        in check_call[0][0].lower()
-    )
+    assert "coalesce(last_activity, date_created)" in check_call[0][0].lower()
+    assert "memori_conversation_message" not in check_call[0][0]
     assert check_call[0][1] == (789,)
 
     # Verify INSERT query
@@ -166,62 +189,41 @@ def test_conversation_create(mock_conn, mock_single_result):
 
 def test_conversation_create_returns_existing_within_timeout(mock_conn):
     """Test returning existing conversation when within timeout period."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=15)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 15.0,
     }
-
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [15.0]  # 15 minutes elapsed
-
-    mock_conn.execute.side_effect = [
-        mock_existing,  # Existing conversation found
-        mock_timeout_check,  # Time check: 15 min < 30 min timeout
-    ]
+    mock_conn.execute.return_value = mock_existing
 
     conversation = Conversation(mock_conn)
     result = conversation.create(session_id=789, timeout_minutes=30)
 
-    assert result == 101  # Returns existing conversation id
-    assert mock_conn.execute.call_count == 2  # Check existing, check timeout
-    assert mock_conn.commit.call_count == 0  # No insert, no commit
+    assert result == 101
+    assert mock_conn.execute.call_count == 1  # Single lookup, no aggregate
+    assert mock_conn.commit.call_count == 0
 
 
 def test_conversation_create_new_when_expired(mock_conn, mock_single_result):
     """Test creating new conversation when existing one is expired."""
-    from datetime import datetime, timedelta
-
-    last_activity = datetime.now() - timedelta(minutes=45)
-
     mock_existing = MagicMock()
     mock_existing.mappings.return_value.fetchone.return_value = {
         "id": 101,
-        "last_activity": last_activity,
+        "minutes_since_activity": 45.0,
     }
 
-    mock_timeout_check = MagicMock()
-    mock_timeout_check.fetchone.return_value = [45.0]  # 45 minutes elapsed
-
     mock_conn.execute.side_effect = [
-        mock_existing,  # Existing conversation found
-        mock_timeout_check,  # Time check: 45 min > 30 min timeout
-        None,  # INSERT (no return value needed)
-        mock_single_result({"id": 202}),  # SELECT returns new conversation id
+        mock_existing,  # Existing conversation found, 45 min > 30 min timeout
+        None,  # Insert (no return value needed)
+        mock_single_result({"id": 202}),  # SELECT returns conversation id
     ]
 
     conversation = Conversation(mock_conn)
     result = conversation.create(session_id=789, timeout_minutes=30)
 
-    assert result == 202  # Returns new conversation id
-    assert (
-        mock_conn.execute.call_count == 4
-    )  # Check existing, check timeout, INSERT, SELECT
-    assert mock_conn.commit.call_count == 1  # Committed new conversation
+    assert result == 202
+    assert mock_conn.execute.call_count == 3
+    assert mock_conn.commit.call_count == 1
 
 
 def test_conversation_message_create(mock_conn):
@@ -231,7 +233,7 @@ def test_conversation_message_create(mock_conn):
         conversation_id=101, role="user", type="text", content="Hello, world!"
     )
 
-    assert mock_conn.execute.call_count == 1
+    assert mock_conn.execute.call_count == 2
 
     # Verify INSERT query
     insert_call = mock_conn.execute.call_args_list[0]
@@ -245,6 +247,12 @@ def test_conversation_message_create(mock_conn):
     assert type_ == "text"
     assert content == "Hello, world!"
 
+    # Verify conversation last_activity is touched
+    update_call = mock_conn.execute.call_args_list[1]
+    assert "update memori_conversation" in update_call[0][0].lower()
+    assert "last_activity" in update_call[0][0]
+    assert update_call[0][1] == (101,)
+
 
 def test_conversation_messages_read(mock_conn, mock_multiple_results):
     """Test reading conversation messages."""
@@ -270,6 +278,27 @@ def test_conversation_messages_read(mock_conn, mock_multiple_results):
     assert select_call[0][1] == (101,)
 
 
+def test_conversation_messages_read_with_limit(mock_conn, mock_multiple_results):
+    mock_conn.execute.return_value = mock_multiple_results(
+        [
+            {"role": "assistant", "content": "Hi there!"},
+            {"role": "user", "content": "Hello"},
+        ]
+    )
+
+    messages = ConversationMessages(mock_conn)
+    result = messages.read(conversation_id=101, limit=2)
+
+    assert result == [
+        {"content": "Hello", "role": "user"},
+        {"content": "Hi there!", "role": "assistant"},
+    ]
+    select_call = mock_conn.execute.call_args_list[0]
+    assert "order by id desc" in select_call[0][0].lower()
+    assert "limit ?" in select_call[0][0].lower()
+    assert select_call[0][1] == (101, 2)
+
+
 def test_conversation_messages_read_empty(mock_conn, mock_empty_result):
     """Test reading messages when none exist."""
     mock_conn.execute.return_value = mock_empty_result
@@ -330,7 +359,7 @@ def test_schema_initialization(mock_conn):
 
 def test_entity_fact_create(mock_conn, mocker):
     """Test creating entity facts."""
-    mocker.patch("memori._utils.generate_uniq", return_value="uniq123")
+    mocker.patch("memori._utils.generate_uniq", side_effect=["uniq1", "uniq2"])
     mocker.patch(
         "memori.embeddings.format_embedding_for_db",
         return_value=b"\x00\x01\x02\x03",  # Binary data
@@ -343,21 +372,63 @@ def test_entity_fact_create(mock_conn, mocker):
     result = entity_fact.create(entity_id=123, facts=facts, fact_embeddings=embeddings)
 
     assert result == entity_fact
-    assert mock_conn.execute.call_count == 2
+    assert mock_conn.execute.call_count == 1
     assert mock_conn.commit.call_count == 1
 
-    # Verify first INSERT query
-    first_insert = mock_conn.execute.call_args_list[0]
-    assert "insert into memori_entity_fact" in first_insert[0][0].lower()
-    assert "on conflict(entity_id, uniq)" in first_insert[0][0].lower()
+    # Both facts go out in one multi-row upsert
+    insert_call = mock_conn.execute.call_args_list[0]
+    assert "insert into memori_entity_fact" in insert_call[0][0].lower()
+    assert "on conflict(entity_id, uniq)" in insert_call[0][0].lower()
+    assert "excluded.num_times" in insert_call[0][0].lower()
 
-    # Verify parameters for first fact
-    params = first_insert[0][1]
+    params = insert_call[0][1]
+    assert len(params) == 12
     assert params[1] == 123  # entity_id
     assert params[2] == "User likes Python"  # content
     assert params[3] == b"\x00\x01\x02\x03"  # content_embedding (binary)
     assert params[4] == 1  # num_times
-    assert params[5] == "uniq123"  # uniq
+    assert params[5] == "uniq1"  # uniq
+    assert params[8] == "User works as engineer"
+    assert params[11] == "uniq2"
+
+
+def test_entity_fact_create_collapses_duplicate_facts(mock_conn, mocker):
+    """Test repeated facts become one row carrying the repeat count."""
+    mocker.patch(
+        "memori.embeddings.format_embedding_for_db",
+        return_value=b"\x00",
+    )
+
+    entity_fact = EntityFact(mock_conn)
+    entity_fact.create(
+        entity_id=123,
+        facts=["User likes Python", "user likes python!", "User works as engineer"],
+        fact_embeddings=[[0.1], [0.2], [0.3]],
+    )
+
+    assert mock_conn.execute.call_count == 1
+    params = mock_conn.execute.call_args_list[0][0][1]
+    assert len(params) == 12
+    assert params[2] == "User likes Python"
+    assert params[4] == 2
+    assert params[8] == "User works as engineer"
+    assert params[10] == 1
+
+
+def test_entity_fact_create_splits_into_batches(mock_conn, mocker):
+    """Test large fact lists are written in batch_size chunks."""
+    mocker.patch(
+        "memori.embeddings.format_embedding_for_db",
+        return_value=b"",
+    )
+
+    entity_fact = EntityFact(mock_conn)
+    entity_fact.batch_size = 2
+    entity_fact.create(entity_id=123, facts=["a", "b", "c", "d", "e"])
+
+    assert mock_conn.execute.call_count == 3
+    assert [len(c[0][1]) for c in mock_conn.execute.call_args_list] == [12, 12, 6]
+    assert mock_conn.commit.call_count == 1
 
 
 def test_entity_fact_create_empty_facts(mock_conn):
@@ -391,34 +462,40 @@ def test_entity_fact_create_without_embeddings(mock_conn, mocker):
 
 
 def test_entity_fact_create_with_conversation_mention(
-    mock_conn, mock_single_result, mocker
+    mock_conn, mock_multiple_results, mocker
 ):
     """Test creating mention mapping when conversation_id is provided."""
-    mocker.patch("memori._utils.generate_uniq", return_value="uniq123")
+    mocker.patch("memori._utils.generate_uniq", side_effect=["uniq1", "uniq2"])
     mocker.patch(
         "memori.embeddings.format_embedding_for_db",
         return_value=b"\x01\x02",
     )
     mock_conn.execute.side_effect = [
-        None,  # upsert fact
-        mock_single_result({"id": 789}),  # resolve fact id by entity_id+uniq
-        None,  # insert mention mapping
+        None,  # upsert facts
+        mock_multiple_results([{"id": 789}, {"id": 790}]),  # resolve fact ids
+        None,  # insert mention mappings
     ]
 
     entity_fact = EntityFact(mock_conn)
     entity_fact.create(
         entity_id=123,
-        facts=["User likes Python"],
-        fact_embeddings=[[0.1, 0.2]],
+        facts=["User likes Python", "User works as engineer"],
+        fact_embeddings=[[0.1, 0.2], [0.3, 0.4]],
         conversation_id=456,
     )
 
     assert mock_conn.execute.call_count == 3
+    select_call = mock_conn.execute.call_args_list[1]
+    assert "uniq in (?,?)" in select_call[0][0].lower()
+    assert select_call[0][1] == (123, "uniq1", "uniq2")
+
     mention_call = mock_conn.execute.call_args_list[2]
     assert (
         "insert or ignore into memori_entity_fact_mention" in mention_call[0][0].lower()
     )
-    assert mention_call[0][1][1:] == (123, 789, 456)
+    params = mention_call[0][1]
+    assert params[1:4] == (123, 789, 456)
+    assert params[5:8] == (123, 790, 456)
 
 
 def test_entity_fact_get_embeddings(mock_conn, mock_multiple_results):
@@ -534,39 +611,185 @@ def test_entity_fact_delete_by_entity(mock_conn):
     result = entity_fact.delete_by_entity(123)
 
     assert result == entity_fact
-    assert mock_conn.execute.call_count == 1
+    assert mock_conn.execute.call_count == 2
     assert mock_conn.commit.call_count == 1
     delete_call = mock_conn.execute.call_args_list[0]
     assert "delete" in delete_call[0][0].lower()
     assert "from memori_entity_fact" in delete_call[0][0].lower()
     assert "where entity_id = ?" in delete_call[0][0].lower()
     assert delete_call[0][1] == (123,)
+    segment_call = mock_conn.execute.call_args_list[1]
+    assert "from memori_entity_fact_segment" in segment_call[0][0].lower()
+    assert segment_call[0][1] == (123,)
 
 
-def test_knowledge_graph_delete_by_entity(mock_conn):
+def test_knowledge_graph_delete_by_entity(mock_conn, mock_multiple_results):
+    mock_conn.execute.side_effect = [
+        mock_multiple_results(
+            [
+                {"subject_id": 1, "predicate_id": 3, "object_id": 5},
+                {"subject_id": 1, "predicate_id": 4, "object_id": 6},
+            ]
+        ),
+        None,
+        None,
+        None,
+        None,
+    ]
+
     knowledge_graph = Driver(mock_conn).knowledge_graph
     result = knowledge_graph.delete_by_entity(123)
 
     assert result == knowledge_graph
-    assert mock_conn.execute.call_count == 4
+    assert mock_conn.execute.call_count == 5
     assert mock_conn.commit.call_count == 1
-    kg_delete_call = mock_conn.execute.call_args_list[0]
+
+    select_call = mock_conn.execute.call_args_list[0]
+    assert "from memori_knowledge_graph" in select_call[0][0].lower()
+    assert select_call[0][1] == (123,)
+
+    kg_delete_call = mock_conn.execute.call_args_list[1]
     assert "delete" in kg_delete_call[0][0].lower()
     assert "from memori_knowledge_graph" in kg_delete_call[0][0].lower()
     assert "where entity_id = ?" in kg_delete_call[0][0].lower()
     assert kg_delete_call[0][1] == (123,)
 
-    subject_delete_call = mock_conn.execute.call_args_list[1]
-    assert "delete" in subject_delete_call[0][0].lower()
-    assert "from memori_subject" in subject_delete_call[0][0].lower()
-    assert "not exists" in subject_delete_call[0][0].lower()
+    for call, table, ids in zip(
+        mock_conn.execute.call_args_list[2:],
+        ("memori_subject", "memori_predicate", "memori_object"),
+        ((1,), (3, 4), (5, 6)),
+        strict=True,
+    ):
+        assert f"from {table}" in call[0][0].lower()
+        assert "not exists" in call[0][0].lower()
+        assert call[0][1] == ids
+
+
+def test_knowledge_graph_delete_by_entity_keeps_shared_dimensions(tmp_path):
+    import sqlite3
+
+    from memori._config import Config
+    from memori.storage._manager import Manager
+
+    db_path = str(tmp_path / "memori.db")
+    config = Config()
+    config.storage = Manager(config).start(lambda: sqlite3.connect(db_path))
+    config.storage.build()
+    driver = config.storage.driver
+
+    alice = driver.entity.create("alice")
+    bob = driver.entity.create("bob")
+    driver.knowledge_graph.create(alice, [_semantic_triple("alice", "likes", "tea")])
+    driver.knowledge_graph.create(bob, [_semantic_triple("bob", "likes", "tea")])
+
+    driver.knowledge_graph.delete_by_entity(alice)
+
+    def names(table, column):
+        rows = driver.knowledge_graph.conn.execute(
+            f"SELECT {column} FROM {table}"  # nosec B608
+        ).fetchall()
+        return sorted(row[0] for row in rows)
+
+    assert names("memori_subject", "name") == ["bob"]
+    assert names("memori_predicate", "content") == ["likes"]
+    assert names("memori_object", "name") == ["tea"]
+
+
+def _semantic_triple(subject, predicate, obj):
+    from memori.memory._struct import SemanticTriple
+
+    triple = SemanticTriple()
+    triple.subject_name, triple.subject_type = subject, "person"
+    triple.predicate = predicate
+    triple.object_name, triple.object_type = obj, "thing"
+    return triple
+
+
+def test_knowledge_graph_create_batches_dimensions_and_edges(
+    mock_conn, mock_multiple_results
+):
+    from memori._utils import generate_uniq
+
+    subject_uniq = generate_uniq(["alice", "person"])
+    predicate_uniq = generate_uniq(["likes"])
+    tea_uniq = generate_uniq(["tea", "thing"])
+    cake_uniq = generate_uniq(["cake", "thing"])
+    mock_conn.execute.side_effect = [
+        None,
+        mock_multiple_results([{"id": 1, "uniq": subject_uniq}]),
+        None,
+        mock_multiple_results([{"id": 2, "uniq": predicate_uniq}]),
+        None,
+        mock_multiple_results(
+            [{"id": 3, "uniq": tea_uniq}, {"id": 4, "uniq": cake_uniq}]
+        ),
+        None,
+    ]
+
+    knowledge_graph = Driver(mock_conn).knowledge_graph
+    knowledge_graph.create(
+        123,
+        [
+            _semantic_triple("alice", "likes", "tea"),
+            _semantic_triple("alice", "likes", "cake"),
+            _semantic_triple("Alice", "likes", "tea"),
+        ],
+    )
+
+    assert mock_conn.execute.call_count == 7
+    assert mock_conn.commit.call_count == 1
+
+    subject_insert = mock_conn.execute.call_args_list[0]
+    assert "insert or ignore into memori_subject" in subject_insert[0][0].lower()
+    assert len(subject_insert[0][1]) == 4
+
+    object_select = mock_conn.execute.call_args_list[5]
+    assert "where uniq in (?,?)" in object_select[0][0].lower()
+
+    edge_insert = mock_conn.execute.call_args_list[6]
+    assert "insert into memori_knowledge_graph" in edge_insert[0][0].lower()
+    assert "excluded.num_times" in edge_insert[0][0].lower()
+    assert edge_insert[0][1][1:6] == (123, 1, 2, 3, 2)
+    assert edge_insert[0][1][7:12] == (123, 1, 2, 4, 1)
+
+
+def test_knowledge_graph_create_empty(mock_conn):
+    knowledge_graph = Driver(mock_conn).knowledge_graph
+
+    assert knowledge_graph.create(123, []) == knowledge_graph
+    assert mock_conn.execute.call_count == 0
+    assert mock_conn.commit.call_count == 0
+
+
+def test_conversation_messages_create_many(mock_conn):
+    messages = ConversationMessages(mock_conn)
+    result = messages.create_many(
+        456,
+        [
+            {"role": "user", "type": None, "content": "Hello"},
+            {"role": "assistant", "type": "text", "content": "Hi"},
+        ],
+    )
+
+    assert result == messages
+    assert mock_conn.execute.call_count == 1
+    assert mock_conn.execute_many.call_count == 1
+
+    query, binds = mock_conn.execute_many.call_args[0]
+    assert "insert into memori_conversation_message" in query.lower()
+    assert [bind[1:] for bind in binds] == [
+        (456, "user", None, "Hello"),
+        (456, "assistant", "text", "Hi"),
+    ]
+    UUID(binds[0][0])
+    assert binds[0][0] != binds[1][0]
+
+    update_query, update_binds = mock_conn.execute.call_args[0]
+    assert "update memori_conversation" in update_query.lower()
+    assert update_binds == (456,)
+
 
-    predicate_delete_call = mock_conn.execute.call_args_list[2]
-    assert "delete" in predicate_delete_call[0][0].lower()
-    assert "from memori_predicate" in predicate_delete_call[0][0].lower()
-    assert "not exists" in predicate_delete_call[0][0].lower()
+def test_conversation_messages_create_many_empty(mock_conn):
+    ConversationMessages(mock_conn).create_many(456, [])
 
-    object_delete_call = mock_conn.execute.call_args_list[3]
-    assert "delete" in object_delete_call[0][0].lower()
-    assert "from memori_object" in object_delete_call[0][0].lower()
-    assert "not exists" in object_delete_call[0][0].lower()
+    assert mock_conn.execute_many.call_count == 0
@@ -0,0 +1,140 @@
+import gc
+import sqlite3
+from unittest.mock import Mock
+
+from memori.storage._connection import connection_context
+from memori.storage._id_cache import IdCache, get_id_cache
+from memori.storage._pool import ConnectionPool
+
+
+class _Factory:
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE memori_entity(
+                id INTEGER PRIMARY KEY,
+                uuid TEXT,
+                external_id TEXT UNIQUE
+            )
+            """
+        )
+        self.statements = []
+        self.conn.set_trace_callback(self.statements.append)
+
+    def __call__(self):
+        return self.conn, lambda: None
+
+
+def _conn(identity, dialect="sqlite"):
+    conn = Mock()
+    conn.identity = identity
+    conn.get_dialect.return_value = dialect
+    return conn
+
+
+def test_resolve_caches_by_connection_identity():
+    cache = IdCache()
+    create = Mock(return_value=7)
+
+    assert cache.resolve(_conn(1), "entity", "user-1", create) == 7
+    assert cache.resolve(_conn(1), "entity", "user-1", create) == 7
+    assert create.call_count == 1
+
+    cache.resolve(_conn(2), "entity", "user-1", create)
+    cache.resolve(_conn(1), "process", "user-1", create)
+    cache.resolve(_conn(1, "postgresql"), "entity", "user-1", create)
+    assert create.call_count == 4
+
+
+def test_resolve_without_identity_does_not_cache():
+    cache = IdCache()
+    create = Mock(return_value=7)
+
+    cache.resolve(_conn(None), "entity", "user-1", create)
+    cache.resolve(_conn(None), "entity", "user-1", create)
+
+    assert create.call_count == 2
+
+
+def test_resolve_does_not_cache_missing_ids():
+    cache = IdCache()
+    create = Mock(side_effect=[None, 7])
+
+    assert cache.resolve(_conn(1), "entity", "user-1", create) is None
+    assert cache.resolve(_conn(1), "entity", "user-1", create) == 7
+
+
+def test_resolve_evicts_least_recently_used():
+    cache = IdCache(max_size=2)
+    conn = _conn(1)
+
+    cache.resolve(conn, "entity", "a", lambda: 1)
+    cache.resolve(conn, "entity", "b", lambda: 2)
+    cache.resolve(conn, "entity", "a", lambda: 0)
+    cache.resolve(conn, "entity", "c", lambda: 3)
+
+    assert cache.resolve(conn, "entity", "a", lambda: 0) == 1
+    assert cache.resolve(conn, "entity", "b", lambda: 0) == 0
+
+
+def test_identity_unwraps_pool():
+    cache = IdCache()
+    factory = _Factory()
+    pool = ConnectionPool(factory, max_size=1, max_lifetime=60)
+
+    assert cache.identity(pool) == cache.identity(factory) == id(factory)
+    assert cache.identity(None) is None
+
+
+def test_identity_entries_dropped_when_factory_collected():
+    cache = IdCache()
+    factory = _Factory()
+    identity = cache.identity(factory)
+    cache.resolve(_conn(identity), "entity", "user-1", lambda: 7)
+
+    del factory
+    gc.collect()
+
+    assert cache.resolve(_conn(identity), "entity", "user-1", lambda: 8) == 8
+
+
+def test_entity_create_skips_database_once_cached():
+    get_id_cache().clear()
+    factory = _Factory()
+
+    with connection_context(factory) as (_conn, _adapter, driver):
+        entity_id = driver.entity.create("user-1")
+    assert any("INSERT" in statement for statement in factory.statements)
+
+    factory.statements.clear()
+    with connection_context(factory) as (_conn, _adapter, driver):
+        assert driver.entity.create("user-1") == entity_id
+
+    assert not any("memori_entity" in s for s in factory.statements)
+
+
+def test_forget_callbacks_run_when_factory_collected():
+    cache = IdCache()
+    forgotten = []
+    cache.on_forget(forgotten.append)
+    factory = _Factory()
+    identity = cache.identity(factory)
+
+    del factory
+    gc.collect()
+
+    assert forgotten == [identity]
+
+
+def test_forget_reentrant_while_lock_held():
+    # A finalizer can fire from a collection triggered inside the lock.
+    cache = IdCache()
+    factory = _Factory()
+    identity = cache.identity(factory)
+    cache.resolve(_conn(identity), "entity", "user-1", lambda: 7)
+
+    with cache._lock:
+        cache._forget(identity)
+
+    assert cache.resolve(_conn(identity), "entity", "user-1", lambda: 8) == 8
@@ -0,0 +1,177 @@
+import sqlite3
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from memori.storage._connection import connection_context
+from memori.storage._pool import ConnectionPool, pooled_factory
+
+
+class _Factory:
+    def __init__(self):
+        self.conns = []
+
+    def __call__(self):
+        conn = sqlite3.connect(":memory:")
+        self.conns.append(conn)
+        return conn
+
+
+def _pool(factory, **kwargs):
+    kwargs.setdefault("max_size", 4)
+    kwargs.setdefault("max_lifetime", 1800)
+    return ConnectionPool(factory, **kwargs)
+
+
+def test_pool_reuses_connection_on_same_thread():
+    factory = _Factory()
+    pool = _pool(factory)
+
+    for _ in range(3):
+        with connection_context(pool) as (_conn, _adapter, driver):
+            assert driver is not None
+
+    assert len(factory.conns) == 1
+    factory.conns[0].execute("SELECT 1")  # still open
+
+
+def test_pool_keeps_connections_per_thread():
+    factory = _Factory()
+    pool = _pool(factory)
+
+    conn, release = pool()
+    release()
+
+    seen = []
+
+    def worker():
+        other, other_release = pool()
+        seen.append(other)
+        other_release()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not conn
+    assert pool()[0] is conn
+
+
+def test_pool_prunes_connections_of_dead_threads():
+    factory = _Factory()
+    pool = _pool(factory, max_size=1)
+
+    def worker():
+        _conn, release = pool()
+        release()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    conn, _release = pool()
+    assert conn is factory.conns[1]
+    assert len(factory.conns) == 2
+
+
+def test_pool_overflow_connections_are_not_pooled():
+    factory = _Factory()
+    pool = _pool(factory, max_size=1)
+
+    first = pool()
+    overflow = pool()
+
+    assert isinstance(first, tuple)
+    assert overflow is factory.conns[1]
+
+
+def test_pool_replaces_expired_connections():
+    factory = _Factory()
+    pool = _pool(factory, max_lifetime=0)
+
+    _conn, release = pool()
+    release()
+    pool()
+
+    assert len(factory.conns) == 2
+
+
+class _PingConnection:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.closed = False
+
+    def cursor(self):
+        raise NotImplementedError
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def ping(self):
+        if not self.alive:
+            raise ConnectionError("server has gone away")
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_replaces_unhealthy_connections():
+    broken = _PingConnection(alive=False)
+    healthy = _PingConnection()
+    factory = Mock(side_effect=[broken, healthy])
+    factory.__self__ = None
+    pool = _pool(factory, health_check_interval=0)
+
+    conn, release = pool()
+    assert conn is broken
+    release()
+
+    conn, _release = pool()
+    assert conn is healthy
+    assert broken.closed
+
+
+def test_pool_passes_through_non_dbapi_resources():
+    release = Mock()
+    resource = (Mock(), release)
+    factory = Mock(return_value=resource)
+    factory.__self__ = None
+    pool = _pool(factory)
+
+    assert pool() is resource
+    assert pool() is resource
+    assert factory.call_count == 2
+
+
+def test_pool_passes_through_pool_methods():
+    class ConnectionPoolLike:
+        __module__ = "psycopg_pool.pool"
+
+        def getconn(self):
+            return sqlite3.connect(":memory:")
+
+    pool = _pool(ConnectionPoolLike().getconn)
+
+    assert isinstance(pool(), sqlite3.Connection)
+
+
+def test_pool_close_closes_idle_connections():
+    factory = _Factory()
+    pool = _pool(factory)
+
+    _conn, release = pool()
+    release()
+    pool.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        factory.conns[0].execute("SELECT 1")
+
+
+def test_pooled_factory_disabled_with_zero_size():
+    factory = Mock()
+    assert pooled_factory(factory, 0, 1800) is factory
+    assert isinstance(pooled_factory(factory, 2, 1800), ConnectionPool)
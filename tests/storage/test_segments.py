@@ -0,0 +1,134 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from memori._config import Config
+from memori.search import search_facts
+from memori.search._parsing import parse_embedding
+from memori.storage._manager import Manager
+from memori.storage._segments import SEGMENT_COMPACT_THRESHOLD
+
+
+@pytest.fixture
+def driver(tmp_path):
+    db_path = str(tmp_path / "memori.db")
+    config = Config()
+    config.storage = Manager(config).start(lambda: sqlite3.connect(db_path))
+    config.storage.build()
+    return config.storage.driver
+
+
+def _vector(seed):
+    return np.random.default_rng(seed).random(8, dtype=np.float32).tolist()
+
+
+def _add(driver, entity_id, *seeds):
+    driver.entity_fact.create(
+        entity_id,
+        [f"fact {seed}" for seed in seeds],
+        [_vector(seed) for seed in seeds],
+    )
+
+
+def _segment_count(driver, entity_id):
+    return driver.entity_fact.conn.execute(
+        "SELECT COUNT(*) FROM memori_entity_fact_segment WHERE entity_id = ?",
+        (entity_id,),
+    ).fetchone()[0]
+
+
+def _assert_matches_rows(driver, entity_id, packed):
+    fact_ids, matrix = packed
+    rows = driver.entity_fact.get_embeddings(entity_id, 1000)
+    expected = {row["id"]: parse_embedding(row["content_embedding"]) for row in rows}
+
+    assert sorted(fact_ids.tolist()) == sorted(expected)
+    for fact_id, vector in zip(fact_ids.tolist(), matrix, strict=True):
+        np.testing.assert_array_equal(vector, expected[fact_id])
+
+
+def test_segments_built_on_first_read(driver):
+    entity_id = driver.entity.create("user-1")
+    _add(driver, entity_id, 1, 2, 3)
+
+    packed = driver.entity_fact.get_embedding_segments(entity_id, 1000)
+
+    assert packed[1].shape == (3, 8)
+    assert packed[1].flags.writeable
+    _assert_matches_rows(driver, entity_id, packed)
+    assert _segment_count(driver, entity_id) == 1
+
+
+def test_new_facts_are_appended_as_a_segment(driver):
+    entity_id = driver.entity.create("user-1")
+    _add(driver, entity_id, 1, 2)
+    driver.entity_fact.get_embedding_segments(entity_id, 1000)
+
+    _add(driver, entity_id, 3)
+    packed = driver.entity_fact.get_embedding_segments(entity_id, 1000)
+
+    _assert_matches_rows(driver, entity_id, packed)
+    assert _segment_count(driver, entity_id) == 2
+
+
+def test_segments_are_compacted(driver):
+    entity_id = driver.entity.create("user-1")
+    for seed in range(SEGMENT_COMPACT_THRESHOLD + 1):
+        _add(driver, entity_id, seed)
+        driver.entity_fact.get_embedding_segments(entity_id, 1000)
+
+    assert _segment_count(driver, entity_id) == 1
+    packed = driver.entity_fact.get_embedding_segments(entity_id, 1000)
+    assert len(packed[0]) == SEGMENT_COMPACT_THRESHOLD + 1
+    _assert_matches_rows(driver, entity_id, packed)
+
+
+def test_stale_segments_are_rebuilt(driver):
+    entity_id = driver.entity.create("user-1")
+    _add(driver, entity_id, 1, 2, 3)
+    driver.entity_fact.get_embedding_segments(entity_id, 1000)
+
+    driver.entity_fact.conn.execute(
+        "DELETE FROM memori_entity_fact WHERE content = ?", ("fact 2",)
+    )
+    driver.entity_fact.conn.commit()
+    _add(driver, entity_id, 4)
+    packed = driver.entity_fact.get_embedding_segments(entity_id, 1000)
+
+    assert len(packed[0]) == 3
+    _assert_matches_rows(driver, entity_id, packed)
+    assert _segment_count(driver, entity_id) == 1
+
+
+def test_falls_back_to_rows_above_limit(driver):
+    entity_id = driver.entity.create("user-1")
+    _add(driver, entity_id, 1, 2, 3)
+
+    assert driver.entity_fact.get_embedding_segments(entity_id, 2) is None
+    assert driver.entity_fact.get_embedding_segments(entity_id + 1, 10) is None
+
+
+def test_delete_by_entity_drops_segments(driver):
+    entity_id = driver.entity.create("user-1")
+    _add(driver, entity_id, 1, 2)
+    driver.entity_fact.get_embedding_segments(entity_id, 1000)
+
+    driver.entity_fact.delete_by_entity(entity_id)
+
+    assert _segment_count(driver, entity_id) == 0
+
+
+def test_search_with_segments_matches_rows(driver):
+    entity_id = driver.entity.create("user-1")
+    _add(driver, entity_id, *range(10))
+
+    query = _vector(4)
+    from_rows = search_facts(driver.entity_fact, entity_id, query, 3, 1000)
+    from_segments = search_facts(
+        driver.entity_fact, entity_id, query, 3, 1000, use_segments=True
+    )
+
+    assert [f.id for f in from_segments] == [f.id for f in from_rows]
+    assert from_segments[0].content == "fact 4"
+    assert _segment_count(driver, entity_id) == 1
@@ -0,0 +1,156 @@
+import sqlite3
+import threading
+
+import pytest
+
+from memori._config import Config
+from memori.storage._manager import Manager
+from memori.storage._sqlite_profile import (
+    SqliteProfile,
+    database_path,
+    get_sqlite_profile,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "memori.db")
+
+
+@pytest.fixture
+def profile(db_path):
+    profile = SqliteProfile(db_path, read_pool_size=2, max_lifetime=60)
+    profile.writer.execute("CREATE TABLE t(id INTEGER PRIMARY KEY, v TEXT)")
+    yield profile
+    profile.readers.close()
+    profile.writer.close()
+
+
+def test_profile_enables_wal_and_pragmas(profile):
+    assert profile.writer.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert profile.writer.execute("PRAGMA synchronous").fetchone() == (1,)
+
+    conn, release = profile()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        assert cursor.fetchall() == [(1,)]
+    finally:
+        release()
+
+
+def test_reads_use_read_only_connection(profile):
+    conn, release = profile()
+    try:
+        assert not conn._writing
+        with pytest.raises(sqlite3.OperationalError):
+            conn._reader.execute("INSERT INTO t(v) VALUES ('x')")
+    finally:
+        release()
+
+
+def test_writes_go_through_writer_and_are_visible_after_commit(profile):
+    writer, release_writer = profile()
+    reader, release_reader = profile()
+    try:
+        writer.cursor().execute("INSERT INTO t(v) VALUES (?)", ("a",))
+        cursor = writer.cursor()
+        cursor.execute("SELECT v FROM t")
+        assert cursor.fetchall() == [("a",)]
+
+        cursor = reader.cursor()
+        cursor.execute("SELECT v FROM t")
+        assert cursor.fetchall() == []
+
+        writer.commit()
+        cursor = reader.cursor()
+        cursor.execute("SELECT v FROM t")
+        assert cursor.fetchall() == [("a",)]
+    finally:
+        release_writer()
+        release_reader()
+
+
+def test_writer_is_held_until_commit(profile):
+    profile.busy_timeout = 0.05
+    first, release_first = profile()
+    second, release_second = profile()
+    try:
+        first.cursor().execute("INSERT INTO t(v) VALUES ('a')")
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            second.cursor().execute("INSERT INTO t(v) VALUES ('b')")
+
+        first.commit()
+        second.cursor().execute("INSERT INTO t(v) VALUES ('b')")
+        second.commit()
+    finally:
+        release_first()
+        release_second()
+
+    assert profile.writer.execute("SELECT COUNT(*) FROM t").fetchone() == (2,)
+
+
+def test_release_rolls_back_uncommitted_writes(profile):
+    conn, release = profile()
+    conn.cursor().execute("INSERT INTO t(v) VALUES ('a')")
+    release()
+
+    assert profile.writer.execute("SELECT COUNT(*) FROM t").fetchone() == (0,)
+    assert profile.writer_lock.acquire(blocking=False)
+    profile.writer_lock.release()
+
+
+def test_database_path(db_path):
+    assert database_path(sqlite3.connect(":memory:")) is None
+    assert database_path(object()) is None
+    assert database_path(sqlite3.connect(db_path)).endswith("memori.db")
+
+
+def test_profile_is_shared_per_file(db_path):
+    first = get_sqlite_profile(
+        sqlite3.connect(db_path), read_pool_size=2, max_lifetime=60
+    )
+    second = get_sqlite_profile(
+        sqlite3.connect(db_path), read_pool_size=2, max_lifetime=60
+    )
+
+    assert first is second
+    assert (
+        get_sqlite_profile(
+            sqlite3.connect(":memory:"), read_pool_size=2, max_lifetime=60
+        )
+        is None
+    )
+
+
+def test_manager_uses_profile_when_enabled(db_path):
+    config = Config()
+    config.storage_config.sqlite_wal = True
+    config.storage = Manager(config).start(lambda: sqlite3.connect(db_path))
+    config.storage.build()
+
+    assert isinstance(config.storage.conn_factory, SqliteProfile)
+    entity_id = config.storage.driver.entity.create("user-1")
+
+    results = []
+
+    def read():
+        conn = sqlite3.connect(db_path)
+        results.append(
+            conn.execute(
+                "SELECT id FROM memori_entity WHERE external_id = 'user-1'"
+            ).fetchone()
+        )
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    thread.join()
+
+    assert results == [(entity_id,)]
+
+
+def test_manager_ignores_profile_by_default(db_path):
+    config = Config()
+    config.storage = Manager(config).start(lambda: sqlite3.connect(db_path))
+
+    assert not isinstance(config.storage.conn_factory, SqliteProfile)
@@ -112,3 +112,174 @@ def test_manager_start_with_none_conn_does_not_set_flag():
     manager.start(None)
 
     assert config.storage_config.cockroachdb == original_value
+
+
+def test_manager_start_wraps_callable_in_connection_pool():
+    from memori.storage._pool import ConnectionPool
+
+    config = Config()
+    factory = Mock()
+
+    with patch("memori.storage._manager.Registry"):
+        manager = Manager(config).start(factory)
+
+    assert isinstance(manager.conn_factory, ConnectionPool)
+    assert manager.conn_factory.factory is factory
+
+
+def test_manager_start_skips_pool_when_disabled():
+    config = Config()
+    config.storage_config.pool_size = 0
+    factory = Mock()
+
+    with patch("memori.storage._manager.Registry"):
+        manager = Manager(config).start(factory)
+
+    assert manager.conn_factory is factory
+
+
+def test_manager_start_configures_driver():
+    config = Config()
+    manager = Manager(config)
+
+    mock_adapter = Mock()
+    mock_adapter.get_dialect.return_value = "oracle"
+    mock_driver = Mock()
+
+    with patch("memori.storage._manager.Registry") as mock_registry_class:
+        mock_registry = Mock()
+        mock_registry.adapter.return_value = mock_adapter
+        mock_registry.driver.return_value = mock_driver
+        mock_registry_class.return_value = mock_registry
+
+        manager.start(Mock())
+
+    mock_driver.configure.assert_called_once_with(config.storage_config)
+
+
+def _sqlite_manager(tmp_path, **storage_config):
+    import sqlite3
+
+    config = Config()
+    for name, value in storage_config.items():
+        setattr(config.storage_config, name, value)
+    primary = str(tmp_path / "primary.db")
+    replica = str(tmp_path / "replica.db")
+    return Manager(config).start(
+        lambda: sqlite3.connect(primary), read_conn=lambda: sqlite3.connect(replica)
+    )
+
+
+def test_manager_without_read_conn_reads_from_primary():
+    config = Config()
+    mock_driver = Mock()
+
+    with patch("memori.storage._manager.Registry") as mock_registry_class:
+        mock_registry_class.return_value.driver.return_value = mock_driver
+        manager = Manager(config).start(Mock())
+
+    assert manager.read_conn_factory is None
+    assert manager.read_driver is mock_driver
+    assert manager.reader(1) is mock_driver
+
+
+def test_manager_start_with_read_conn_builds_replica_driver(tmp_path):
+    manager = _sqlite_manager(tmp_path)
+
+    assert manager.read_driver is not manager.driver
+    assert manager.read_adapter.identity == manager.adapter.identity
+
+    with manager.read_conn as (_conn, adapter, _driver):
+        rows = adapter.execute("PRAGMA database_list").fetchall()
+        assert rows[0][2].endswith("replica.db")
+        assert adapter.identity == manager.adapter.identity
+
+
+def test_manager_reader_reads_own_writes_from_primary(tmp_path, monkeypatch):
+    import time
+
+    manager = _sqlite_manager(tmp_path)
+    manager.mark_written(7)
+
+    assert manager.reader(7) is manager.driver
+    assert manager.reader(8) is manager.read_driver
+    assert manager.reader() is manager.read_driver
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 5)
+    assert manager.reader(7) is manager.read_driver
+
+
+def test_manager_reader_without_read_your_writes(tmp_path):
+    manager = _sqlite_manager(tmp_path, read_your_writes=False)
+    manager.mark_written(7)
+
+    assert manager.reader(7) is manager.read_driver
+
+
+def test_manager_start_rejects_replica_of_another_dialect():
+    import pytest
+
+    config = Config()
+    primary, replica = Mock(), Mock()
+    primary.get_dialect.return_value = "postgresql"
+    replica.get_dialect.return_value = "mysql"
+
+    with patch("memori.storage._manager.Registry") as mock_registry_class:
+        mock_registry_class.return_value.adapter.side_effect = [primary, replica]
+        with pytest.raises(ValueError, match="replica"):
+            Manager(config).start(Mock(), read_conn=Mock())
+
+
+def test_manager_end_read_ends_replica_transaction(tmp_path):
+    manager = _sqlite_manager(tmp_path)
+    manager.read_adapter.execute("CREATE TABLE t (id INTEGER)")
+    manager.read_adapter.execute("INSERT INTO t VALUES (1)")
+    assert manager.read_adapter.conn.in_transaction
+
+    manager.end_read(manager.read_driver)
+
+    assert not manager.read_adapter.conn.in_transaction
+
+
+def test_manager_end_read_leaves_primary_alone(tmp_path):
+    manager = _sqlite_manager(tmp_path)
+    manager.adapter.execute("CREATE TABLE t (id INTEGER)")
+    manager.adapter.execute("INSERT INTO t VALUES (1)")
+
+    manager.end_read(manager.driver)
+
+    assert manager.adapter.conn.in_transaction
+
+
+def test_manager_close_closes_pooled_connections(tmp_path):
+    import sqlite3
+
+    import pytest
+
+    manager = _sqlite_manager(tmp_path)
+    with manager.conn as (_conn, adapter, _driver):
+        pooled = adapter.conn
+    with manager.read_conn as (_conn, adapter, _driver):
+        pooled_read = adapter.conn
+
+    manager.close()
+
+    for conn in (pooled, pooled_read):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    assert manager.conn_factory._closed
+    assert manager.read_conn_factory._closed
+
+
+def test_manager_close_leaves_user_connection_factory_alone():
+    config = Config()
+    config.storage_config.pool_size = 0
+    factory = Mock()
+
+    with patch("memori.storage._manager.Registry"):
+        manager = Manager(config).start(factory)
+    manager.close()
+
+    manager.adapter.close.assert_called_once_with()
+    factory.close.assert_not_called()
@@ -89,3 +89,15 @@ def test_storage_driver_raises_for_unsupported_dialect(mocker):
 
     with pytest.raises(RuntimeError, match="Unsupported database dialect"):
         Registry().driver(fake_adapter)
+
+
+def test_storage_sharded_conn_uses_sharded_driver():
+    """Test that a ShardedConn is served by the sharded adapter and driver."""
+    from memori.storage.adapters.sharded import Adapter, ShardedConn
+    from memori.storage.drivers.sharded import Driver
+
+    adapter = Registry().adapter(lambda: ShardedConn([lambda: None]))
+    driver = Registry().driver(adapter)
+
+    assert isinstance(adapter, Adapter)
+    assert isinstance(driver, Driver)
@@ -0,0 +1,186 @@
+import json
+import sqlite3
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from memori._config import Config
+from memori.memory._struct import SemanticTriple
+from memori.search._parsing import parse_embedding
+from memori.storage._manager import Manager
+from memori.storage._transfer import (
+    MANIFEST,
+    export_entity,
+    import_entity,
+    read_manifest,
+)
+
+
+def _config(path):
+    config = Config()
+    config.storage = Manager(config).start(lambda: sqlite3.connect(path))
+    config.storage.build()
+    return config
+
+
+def _vector(seed):
+    return np.random.default_rng(seed).random(8, dtype=np.float32).tolist()
+
+
+def _triple(subject, predicate, obj):
+    triple = SemanticTriple()
+    triple.subject_name = subject
+    triple.subject_type = "person"
+    triple.predicate = predicate
+    triple.object_name = obj
+    triple.object_type = "thing"
+    return triple
+
+
+def _populate(config):
+    driver = config.storage.driver
+    entity_id = driver.entity.create("user-1")
+    process_id = driver.process.create("app-1")
+
+    conversation_ids = []
+    for i in range(3):
+        session_id = driver.session.create(str(uuid4()), entity_id, process_id)
+        conversation_id = driver.conversation.create(session_id, 30)
+        driver.conversation.update(conversation_id, f"summary {i}")
+        driver.conversation.messages.create_many(
+            conversation_id,
+            [
+                {"role": "user", "type": None, "content": f"question {i}"},
+                {"role": "assistant", "type": "text", "content": f"answer {i}"},
+            ],
+        )
+        conversation_ids.append(conversation_id)
+
+    facts = [f"fact {i}" for i in range(5)]
+    embeddings = [_vector(i) for i in range(5)]
+    driver.entity_fact.create(entity_id, facts, embeddings, conversation_ids[0])
+    driver.entity_fact.create(entity_id, facts[:2], embeddings[:2], conversation_ids[2])
+
+    driver.knowledge_graph.create(
+        entity_id,
+        [_triple("alice", "likes", "tea"), _triple("alice", "owns", "cat")],
+    )
+    driver.knowledge_graph.create(entity_id, [_triple("alice", "likes", "tea")])
+    config.storage.adapter.commit()
+
+
+def _snapshot(config):
+    driver = config.storage.driver
+    entity_id = driver.entity.create("user-1")
+
+    conversations = driver.conversation.export(entity_id)
+    position = {row["id"]: i for i, row in enumerate(conversations)}
+    facts = driver.entity_fact.export(entity_id)
+    mentions = {}
+    for mention in driver.entity_fact.read_mentions([row["id"] for row in facts]):
+        mentions.setdefault(mention["fact_id"], set()).add(
+            position[mention["conversation_id"]]
+        )
+
+    return {
+        "conversations": [
+            (
+                str(row["session_uuid"]),
+                row["process_external_id"],
+                row["summary"],
+                [
+                    (m["role"], m["content"])
+                    for m in driver.conversation.messages.read(row["id"])
+                ],
+            )
+            for row in conversations
+        ],
+        "facts": sorted(
+            (
+                row["content"],
+                row["num_times"],
+                tuple(parse_embedding(row["content_embedding"]).tolist()),
+                tuple(sorted(mentions.get(row["id"], ()))),
+            )
+            for row in facts
+        ),
+        "triples": sorted(
+            tuple(row[k] for k in row if k != "id")
+            for row in driver.knowledge_graph.export(entity_id)
+        ),
+    }
+
+
+def test_round_trip(tmp_path):
+    source = _config(str(tmp_path / "source.db"))
+    _populate(source)
+
+    counts = export_entity(source, "user-1", str(tmp_path / "export"), chunk_size=2)
+    assert counts == {"conversations": 3, "facts": 5, "triples": 2}
+
+    manifest = read_manifest(str(tmp_path / "export"))
+    assert manifest["entity_id"] == "user-1"
+    assert len(manifest["chunks"]["facts"]) == 3
+
+    target = _config(str(tmp_path / "target.db"))
+    assert import_entity(target, "user-1", str(tmp_path / "export")) == counts
+    target.storage.adapter.commit()
+
+    expected = _snapshot(source)
+    assert _snapshot(target) == expected
+    assert [f[1] for f in expected["facts"]] == [2, 2, 1, 1, 1]
+    assert expected["facts"][0][3] == (0, 2)
+
+
+def test_export_of_entity_without_memories_is_empty(tmp_path):
+    config = _config(str(tmp_path / "memori.db"))
+    config.storage.driver.entity.create("user-1")
+
+    counts = export_entity(config, "user-1", str(tmp_path / "export"))
+
+    assert counts == {"conversations": 0, "facts": 0, "triples": 0}
+    assert read_manifest(str(tmp_path / "export"))["chunks"] == {}
+
+
+def test_export_of_unknown_entity_raises_without_writing(tmp_path):
+    path = str(tmp_path / "memori.db")
+    config = _config(path)
+
+    with pytest.raises(ValueError, match="nobody"):
+        export_entity(config, "nobody", str(tmp_path / "export"))
+
+    assert not (tmp_path / "export").exists()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM memori_entity").fetchone() == (0,)
+
+
+def test_read_manifest_rejects_other_formats(tmp_path):
+    with open(tmp_path / MANIFEST, "w") as f:
+        json.dump({"format": "memori-export", "version": 99}, f)
+    with pytest.raises(ValueError, match="version 99"):
+        read_manifest(str(tmp_path))
+
+    with open(tmp_path / MANIFEST, "w") as f:
+        json.dump({"format": "other"}, f)
+    with pytest.raises(ValueError, match="not a Memori export"):
+        read_manifest(str(tmp_path))
+
+
+def test_import_into_sharded_storage(tmp_path):
+    from memori.storage.adapters.sharded import ShardedConn
+
+    source = _config(str(tmp_path / "source.db"))
+    _populate(source)
+    export_entity(source, "user-1", str(tmp_path / "export"))
+
+    paths = [str(tmp_path / f"shard-{i}.db") for i in range(2)]
+    target = Config()
+    target.storage = Manager(target).start(
+        ShardedConn([lambda path=path: sqlite3.connect(path) for path in paths])
+    )
+    target.storage.build()
+    import_entity(target, "user-1", str(tmp_path / "export"))
+    target.storage.adapter.commit()
+
+    assert _snapshot(target) == _snapshot(source)
@@ -99,6 +99,13 @@ class TestCliEntrypoint:
         captured = capsys.readouterr()
         assert "usage" in captured.out.lower()
 
+    @pytest.mark.parametrize("command", ["export", "import"])
+    def test_transfer_missing_arguments_shows_usage(self, command, capsys):
+        exit_code = self.run_main_with_args([command, "app:conn"])
+        assert exit_code != 0
+        captured = capsys.readouterr()
+        assert f"usage: python -m memori {command}" in captured.out.lower()
+
     @mock.patch("memori.__main__.CockroachDBClusterManager")
     def test_cockroachdb_cluster_start_dispatches_correctly(
         self, mock_manager_cls, capsys
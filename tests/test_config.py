@@ -56,3 +56,89 @@ def test_rust_core_env_override(monkeypatch):
     monkeypatch.setenv("MEMORI_USE_RUST_CORE", "true")
     config = Config()
     assert config.use_rust_core is True
+
+
+def test_embeddings_warmup_env_override(monkeypatch):
+    monkeypatch.setenv("MEMORI_EMBEDDINGS_WARMUP", "1")
+    config = Config()
+    assert config.embeddings.warmup is True
+
+
+def test_embeddings_executor_env_overrides(monkeypatch):
+    monkeypatch.setenv("MEMORI_EMBEDDINGS_WORKERS", "4")
+    monkeypatch.setenv("MEMORI_EMBEDDINGS_QUEUE_SIZE", "32")
+    config = Config()
+    assert config.embeddings.executor_workers == 4
+    assert config.embeddings.executor_queue_size == 32
+
+
+def test_storage_pool_env_overrides(monkeypatch):
+    monkeypatch.setenv("MEMORI_STORAGE_POOL_SIZE", "0")
+    monkeypatch.setenv("MEMORI_STORAGE_POOL_MAX_LIFETIME", "60")
+    config = Config()
+    assert config.storage_config.pool_size == 0
+    assert config.storage_config.pool_max_lifetime_seconds == 60
+
+
+def test_storage_sqlite_wal_env_overrides(monkeypatch):
+    assert Config().storage_config.sqlite_wal is False
+    monkeypatch.setenv("MEMORI_SQLITE_WAL", "1")
+    monkeypatch.setenv("MEMORI_SQLITE_READ_POOL_SIZE", "2")
+    config = Config()
+    assert config.storage_config.sqlite_wal is True
+    assert config.storage_config.sqlite_read_pool_size == 2
+
+
+def test_storage_embedding_segments_env_override(monkeypatch):
+    assert Config().storage_config.embedding_segments is False
+    monkeypatch.setenv("MEMORI_EMBEDDING_SEGMENTS", "1")
+    assert Config().storage_config.embedding_segments is True
+
+
+def test_storage_cockroachdb_follower_reads_env_overrides(monkeypatch):
+    config = Config()
+    assert config.storage_config.cockroachdb_follower_reads is False
+    assert config.storage_config.cockroachdb_follower_read_staleness_seconds == 0
+
+    monkeypatch.setenv("MEMORI_COCKROACHDB_FOLLOWER_READS", "1")
+    monkeypatch.setenv("MEMORI_COCKROACHDB_FOLLOWER_READ_STALENESS", "30")
+    config = Config()
+    assert config.storage_config.cockroachdb_follower_reads is True
+    assert config.storage_config.cockroachdb_follower_read_staleness_seconds == 30
+
+
+def test_storage_oracle_batch_size_env_override(monkeypatch):
+    assert Config().storage_config.oracle_batch_size == 1000
+    monkeypatch.setenv("MEMORI_ORACLE_BATCH_SIZE", "200")
+    assert Config().storage_config.oracle_batch_size == 200
+
+
+def test_storage_read_your_writes_env_override(monkeypatch):
+    config = Config()
+    assert config.storage_config.read_your_writes is True
+    assert config.storage_config.read_your_writes_seconds == 5
+
+    monkeypatch.setenv("MEMORI_STORAGE_READ_YOUR_WRITES", "0")
+    monkeypatch.setenv("MEMORI_STORAGE_READ_YOUR_WRITES_SECONDS", "30")
+    config = Config()
+    assert config.storage_config.read_your_writes is False
+    assert config.storage_config.read_your_writes_seconds == 30
+
+
+def test_history_window_env_overrides(monkeypatch):
+    config = Config()
+    assert config.history.max_messages == 0
+    assert config.history.max_tokens == 0
+    assert config.history.token_counter is None
+
+    monkeypatch.setenv("MEMORI_HISTORY_MAX_MESSAGES", "20")
+    monkeypatch.setenv("MEMORI_HISTORY_MAX_TOKENS", "4000")
+    config = Config()
+    assert config.history.max_messages == 20
+    assert config.history.max_tokens == 4000
+
+
+def test_history_cache_env_override(monkeypatch):
+    assert Config().history.cache is False
+    monkeypatch.setenv("MEMORI_HISTORY_CACHE", "1")
+    assert Config().history.cache is True
@@ -169,6 +169,43 @@ def test_set_session_resets_cache(mocker):
     assert mem.config.cache.session_id is None
 
 
+def test_warmup_starts_background_embedding_load(mocker):
+    mock_conn = mocker.Mock(spec=["cursor", "commit", "rollback"])
+    mock_conn.__module__ = "psycopg"
+    type(mock_conn).__module__ = "psycopg"
+    mock_cursor = mocker.MagicMock()
+    mock_conn.cursor = mocker.MagicMock(return_value=mock_cursor)
+
+    warmup = mocker.Mock()
+    warmup.is_ready.return_value = False
+    start = mocker.patch(
+        "memori.embeddings._warmup.warmup_embeddings", return_value=warmup
+    )
+
+    mem = Memori(conn=lambda: mock_conn, warmup=True)
+
+    start.assert_called_once_with(mem.config.embeddings.model)
+    assert mem.is_ready() is False
+    warmup.is_ready.return_value = True
+    assert mem.is_ready() is True
+
+
+def test_warmup_disabled_by_default(mocker, monkeypatch):
+    monkeypatch.delenv("MEMORI_EMBEDDINGS_WARMUP", raising=False)
+    mock_conn = mocker.Mock(spec=["cursor", "commit", "rollback"])
+    mock_conn.__module__ = "psycopg"
+    type(mock_conn).__module__ = "psycopg"
+    mock_cursor = mocker.MagicMock()
+    mock_conn.cursor = mocker.MagicMock(return_value=mock_cursor)
+
+    start = mocker.patch("memori.embeddings._warmup.warmup_embeddings")
+
+    mem = Memori(conn=lambda: mock_conn)
+
+    start.assert_not_called()
+    assert mem.is_ready() is True
+
+
 def test_embed_texts_uses_config_defaults(mocker):
     mock_conn = mocker.Mock(spec=["cursor", "commit", "rollback"])
     mock_conn.__module__ = "psycopg"
@@ -270,3 +307,49 @@ def test_delete_entity_memories_rejected_for_cockroach_connection_string(
 
     assert mem.config.byodb is False
     assert str(e.value) == "delete_entity_memories is only available in BYODB mode"
+
+
+def test_export_and_import_memories_round_trip(tmp_path):
+    import sqlite3
+
+    source = Memori(conn=lambda: sqlite3.connect(str(tmp_path / "source.db")))
+    source.config.storage.build()
+    source.attribution(entity_id="user-1")
+    driver = source.config.storage.driver
+    driver.entity_fact.create(driver.entity.create("user-1"), ["fact"], [[0.5] * 4])
+
+    assert source.export_memories(str(tmp_path / "export")) == {
+        "conversations": 0,
+        "facts": 1,
+        "triples": 0,
+    }
+
+    target = Memori(conn=lambda: sqlite3.connect(str(tmp_path / "target.db")))
+    target.config.storage.build()
+    assert target.import_memories(str(tmp_path / "export"))["facts"] == 1
+    driver = target.config.storage.driver
+    rows = driver.entity_fact.export(driver.entity.create("user-1"))
+    assert [row["content"] for row in rows] == ["fact"]
+
+
+def test_export_memories_requires_entity_id(tmp_path):
+    import sqlite3
+
+    mem = Memori(conn=lambda: sqlite3.connect(str(tmp_path / "memori.db")))
+
+    with pytest.raises(RuntimeError) as e:
+        mem.export_memories(str(tmp_path / "export"))
+
+    assert str(e.value) == "export_memories requires an entity_id"
+
+
+def test_import_memories_rejected_in_cloud_mode(monkeypatch, tmp_path):
+    monkeypatch.delenv("MEMORI_COCKROACHDB_CONNECTION_STRING", raising=False)
+    monkeypatch.setenv("MEMORI_API_KEY", "test-api-key")
+    monkeypatch.setenv("MEMORI_TEST_MODE", "1")
+    mem = Memori()
+
+    with pytest.raises(RuntimeError) as e:
+        mem.import_memories(str(tmp_path), entity_id="entity-id")
+
+    assert str(e.value) == "import_memories is only available in BYODB mode"
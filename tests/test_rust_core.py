@@ -17,9 +17,8 @@ def _fake_connection_context(_conn_factory, driver):
 
 def test_fetch_embeddings_callback_serializes_binary_embeddings(mocker):
     config = Config()
-    config.storage = SimpleNamespace(conn_factory=object)
     driver = SimpleNamespace(
-        entity=SimpleNamespace(create=mocker.Mock(return_value=42)),
+        entity=SimpleNamespace(read=mocker.Mock(return_value=42)),
         entity_fact=SimpleNamespace(
             get_embeddings=mocker.Mock(
                 return_value=[
@@ -32,10 +31,7 @@ def test_fetch_embeddings_callback_serializes_binary_embeddings(mocker):
         ),
     )
 
-    mocker.patch(
-        "memori._rust_core.connection_context",
-        side_effect=lambda conn_factory: _fake_connection_context(conn_factory, driver),
-    )
+    config.storage = SimpleNamespace(read_conn=_fake_connection_context(None, driver))
 
     callback = _rust_core.RustCoreAdapter._fetch_embeddings_cb(config)
     output = json.loads(callback(json.dumps({"entity_id": "entity-abc", "limit": 10})))
@@ -46,10 +42,28 @@ def test_fetch_embeddings_callback_serializes_binary_embeddings(mocker):
         base64.b64decode(output[0]["content_embedding_b64"])
         == b"\x00\x00\x80?\x00\x00\x00@"
     )
-    driver.entity.create.assert_called_once_with("entity-abc")
+    driver.entity.read.assert_called_once_with("entity-abc")
     driver.entity_fact.get_embeddings.assert_called_once_with(42, 10)
 
 
+def test_fetch_embeddings_callback_never_writes_to_replica(mocker):
+    config = Config()
+    driver = SimpleNamespace(
+        entity=SimpleNamespace(
+            create=mocker.Mock(side_effect=RuntimeError("read-only replica")),
+            read=mocker.Mock(return_value=None),
+        ),
+        entity_fact=SimpleNamespace(get_embeddings=mocker.Mock()),
+    )
+    config.storage = SimpleNamespace(read_conn=_fake_connection_context(None, driver))
+
+    callback = _rust_core.RustCoreAdapter._fetch_embeddings_cb(config)
+
+    assert json.loads(callback(json.dumps({"entity_id": "entity-new"}))) == []
+    driver.entity.create.assert_not_called()
+    driver.entity_fact.get_embeddings.assert_not_called()
+
+
 def test_write_batch_callback_maps_process_attribute_dict(mocker):
     config = Config()
     config.storage = SimpleNamespace(conn_factory=object)